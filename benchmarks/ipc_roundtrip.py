@@ -0,0 +1,297 @@
+"""Round-trip benchmark for the file-based host <-> container IPC path.
+
+Runs both ends in one process against a temp directory — no Docker.  The
+container side is the real agent-runner code (``ipc_service_request``,
+``OutputWriter``/``write_output``, ``wait_for_ipc_message``) and the host
+side is the real watcher queue, ``dispatch`` and ``write_ipc_message`` /
+``write_ipc_response``.  Only the service handler is a stand-in: an echo
+registered under ``bench:`` so the numbers measure transport, not the
+security gate or a plugin.
+
+Scenarios, each at several concurrency levels:
+
+  service  container request -> host dispatch -> response file -> container
+  output   container output event -> host session output handler
+  input    host message -> container input wait
+
+    uv run python benchmarks/ipc_roundtrip.py
+    uv run python benchmarks/ipc_roundtrip.py --output benchmarks/ipc_roundtrip.baseline.json
+    uv run python benchmarks/ipc_roundtrip.py --compare benchmarks/ipc_roundtrip.baseline.json
+
+With ``--compare`` the exit status is 1 if any p50/p99 grew (or throughput
+shrank) by more than ``--tolerance`` against the baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+_AGENT_SRC = Path(__file__).parent.parent / "src" / "pynchy" / "agent" / "agent_runner" / "src"
+sys.path.insert(0, str(_AGENT_SRC))
+
+from agent_runner import ipc as agent_ipc  # noqa: E402
+from agent_runner.agent_tools import _ipc_request  # noqa: E402
+from agent_runner.models import ContainerOutput  # noqa: E402
+from watchdog.observers import Observer  # noqa: E402
+
+from pynchy.host.container_manager.ipc import registry, watcher  # noqa: E402
+from pynchy.host.container_manager.ipc.write import (  # noqa: E402
+    ipc_response_path,
+    write_ipc_message,
+    write_ipc_response,
+)
+
+GROUP = "bench"
+LEVELS = [1, 4, 16]
+
+
+class _Deps:
+    """IpcDeps stand-in; the benchmarked paths only ask for workspaces."""
+
+    def workspaces(self) -> dict:
+        return {}
+
+    async def broadcast_to_channels(self, jid: str, event: object) -> None:
+        pass
+
+
+async def _echo(data: dict[str, Any], source_group: str, is_admin: bool, deps: Any) -> None:
+    write_ipc_response(
+        ipc_response_path(source_group, data["request_id"]), {"result": {"n": data["n"]}}
+    )
+
+
+def _summarize(latencies_ms: list[float], wall_s: float) -> dict[str, float]:
+    latencies_ms.sort()
+    return {
+        "n": len(latencies_ms),
+        "p50_ms": round(statistics.median(latencies_ms), 3),
+        "p99_ms": round(latencies_ms[math.ceil(0.99 * len(latencies_ms)) - 1], 3),
+        "throughput_per_s": round(len(latencies_ms) / wall_s, 1),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Scenarios — each returns (per-item latencies in ms, wall seconds)
+# ---------------------------------------------------------------------------
+
+
+async def _service(concurrency: int, total: int) -> tuple[list[float], float]:
+    latencies: list[float] = []
+
+    async def one(n: int) -> None:
+        start = time.perf_counter()
+        result = await _ipc_request.ipc_service_request(
+            "echo", {"n": n}, timeout=10, type_override="bench:echo"
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        if "Error" in result[0].text:
+            raise RuntimeError(result[0].text)
+
+    wall = time.perf_counter()
+    for batch in range(0, total, concurrency):
+        await asyncio.gather(*(one(n) for n in range(batch, min(batch + concurrency, total))))
+    return latencies, time.perf_counter() - wall
+
+
+async def _output(burst: int, total: int, received: dict[str, float]) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    received.clear()
+    writer = agent_ipc.OutputWriter(max_delay_ms=0)
+    wall = time.perf_counter()
+    try:
+        for batch in range(0, total, burst):
+            sent: dict[str, float] = {}
+            for n in range(batch, min(batch + burst, total)):
+                key = f"{burst}-{n}"
+                sent[key] = time.perf_counter()
+                writer.write(ContainerOutput(status="success", type="text", text=key))
+            await writer.drain()
+            while not sent.keys() <= received.keys():
+                await asyncio.sleep(0.0005)
+            latencies.extend((received[k] - t) * 1000 for k, t in sent.items())
+    finally:
+        await writer.aclose()
+    return latencies, time.perf_counter() - wall
+
+
+async def _input(burst: int, total: int) -> tuple[list[float], float]:
+    latencies: list[float] = []
+    wall = time.perf_counter()
+    for batch in range(0, total, burst):
+        keys = [f"{burst}-{n}" for n in range(batch, min(batch + burst, total))]
+        waiter = asyncio.create_task(agent_ipc.wait_for_ipc_message())
+        await asyncio.sleep(0)  # let the container side start watching first
+        sent: dict[str, float] = {}
+        for key in keys:
+            sent[key] = time.perf_counter()
+            write_ipc_message(GROUP, key)
+        pending = set(keys)
+        while pending:
+            message = await waiter
+            now = time.perf_counter()
+            assert message is not None
+            for key in [k for k in pending if k in message]:
+                latencies.append((now - sent[key]) * 1000)
+                pending.discard(key)
+            if pending:
+                waiter = asyncio.create_task(agent_ipc.wait_for_ipc_message())
+    return latencies, time.perf_counter() - wall
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+
+@contextlib.contextmanager
+def _wired(root: Path, received: dict[str, float]):
+    """Point both sides at *root* and install the bench handlers."""
+    group_dir = root / "ipc" / GROUP
+
+    async def on_output(output: Any) -> None:
+        received[output.text] = time.perf_counter()
+
+    with contextlib.ExitStack() as stack:
+        settings = SimpleNamespace(data_dir=root)
+        for mod in ("write", "watcher"):
+            stack.enter_context(
+                patch(f"pynchy.host.container_manager.ipc.{mod}.get_settings", lambda: settings)
+            )
+        stack.enter_context(patch.object(watcher, "_get_output_handler", lambda _g: on_output))
+        stack.enter_context(patch.object(_ipc_request, "IPC_DIR", group_dir))
+        stack.enter_context(patch.object(_ipc_request, "RESPONSES_DIR", group_dir / "responses"))
+        stack.enter_context(patch.object(agent_ipc, "IPC_OUTPUT_DIR", group_dir / "output"))
+        stack.enter_context(patch.object(agent_ipc, "IPC_INPUT_DIR", group_dir / "input"))
+        stack.enter_context(
+            patch.object(agent_ipc, "IPC_INPUT_CLOSE_SENTINEL", group_dir / "input" / "_close")
+        )
+        stack.enter_context(patch.dict(registry.PREFIX_HANDLERS, {"bench:": _echo}))
+        stack.enter_context(patch.object(agent_ipc, "log", lambda _msg: None))
+        yield
+
+
+async def _run(levels: list[int], total: int) -> dict[str, dict[str, dict[str, float]]]:
+    received: dict[str, float] = {}
+    with tempfile.TemporaryDirectory() as tmp, _wired(Path(tmp), received):
+        ipc_base = Path(tmp) / "ipc"
+        for sub in ("tasks", "responses", "output", "input"):
+            (ipc_base / GROUP / sub).mkdir(parents=True)
+
+        # Host side: the watcher's event handler and queue consumer
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[Path] = asyncio.Queue()
+        observer = Observer()
+        observer.schedule(
+            watcher._IpcEventHandler(ipc_base, loop, queue), str(ipc_base), recursive=True
+        )
+        observer.daemon = True
+        observer.start()
+        consumer = asyncio.create_task(watcher._process_queue(queue, ipc_base, _Deps()))
+
+        scenarios: dict[str, Callable[[int], Awaitable[tuple[list[float], float]]]] = {
+            "service": lambda c: _service(c, total),
+            "output": lambda c: _output(c, total, received),
+            "input": lambda c: _input(c, total),
+        }
+        results: dict[str, dict[str, dict[str, float]]] = {}
+        try:
+            for name, scenario in scenarios.items():
+                await scenario(1)  # warm-up: imports, inotify watches, page cache
+                results[name] = {}
+                for level in levels:
+                    latencies, wall = await scenario(level)
+                    results[name][f"c{level}"] = _summarize(latencies, wall)
+        finally:
+            consumer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await consumer
+            observer.stop()
+            observer.join(timeout=2)
+    return results
+
+
+def _compare(
+    current: dict[str, Any], baseline: dict[str, Any], tolerance: float, min_delta_ms: float
+) -> list[str]:
+    """Describe every metric that regressed beyond *tolerance*."""
+    regressions = []
+    for name, levels in baseline["results"].items():
+        for level, base in levels.items():
+            now = current["results"].get(name, {}).get(level)
+            if now is None:
+                continue
+            for metric in ("p50_ms", "p99_ms"):
+                if now[metric] > base[metric] * tolerance and (
+                    now[metric] - base[metric] > min_delta_ms
+                ):
+                    regressions.append(
+                        f"{name} {level} {metric}: {base[metric]:.2f} -> {now[metric]:.2f}"
+                    )
+            if now["throughput_per_s"] < base["throughput_per_s"] / tolerance:
+                regressions.append(
+                    f"{name} {level} throughput_per_s: "
+                    f"{base['throughput_per_s']:.0f} -> {now['throughput_per_s']:.0f}"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--levels", type=int, nargs="+", default=LEVELS)
+    parser.add_argument("--requests", type=int, default=200, help="items per scenario and level")
+    parser.add_argument("--output", type=Path, help="write results as JSON (e.g. a new baseline)")
+    parser.add_argument("--compare", type=Path, help="baseline JSON to check against")
+    parser.add_argument("--tolerance", type=float, default=2.0, help="allowed slowdown factor")
+    parser.add_argument(
+        "--min-delta-ms", type=float, default=1.0, help="ignore latency changes below this"
+    )
+    args = parser.parse_args()
+
+    results = asyncio.run(_run(args.levels, args.requests))
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+        },
+        "results": results,
+    }
+
+    print(f"{'scenario':>8} {'level':>5} {'p50 ms':>8} {'p99 ms':>8} {'per s':>8}")
+    for name, levels in results.items():
+        for level, stats in levels.items():
+            print(
+                f"{name:>8} {level:>5} {stats['p50_ms']:>8.2f} {stats['p99_ms']:>8.2f}"
+                f" {stats['throughput_per_s']:>8.0f}"
+            )
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = _compare(report, baseline, args.tolerance, args.min_delta_ms)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            raise SystemExit(1)
+        print(f"No regressions against {args.compare} (tolerance x{args.tolerance})")
+
+
+if __name__ == "__main__":
+    main()
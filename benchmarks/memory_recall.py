@@ -0,0 +1,134 @@
+"""Recall benchmark for the SQLite memory backend.
+
+Builds synthetic memory sets (one group per size) in a throwaway database
+and times ``recall`` with BM25 only and with the hybrid BM25 + vector path.
+Queries mix exact vocabulary hits with misspelled variants, which only the
+vector side can match.
+
+    uv run python benchmarks/memory_recall.py                 # 10k, 100k rows
+    uv run python benchmarks/memory_recall.py --rows 1000000  # ~1 GB of vectors
+
+Requires the ``memory`` extra (NumPy).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+from pynchy.plugins.memory.sqlite_memory import vectors
+from pynchy.plugins.memory.sqlite_memory.backend import SqliteMemoryBackend
+
+_SYLLABLES = ["ka", "lo", "mi", "ra", "te", "su", "no", "vi", "de", "pa", "ri", "zo", "en", "ul"]
+
+
+def _vocabulary(size: int, rng: random.Random) -> list[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+def _misspell(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word))
+    return word[:i] + word[i + 1 :] if len(word) > 4 else word + "e"
+
+
+async def _populate(backend: SqliteMemoryBackend, group: str, rows: int, words: list[str]) -> None:
+    db = await backend._conn()
+    rng = random.Random(rows)
+    now = "2026-01-01T00:00:00+00:00"
+    batch = []
+    for i in range(rows):
+        content = " ".join(rng.choices(words, k=rng.randint(6, 20)))
+        batch.append((uuid.uuid4().hex, group, f"mem-{i}", content, "core", "{}", now, now))
+        if len(batch) == 10_000:
+            await db.executemany("INSERT INTO memories VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+            batch.clear()
+    if batch:
+        await db.executemany("INSERT INTO memories VALUES (?, ?, ?, ?, ?, ?, ?, ?)", batch)
+    await db.commit()
+
+
+async def _time_queries(backend: SqliteMemoryBackend, group: str, queries: list[str]) -> dict:
+    latencies = []
+    hits = 0
+    for query in queries:
+        start = time.perf_counter()
+        results = await backend.recall(group, query, limit=5)
+        latencies.append((time.perf_counter() - start) * 1000)
+        hits += bool(results)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "hit_rate": hits / len(queries),
+    }
+
+
+async def _run(sizes: list[int], queries_per_size: int) -> None:
+    rng = random.Random(0)
+    words = _vocabulary(20_000, rng)
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "memories.db"
+        with patch("pynchy.plugins.memory.sqlite_memory.backend._db_path", return_value=db_path):
+            backend = SqliteMemoryBackend()
+            await backend.init()
+            for rows in sizes:
+                await _populate(backend, f"bench-{rows}", rows, words)
+            await backend.close()
+
+            # Reopen so init() embeds everything, as after an upgrade
+            start = time.perf_counter()
+            backend = SqliteMemoryBackend()
+            await backend.init()
+            print(f"backfill: {time.perf_counter() - start:.1f}s for {sum(sizes):,} rows")
+
+            exact = [" ".join(rng.sample(words, 2)) for _ in range(queries_per_size)]
+            fuzzy = [
+                " ".join(_misspell(w, rng) for w in rng.sample(words, 2))
+                for _ in range(queries_per_size)
+            ]
+            header = (
+                f"{'rows':>9} {'mode':>7} {'queries':>7} {'p50 ms':>8} {'p95 ms':>8} {'hits':>5}"
+            )
+            print(header)
+            for rows in sizes:
+                group = f"bench-{rows}"
+                start = time.perf_counter()
+                assert backend._vectors is not None
+                await backend._vectors.group(await backend._conn(), group)
+                load_s = time.perf_counter() - start
+                vectors_index, backend._vectors = backend._vectors, None
+                for label, queries in (("exact", exact), ("fuzzy", fuzzy)):
+                    for mode in ("bm25", "hybrid"):
+                        backend._vectors = vectors_index if mode == "hybrid" else None
+                        stats = await _time_queries(backend, group, queries)
+                        print(
+                            f"{rows:>9,} {mode:>7} {label:>7} {stats['p50_ms']:>8.2f}"
+                            f" {stats['p95_ms']:>8.2f} {stats['hit_rate']:>5.0%}"
+                        )
+                backend._vectors = vectors_index
+                print(f"{rows:>9,} index load {load_s:.2f}s")
+            await backend.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    if not vectors.AVAILABLE:
+        raise SystemExit("numpy is required: uv sync --extra memory")
+    asyncio.run(_run(args.rows, args.queries))
+
+
+if __name__ == "__main__":
+    main()
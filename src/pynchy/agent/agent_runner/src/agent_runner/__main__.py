@@ -2,6 +2,8 @@
 
 import asyncio
 
+from agent_runner import startup  # first: starts the cold-start clock
 from agent_runner.main import main
 
+startup.mark("imports")
 asyncio.run(main())
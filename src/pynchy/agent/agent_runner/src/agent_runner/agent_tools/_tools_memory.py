@@ -65,6 +65,61 @@ register_ipc_tool(
     },
 )
 
+register_ipc_tool(
+    name="save_memories",
+    description=(
+        "Save several memories at once (up to 50). Same semantics as save_memory "
+        "for each item; prefer this over repeated save_memory calls."
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "memories": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "key": {"type": "string"},
+                        "content": {"type": "string"},
+                        "category": {"type": "string", "default": "core"},
+                    },
+                    "required": ["key", "content"],
+                },
+                "description": "Memories to save, each with key, content and optional category",
+            },
+        },
+        "required": ["memories"],
+    },
+)
+
+register_ipc_tool(
+    name="recall_memories_batch",
+    description=(
+        "Run several memory searches at once (up to 50 queries). Returns one "
+        "result list per query; prefer this over repeated recall_memories calls."
+    ),
+    input_schema={
+        "type": "object",
+        "properties": {
+            "queries": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Search queries",
+            },
+            "category": {
+                "type": "string",
+                "description": "Filter by category (optional)",
+            },
+            "limit": {
+                "type": "integer",
+                "description": "Maximum results per query (default: 5)",
+                "default": 5,
+            },
+        },
+        "required": ["queries"],
+    },
+)
+
 register_ipc_tool(
     name="forget_memory",
     description="Delete a memory by key. Use this to remove outdated or incorrect information.",
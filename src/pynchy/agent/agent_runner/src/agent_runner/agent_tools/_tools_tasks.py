@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 
-from croniter import croniter
 from mcp.types import CallToolResult, TextContent, Tool
 
 from agent_runner.agent_tools import _ipc
@@ -220,6 +219,10 @@ async def _schedule_task_handle(arguments: dict) -> list[TextContent] | CallTool
 def _validate_schedule(schedule_type: str, schedule_value: str) -> CallToolResult | None:
     """Return a CallToolResult error if validation fails, else None."""
     if schedule_type == "cron":
+        # Imported here: only schedule_task needs it, and the tool server
+        # is started for every agent session.
+        from croniter import croniter
+
         try:
             croniter(schedule_value)
         except (ValueError, KeyError):
@@ -121,6 +121,18 @@ def _get_session_summary(session_id: str, transcript_path: str) -> str | None:
     return None
 
 
+def _query_cost(total_cost_usd: float | None, reported: float) -> float | None:
+    """This query's cost, given the CLI's running total and what was already reported.
+
+    ``ResultMessage.total_cost_usd`` accumulates for the lifetime of the CLI
+    process, and a persistent client sends every query through one process.
+    A total below *reported* means the process restarted, so it is all new.
+    """
+    if total_cost_usd is None:
+        return None
+    return total_cost_usd - reported if total_cost_usd >= reported else total_cost_usd
+
+
 def _create_pre_compact_hook():
     """Create a PreCompact hook that archives the transcript."""
 
@@ -226,6 +238,8 @@ class ClaudeAgentCore:
         self.config = config
         self._client: ClaudeSDKClient | None = None
         self._session_id: str | None = config.session_id
+        # Running total_cost_usd already reported for the current CLI process
+        self._reported_cost = 0.0
 
     async def start(self) -> None:
         """Initialize Claude SDK client."""
@@ -351,6 +365,7 @@ class ClaudeAgentCore:
         # Create and enter client context
         self._client = ClaudeSDKClient(options)
         await self._client.__aenter__()
+        self._reported_cost = 0.0
 
     async def query(self, prompt: str) -> AsyncIterator[AgentEvent]:
         """Execute a query using Claude SDK."""
@@ -364,6 +379,7 @@ class ClaudeAgentCore:
         message_count = 0
         result_count = 0
         new_session_id: str | None = None
+        model: str | None = None
 
         async for message in self._client.receive_response():
             message_count += 1
@@ -386,6 +402,7 @@ class ClaudeAgentCore:
 
             # Assistant messages (thinking, tool use, tool results, text)
             elif isinstance(message, AssistantMessage):
+                model = getattr(message, "model", None) or model
                 for block in message.content:
                     if isinstance(block, ThinkingBlock):
                         yield AgentEvent(
@@ -441,9 +458,14 @@ class ClaudeAgentCore:
                     "num_turns": message.num_turns,
                     "session_id": message.session_id,
                     "total_cost_usd": message.total_cost_usd,
+                    "cost_usd": _query_cost(message.total_cost_usd, self._reported_cost),
                     "usage": message.usage,
+                    "model": model,
                 }
 
+                if message.total_cost_usd is not None:
+                    self._reported_cost = message.total_cost_usd
+
                 yield AgentEvent(
                     type="result",
                     data={
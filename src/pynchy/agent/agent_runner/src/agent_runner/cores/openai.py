@@ -394,6 +394,11 @@ class OpenAIAgentCore:
         self._previous_response_id = result.last_response_id
         self._session_id = result.last_response_id
 
+        # Token usage in the Anthropic shape the host accounts in; OpenAI's
+        # input count includes cache hits, Anthropic's excludes them.
+        usage = result.context_wrapper.usage
+        cached = getattr(getattr(usage, "input_tokens_details", None), "cached_tokens", 0) or 0
+
         # Yield final result event
         yield AgentEvent(
             type="result",
@@ -403,6 +408,12 @@ class OpenAIAgentCore:
                     "subtype": "result",
                     "session_id": result.last_response_id,
                     "is_error": False,
+                    "model": model,
+                    "usage": {
+                        "input_tokens": usage.input_tokens - cached,
+                        "output_tokens": usage.output_tokens,
+                        "cache_read_input_tokens": cached,
+                    },
                 },
             },
         )
@@ -10,11 +10,14 @@ Output protocol:
   Each event is written as a JSON file to /workspace/ipc/output/.
   Filenames are monotonic nanosecond timestamps ({ns}.json) for guaranteed
   ordering. Files are written atomically (write .json.tmp, then rename).
+  During a query, OutputWriter performs the writes on a worker thread and
+  merges adjacent text deltas into one file.
 """
 
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
 import contextlib
 import json
 import sys
@@ -22,9 +25,6 @@ import time
 from pathlib import Path
 from typing import Any
 
-from watchdog.events import FileCreatedEvent, FileMovedEvent, FileSystemEventHandler
-from watchdog.observers import Observer
-
 from .models import ContainerInput, ContainerOutput
 
 IPC_INPUT_DIR = Path("/workspace/ipc/input")
@@ -54,6 +54,88 @@ def write_output(output: ContainerOutput) -> None:
     tmp_path.rename(final_path)
 
 
+# Default window for merging adjacent text deltas into one output file.
+DEFAULT_OUTPUT_MAX_DELAY_MS = 50
+
+# Flush merged text early once it grows past this many characters.
+_MAX_COALESCED_CHARS = 32_000
+
+
+def _is_mergeable_text(output: ContainerOutput) -> bool:
+    # Events carrying the startup timeline are written as-is so it isn't lost.
+    return output.type == "text" and output.status == "success" and not output.startup
+
+
+class OutputWriter:
+    """Off-loop, coalescing writer for query output events.
+
+    Files are written by a single worker thread, so they land in submission
+    order and the event loop never blocks on disk I/O.  Adjacent ``text``
+    deltas are buffered and merged into one event; the buffer is written
+    when *max_delay_ms* elapses, when it grows large, or as soon as any
+    other event type (tool_use, tool_result, result, ...) arrives, so event
+    boundaries are never delayed.  ``max_delay_ms=0`` disables merging.
+    """
+
+    def __init__(self, max_delay_ms: int = DEFAULT_OUTPUT_MAX_DELAY_MS) -> None:
+        self._max_delay = max(0, max_delay_ms) / 1000
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ipc-output"
+        )
+        self._pending: list[concurrent.futures.Future[None]] = []
+        self._text_parts: list[str] = []
+        self._text_chars = 0
+        self._text_trace_id: str | None = None
+        self._timer: asyncio.TimerHandle | None = None
+
+    def write(self, output: ContainerOutput) -> None:
+        """Queue an output event; returns without waiting for the write."""
+        if self._max_delay and _is_mergeable_text(output):
+            text = output.text or ""
+            self._text_parts.append(text)
+            self._text_trace_id = output.trace_id
+            self._text_chars += len(text)
+            if self._text_chars >= _MAX_COALESCED_CHARS:
+                self._flush_text()
+            elif self._timer is None:
+                loop = asyncio.get_running_loop()
+                self._timer = loop.call_later(self._max_delay, self._flush_text)
+            return
+        self._flush_text()
+        self._submit(output)
+
+    async def drain(self) -> None:
+        """Flush buffered text and wait until every queued file is on disk."""
+        self._flush_text()
+        pending, self._pending = self._pending, []
+        for future in pending:
+            try:
+                await asyncio.wrap_future(future)
+            except Exception as exc:
+                log(f"Failed to write output event: {exc}")
+
+    async def aclose(self) -> None:
+        await self.drain()
+        self._executor.shutdown(wait=True)
+
+    def _flush_text(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._text_parts:
+            return
+        text = "".join(self._text_parts)
+        self._text_parts = []
+        self._text_chars = 0
+        self._submit(
+            ContainerOutput(status="success", type="text", text=text, trace_id=self._text_trace_id)
+        )
+
+    def _submit(self, output: ContainerOutput) -> None:
+        self._pending = [f for f in self._pending if not f.done() or f.exception()]
+        self._pending.append(self._executor.submit(write_output, output))
+
+
 def log(message: str) -> None:
     """Log to stderr (captured by host container runner)."""
     print(f"[agent-runner] {message}", file=sys.stderr, flush=True)
@@ -90,8 +172,18 @@ def should_close() -> bool:
     return False
 
 
+# Trace ID of the newest drained input message (see latest_trace_id)
+_latest_trace_id: str | None = None
+
+
+def latest_trace_id() -> str | None:
+    """Host trace ID carried by the most recently drained input message."""
+    return _latest_trace_id
+
+
 def drain_ipc_input() -> list[str]:
     """Drain all pending IPC input messages. Returns messages found."""
+    global _latest_trace_id
     try:
         IPC_INPUT_DIR.mkdir(parents=True, exist_ok=True)
         files = sorted(f for f in IPC_INPUT_DIR.iterdir() if f.suffix == ".json")
@@ -103,6 +195,8 @@ def drain_ipc_input() -> list[str]:
                 file_path.unlink()
                 if isinstance(data, dict) and data.get("type") == "message" and data.get("text"):
                     messages.append(data["text"])
+                    if data.get("trace_id"):
+                        _latest_trace_id = data["trace_id"]
             except (json.JSONDecodeError, OSError) as exc:
                 log(f"Failed to process input file {file_path.name}: {exc}")
                 with contextlib.suppress(OSError):
@@ -113,16 +207,19 @@ def drain_ipc_input() -> list[str]:
         return []
 
 
-class _InputEventHandler(FileSystemEventHandler):
+class _InputEventHandler:
     """Watchdog handler that signals an asyncio.Event when input files appear.
 
     Runs in the watchdog background thread; uses call_soon_threadsafe to wake
     the async event loop.  Matches the pattern used by the host-side watcher
     (src/pynchy/ipc/_watcher.py).
+
+    Implements watchdog's ``dispatch()`` protocol directly rather than
+    subclassing ``FileSystemEventHandler`` so that importing this module
+    does not import watchdog — it is only loaded once a watch starts.
     """
 
     def __init__(self, loop: asyncio.AbstractEventLoop, event: asyncio.Event) -> None:
-        super().__init__()
         self._loop = loop
         self._event = event
 
@@ -132,16 +229,67 @@ class _InputEventHandler(FileSystemEventHandler):
         if p.suffix == ".json" or p.name == "_close":
             self._loop.call_soon_threadsafe(self._event.set)
 
-    def on_created(self, event: Any) -> None:
-        if isinstance(event, FileCreatedEvent):
+    def dispatch(self, event: Any) -> None:
+        if event.is_directory:
+            return
+        if event.event_type == "created":
             self._signal_if_relevant(event.src_path)
-
-    def on_moved(self, event: Any) -> None:
-        # Host writes atomically (tmp -> rename), which produces a moved event
-        if isinstance(event, FileMovedEvent):
+        elif event.event_type == "moved":
+            # Host writes atomically (tmp -> rename), which produces a moved event
             self._signal_if_relevant(event.dest_path)
 
 
+def _start_observer(handler: _InputEventHandler) -> Any:
+    """Start a daemon watchdog observer on IPC_INPUT_DIR."""
+    from watchdog.observers import Observer
+
+    observer = Observer()
+    observer.schedule(handler, str(IPC_INPUT_DIR), recursive=False)
+    observer.daemon = True
+    observer.start()
+    return observer
+
+
+class InputWatch:
+    """Watch the IPC input directory for activity while a query runs.
+
+    Replaces a ``should_close()`` stat per agent event: the sentinel is only
+    checked after watchdog reports a new file in the input directory.
+    """
+
+    def __init__(self) -> None:
+        self._activity: asyncio.Event | None = None
+        self._observer: Any = None
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._activity = asyncio.Event()
+        # Start "dirty" so a sentinel written before the watch began is seen.
+        self._activity.set()
+        IPC_INPUT_DIR.mkdir(parents=True, exist_ok=True)
+        self._observer = _start_observer(_InputEventHandler(loop, self._activity))
+
+    def close_requested(self) -> bool:
+        """Return True (consuming the sentinel) if _close has appeared."""
+        if self._activity is None or not self._activity.is_set():
+            return False
+        self._activity.clear()
+        return should_close()
+
+    def stop(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+            self._observer = None
+
+    def __enter__(self) -> InputWatch:
+        self.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
 async def wait_for_ipc_message() -> str | None:
     """Wait for a new IPC message or _close sentinel.
 
@@ -151,11 +299,7 @@ async def wait_for_ipc_message() -> str | None:
     loop = asyncio.get_running_loop()
     wakeup = asyncio.Event()
 
-    handler = _InputEventHandler(loop, wakeup)
-    observer = Observer()
-    observer.schedule(handler, str(IPC_INPUT_DIR), recursive=False)
-    observer.daemon = True
-    observer.start()
+    observer = _start_observer(_InputEventHandler(loop, wakeup))
 
     try:
         while True:
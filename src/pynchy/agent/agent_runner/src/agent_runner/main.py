@@ -15,17 +15,22 @@ from typing import Any
 
 from .core import AgentCoreConfig, AgentEvent
 from .ipc import (
+    DEFAULT_OUTPUT_MAX_DELAY_MS,
     IPC_INPUT_CLOSE_SENTINEL,
     IPC_INPUT_DIR,
+    InputWatch,
+    OutputWriter,
     drain_ipc_input,
+    latest_trace_id,
     log,
     read_initial_input,
-    should_close,
     wait_for_ipc_message,
     write_output,
 )
 from .models import ContainerInput, ContainerOutput
 from .registry import create_agent_core
+from .startup import mark as mark_startup
+from .startup import timeline as startup_timeline
 
 # ---------------------------------------------------------------------------
 # Message conversion
@@ -212,6 +217,7 @@ async def main() -> None:
     try:
         container_input = read_initial_input()
         log(f"Received input for group: {container_input.group_folder}")
+        mark_startup("input_read")
         core_ref = f"{container_input.agent_core_module}.{container_input.agent_core_class}"
         log(f"Using agent core: {core_ref}")
     except Exception as exc:
@@ -277,6 +283,7 @@ async def main() -> None:
             )
         )
         sys.exit(1)
+    mark_startup("core_created")
 
     try:
         await core.start()
@@ -288,8 +295,14 @@ async def main() -> None:
             )
         )
         sys.exit(1)
+    mark_startup("core_started")
 
     session_id = container_input.session_id
+    # Echoed on every output so the host can attribute it to its trace
+    trace_id = latest_trace_id() or container_input.trace_id
+    max_delay_ms = container_input.output_max_delay_ms
+    writer = OutputWriter(DEFAULT_OUTPUT_MAX_DELAY_MS if max_delay_ms is None else max_delay_ms)
+    startup_sent = False
 
     try:
         while True:
@@ -299,29 +312,35 @@ async def main() -> None:
             closed_during_query = False
             new_session_id: str | None = None
 
-            async for event in core.query(prompt):
-                # Check for close during query
-                if should_close():
-                    log("Close sentinel detected during query")
-                    closed_during_query = True
-                    break
-
-                # Track session ID from system init events
-                if event.type == "system":
-                    subtype = event.data.get("system_subtype")
-                    if subtype == "init":
-                        sid = event.data.get("system_data", {}).get("session_id")
-                        if sid:
-                            new_session_id = sid
-                            log(f"Session initialized: {new_session_id}")
-
-                # Track results
-                if event.type == "result":
-                    result_count += 1
-
-                # Convert event to output and write
-                output = event_to_output(event, new_session_id or session_id)
-                write_output(output)
+            with InputWatch() as input_watch:
+                async for event in core.query(prompt):
+                    # Check for close during query
+                    if input_watch.close_requested():
+                        log("Close sentinel detected during query")
+                        closed_during_query = True
+                        break
+
+                    # Track session ID from system init events
+                    if event.type == "system":
+                        subtype = event.data.get("system_subtype")
+                        if subtype == "init":
+                            sid = event.data.get("system_data", {}).get("session_id")
+                            if sid:
+                                new_session_id = sid
+                                log(f"Session initialized: {new_session_id}")
+
+                    # Track results
+                    if event.type == "result":
+                        result_count += 1
+
+                    # Convert event to output and write
+                    output = event_to_output(event, new_session_id or session_id)
+                    output.trace_id = trace_id
+                    if not startup_sent:
+                        mark_startup("first_event")
+                        output.startup = startup_timeline()
+                        startup_sent = True
+                    writer.write(output)
 
             # Update session ID from core after query
             if core.session_id:
@@ -337,13 +356,14 @@ async def main() -> None:
                 break
 
             # Emit session update so host can track it
-            write_output(
+            writer.write(
                 ContainerOutput(
                     status="success",
                     result=None,
                     new_session_id=session_id,
                 )
             )
+            await writer.drain()
 
             log("Query ended, waiting for next IPC message...")
 
@@ -354,11 +374,12 @@ async def main() -> None:
 
             log(f"Got new message ({len(next_message)} chars), starting new query")
             prompt = next_message
+            trace_id = latest_trace_id() or trace_id
 
     except Exception as exc:
         error_message = str(exc)
         log(f"Agent error: {error_message}")
-        write_output(
+        writer.write(
             ContainerOutput(
                 status="error",
                 new_session_id=session_id,
@@ -367,6 +388,7 @@ async def main() -> None:
         )
         sys.exit(1)
     finally:
+        await writer.aclose()
         # Clean up core
         try:
             await core.stop()
@@ -35,6 +35,8 @@ class ContainerInput:
     mcp_gateway_url: str | None = None
     mcp_gateway_key: str | None = None
     mcp_direct_servers: list[dict[str, Any]] | None = None
+    output_max_delay_ms: int | None = None
+    trace_id: str | None = None
 
     def __post_init__(self) -> None:
         # Normalize empty string to None (JSON has no null distinction for
@@ -72,6 +74,10 @@ class ContainerOutput:
     tool_result_content: str | None = None
     tool_result_is_error: bool | None = None
     result_metadata: dict[str, Any] | None = None
+    # Cold-start timeline (see startup.py); set on the first output only.
+    startup: dict[str, int] | None = None
+    # Host trace ID of the input this output answers, echoed back for tracing.
+    trace_id: str | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a dict suitable for JSON output.
@@ -104,4 +110,8 @@ class ContainerOutput:
             d["tool_result_content"] = self.tool_result_content
             d["tool_result_is_error"] = self.tool_result_is_error
 
+        if self.startup:
+            d["startup"] = self.startup
+        if self.trace_id:
+            d["trace_id"] = self.trace_id
         return d
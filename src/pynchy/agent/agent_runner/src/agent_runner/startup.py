@@ -0,0 +1,24 @@
+"""Cold-start timeline — milestones from entry point to first agent event.
+
+``__main__`` imports this module before anything else, so offsets are
+measured from the moment the runner's own code starts executing
+(interpreter boot is excluded).  The timeline rides along on the first
+``ContainerOutput`` so the host can log where a cold start spent its time.
+"""
+
+from __future__ import annotations
+
+import time
+
+_origin = time.monotonic()
+_marks: dict[str, int] = {}
+
+
+def mark(name: str) -> None:
+    """Record milestone *name* (first call wins) as ms since entry."""
+    _marks.setdefault(f"{name}_ms", round((time.monotonic() - _origin) * 1000))
+
+
+def timeline() -> dict[str, int]:
+    """Milestones recorded so far, in the order they happened."""
+    return dict(_marks)
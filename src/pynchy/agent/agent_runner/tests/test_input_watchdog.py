@@ -1,4 +1,4 @@
-"""Tests for watchdog-based IPC input waiting (wait_for_ipc_message)."""
+"""Tests for watchdog-based IPC input waiting (wait_for_ipc_message, InputWatch)."""
 
 from __future__ import annotations
 
@@ -9,7 +9,7 @@ from unittest.mock import patch
 
 import pytest
 
-from agent_runner.ipc import wait_for_ipc_message
+from agent_runner.ipc import InputWatch, wait_for_ipc_message
 
 
 @pytest.fixture()
@@ -107,3 +107,35 @@ class TestDrainsMultipleMessages:
         assert "first" in parts
         assert "second" in parts
         assert "third" in parts
+
+
+class TestInputWatch:
+    """InputWatch reports the close sentinel without polling per event."""
+
+    @pytest.mark.asyncio
+    async def test_no_sentinel(self, input_dir: Path) -> None:
+        with InputWatch() as watch:
+            assert watch.close_requested() is False
+            # No new activity since the first check — no stat needed.
+            with patch("agent_runner.ipc.should_close") as mock_should_close:
+                assert watch.close_requested() is False
+            mock_should_close.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_sentinel_present_before_start(self, input_dir: Path) -> None:
+        (input_dir / "_close").touch()
+        with InputWatch() as watch:
+            assert watch.close_requested() is True
+        assert not (input_dir / "_close").exists()
+
+    @pytest.mark.asyncio
+    async def test_sentinel_written_during_watch(self, input_dir: Path) -> None:
+        with InputWatch() as watch:
+            assert watch.close_requested() is False
+            (input_dir / "_close").touch()
+
+            async def wait_for_close() -> None:
+                while not watch.close_requested():
+                    await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(wait_for_close(), timeout=5.0)
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from agent_runner.ipc import write_output
+from agent_runner.ipc import OutputWriter, write_output
 from agent_runner.models import ContainerOutput
 
 
@@ -149,3 +151,101 @@ class TestAtomicWrite:
         assert tmp_files == []
         json_files = list(output_dir.glob("*.json"))
         assert len(json_files) == 10
+
+
+def _read_all(output_dir: Path) -> list[dict]:
+    return [json.loads(f.read_text()) for f in sorted(output_dir.glob("*.json"))]
+
+
+def _text(text: str) -> ContainerOutput:
+    return ContainerOutput(status="success", type="text", text=text)
+
+
+class TestOutputWriter:
+    """OutputWriter merges text deltas and writes off the event loop."""
+
+    @pytest.mark.asyncio
+    async def test_merges_adjacent_text_deltas(self, output_dir: Path) -> None:
+        writer = OutputWriter(max_delay_ms=1000)
+        for part in ("Hel", "lo ", "world"):
+            writer.write(_text(part))
+        await writer.aclose()
+
+        assert _read_all(output_dir) == [_text("Hello world").to_dict()]
+
+    @pytest.mark.asyncio
+    async def test_flushes_text_before_other_events(self, output_dir: Path) -> None:
+        writer = OutputWriter(max_delay_ms=1000)
+        tool = ContainerOutput(status="success", type="tool_use", tool_name="Read")
+        result = ContainerOutput(status="success", result="done")
+        writer.write(_text("a"))
+        writer.write(_text("b"))
+        writer.write(tool)
+        writer.write(_text("c"))
+        writer.write(result)
+        await writer.aclose()
+
+        assert _read_all(output_dir) == [
+            _text("ab").to_dict(),
+            tool.to_dict(),
+            _text("c").to_dict(),
+            result.to_dict(),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_flushes_text_after_max_delay(self, output_dir: Path) -> None:
+        writer = OutputWriter(max_delay_ms=20)
+        writer.write(_text("x"))
+        await asyncio.sleep(0.1)
+        await writer.drain()
+
+        assert _read_all(output_dir) == [_text("x").to_dict()]
+        await writer.aclose()
+
+    @pytest.mark.asyncio
+    async def test_zero_delay_disables_merging(self, output_dir: Path) -> None:
+        writer = OutputWriter(max_delay_ms=0)
+        writer.write(_text("a"))
+        writer.write(_text("b"))
+        await writer.aclose()
+
+        assert [c["text"] for c in _read_all(output_dir)] == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_writes_on_worker_thread(self, output_dir: Path) -> None:
+        threads: list[str] = []
+        writer = OutputWriter()
+        with patch(
+            "agent_runner.ipc.write_output",
+            side_effect=lambda _o: threads.append(threading.current_thread().name),
+        ):
+            writer.write(ContainerOutput(status="success", result="r"))
+            await writer.drain()
+        await writer.aclose()
+
+        assert len(threads) == 1
+        assert threads[0].startswith("ipc-output")
+
+    @pytest.mark.asyncio
+    async def test_startup_timeline_is_not_merged_away(self, output_dir: Path) -> None:
+        writer = OutputWriter(max_delay_ms=1000)
+        first = _text("Hel")
+        first.startup = {"imports_ms": 120, "first_event_ms": 900}
+        writer.write(first)
+        writer.write(_text("lo"))
+        await writer.aclose()
+
+        written = _read_all(output_dir)
+        assert written[0] == {**_text("Hel").to_dict(), "startup": first.startup}
+        assert written[1] == _text("lo").to_dict()
+
+    @pytest.mark.asyncio
+    async def test_merged_text_keeps_trace_id(self, output_dir: Path) -> None:
+        writer = OutputWriter(max_delay_ms=1000)
+        for part in ("a", "b"):
+            output = _text(part)
+            output.trace_id = "abc123"
+            writer.write(output)
+        await writer.aclose()
+
+        assert _read_all(output_dir) == [{**_text("ab").to_dict(), "trace_id": "abc123"}]
@@ -42,6 +42,7 @@ class ContainerConfig(_StrictModel):
     idle_timeout_ms: int = 1800000  # 30 minutes
     max_concurrent: int = 10
     runtime: str | None = None  # "docker" | plugin runtime name (e.g. "apple") | None
+    output_max_delay_ms: int = 50  # Window for merging streamed text deltas (0 = off)
 
     @field_validator("max_concurrent")
     @classmethod
@@ -55,6 +56,9 @@ class ServerConfig(_StrictModel):
 
 class LoggingConfig(_StrictModel):
     level: str = "INFO"
+    # Append message latency spans as OTLP/JSON lines to this file
+    # (relative paths are under data_dir).  None = don't export.
+    trace_export: str | None = None
 
     @field_validator("level")
     @classmethod
@@ -356,6 +360,24 @@ class CronJobConfig(_StrictModel):
         return v
 
 
+class MemoryConfig(_StrictModel):
+    # Cron schedule for memory-backend maintenance (FTS merge, quotas, vacuum);
+    # empty disables it
+    maintenance_schedule: str = "30 4 * * *"
+    # Per-group quotas (opt-in); the least recently updated memories beyond
+    # them are moved to cold storage, out of recall.  None → unlimited.
+    max_rows_per_group: int | None = None
+    max_bytes_per_group: int | None = None
+
+    @field_validator("maintenance_schedule")
+    @classmethod
+    def validate_schedule(cls, v: str) -> str:
+        if v and not croniter.is_valid(v):
+            msg = f"Invalid cron expression: {v}"
+            raise ValueError(msg)
+        return v
+
+
 class IntervalsConfig(_StrictModel):
     message_poll: float = 2.0  # seconds
     ipc_poll: float = 1.0  # seconds
@@ -366,6 +388,14 @@ class QueueConfig(_StrictModel):
     base_retry_seconds: float = 5.0
 
 
+class UsageConfig(_StrictModel):
+    # Per-workspace spend cap for the current UTC day, read from the usage
+    # rollups.  Non-admin workspaces over it get no new agent runs.  None = no cap.
+    daily_budget_usd: float | None = None
+    flush_interval: float = 5.0  # seconds buffered usage rows wait before a write
+    batch_size: int = 50  # buffered rows that trigger an immediate write
+
+
 class PluginConfig(_StrictModel):
     enabled: bool = True
 
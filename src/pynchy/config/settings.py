@@ -44,6 +44,7 @@ from pynchy.config.models import (
     GatewayConfig,
     IntervalsConfig,
     LoggingConfig,
+    MemoryConfig,
     OwnerConfig,
     PluginConfig,
     QueueConfig,
@@ -54,6 +55,7 @@ from pynchy.config.models import (
     SecurityConfig,
     ServerConfig,
     ServiceTrustTomlConfig,
+    UsageConfig,
     WorkspaceConfig,
     _StrictModel,
 )
@@ -170,8 +172,10 @@ class Settings(BaseSettings):
     commands: CommandWordsConfig = CommandWordsConfig()
     scheduler: SchedulerConfig = SchedulerConfig()
     cron_jobs: dict[str, CronJobConfig] = {}  # [cron_jobs.<job_name>]
+    memory: MemoryConfig = MemoryConfig()
     intervals: IntervalsConfig = IntervalsConfig()
     queue: QueueConfig = QueueConfig()
+    usage: UsageConfig = UsageConfig()
     command_center: CommandCenterConfig = CommandCenterConfig()
     connection: ConnectionsConfig = ConnectionsConfig()
     plugins: dict[str, PluginConfig] = {}
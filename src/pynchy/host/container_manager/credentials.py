@@ -6,9 +6,14 @@ API credentials.  Real keys never leave the host process.
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
 import subprocess
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from pynchy.config import get_settings
 from pynchy.logger import logger
@@ -94,6 +99,67 @@ def _read_git_identity() -> tuple[str | None, str | None]:
     return name, email
 
 
+# ---------------------------------------------------------------------------
+# Host credential cache
+# ---------------------------------------------------------------------------
+
+# gh/git are forked at most once per TTL, or sooner when a file they read
+# from changes (``gh auth login``/``refresh``, ``git config --global``).
+_HOST_CREDENTIAL_TTL = 300.0
+
+# key → (watched-file signature, resolved at (monotonic), value)
+_host_cache: dict[str, tuple[tuple, float, Any]] = {}
+# env file → sha256 of the content last written there
+_env_hashes: dict[Path, str] = {}
+
+
+def _host_credential_files() -> list[Path]:
+    """Files whose change invalidates cached gh/git credentials."""
+    home = Path.home()
+    config_home = Path(os.environ.get("XDG_CONFIG_HOME") or home / ".config")
+    gh_dir = Path(os.environ.get("GH_CONFIG_DIR") or config_home / "gh")
+    return [gh_dir / "hosts.yml", home / ".gitconfig", config_home / "git" / "config"]
+
+
+def _files_signature(paths: list[Path]) -> tuple:
+    sig = []
+    for path in paths:
+        try:
+            st = path.stat()
+            sig.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append(None)
+    return tuple(sig)
+
+
+def _cached_host_value(key: str, reader: Callable[[], Any]) -> Any:
+    """Return *reader*'s cached result, re-reading on TTL expiry or file change."""
+    signature = _files_signature(_host_credential_files())
+    now = time.monotonic()
+    entry = _host_cache.get(key)
+    if entry and entry[0] == signature and now - entry[1] < _HOST_CREDENTIAL_TTL:
+        return entry[2]
+    value = reader()
+    _host_cache[key] = (signature, now, value)
+    return value
+
+
+def _host_gh_token() -> str | None:
+    """Host gh CLI token, cached (see :func:`_cached_host_value`)."""
+    return _cached_host_value("gh_token", _read_gh_token)
+
+
+def _host_git_identity() -> tuple[str | None, str | None]:
+    """Host git ``(user.name, user.email)``, cached."""
+    return _cached_host_value("git_identity", _read_git_identity)
+
+
+def _clear_credential_cache() -> None:
+    """Forget cached host credentials and env-file hashes."""
+    _host_cache.clear()
+    _env_hashes.clear()
+
+
 def _shell_quote(value: str) -> str:
     """Quote a value for safe inclusion in a shell env file."""
     return "'" + value.replace("'", "'\\''") + "'"
@@ -131,7 +197,6 @@ def _write_env_file(*, is_admin: bool, group_folder: str) -> Path | None:
 
     s = get_settings()
     env_dir = s.data_dir / "env" / group_folder
-    env_dir.mkdir(parents=True, exist_ok=True)
 
     env_vars: dict[str, str] = {}
     gateway = get_gateway()
@@ -156,7 +221,7 @@ def _write_env_file(*, is_admin: bool, group_folder: str) -> Path | None:
     if is_admin:
         if s.secrets.gh_token:
             env_vars["GH_TOKEN"] = s.secrets.gh_token.get_secret_value()
-        elif gh_token := _read_gh_token():
+        elif gh_token := _host_gh_token():
             env_vars["GH_TOKEN"] = gh_token
             logger.debug("Using GitHub token from gh CLI")
     else:
@@ -170,7 +235,7 @@ def _write_env_file(*, is_admin: bool, group_folder: str) -> Path | None:
                 env_vars["GH_TOKEN"] = repo_cfg.token.get_secret_value()
 
     # Git identity
-    git_name, git_email = _read_git_identity()
+    git_name, git_email = _host_git_identity()
     if git_name:
         env_vars["GIT_AUTHOR_NAME"] = git_name
         env_vars["GIT_COMMITTER_NAME"] = git_name
@@ -213,5 +278,11 @@ def _write_env_file(*, is_admin: bool, group_folder: str) -> Path | None:
         vars=list(env_vars.keys()),
     )
     lines = [f"{k}={_shell_quote(v)}" for k, v in env_vars.items()]
-    (env_dir / "env").write_text("\n".join(lines) + "\n")
+    content = "\n".join(lines) + "\n"
+    env_file = env_dir / "env"
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    if _env_hashes.get(env_file) != digest or not env_file.exists():
+        env_dir.mkdir(parents=True, exist_ok=True)
+        env_file.write_text(content)
+        _env_hashes[env_file] = digest
     return env_dir
@@ -16,6 +16,7 @@ import secrets
 import aiohttp
 from aiohttp import web
 
+from pynchy import metrics
 from pynchy.config import get_settings
 from pynchy.logger import logger
 
@@ -32,6 +33,12 @@ _STRIP_RESPONSE_HEADERS = frozenset(
     {"transfer-encoding", "content-encoding", "connection", "keep-alive"}
 )
 
+_UPSTREAM_ERRORS = metrics.counter(
+    "pynchy_gateway_upstream_errors_total",
+    "Builtin gateway requests that failed to reach the provider.",
+    ("provider",),
+)
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -194,6 +201,7 @@ class BuiltinGateway:
                 await response.write_eof()
                 return response
         except aiohttp.ClientError as exc:
+            _UPSTREAM_ERRORS.labels(provider).inc()
             logger.error("Gateway upstream error", provider=provider, err=str(exc))
             return web.Response(status=502, text=f"Gateway error: {type(exc).__name__}")
 
@@ -214,7 +222,9 @@ class BuiltinGateway:
             timeout=aiohttp.ClientTimeout(total=None),
         )
 
-        app = web.Application()
+        app = web.Application(
+            middlewares=[metrics.request_middleware("pynchy_gateway", "builtin LLM gateway")]
+        )
         app.router.add_route("*", "/{path:.*}", self._proxy_handler)
 
         self._runner = web.AppRunner(app)
@@ -23,6 +23,7 @@ from typing import Any
 from pynchy.config import get_settings
 from pynchy.host.container_manager.ipc.handlers_service import _get_plugin_handlers
 from pynchy.host.container_manager.ipc.write import ipc_response_path, write_ipc_response
+from pynchy.host.container_manager.security.approval import remove_pending_approval
 from pynchy.host.container_manager.security.audit import record_security_event
 from pynchy.logger import logger
 
@@ -58,7 +59,7 @@ async def process_approval_decision(
     except (json.JSONDecodeError, OSError) as exc:
         logger.error("Failed to read pending file", path=str(pending_file), err=str(exc))
         decision_file.unlink(missing_ok=True)
-        pending_file.unlink(missing_ok=True)
+        remove_pending_approval(pending_file)
         return
 
     tool_name = pending.get("tool_name", "unknown")
@@ -92,7 +93,7 @@ async def process_approval_decision(
             approved=approved,
         )
 
-        pending_file.unlink(missing_ok=True)
+        remove_pending_approval(pending_file)
         decision_file.unlink(missing_ok=True)
         return
 
@@ -126,7 +127,7 @@ async def process_approval_decision(
         logger.info("Denied request", request_id=request_id, tool_name=tool_name)
 
     # Clean up files
-    pending_file.unlink(missing_ok=True)
+    remove_pending_approval(pending_file)
     decision_file.unlink(missing_ok=True)
 
 
@@ -52,8 +52,9 @@ async def _handle_deploy(
             chat_jid=chat_jid,
         )
 
+    build = None
     if rebuild_container:
-        build = await asyncio.to_thread(build_container_image)
+        build = await asyncio.to_thread(build_container_image, reason="requested by deploy")
         if not build.success and not build.skipped:
             await _deploy_error(
                 deps,
@@ -75,6 +76,7 @@ async def _handle_deploy(
         session_id=session_id,
         resume_prompt=resume_prompt,
         active_sessions=active_sessions,
+        build=build,
     )
 
 
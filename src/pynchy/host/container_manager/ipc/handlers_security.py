@@ -1,8 +1,8 @@
 """IPC handler for bash security checks.
 
-Evaluates bash commands against taint state and the three-tier cascade
-(blacklist -> Cop -> human approval). Called by the container's
-BEFORE_TOOL_USE hook via IPC.
+Evaluates bash commands against taint state and the cascade
+(blacklist -> local classifier -> Cop -> human approval). Called by the
+container's BEFORE_TOOL_USE hook via IPC.
 """
 
 from __future__ import annotations
@@ -13,6 +13,16 @@ from pynchy.host.container_manager.ipc.deps import IpcDeps, resolve_chat_jid
 from pynchy.host.container_manager.ipc.registry import register_prefix
 from pynchy.host.container_manager.ipc.write import ipc_response_path, write_ipc_response
 from pynchy.host.container_manager.security.audit import record_security_event
+from pynchy.host.container_manager.security.bash_classify import (
+    _NETWORK_MULTI,
+    _NETWORK_SINGLE,
+    BashClass,
+    classify_parsed,
+    is_learned_safe,
+    learn_safe,
+    parse_command,
+    record_resolution,
+)
 from pynchy.host.container_manager.security.cop import inspect_bash
 from pynchy.host.container_manager.security.gate import (
     SecurityGate,
@@ -21,65 +31,28 @@ from pynchy.host.container_manager.security.gate import (
 )
 from pynchy.logger import logger
 
-# Inline network-capable check (same logic as container's classify.py).
-# We duplicate rather than import because the container package isn't
-# available on the host.
-_NETWORK_SINGLE: frozenset[str] = frozenset(
-    {
-        "curl",
-        "wget",
-        "nc",
-        "netcat",
-        "ncat",
-        "telnet",
-        "ssh",
-        "scp",
-        "sftp",
-        "rsync",
-        "nslookup",
-        "dig",
-        "host",
-        "ping",
-        "traceroute",
-        "python",
-        "python3",
-        "node",
-        "ruby",
-        "perl",
-        "php",
-        "eval",
-    }
-)
-
-_NETWORK_MULTI: tuple[str, ...] = (
-    "apt-get install",
-    "apt install",
-    "pip install",
-    "npm install",
-    "yarn add",
-    "cargo install",
-    "bash -c",
-    "sh -c",
-)
-
 
 def _is_network_command(command: str) -> bool:
     """Check if command matches network-capable blacklist patterns."""
     cmd_lower = command.lower().strip()
     for pattern in _NETWORK_MULTI:
-        if pattern in cmd_lower:
+        if " ".join(pattern) in cmd_lower:
             return True
     first_token = cmd_lower.split()[0] if cmd_lower.split() else ""
     return first_token in _NETWORK_SINGLE
 
 
-async def evaluate_bash_command(gate: SecurityGate, command: str) -> dict:
+async def evaluate_bash_command(
+    gate: SecurityGate, command: str, *, workspace: str | None = None
+) -> dict:
     """Evaluate a bash command against taint state and classification.
 
-    Three-tier cascade:
+    Cascade:
     1. No taint -> allow (no risk of compromised agent)
     2. Network blacklist hit -> escalate based on taint combo
-    3. Grey zone (not blacklisted) -> Cop reviews, escalate if flagged
+    3. Local classifier: read-only/known-safe commands, or commands the Cop
+       already cleared for ``workspace`` -> allow without a Cop call
+    4. Grey zone -> Cop reviews, escalate if flagged
 
     Returns:
         {"decision": "allow"} or
@@ -93,22 +66,40 @@ async def evaluate_bash_command(gate: SecurityGate, command: str) -> dict:
         return {"decision": "allow"}
 
     both_tainted = policy.corruption_tainted and policy.secret_tainted
-
-    # Tier 2: Network blacklist
-    if _is_network_command(command):
+    parsed = parse_command(command)
+    cls = classify_parsed(parsed) if parsed is not None else BashClass.GREY
+
+    # Tier 2: Network blacklist. Parsed commands use the per-segment
+    # classification (so ``grep "pip install"`` isn't a hit); the substring
+    # check remains the fallback for commands we couldn't parse.
+    is_network = cls == BashClass.NETWORK if parsed is not None else _is_network_command(command)
+    if is_network:
         if both_tainted:
             # Lethal trifecta: corruption + secret + network -> human
+            record_resolution(local=True)
             return {
                 "decision": "needs_human",
                 "reason": f"Network command while corruption+secret tainted: {command[:200]}",
             }
         # Single taint (corruption only) + network -> Cop review
+        record_resolution(local=False)
         verdict = await inspect_bash(command)
         if verdict.flagged:
             return {"decision": "deny", "reason": verdict.reason or "Cop flagged command"}
         return {"decision": "allow"}
 
-    # Tier 3: Grey zone -> Cop review
+    # Tier 3: Local fast path. Test runners execute workspace code, so they
+    # only skip the Cop when a single taint is present.
+    if parsed is not None and (
+        cls == BashClass.LOCAL
+        or (cls == BashClass.CODE and not both_tainted)
+        or (workspace is not None and is_learned_safe(workspace, parsed))
+    ):
+        record_resolution(local=True)
+        return {"decision": "allow"}
+
+    # Tier 4: Grey zone -> Cop review
+    record_resolution(local=False)
     verdict = await inspect_bash(command)
     if verdict.flagged:
         if both_tainted:
@@ -118,6 +109,8 @@ async def evaluate_bash_command(gate: SecurityGate, command: str) -> dict:
             }
         return {"decision": "deny", "reason": verdict.reason or "Cop flagged command"}
 
+    if workspace is not None and parsed is not None:
+        learn_safe(workspace, parsed)
     return {"decision": "allow"}
 
 
@@ -147,7 +140,7 @@ async def _handle_bash_security_check(
 
     chat_jid = resolve_chat_jid(source_group, deps) or "unknown"
 
-    decision = await evaluate_bash_command(gate, command)
+    decision = await evaluate_bash_command(gate, command, workspace=source_group)
 
     if decision["decision"] == "needs_human":
         # Lazy import to avoid circular: security.approval -> ipc._write -> ipc.__init__ -> here
@@ -8,7 +8,7 @@ plugin-provided handlers discovered via the ``pynchy_service_handler`` hook.
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from pynchy.config import get_settings
 from pynchy.host.container_manager.ipc.deps import IpcDeps, resolve_chat_jid
@@ -23,32 +23,62 @@ from pynchy.host.container_manager.security.gate import (
 from pynchy.logger import logger
 from pynchy.plugins import get_plugin_manager
 
-# Lazily populated mapping of tool_name -> async handler from plugins.
+if TYPE_CHECKING:
+    import pluggy
+
+# tool_name -> async handler from plugins.  Built by index_plugin_handlers()
+# when plugins load at boot, or lazily on first use.
 _plugin_handlers: dict[str, Callable[[dict], Awaitable[dict]]] | None = None
+# Optional ``close`` teardowns from the same plugins, run at shutdown.
+_plugin_closers: list[Callable[[], Awaitable[None]]] = []
+
+
+def index_plugin_handlers(
+    pm: pluggy.PluginManager | None = None,
+) -> dict[str, Callable[[dict], Awaitable[dict]]]:
+    """(Re)build the tool_name -> handler index from MCP server plugins.
+
+    Called at boot with the app's plugin manager so the first service
+    request doesn't pay for plugin discovery; call again after plugins
+    change.  Without *pm* a fresh plugin manager is created.
+    """
+    global _plugin_handlers, _plugin_closers  # noqa: PLW0603
+    if pm is None:
+        pm = get_plugin_manager()
+    merged: dict[str, Callable[[dict], Awaitable[dict]]] = {}
+    closers: list[Callable[[], Awaitable[None]]] = []
+    for result in pm.hook.pynchy_service_handler():
+        merged.update(result.get("tools", {}))
+        if result.get("close") is not None:
+            closers.append(result["close"])
+    _plugin_handlers = merged
+    _plugin_closers = closers
+    logger.debug("Indexed service handlers", tools=len(merged))
+    return merged
 
 
 def _get_plugin_handlers() -> dict[str, Callable[[dict], Awaitable[dict]]]:
-    """Collect and cache tool handlers from all MCP server plugins."""
-    global _plugin_handlers  # noqa: PLW0603
+    """Return the plugin handler index, building it on first use."""
     if _plugin_handlers is not None:
         return _plugin_handlers
-
-    pm = get_plugin_manager()
-    merged: dict[str, Callable[[dict], Awaitable[dict]]] = {}
-    for result in pm.hook.pynchy_service_handler():
-        tools = result.get("tools", {})
-        merged.update(tools)
-
-    _plugin_handlers = merged
-    return _plugin_handlers
+    return index_plugin_handlers()
 
 
 def clear_plugin_handler_cache() -> None:
-    """Clear the cached plugin handler mapping (for tests or config reload)."""
+    """Drop the plugin handler index so the next request rebuilds it."""
     global _plugin_handlers  # noqa: PLW0603
     _plugin_handlers = None
 
 
+async def close_plugin_handlers() -> None:
+    """Run the plugins' ``close`` teardowns (at shutdown); failures are logged."""
+    for close in _plugin_closers:
+        try:
+            await close()
+        except Exception:
+            logger.exception("Service handler teardown failed")
+
+
 def _write_response(source_group: str, request_id: str, response: dict) -> None:
     """Write a response file for the container to pick up."""
     write_ipc_response(ipc_response_path(source_group, request_id), response)
@@ -106,7 +136,7 @@ async def _handle_service_request(
     chat_jid = resolve_chat_jid(source_group, deps) or "unknown"
 
     # Evaluate policy — service requests are writes (they perform actions)
-    decision = gate.evaluate_write(tool_name, data)
+    decision = await gate.evaluate_write_async(tool_name, data)
 
     if not decision.allowed:
         await record_security_event(
@@ -1,17 +1,27 @@
-"""Handler registry for IPC task types."""
+"""Handler registry for IPC task types.
+
+Types are either exact (``schedule_task``) or namespaced
+(``service:list_calendar``).  Namespaced handlers are registered per
+namespace and found by splitting the type at its first ``:``, so dispatch
+is a dict lookup whichever form a type takes.
+"""
 
 from __future__ import annotations
 
+import bisect
+import time
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from pynchy.host.container_manager.ipc.deps import IpcDeps
 from pynchy.logger import logger
 
+NAMESPACE_SEPARATOR = ":"
+
 # type -> async handler(data, source_group, is_admin, deps)
 HANDLERS: dict[str, Callable[[dict[str, Any], str, bool, IpcDeps], Awaitable[None]]] = {}
 
-# prefix -> async handler (checked when exact match fails)
+# "<namespace>:" -> async handler (checked when exact match fails)
 PREFIX_HANDLERS: dict[str, Callable[[dict[str, Any], str, bool, IpcDeps], Awaitable[None]]] = {}
 
 
@@ -31,13 +41,31 @@ def register_prefix(
     prefix: str,
     handler: Callable[[dict[str, Any], str, bool, IpcDeps], Awaitable[None]],
 ) -> None:
-    """Register a handler for all IPC types matching a prefix.
+    """Register a handler for every IPC type in a namespace.
 
+    *prefix* is the namespace including its separator (``"service:"``).
     Prefix handlers are checked when no exact match is found.
     """
+    if not prefix.endswith(NAMESPACE_SEPARATOR) or NAMESPACE_SEPARATOR in prefix[:-1]:
+        raise ValueError(
+            f"IPC prefix must be a namespace ending in {NAMESPACE_SEPARATOR!r}: {prefix!r}"
+        )
     PREFIX_HANDLERS[prefix] = handler
 
 
+def resolve_handler(
+    task_type: str,
+) -> Callable[[dict[str, Any], str, bool, IpcDeps], Awaitable[None]] | None:
+    """Return the handler for *task_type*, or None if nothing is registered."""
+    handler = HANDLERS.get(task_type)
+    if handler is not None:
+        return handler
+    sep = task_type.find(NAMESPACE_SEPARATOR)
+    if sep < 0:
+        return None
+    return PREFIX_HANDLERS.get(task_type[: sep + 1])
+
+
 async def dispatch(
     data: dict[str, Any],
     source_group: str,
@@ -46,15 +74,79 @@ async def dispatch(
 ) -> None:
     """Dispatch an IPC task to its registered handler."""
     task_type = data.get("type") or ""
-    handler = HANDLERS.get(task_type)
-    if handler:
-        await handler(data, source_group, is_admin, deps)
+    handler = resolve_handler(task_type)
+    if handler is None:
+        _record(_UNKNOWN_TYPE, 0.0, ok=False)
+        logger.warning("Unknown IPC task type", type=task_type)
         return
 
-    # Check prefix handlers
-    for prefix, prefix_handler in PREFIX_HANDLERS.items():
-        if task_type.startswith(prefix):
-            await prefix_handler(data, source_group, is_admin, deps)
-            return
+    started = time.monotonic()
+    ok = False
+    try:
+        await handler(data, source_group, is_admin, deps)
+        ok = True
+    finally:
+        _record(task_type, time.monotonic() - started, ok=ok)
+
+
+# ---------------------------------------------------------------------------
+# Per-type dispatch stats (served in the "ipc" section of /status)
+# ---------------------------------------------------------------------------
+
+# Upper bounds (ms) of the latency histogram buckets; a final bucket
+# catches everything slower.
+_LATENCY_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+# Unregistered types, and any new type once _MAX_TRACKED_TYPES are
+# tracked, are counted together so a misbehaving container can't grow the
+# table without bound (namespaced types carry container-chosen suffixes).
+_UNKNOWN_TYPE = "<unknown>"
+_OTHER_TYPE = "<other>"
+_MAX_TRACKED_TYPES = 256
+
+
+class _TypeStats:
+    __slots__ = ("count", "errors", "total_s", "max_s", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self.buckets = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+
+
+_stats: dict[str, _TypeStats] = {}
+
+
+def _record(task_type: str, elapsed_s: float, *, ok: bool) -> None:
+    stats = _stats.get(task_type)
+    if stats is None:
+        if len(_stats) >= _MAX_TRACKED_TYPES:
+            task_type = _OTHER_TYPE
+        stats = _stats.setdefault(task_type, _TypeStats())
+    stats.count += 1
+    if not ok:
+        stats.errors += 1
+    stats.total_s += elapsed_s
+    stats.max_s = max(stats.max_s, elapsed_s)
+    stats.buckets[bisect.bisect_left(_LATENCY_BUCKETS_MS, elapsed_s * 1000)] += 1
+
+
+def get_dispatch_stats() -> dict[str, dict[str, Any]]:
+    """Per-type dispatch counts, errors and latency histograms."""
+    labels = [f"le_{b}ms" for b in _LATENCY_BUCKETS_MS] + ["slower"]
+    return {
+        task_type: {
+            "count": s.count,
+            "errors": s.errors,
+            "avg_ms": round(1000 * s.total_s / s.count, 2) if s.count else 0.0,
+            "max_ms": round(1000 * s.max_s, 2),
+            "histogram": dict(zip(labels, s.buckets, strict=True)),
+        }
+        for task_type, s in sorted(_stats.items())
+    }
+
 
-    logger.warning("Unknown IPC task type", type=task_type)
+def reset_dispatch_stats() -> None:
+    _stats.clear()
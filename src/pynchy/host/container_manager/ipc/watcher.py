@@ -8,12 +8,14 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import time
 from pathlib import Path
 from typing import Any
 
 from watchdog.events import FileCreatedEvent, FileMovedEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from pynchy import metrics
 from pynchy.config import get_settings
 from pynchy.host.container_manager.ipc.deps import IpcDeps
 from pynchy.host.container_manager.ipc.protocol import parse_ipc_file, validate_signal
@@ -25,6 +27,19 @@ from pynchy.logger import logger
 _ipc_watcher_lock = asyncio.Lock()
 _ipc_watcher_running = False
 
+_FILES = metrics.counter(
+    "pynchy_ipc_files_total", "IPC files processed by the watcher queue.", ("kind",)
+)
+_FILE_SECONDS = metrics.histogram(
+    "pynchy_ipc_file_seconds", "Time to process one IPC file, handler included.", ("kind",)
+)
+_ERROR_FILES = metrics.counter(
+    "pynchy_ipc_error_files_total", "IPC files moved aside to errors/ after a failure."
+)
+_QUEUE_DEPTH = metrics.gauge(
+    "pynchy_ipc_queue_depth", "IPC file events waiting in the watcher queue."
+)
+
 
 def _move_to_error_dir(ipc_base_dir: Path, source_group: str, file_path: Path) -> None:
     """Move a failed IPC file to the errors/ directory for later inspection.
@@ -32,6 +47,7 @@ def _move_to_error_dir(ipc_base_dir: Path, source_group: str, file_path: Path) -
     Safe to call inside ``except`` blocks — catches its own OSError so a
     failed move never masks the original error or escapes the handler.
     """
+    _ERROR_FILES.inc()
     try:
         error_dir = ipc_base_dir / "errors"
         error_dir.mkdir(parents=True, exist_ok=True)
@@ -151,6 +167,20 @@ def _signal_query_done(group_folder: str) -> None:
     session.signal_query_done()
 
 
+def _log_cold_start(source_group: str, startup: object) -> None:
+    """Log the agent-runner's cold-start milestones (``{name: ms}``).
+
+    The timeline comes from the container, so anything but a dict of ints
+    is logged as malformed rather than trusted.
+    """
+    if isinstance(startup, dict) and all(
+        isinstance(v, int) and not isinstance(v, bool) for v in startup.values()
+    ):
+        logger.info("Agent cold start", group=source_group, startup=startup)
+    else:
+        logger.warning("Malformed startup timeline from agent", group=source_group)
+
+
 async def _process_output_file(
     file_path: Path,
     source_group: str,
@@ -169,6 +199,8 @@ async def _process_output_file(
     try:
         json_str = file_path.read_text()
         output = _parse_container_output(json_str)
+        if output.startup:
+            _log_cold_start(source_group, output.startup)
 
         # Dispatch to the session's output handler
         handler = _get_output_handler(source_group)
@@ -400,8 +432,11 @@ async def _process_queue(
     deps: IpcDeps,
 ) -> None:
     """Consume the event queue and dispatch IPC files."""
+    _QUEUE_DEPTH.set_function(queue.qsize)
     while True:
         file_path = await queue.get()
+        started = time.perf_counter()
+        subdir = ""
         try:
             if not file_path.exists():
                 continue
@@ -434,6 +469,9 @@ async def _process_queue(
                 file=str(file_path),
             )
         finally:
+            if subdir:
+                _FILES.labels(subdir).inc()
+                _FILE_SECONDS.labels(subdir).observe(time.perf_counter() - started)
             queue.task_done()
 
 
@@ -16,6 +16,7 @@ import time
 from pathlib import Path
 from typing import Any
 
+from pynchy import tracing
 from pynchy.config import get_settings
 from pynchy.utils import write_json_atomic
 
@@ -31,11 +32,16 @@ def write_ipc_message(group_folder: str, text: str) -> None:
     """Write a JSON message file to a group's IPC input directory.
 
     Uses atomic write (tmp → rename) so the container's file watcher
-    never sees a partially-written file.
+    never sees a partially-written file.  The current trace ID, if any,
+    rides along so the container can tag the reply's output with it.
     """
     input_dir = _ipc_input_dir(group_folder)
     filename = f"{int(time.time() * 1000)}-{random.randbytes(3).hex()}.json"
-    write_json_atomic(input_dir / filename, {"type": "message", "text": text})
+    data = {"type": "message", "text": text}
+    trace_id = tracing.current_trace_id()
+    if trace_id:
+        data["trace_id"] = trace_id
+    write_json_atomic(input_dir / filename, data)
 
 
 def write_ipc_close_sentinel(group_folder: str) -> None:
@@ -22,6 +22,7 @@ from typing import Any
 import aiohttp
 from aiohttp import web
 
+from pynchy import metrics
 from pynchy.host.container_manager.security.approval import (
     APPROVAL_TIMEOUT_SECONDS,
     register_mcp_proxy_approval,
@@ -73,7 +74,7 @@ def create_proxy_app(
             triggers needs_human, the proxy calls this to write the pending
             file and broadcast to chat, then blocks until the human responds.
     """
-    app = web.Application()
+    app = web.Application(middlewares=[metrics.request_middleware("pynchy_mcp_proxy", "MCP proxy")])
     app[_STATE_KEY] = _ProxyState(
         instance_urls=instance_urls,
         trust_map=trust_map or {},
@@ -140,7 +141,7 @@ async def _proxy_handler(request: web.Request) -> web.Response:
         rpc = {}
 
     if rpc.get("method") == "tools/call":
-        decision = gate.evaluate_write(instance_id, rpc.get("params", {}))
+        decision = await gate.evaluate_write_async(instance_id, rpc.get("params", {}))
         if not decision.allowed:
             return web.json_response({"error": f"Policy denied: {decision.reason}"}, status=403)
         if decision.needs_human:
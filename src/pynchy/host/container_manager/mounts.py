@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import compileall
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,8 +16,43 @@ from pynchy.host.container_manager.security.mount_security import validate_addit
 from pynchy.host.container_manager.session_prep import _sync_skills, _write_settings_json
 from pynchy.host.git_ops.repo import RepoContext
 from pynchy.host.orchestrator.workspace_config import load_resolved_config
+from pynchy.logger import logger
 from pynchy.types import VolumeMount, WorkspaceProfile
 
+# Interpreter version of the agent image (``FROM python:3.13-slim``).
+_AGENT_IMAGE_PYTHON = (3, 13)
+
+
+def _agent_runner_src() -> Path:
+    return get_settings().project_root / "src" / "pynchy" / "agent" / "agent_runner" / "src"
+
+
+def precompile_agent_runner() -> bool:
+    """Write ``__pycache__`` bytecode for the bind-mounted agent-runner source.
+
+    The container mounts ``/app/src`` read-only and runs as a non-root user,
+    so it can never cache bytecode itself — every cold start would recompile
+    every module it imports.  Compiling on the host puts the ``.pyc`` files
+    next to the source, where the container finds them through the mount.
+
+    Skipped when the host interpreter differs from the image's, since the
+    container would ignore bytecode tagged for another version.  Returns
+    True if compilation ran and succeeded.
+    """
+    if sys.version_info[:2] != _AGENT_IMAGE_PYTHON:
+        logger.debug(
+            "Skipping agent-runner precompile: host Python differs from image",
+            host=f"{sys.version_info[0]}.{sys.version_info[1]}",
+        )
+        return False
+    src = _agent_runner_src()
+    if not src.is_dir():
+        return False
+    ok = bool(compileall.compile_dir(str(src), quiet=1))
+    if not ok:
+        logger.warning("Agent-runner precompile reported errors", path=str(src))
+    return ok
+
 
 def _build_volume_mounts(
     group: WorkspaceProfile,
@@ -81,8 +118,7 @@ def _build_volume_mounts(
         mounts.append(VolumeMount(str(env_dir), "/workspace/env-dir", readonly=True))
 
     # Agent-runner source (read-only, Python source for container)
-    agent_runner_src = s.project_root / "src" / "pynchy" / "agent" / "agent_runner" / "src"
-    mounts.append(VolumeMount(str(agent_runner_src), "/app/src", readonly=True))
+    mounts.append(VolumeMount(str(_agent_runner_src()), "/app/src", readonly=True))
 
     # Admin groups get a read-write mount of the actual host repo root.
     # This gives them direct access to config.toml, data/, other worktrees, etc.
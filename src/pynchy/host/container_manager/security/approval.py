@@ -14,6 +14,10 @@ Each file represents a PENDING state in the approval state machine:
 
     startup sweep: auto-deny stale pending files, clean orphaned decisions
 
+The files are the durable store. Lookups go through an in-memory
+write-through index (``_index``) keyed by request_id and short_id, rebuilt
+from disk by the startup sweep and kept in sync by create/remove/sweep.
+
 See docs/plans/2026-02-24-human-approval-gate-design.md
 """
 
@@ -34,6 +38,7 @@ from pynchy.host.container_manager.ipc.write import (
 )
 from pynchy.host.container_manager.security.audit import record_security_event
 from pynchy.logger import logger
+from pynchy.utils import PendingFileIndex
 
 # Alphabet for short approval IDs: lowercase + digits = 36 chars.
 # 2-char IDs give 1296 combinations — more than enough for the handful
@@ -88,9 +93,17 @@ _INTERNAL_FIELDS = frozenset({"type", "request_id", "source_group"})
 _MAX_DETAIL_LEN = 100
 
 
+# In-memory mirror of every pending_approvals/*.json file across groups.
+_index = PendingFileIndex("pending_approvals", keys=("short_id",))
+
+
 # -- Directory helpers ---------------------------------------------------------
 
 
+def _ipc_dir() -> Path:
+    return get_settings().data_dir / "ipc"
+
+
 def _pending_approvals_dir(source_group: str) -> Path:
     """Return the pending_approvals directory for a group, creating it if needed."""
     d = get_settings().data_dir / "ipc" / source_group / "pending_approvals"
@@ -111,19 +124,12 @@ def _approval_decisions_dir(source_group: str) -> Path:
 def generate_short_id(source_group: str) -> str:
     """Generate a unique 2-char [a-z0-9] short ID for an approval request.
 
-    Checks for collisions against existing pending approvals in the group.
-    With 1296 possible IDs and typically 0-3 concurrent approvals, collisions
-    are rare but handled gracefully.
+    Checks for collisions against every pending approval (short IDs are
+    looked up globally by ``approve <id>``). With 1296 possible IDs and
+    typically 0-3 concurrent approvals, collisions are rare but handled
+    gracefully.
     """
-    pending_dir = _pending_approvals_dir(source_group)
-    existing: set[str] = set()
-    for filepath in pending_dir.glob("*.json"):
-        try:
-            data = json.loads(filepath.read_text())
-            if "short_id" in data:
-                existing.add(data["short_id"])
-        except (json.JSONDecodeError, OSError):
-            continue
+    existing = _index.values_for(_ipc_dir(), "short_id")
 
     for _ in range(100):
         candidate = "".join(random.choices(_SHORT_ID_ALPHABET, k=2))
@@ -174,6 +180,7 @@ def create_pending_approval(
     }
 
     write_json_atomic(pending_dir / f"{request_id}.json", data, indent=2)
+    _index.put(_ipc_dir(), data)
 
     logger.info(
         "Pending approval created",
@@ -187,79 +194,41 @@ def create_pending_approval(
 
 
 def list_pending_approvals(group: str | None = None) -> list[dict]:
-    """List all pending approval files, optionally filtered by group.
+    """List all pending approvals, optionally filtered by group.
 
-    Returns parsed dicts sorted by timestamp (oldest first).
+    Returns dicts sorted by timestamp (oldest first).
     """
-    s = get_settings()
-    ipc_dir = s.data_dir / "ipc"
-
-    if not ipc_dir.exists():
-        return []
-
-    results: list[dict] = []
-
-    groups = (
-        [group]
-        if group
-        else [f.name for f in ipc_dir.iterdir() if f.is_dir() and f.name != "errors"]
-    )
-
-    for grp in groups:
-        pending_dir = ipc_dir / grp / "pending_approvals"
-        if not pending_dir.exists():
-            continue
-        for filepath in pending_dir.glob("*.json"):
-            try:
-                data = json.loads(filepath.read_text())
-                results.append(data)
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning(
-                    "Failed to read pending approval",
-                    path=str(filepath),
-                    err=str(exc),
-                )
-
+    results = _index.list(_ipc_dir(), group)
     results.sort(key=lambda d: d.get("timestamp", ""))
     return results
 
 
 def find_pending_by_short_id(short_id: str) -> dict | None:
-    """Find a pending approval matching the given short ID.
+    """Find a pending approval matching the given short ID."""
+    return _index.find(_ipc_dir(), "short_id", short_id)
 
-    Scans file contents for the ``short_id`` field. With typically 0-3
-    pending approvals across all groups, this is fast enough.
+
+def remove_pending_approval(pending_file: Path) -> None:
+    """Delete a pending approval file and drop it from the index.
+
+    Takes the file path (``ipc/<group>/pending_approvals/<request_id>.json``)
+    so callers that already resolved it don't need settings again.
     """
-    s = get_settings()
-    ipc_dir = s.data_dir / "ipc"
-    if not ipc_dir.exists():
-        return None
-
-    for group_dir in ipc_dir.iterdir():
-        if not group_dir.is_dir() or group_dir.name == "errors":
-            continue
-        pending_dir = group_dir / "pending_approvals"
-        if not pending_dir.exists():
-            continue
-        for filepath in pending_dir.glob("*.json"):
-            try:
-                data = json.loads(filepath.read_text())
-                if data.get("short_id") == short_id:
-                    return data
-            except (json.JSONDecodeError, OSError):
-                continue
-    return None
+    pending_file.unlink(missing_ok=True)
+    _index.discard(pending_file.parent.parent.parent, pending_file.stem)
 
 
 async def sweep_expired_approvals() -> list[dict]:
     """Find and auto-deny expired pending approvals. Clean orphaned decisions.
 
     Called on startup (crash recovery) and optionally on a slow timer.
+    Rebuilds the in-memory index from disk afterwards.
     Returns list of expired approval dicts.
     """
     s = get_settings()
     ipc_dir = s.data_dir / "ipc"
     if not ipc_dir.exists():
+        _index.rebuild(ipc_dir)
         return []
 
     now = datetime.now(UTC)
@@ -321,6 +290,7 @@ async def sweep_expired_approvals() -> list[dict]:
                     logger.info("Removing orphaned decision file", path=str(filepath))
                     filepath.unlink(missing_ok=True)
 
+    _index.rebuild(ipc_dir)
     return expired
 
 
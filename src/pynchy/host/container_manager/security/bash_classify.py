@@ -0,0 +1,631 @@
+"""Host-side fast-path classifier for the bash security gate.
+
+Sits between the taint check and the Cop in ``evaluate_bash_command``.
+Parses a command into simple commands (argv lists separated by shell
+operators) and decides locally when the outcome is obvious:
+
+- LOCAL: every simple command is read-only or a known-safe invocation
+  (``ls``, ``grep``, ``git status``, ``pip list``...), with no file-writing
+  redirect and no env prefix beyond locale/terminal settings.
+- CODE: like LOCAL, but a test runner (``pytest``) executes workspace code.
+- NETWORK: a segment is a known network-capable command.
+- GREY: anything else, including constructs we refuse to reason about
+  (command/process substitution, heredocs, subshells) — the Cop decides.
+
+The container runs its own (coarser) classifier in
+``agent_runner.security.classify``; the host only sees commands the
+container escalated, so this module is where the Cop round trip is saved.
+
+Learned patterns are exact normalized commands the Cop cleared (checked
+by the handler before escalating), stored
+per workspace under ``data/security/bash_patterns/`` (deliberately outside
+the container-mounted ``ipc/`` tree so an agent can't teach itself).
+"""
+
+from __future__ import annotations
+
+import json
+import shlex
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+
+from pynchy.config import get_settings
+from pynchy.logger import logger
+from pynchy.utils import write_json_atomic
+
+
+class BashClass(StrEnum):
+    LOCAL = "local"
+    CODE = "code"  # known-safe, but executes workspace code (test runners)
+    NETWORK = "network"
+    GREY = "grey"
+
+
+# Read-only / provably local commands. Mirrors the container's
+# PROVABLY_LOCAL list, minus commands that execute other commands
+# (xargs, find -exec) or whose scripts can (awk's system(), sed's e/w),
+# plus a few shell builtins.
+_READ_ONLY: frozenset[str] = frozenset(
+    {
+        "[",
+        "base64",
+        "basename",
+        "bc",
+        "cal",
+        "cat",
+        "cd",
+        "column",
+        "comm",
+        "cut",
+        "date",
+        "df",
+        "diff",
+        "dirname",
+        "du",
+        "echo",
+        "expand",
+        "expr",
+        "false",
+        "fd",
+        "file",
+        "find",
+        "fmt",
+        "fold",
+        "free",
+        "grep",
+        "head",
+        "hexdump",
+        "id",
+        "iconv",
+        "jq",
+        "less",
+        "locale",
+        "ls",
+        "lscpu",
+        "md5sum",
+        "mktemp",
+        "nl",
+        "nproc",
+        "od",
+        "paste",
+        "printf",
+        "pwd",
+        "readelf",
+        "realpath",
+        "rev",
+        "rg",
+        "seq",
+        "sha256sum",
+        "sort",
+        "stat",
+        "strings",
+        "tac",
+        "tail",
+        "test",
+        "tr",
+        "tree",
+        "true",
+        "type",
+        "uname",
+        "unexpand",
+        "uniq",
+        "uptime",
+        "wc",
+        "which",
+        "whoami",
+        "xxd",
+    }
+)
+
+# find actions that run, delete or write files — never local fast-path.
+_FIND_EXEC_FLAGS: frozenset[str] = frozenset(
+    {"-exec", "-execdir", "-ok", "-okdir", "-delete", "-fprint", "-fprint0", "-fprintf", "-fls"}
+)
+
+# Per-command flags that run a program or write a file, making an otherwise
+# read-only command GREY.  Short flags also match inside a cluster (-uo).
+_UNSAFE_FLAGS: dict[str, frozenset[str]] = {
+    "fd": frozenset({"-x", "--exec", "-X", "--exec-batch"}),
+    "file": frozenset({"-C", "--compile"}),
+    "iconv": frozenset({"-o", "--output"}),
+    "rg": frozenset({"--pre"}),
+    "sort": frozenset({"-o", "--output", "--compress-program"}),
+    "tree": frozenset({"-o"}),
+    "xxd": frozenset({"-r", "-revert"}),
+}
+
+# xxd options that consume the next token (so it isn't an infile/outfile).
+_XXD_VALUE_OPTIONS: frozenset[str] = frozenset(
+    {"-c", "-cols", "-g", "-groupsize", "-l", "-len", "-n", "-name", "-o", "-offset", "-s", "-seek"}
+)
+
+# git subcommands that only read the local repository.
+_GIT_READ_ONLY: frozenset[str] = frozenset(
+    {
+        "blame",
+        "cat-file",
+        "describe",
+        "diff",
+        "grep",
+        "help",
+        "log",
+        "ls-files",
+        "merge-base",
+        "name-rev",
+        "reflog",
+        "rev-list",
+        "rev-parse",
+        "shortlog",
+        "show",
+        "show-ref",
+        "status",
+        "version",
+    }
+)
+
+# `git branch` flags that only list branches; anything else (-d, -m, a new
+# branch name...) mutates refs.
+_GIT_BRANCH_LISTING: frozenset[str] = frozenset(
+    {"-a", "--all", "-r", "--remotes", "-v", "-vv", "--verbose", "--show-current", "--no-color"}
+)
+
+# `uv run` options that consume the next token (so it isn't the command).
+_UV_RUN_VALUE_OPTIONS: frozenset[str] = frozenset(
+    {
+        "--with",
+        "--with-editable",
+        "--with-requirements",
+        "--python",
+        "-p",
+        "--project",
+        "--directory",
+        "--package",
+        "--extra",
+        "--group",
+        "--env-file",
+        "--index",
+        "--default-index",
+        "--index-url",
+        "--extra-index-url",
+    }
+)
+
+# (command, subcommand) pairs that only list installed packages.
+_PACKAGE_LISTING: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("pip", "list"),
+        ("pip", "show"),
+        ("pip", "freeze"),
+        ("pip3", "list"),
+        ("pip3", "show"),
+        ("pip3", "freeze"),
+        ("npm", "list"),
+        ("npm", "ls"),
+        ("uv", "tree"),
+    }
+)
+
+# Same lists as the container classifier; also used by
+# handlers_security._is_network_command for commands that don't parse.
+_NETWORK_SINGLE: frozenset[str] = frozenset(
+    {
+        "curl",
+        "wget",
+        "nc",
+        "netcat",
+        "ncat",
+        "telnet",
+        "ssh",
+        "scp",
+        "sftp",
+        "rsync",
+        "nslookup",
+        "dig",
+        "host",
+        "ping",
+        "traceroute",
+        "python",
+        "python3",
+        "node",
+        "ruby",
+        "perl",
+        "php",
+        "eval",
+    }
+)
+
+_NETWORK_MULTI: frozenset[tuple[str, str]] = frozenset(
+    {
+        ("apt-get", "install"),
+        ("apt", "install"),
+        ("pip", "install"),
+        ("npm", "install"),
+        ("yarn", "add"),
+        ("cargo", "install"),
+        ("bash", "-c"),
+        ("sh", "-c"),
+    }
+)
+
+# Substrings that make a command opaque to token-level analysis.
+_OPAQUE_MARKERS: tuple[str, ...] = ("`", "$(", "<(", ">(", "<<")
+
+_SEPARATORS: frozenset[str] = frozenset({"|", "||", "&&", ";", "&", "|&"})
+_REDIRECTS: frozenset[str] = frozenset({">", ">>", "<", ">&", "&>", "&>>", ">|", "<>", "<&"})
+_INPUT_REDIRECTS: frozenset[str] = frozenset({"<", "<&"})
+
+# Env prefixes that can't change what a read-only command executes or
+# writes. Anything else (PAGER, GIT_*, LD_PRELOAD...) goes to the Cop.
+_SAFE_ENV: frozenset[str] = frozenset(
+    {"LANG", "LANGUAGE", "TZ", "NO_COLOR", "FORCE_COLOR", "COLUMNS", "LINES", "TERM"}
+)
+
+# Max learned patterns kept per workspace (oldest evicted first).
+MAX_LEARNED_PATTERNS = 500
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class SimpleCommand:
+    """One command in a pipeline/chain.
+
+    ``argv`` excludes the ``VAR=value`` prefixes (kept in ``env``) and
+    redirections (kept in ``redirects`` as ``(operator, target)``).
+    """
+
+    argv: tuple[str, ...]
+    env: tuple[str, ...] = ()
+    redirects: tuple[tuple[str, str], ...] = ()
+
+    @property
+    def name(self) -> str:
+        return self.argv[0].rsplit("/", 1)[-1] if self.argv else ""
+
+    def normalized(self) -> str:
+        parts = [shlex.join((*self.env, *self.argv))]
+        parts.extend(f"{op} {shlex.quote(target)}" for op, target in self.redirects)
+        return " ".join(parts)
+
+
+@dataclass(frozen=True)
+class ParsedCommand:
+    """A bash command line split into simple commands."""
+
+    commands: tuple[SimpleCommand, ...]
+    operators: tuple[str, ...]  # separators between consecutive commands
+
+    @property
+    def redirect_targets(self) -> tuple[str, ...]:
+        return tuple(target for cmd in self.commands for _, target in cmd.redirects)
+
+    def normalized(self) -> str:
+        """Canonical form used as the learned-pattern key.
+
+        Env prefixes and redirects are part of the key, so clearing
+        ``cmd`` doesn't also clear ``LD_PRELOAD=x cmd`` or ``cmd > file``.
+        """
+        parts = [self.commands[0].normalized()]
+        for op, cmd in zip(self.operators, self.commands[1:], strict=False):
+            parts.append(op)
+            parts.append(cmd.normalized())
+        return " ".join(parts)
+
+
+def parse_command(command: str) -> ParsedCommand | None:
+    """Parse a command line, or return None if it can't be reasoned about.
+
+    Returns None for substitutions, heredocs, subshells and unbalanced
+    quoting — those always go to the Cop.
+    """
+    if any(marker in command for marker in _OPAQUE_MARKERS):
+        return None
+
+    lexer = shlex.shlex(command.replace("\n", " ; "), posix=True, punctuation_chars=True)
+    lexer.whitespace_split = True
+    try:
+        tokens = list(lexer)
+    except ValueError:
+        return None
+
+    commands: list[SimpleCommand] = []
+    operators: list[str] = []
+    current: list[str] = []
+    env: list[str] = []
+    redirects: list[tuple[str, str]] = []
+    pending_redirect: str | None = None
+
+    def finish() -> bool:
+        if not current:
+            return not env and not redirects  # bare assignments/redirects: unmodelled
+        commands.append(SimpleCommand(tuple(current), tuple(env), tuple(redirects)))
+        current.clear()
+        env.clear()
+        redirects.clear()
+        return True
+
+    for token in tokens:
+        if pending_redirect is not None:
+            if token in _SEPARATORS or token in _REDIRECTS:
+                return None
+            redirects.append((pending_redirect, token))
+            pending_redirect = None
+            continue
+        if token in _SEPARATORS:
+            had_command = bool(current)
+            if not finish():
+                return None
+            if had_command:
+                operators.append(token)
+        elif token in _REDIRECTS:
+            # "2>" lexes as "2", ">" — the fd number belongs to the operator.
+            if current and current[-1].isdigit():
+                token = current.pop() + token
+            pending_redirect = token
+        elif token in ("(", ")") or set(token) <= set("();<>|&"):
+            return None  # subshells and operators we don't model
+        elif not current and "=" in token and not token.startswith("="):
+            env.append(token)  # env var prefix: VAR=value cmd
+        else:
+            current.append(token)
+
+    if pending_redirect is not None or not finish():
+        return None
+    if not commands:
+        return None
+    return ParsedCommand(tuple(commands), tuple(operators))
+
+
+# ---------------------------------------------------------------------------
+# Classification
+# ---------------------------------------------------------------------------
+
+
+def _git_subcommand(argv: tuple[str, ...]) -> str | None:
+    """Return the git subcommand, skipping harmless global options.
+
+    ``-c`` (arbitrary config, e.g. core.sshCommand) makes it unknowable.
+    """
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "-c" or arg.startswith(("--config-env", "--exec-path")):
+            return None
+        if arg == "-C":
+            i += 2
+            continue
+        if arg.startswith("-"):
+            i += 1
+            continue
+        return arg
+    return None
+
+
+def _is_git_branch_listing(args: tuple[str, ...]) -> bool:
+    """True for ``git branch`` forms that only list (no names, no -d/-m/...)."""
+    return all(
+        a in _GIT_BRANCH_LISTING or a.startswith(("--sort=", "--format=", "--color=")) for a in args
+    )
+
+
+def _uv_run_command(argv: tuple[str, ...]) -> tuple[str, ...]:
+    """The command ``uv run [opts] cmd ...`` runs, skipping option values."""
+    i = 2
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--":
+            return argv[i + 1 :]
+        if not arg.startswith("-"):
+            return argv[i:]
+        i += 2 if arg in _UV_RUN_VALUE_OPTIONS else 1
+    return ()
+
+
+def _is_pytest(argv: tuple[str, ...]) -> bool:
+    name = SimpleCommand(argv).name
+    if name == "pytest":
+        return True
+    if name in ("python", "python3") and argv[1:3] == ("-m", "pytest"):
+        return True
+    if name == "uv" and len(argv) > 2 and argv[1] == "run":
+        command = _uv_run_command(argv)
+        return bool(command) and _is_pytest(command)
+    return False
+
+
+def _has_flag(args: tuple[str, ...], flags: frozenset[str]) -> bool:
+    """True if any of *flags* appears in *args* (``--opt=value`` and ``-xy`` forms too)."""
+    for arg in args:
+        if arg == "--":
+            return False
+        if arg.startswith("--"):
+            if arg.split("=", 1)[0] in flags:
+                return True
+        elif arg.startswith("-") and (arg in flags or any(f"-{c}" in flags for c in arg[1:])):
+            return True
+    return False
+
+
+def _xxd_writes(args: tuple[str, ...]) -> bool:
+    """``xxd infile outfile`` writes *outfile*."""
+    operands = 0
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg in _XXD_VALUE_OPTIONS:
+            skip = True
+        elif not arg.startswith("-") or arg == "-":
+            operands += 1
+    return operands > 1
+
+
+def _is_safe_env(assignment: str) -> bool:
+    var = assignment.split("=", 1)[0]
+    return var in _SAFE_ENV or var.startswith("LC_")
+
+
+def _is_write_redirect(op: str, target: str) -> bool:
+    """True for redirects that write a file (``/dev/null`` and fd dups excepted)."""
+    op = op.lstrip("0123456789")
+    if op in _INPUT_REDIRECTS:
+        return False
+    if op == ">&" and (target.isdigit() or target == "-"):
+        return False  # 2>&1: duplicate a descriptor
+    return target != "/dev/null"
+
+
+def _classify_simple(cmd: SimpleCommand) -> BashClass:
+    argv = cmd.argv
+    name = cmd.name
+    sub = argv[1] if len(argv) > 1 else ""
+
+    if any(target.startswith(("/dev/tcp/", "/dev/udp/")) for _, target in cmd.redirects):
+        return BashClass.NETWORK
+    if (name, sub) in _NETWORK_MULTI:
+        return BashClass.NETWORK
+    if _is_pytest(argv):
+        return BashClass.CODE
+    if name in _NETWORK_SINGLE:
+        return BashClass.NETWORK
+    # Env and redirects can make any "read-only" command execute or write
+    # (GIT_EXTERNAL_DIFF, LD_PRELOAD, `> .git/config`).
+    if not all(_is_safe_env(a) for a in cmd.env):
+        return BashClass.GREY
+    if any(_is_write_redirect(op, target) for op, target in cmd.redirects):
+        return BashClass.GREY
+    if name == "find":
+        return BashClass.GREY if _FIND_EXEC_FLAGS.intersection(argv) else BashClass.LOCAL
+    if name in _READ_ONLY:
+        unsafe = _UNSAFE_FLAGS.get(name)
+        if unsafe is not None and _has_flag(argv[1:], unsafe):
+            return BashClass.GREY
+        if name == "xxd" and _xxd_writes(argv[1:]):
+            return BashClass.GREY
+        return BashClass.LOCAL
+    if name == "git":
+        return _classify_git(argv)
+    if (name, sub) in _PACKAGE_LISTING:
+        return BashClass.LOCAL
+    return BashClass.GREY
+
+
+def _classify_git(argv: tuple[str, ...]) -> BashClass:
+    sub = _git_subcommand(argv)
+    args = argv[argv.index(sub) + 1 :] if sub is not None else ()
+    # --output=<file> (diff, log, show...) writes wherever it's told to;
+    # --ext-diff runs the configured external diff program
+    if any(a.startswith(("--output", "--ext-diff")) for a in args):
+        return BashClass.GREY
+    if sub == "branch":
+        return BashClass.LOCAL if _is_git_branch_listing(args) else BashClass.GREY
+    return BashClass.LOCAL if sub in _GIT_READ_ONLY else BashClass.GREY
+
+
+def classify_parsed(parsed: ParsedCommand) -> BashClass:
+    """Classify a parsed command: the most dangerous segment wins."""
+    result = BashClass.LOCAL
+    for cmd in parsed.commands:
+        cls = _classify_simple(cmd)
+        if cls == BashClass.NETWORK:
+            return BashClass.NETWORK
+        if cls == BashClass.GREY:
+            result = BashClass.GREY
+        elif cls == BashClass.CODE and result == BashClass.LOCAL:
+            result = BashClass.CODE
+    return result
+
+
+def classify_bash(command: str) -> BashClass:
+    """Parse and classify a command line (GREY when it can't be parsed)."""
+    parsed = parse_command(command)
+    if parsed is None:
+        return BashClass.GREY
+    return classify_parsed(parsed)
+
+
+# ---------------------------------------------------------------------------
+# Learned safe patterns (per workspace)
+# ---------------------------------------------------------------------------
+
+# workspace -> normalized command -> None (OrderedDict as an LRU set)
+_learned: dict[str, OrderedDict[str, None]] = {}
+
+
+def _patterns_path(workspace: str) -> Path:
+    return get_settings().data_dir / "security" / "bash_patterns" / f"{workspace}.json"
+
+
+def _load_patterns(workspace: str) -> OrderedDict[str, None]:
+    patterns = _learned.get(workspace)
+    if patterns is not None:
+        return patterns
+    patterns = OrderedDict()
+    path = _patterns_path(workspace)
+    if path.exists():
+        try:
+            for item in json.loads(path.read_text())[-MAX_LEARNED_PATTERNS:]:
+                patterns[str(item)] = None
+        except (json.JSONDecodeError, OSError, TypeError) as exc:
+            logger.warning("Failed to load learned bash patterns", path=str(path), err=str(exc))
+    _learned[workspace] = patterns
+    return patterns
+
+
+def is_learned_safe(workspace: str, parsed: ParsedCommand) -> bool:
+    """True if the Cop already cleared this exact command for the workspace."""
+    patterns = _load_patterns(workspace)
+    key = parsed.normalized()
+    if key in patterns:
+        patterns.move_to_end(key)
+        return True
+    return False
+
+
+def learn_safe(workspace: str, parsed: ParsedCommand) -> None:
+    """Remember a Cop-cleared grey-zone command for this workspace."""
+    patterns = _load_patterns(workspace)
+    patterns[parsed.normalized()] = None
+    patterns.move_to_end(parsed.normalized())
+    while len(patterns) > MAX_LEARNED_PATTERNS:
+        patterns.popitem(last=False)
+    try:
+        write_json_atomic(_patterns_path(workspace), list(patterns))
+    except OSError as exc:
+        logger.warning("Failed to persist learned bash patterns", err=str(exc))
+
+
+def clear_learned_patterns() -> None:
+    """Drop the in-memory pattern cache (tests, config reload)."""
+    _learned.clear()
+
+
+# ---------------------------------------------------------------------------
+# Stats — how often the Cop round trip was avoided
+# ---------------------------------------------------------------------------
+
+_stats: dict[str, int] = {"local": 0, "cop": 0}
+
+
+def record_resolution(*, local: bool) -> None:
+    _stats["local" if local else "cop"] += 1
+
+
+def get_classifier_stats() -> dict[str, float | int]:
+    """Counts of locally-resolved vs Cop-reviewed tainted commands."""
+    total = _stats["local"] + _stats["cop"]
+    return {
+        "resolved_locally": _stats["local"],
+        "escalated_to_cop": _stats["cop"],
+        "local_pct": round(100.0 * _stats["local"] / total, 1) if total else 0.0,
+    }
+
+
+def reset_classifier_stats() -> None:
+    _stats["local"] = 0
+    _stats["cop"] = 0
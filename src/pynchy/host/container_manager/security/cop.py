@@ -14,10 +14,12 @@ See docs/plans/2026-02-24-host-mutating-cop-design.md
 from __future__ import annotations
 
 import json as _json
+import time
 from dataclasses import dataclass
 
 import aiohttp
 
+from pynchy import metrics
 from pynchy.logger import logger
 
 
@@ -119,6 +121,16 @@ Be conservative — only flag genuinely suspicious commands. False positives dis
 """
 
 
+_INSPECTIONS = metrics.counter(
+    "pynchy_cop_inspections_total",
+    "Cop LLM inspections by kind (outbound, inbound, bash) and outcome.",
+    ("kind", "outcome"),
+)
+_INSPECTION_SECONDS = metrics.histogram(
+    "pynchy_cop_inspection_seconds", "Cop inspection latency.", ("kind",)
+)
+
+
 async def inspect_outbound(
     operation: str,
     payload_summary: str,
@@ -173,13 +185,27 @@ async def _inspect(
     context: str,
 ) -> CopVerdict:
     """Run an LLM inspection and return a CopVerdict."""
+    kind = context.partition(":")[0]
+    started = time.perf_counter()
+    outcome, verdict = await _run_inspection(system_prompt, user_content, context)
+    _INSPECTION_SECONDS.labels(kind).observe(time.perf_counter() - started)
+    _INSPECTIONS.labels(kind, outcome).inc()
+    return verdict
+
+
+async def _run_inspection(
+    system_prompt: str,
+    user_content: str,
+    context: str,
+) -> tuple[str, CopVerdict]:
+    """Return the metrics outcome ("flagged", "allowed", "error") and the verdict."""
     from pynchy.host.container_manager.gateway import get_gateway
 
     try:
         gateway = get_gateway()
         if gateway is None:
             logger.warning("Cop: no gateway available, allowing operation", context=context)
-            return CopVerdict(flagged=False, reason="No gateway available")
+            return "error", CopVerdict(flagged=False, reason="No gateway available")
 
         url = f"http://localhost:{gateway.port}/v1/messages"
         headers = {
@@ -222,9 +248,9 @@ async def _inspect(
             flagged=verdict.flagged,
             reason=verdict.reason,
         )
-        return verdict
+        return ("flagged" if verdict.flagged else "allowed"), verdict
 
     except Exception as exc:
         # Fail open: if the Cop can't run, log and allow
         logger.error("Cop inspection failed, allowing operation", context=context, err=str(exc))
-        return CopVerdict(flagged=False, reason=f"Cop error: {exc}")
+        return "error", CopVerdict(flagged=False, reason=f"Cop error: {exc}")
@@ -11,6 +11,9 @@ concurrent containers for the same group.
 from __future__ import annotations
 
 from pynchy.host.container_manager.security.middleware import PolicyDecision, SecurityPolicy
+from pynchy.host.container_manager.security.secrets_scanner import (
+    scan_payload_for_secrets_async,
+)
 from pynchy.types import ServiceTrustConfig, WorkspaceSecurity
 
 # ---------------------------------------------------------------------------
@@ -37,6 +40,11 @@ class SecurityGate:
         """Evaluate a write operation. Delegates to SecurityPolicy."""
         return self._policy.evaluate_write(service, data)
 
+    async def evaluate_write_async(self, service: str, data: dict) -> PolicyDecision:
+        """Like evaluate_write, but runs the payload secrets scan off the event loop."""
+        scan_result = await scan_payload_for_secrets_async(data)
+        return self._policy.evaluate_write(service, data, scan_result=scan_result)
+
     def notify_file_access(self) -> None:
         """Forward file-access notification to the policy."""
         self._policy.notify_file_access()
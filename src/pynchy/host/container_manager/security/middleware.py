@@ -13,7 +13,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from pynchy.host.container_manager.security.secrets_scanner import scan_payload_for_secrets
+from pynchy.host.container_manager.security.secrets_scanner import (
+    ScanResult,
+    scan_payload_for_secrets,
+)
 from pynchy.types import ServiceTrustConfig, WorkspaceSecurity
 
 # Default trust for unknown services — maximally cautious
@@ -96,12 +99,17 @@ class SecurityPolicy:
 
         return PolicyDecision(allowed=True)
 
-    def evaluate_write(self, service: str, data: dict) -> PolicyDecision:
+    def evaluate_write(
+        self, service: str, data: dict, *, scan_result: ScanResult | None = None
+    ) -> PolicyDecision:
         """Evaluate a write operation on a service.
 
         Checks forbidden first, then derives gating from the matrix:
         - Cop: corruption_tainted (any write by potentially-hijacked agent)
         - Human: dangerous_writes=True OR (corruption + secret + public_sink)
+
+        ``scan_result`` lets async callers pass a payload scan they already
+        ran off the event loop; otherwise the payload is scanned here.
         """
         trust = self._get_trust(service)
 
@@ -130,7 +138,8 @@ class SecurityPolicy:
             needs_human = True
 
         # Payload secrets scan — escalate if secrets detected
-        scan_result = scan_payload_for_secrets(data)
+        if scan_result is None:
+            scan_result = scan_payload_for_secrets(data)
         if scan_result.secrets_found:
             needs_human = True
 
@@ -4,15 +4,37 @@ Scans outbound write payloads for leaked secrets (API keys, tokens,
 private keys, etc.). Non-LLM, non-AI — purely rule-based detection.
 Used by SecurityPolicy.evaluate_write() to escalate gating when
 secrets are found in payloads regardless of taint state.
+
+detect-secrets keeps its configuration in process-global state, so all
+scanning runs on one dedicated worker thread that configures the plugins
+once (instead of entering ``transient_settings`` on every call).  Async
+callers await ``scan_payload_for_secrets_async`` and never block the
+event loop on large payloads (diffs, file writes).
+
+Two shortcuts keep the common case cheap:
+
+- Prefilter: every configured detector is regex-based, so the text is
+  first searched with the detectors' own patterns (recompiled with
+  ``re.MULTILINE``).  Only lines with a hit go through ``scan_line`` and
+  its filters; a clean payload costs one C-level pass per pattern.
+- Result cache: results are cached by SHA-256 of the scanned text, so
+  payloads re-submitted after approval or retry aren't scanned twice.
 """
 
 from __future__ import annotations
 
+import asyncio
+import bisect
+import hashlib
 import json
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 
-from detect_secrets.core.scan import scan_line
-from detect_secrets.settings import transient_settings
+from detect_secrets.core.scan import get_plugins, scan_line
+from detect_secrets.settings import configure_settings_from_baseline
 
 # Pattern-based detectors only — no high-entropy string detectors.
 # High-entropy detectors (Base64HighEntropyString, HexHighEntropyString)
@@ -43,6 +65,13 @@ _SCANNER_CONFIG = {
 }
 
 
+# Cached scan results (keyed by SHA-256 of the scanned text).
+_CACHE_SIZE = 256
+
+# Same boundaries as str.splitlines(), so regex offsets map onto its lines.
+_LINE_BREAK = re.compile("\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
 @dataclass
 class ScanResult:
     """Result of scanning a payload for secrets."""
@@ -60,26 +89,151 @@ def _payload_to_text(payload: str | dict | None) -> str:
     return str(payload)
 
 
+class SecretsScanner:
+    """detect-secrets wrapper with prebuilt detector state and a result cache.
+
+    All detect-secrets calls happen on the single worker thread owned by
+    this instance; the cache is shared and lock-protected.
+    """
+
+    def __init__(self, cache_size: int = _CACHE_SIZE) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="secrets-scan")
+        self._cache: OrderedDict[str, ScanResult] = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        # Built lazily on the worker thread by _ensure_configured().
+        self._prefilter: list[re.Pattern[str]] | None = None
+
+    # -- public API --------------------------------------------------------
+
+    def scan(self, payload: str | dict | None) -> ScanResult:
+        """Scan synchronously (blocks the caller until the worker finishes)."""
+        text = _payload_to_text(payload)
+        if not text.strip():
+            return ScanResult()
+        key = _content_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        result = self._executor.submit(self._scan_text, text).result()
+        self._cache_put(key, result)
+        return _copy(result)
+
+    async def scan_async(self, payload: str | dict | None) -> ScanResult:
+        """Scan on the worker thread without blocking the event loop."""
+        text = _payload_to_text(payload)
+        if not text.strip():
+            return ScanResult()
+        key = _content_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor, self._scan_text, text)
+        self._cache_put(key, result)
+        return _copy(result)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    # -- cache -------------------------------------------------------------
+
+    def _cache_get(self, key: str) -> ScanResult | None:
+        with self._lock:
+            result = self._cache.get(key)
+            if result is None:
+                return None
+            self._cache.move_to_end(key)
+            return _copy(result)
+
+    def _cache_put(self, key: str, result: ScanResult) -> None:
+        with self._lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    # -- worker-thread only ------------------------------------------------
+
+    def _ensure_configured(self) -> list[re.Pattern[str]]:
+        if self._prefilter is None:
+            configure_settings_from_baseline(_SCANNER_CONFIG)
+            self._prefilter = [
+                re.compile(regex.pattern, regex.flags | re.MULTILINE)
+                for plugin in get_plugins()
+                for regex in plugin.denylist
+            ]
+        return self._prefilter
+
+    def _scan_text(self, text: str) -> ScanResult:
+        prefilter = self._ensure_configured()
+
+        # Offsets of every regex hit -> the set of line indexes worth scanning.
+        hit_offsets: list[tuple[int, int]] = [
+            (m.start(), m.end()) for regex in prefilter for m in regex.finditer(text)
+        ]
+        if not hit_offsets:
+            return ScanResult()
+
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _LINE_BREAK.finditer(text))
+        candidate_lines: set[int] = set()
+        for start, end in hit_offsets:
+            first = _line_index(line_starts, start)
+            last = _line_index(line_starts, max(start, end - 1))
+            candidate_lines.update(range(first, last + 1))
+
+        lines = text.splitlines()
+        detected_types: list[str] = []
+        for idx in sorted(candidate_lines):
+            if idx >= len(lines):
+                continue
+            for secret in scan_line(lines[idx]):
+                detected_types.append(secret.type)
+
+        if not detected_types:
+            return ScanResult()
+        return ScanResult(secrets_found=True, detected=detected_types)
+
+
+def _content_key(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _copy(result: ScanResult) -> ScanResult:
+    return ScanResult(secrets_found=result.secrets_found, detected=list(result.detected))
+
+
+def _line_index(line_starts: list[int], offset: int) -> int:
+    """Index of the line containing ``offset`` (``line_starts`` is sorted)."""
+    return bisect.bisect_right(line_starts, offset) - 1
+
+
+_scanner: SecretsScanner | None = None
+_scanner_lock = threading.Lock()
+
+
+def get_secrets_scanner() -> SecretsScanner:
+    """Return the process-wide scanner (created on first use)."""
+    global _scanner
+    if _scanner is None:
+        with _scanner_lock:
+            if _scanner is None:
+                _scanner = SecretsScanner()
+    return _scanner
+
+
 def scan_payload_for_secrets(payload: str | dict | None) -> ScanResult:
     """Scan a payload for secrets using detect-secrets.
 
     Returns a ScanResult indicating whether secrets were found
-    and what types were detected.
+    and what types were detected.  Blocks the caller; async code should
+    use :func:`scan_payload_for_secrets_async`.
     """
-    text = _payload_to_text(payload)
-    if not text.strip():
-        return ScanResult()
-
-    detected_types: list[str] = []
-    with transient_settings(_SCANNER_CONFIG):
-        for line in text.splitlines():
-            for secret in scan_line(line):
-                detected_types.append(secret.type)
+    return get_secrets_scanner().scan(payload)
 
-    if not detected_types:
-        return ScanResult()
 
-    return ScanResult(
-        secrets_found=True,
-        detected=detected_types,
-    )
+async def scan_payload_for_secrets_async(payload: str | dict | None) -> ScanResult:
+    """Async variant of :func:`scan_payload_for_secrets` (runs off the event loop)."""
+    return await get_secrets_scanner().scan_async(payload)
@@ -11,12 +11,16 @@ from pynchy.host.git_ops.sync import (
     host_sync_worktree,
 )
 from pynchy.host.git_ops.sync_poll import (
+    RebuildPlan,
     needs_container_rebuild,
     needs_deploy,
+    plan_container_rebuild,
+    plan_rebuild,
     start_host_git_sync_loop,
 )
 from pynchy.host.git_ops.utils import (
     GitCommandError,
+    changed_files_between,
     count_unpushed_commits,
     detect_main_branch,
     files_changed_between,
@@ -38,9 +42,11 @@ from pynchy.host.git_ops.worktree import (
 __all__ = [
     "GitCommandError",
     "GitSyncDeps",
+    "RebuildPlan",
     "WorktreeNotifyDeps",
     "WorktreeError",
     "WorktreeResult",
+    "changed_files_between",
     "count_unpushed_commits",
     "detect_main_branch",
     "ensure_worktree",
@@ -56,6 +62,8 @@ __all__ = [
     "merge_worktree_with_policy",
     "needs_container_rebuild",
     "needs_deploy",
+    "plan_container_rebuild",
+    "plan_rebuild",
     "push_local_commits",
     "reconcile_worktrees_at_startup",
     "require_success",
@@ -74,7 +74,7 @@ def get_repo_token(slug: str) -> str | None:
     3. gh auth token — auto-discovered from gh CLI (lowest priority)
     """
     from pynchy.config import get_settings
-    from pynchy.host.container_manager.credentials import _read_gh_token
+    from pynchy.host.container_manager.credentials import _host_gh_token
 
     s = get_settings()
     repo_cfg = s.repos.get(slug)
@@ -82,7 +82,7 @@ def get_repo_token(slug: str) -> str | None:
         return repo_cfg.token.get_secret_value()
     if s.secrets.gh_token:
         return s.secrets.gh_token.get_secret_value()
-    return _read_gh_token()
+    return _host_gh_token()
 
 
 def _sanitize_token(text: str, token: str | None) -> str:
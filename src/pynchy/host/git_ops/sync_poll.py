@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
+from dataclasses import dataclass
 from pathlib import Path
 
 from pynchy.config import get_settings
@@ -16,6 +17,7 @@ from pynchy.host.git_ops._worktree_notify import host_notify_worktree_updates, l
 from pynchy.host.git_ops.repo import RepoContext
 from pynchy.host.git_ops.sync import GitSyncDeps
 from pynchy.host.git_ops.utils import (
+    changed_files_between,
     detect_main_branch,
     files_changed_between,
     get_head_sha,
@@ -120,9 +122,12 @@ def _host_update_main(repo_root: Path, env: dict[str, str] | None = None) -> boo
     return True
 
 
+_AGENT_DIR = "src/pynchy/agent/"
+
+
 def _host_container_files_changed(old_sha: str, new_sha: str) -> bool:
     """Check if agent-side files changed between two commits."""
-    return files_changed_between(old_sha, new_sha, "src/pynchy/agent/")
+    return files_changed_between(old_sha, new_sha, _AGENT_DIR)
 
 
 def _host_source_files_changed(old_sha: str, new_sha: str) -> bool:
@@ -141,9 +146,78 @@ def needs_deploy(old_sha: str, new_sha: str) -> bool:
     )
 
 
+# Agent files delivered to containers at spawn time rather than baked into
+# the image: agent_runner/src is bind-mounted at /app/src (on PYTHONPATH),
+# skills are synced into each session, scripts/settings.json is mounted.
+_RUNTIME_DELIVERED_PREFIXES = (
+    "src/pynchy/agent/agent_runner/src/",
+    "src/pynchy/agent/agent_runner/tests/",
+    "src/pynchy/agent/skills/",
+)
+_RUNTIME_DELIVERED_FILES = frozenset({"src/pynchy/agent/scripts/settings.json"})
+
+# Changing these invalidates the image's dependency-install layers.
+_DEPENDENCY_MANIFESTS = frozenset(
+    {
+        "src/pynchy/agent/agent_runner/pyproject.toml",
+        "src/pynchy/agent/agent_runner/uv.lock",
+        "src/pynchy/agent/scripts/generate_plugin_requirements.py",
+    }
+)
+
+
+@dataclass(frozen=True)
+class RebuildPlan:
+    """Whether the agent image must be rebuilt, and why."""
+
+    rebuild: bool
+    reason: str
+    changed: tuple[str, ...] = ()
+
+
+def plan_rebuild(changed_paths: list[str]) -> RebuildPlan:
+    """Classify changed agent files into a rebuild decision.
+
+    Only files that end up inside the image (Dockerfile, entrypoint,
+    dependency manifests, MCP images) require a rebuild; source that is
+    mounted or synced at spawn time takes effect on the next container.
+    """
+    agent_paths = [p for p in changed_paths if p.startswith(_AGENT_DIR)]
+    baked = [
+        p
+        for p in agent_paths
+        if p not in _RUNTIME_DELIVERED_FILES and not p.startswith(_RUNTIME_DELIVERED_PREFIXES)
+    ]
+    if not baked:
+        if agent_paths:
+            return RebuildPlan(
+                False, f"runtime-mounted agent source only ({len(agent_paths)} files)"
+            )
+        return RebuildPlan(False, "no agent files changed")
+
+    def _short(path: str) -> str:
+        return path.removeprefix(_AGENT_DIR)
+
+    manifests = [p for p in baked if p in _DEPENDENCY_MANIFESTS]
+    if manifests:
+        reason = "dependencies changed: " + ", ".join(_short(p) for p in manifests)
+    else:
+        reason = "image files changed: " + ", ".join(_short(p) for p in baked[:3])
+        if len(baked) > 3:
+            reason += f" (+{len(baked) - 3} more)"
+    return RebuildPlan(True, reason, tuple(baked))
+
+
+def plan_container_rebuild(old_sha: str, new_sha: str) -> RebuildPlan:
+    """Rebuild plan for the agent-file changes between two commits."""
+    return plan_rebuild(changed_files_between(old_sha, new_sha, _AGENT_DIR))
+
+
 def needs_container_rebuild(old_sha: str, new_sha: str) -> bool:
-    """Check if container image needs rebuilding. Only src/pynchy/agent/ changes require this."""
-    return _host_container_files_changed(old_sha, new_sha)
+    """Check if the container image needs rebuilding (see :func:`plan_rebuild`)."""
+    plan = plan_container_rebuild(old_sha, new_sha)
+    logger.info("Container rebuild plan", rebuild=plan.rebuild, reason=plan.reason)
+    return plan.rebuild
 
 
 def _hash_config_files() -> str:
@@ -148,8 +148,15 @@ def get_head_commit_message(max_length: int = 72, cwd: Path | None = None) -> st
 
 def files_changed_between(old_sha: str, new_sha: str, path: str) -> bool:
     """Check if files under *path* changed between two commits."""
+    return bool(changed_files_between(old_sha, new_sha, path))
+
+
+def changed_files_between(old_sha: str, new_sha: str, path: str) -> list[str]:
+    """Repo-relative paths under *path* that changed between two commits."""
     result = run_git("diff", "--name-only", old_sha, new_sha, "--", path)
-    return bool(result.stdout.strip()) if result.returncode == 0 else False
+    if result.returncode != 0:
+        return []
+    return [line for line in result.stdout.splitlines() if line.strip()]
 
 
 def push_local_commits(
@@ -13,6 +13,7 @@ import time
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Protocol
 
+from pynchy import tracing
 from pynchy.config import get_settings
 from pynchy.host.container_manager import (
     ContainerSession,
@@ -151,6 +152,8 @@ def _build_container_input(
         system_prompt_append=ctx.system_prompt_append,
         agent_core_module=ctx.agent_core_module,
         agent_core_class=ctx.agent_core_class,
+        output_max_delay_ms=get_settings().container.output_max_delay_ms,
+        trace_id=tracing.current_trace_id(),
     )
 
 
@@ -359,6 +362,7 @@ async def _warm_query(
     formatted = _format_messages_for_ipc(messages, ctx.system_notices or None)
 
     # Send via IPC
+    tracing.mark(chat_jid, "dispatched")
     await session.send_ipc_message(formatted)
 
     return await _await_query(session, group, ctx.config_timeout, "warm query")
@@ -379,6 +383,7 @@ async def _cold_start(
     """Spawn a new container, create a persistent session, and wait for the first query."""
     container_name = stable_container_name(group.folder)
     input_data = _build_container_input(messages, ctx, chat_jid, group)
+    tracing.mark(chat_jid, "dispatched")
 
     # Remove stale container with the same name before spawning.
     # After a service restart or container crash, a dead Docker container may
@@ -446,17 +451,18 @@ async def run_agent(
         await destroy_session(group.folder)
 
     # Pre-container setup is shared by all paths (warm, cold, scheduled).
-    ctx = await _pre_container_setup(
-        deps,
-        group,
-        chat_jid,
-        messages,
-        on_output,
-        extra_system_notices,
-        input_source,
-        is_scheduled_task,
-        repo_access_override,
-    )
+    with tracing.span("agent_setup"):
+        ctx = await _pre_container_setup(
+            deps,
+            group,
+            chat_jid,
+            messages,
+            on_output,
+            extra_system_notices,
+            input_source,
+            is_scheduled_task,
+            repo_access_override,
+        )
 
     # --- Scheduled tasks: one-shot container, no persistent session ---
     if is_scheduled_task:
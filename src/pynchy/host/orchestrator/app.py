@@ -6,7 +6,6 @@ Lifecycle (startup phases, shutdown) lives in :mod:`lifecycle`.
 from __future__ import annotations
 
 import asyncio
-import json
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -31,10 +30,12 @@ from pynchy.host.orchestrator.messaging import (
 from pynchy.logger import logger
 from pynchy.state import (
     delete_workspace_profile,
+    get_agent_cursors,
     get_all_chats,
     get_all_sessions,
     get_all_workspace_profiles,
     get_router_state,
+    save_agent_cursors,
     set_workspace_profile,
 )
 from pynchy.types import (
@@ -59,6 +60,10 @@ class PynchyApp:
         # restart so recover_pending_messages always uses last_agent_timestamp
         # (the true "successfully processed" cursor) as its baseline.
         self._dispatched_through: dict[str, str] = {}
+        # Last values known to be on disk — _save_state writes only the diff.
+        self._persisted_last_timestamp: str = ""
+        self._persisted_agent_cursors: dict[str, str] = {}
+        self._state_save_lock = asyncio.Lock()
         self.message_loop_running: bool = False
         self.queue: GroupQueue = GroupQueue()
         self.channels: list[Channel] = []
@@ -84,12 +89,9 @@ class PynchyApp:
     async def _load_state(self) -> None:
         """Load persisted state from the database."""
         self.last_timestamp = await get_router_state("last_timestamp") or ""
-        agent_ts = await get_router_state("last_agent_timestamp")
-        try:
-            self.last_agent_timestamp = json.loads(agent_ts) if agent_ts else {}
-        except (json.JSONDecodeError, TypeError):
-            logger.warning("Corrupted last_agent_timestamp in DB, resetting")
-            self.last_agent_timestamp = {}
+        self.last_agent_timestamp = await get_agent_cursors()
+        self._persisted_last_timestamp = self.last_timestamp
+        self._persisted_agent_cursors = dict(self.last_agent_timestamp)
         self.sessions = await get_all_sessions()
 
         self.workspaces = await get_all_workspace_profiles()
@@ -100,19 +102,32 @@ class PynchyApp:
         )
 
     async def _save_state(self) -> None:
-        """Persist router state to the database atomically.
-
-        Both rows are written in a single transaction so a crash can never
-        leave them inconsistent.
+        """Persist cursors that changed since the last save, atomically.
+
+        Only dirty per-group cursors (and last_timestamp, if it moved) are
+        written, in a single transaction.  Saves are serialized: a burst of
+        callers queued behind an in-flight write mostly find their changes
+        already on disk and return without touching the database, so a
+        burst coalesces into one or two transactions while every awaited
+        save is still durable when it returns.
         """
-        from pynchy.state import save_router_state_batch
-
-        await save_router_state_batch(
-            {
-                "last_timestamp": self.last_timestamp,
-                "last_agent_timestamp": json.dumps(self.last_agent_timestamp),
-            }
-        )
+        async with self._state_save_lock:
+            persisted = self._persisted_agent_cursors
+            current = dict(self.last_agent_timestamp)
+            changed = {jid: ts for jid, ts in current.items() if persisted.get(jid) != ts}
+            removed = [jid for jid in persisted if jid not in current]
+            last_timestamp = self.last_timestamp
+            router_state = (
+                {"last_timestamp": last_timestamp}
+                if last_timestamp != self._persisted_last_timestamp
+                else None
+            )
+            if not (changed or removed or router_state):
+                return
+
+            await save_agent_cursors(changed, removed, router_state=router_state)
+            self._persisted_agent_cursors = current
+            self._persisted_last_timestamp = last_timestamp
 
     # ------------------------------------------------------------------
     # Protocol adapter methods (satisfy handler Protocols via structural typing)
@@ -0,0 +1,120 @@
+"""Dependency-ordered, concurrent boot phases with a timing record.
+
+Startup is declared as a list of :class:`Phase` objects, each naming the
+phases it must run after.  :func:`run_phases` starts every phase as soon
+as its dependencies finish, so independent work (gateway containers,
+database, memory, channel connections) overlaps instead of queueing.
+
+Each phase's start offset and duration is kept in module state and served
+by :func:`get_boot_stats` — the "boot" section of ``/status``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from pynchy.logger import logger
+
+
+@dataclass(frozen=True)
+class Phase:
+    """One boot step. *after* names phases that must finish first."""
+
+    name: str
+    run: Callable[[], Awaitable[None]]
+    after: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _Timing:
+    name: str
+    start_s: float  # offset from boot start
+    duration_s: float
+
+
+_boot_started: float | None = None
+_timings: list[_Timing] = []
+
+
+def start_boot_clock() -> None:
+    """Reset the timing record; offsets are measured from this call."""
+    global _boot_started
+    _boot_started = time.monotonic()
+    _timings.clear()
+
+
+async def timed(name: str, awaitable: Awaitable[Any]) -> Any:
+    """Await *awaitable* and record it as boot phase *name*."""
+    if _boot_started is None:
+        start_boot_clock()
+    assert _boot_started is not None
+    started = time.monotonic()
+    try:
+        return await awaitable
+    finally:
+        ended = time.monotonic()
+        _timings.append(_Timing(name, started - _boot_started, ended - started))
+
+
+async def run_phases(phases: Sequence[Phase]) -> None:
+    """Run *phases* concurrently, each once everything in its ``after`` is done.
+
+    Dependencies must be declared earlier in *phases*, which rules out
+    cycles.  The first failure cancels every phase still running and is
+    re-raised.
+    """
+    tasks: dict[str, asyncio.Task[None]] = {}
+
+    async def _run(phase: Phase) -> None:
+        if phase.after:
+            await asyncio.gather(*(tasks[dep] for dep in phase.after))
+        await timed(phase.name, phase.run())
+
+    for phase in phases:
+        if phase.name in tasks:
+            raise ValueError(f"Duplicate boot phase: {phase.name}")
+        unknown = [dep for dep in phase.after if dep not in tasks]
+        if unknown:
+            raise ValueError(f"Boot phase {phase.name!r} depends on undeclared {unknown}")
+        tasks[phase.name] = asyncio.create_task(_run(phase), name=f"boot-{phase.name}")
+
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+
+def get_boot_stats() -> dict[str, Any]:
+    """Per-phase start offsets and durations, in the order phases finished."""
+    if _boot_started is None:
+        return {"total_seconds": None, "phases": []}
+    total = max((t.start_s + t.duration_s for t in _timings), default=0.0)
+    return {
+        "total_seconds": round(total, 3),
+        "phases": [
+            {
+                "name": t.name,
+                "start_s": round(t.start_s, 3),
+                "duration_s": round(t.duration_s, 3),
+            }
+            for t in _timings
+        ],
+    }
+
+
+def log_boot_summary() -> None:
+    """Log the slowest phases once startup is complete."""
+    stats = get_boot_stats()
+    slowest = sorted(stats["phases"], key=lambda p: p["duration_s"], reverse=True)[:5]
+    logger.info(
+        "Boot complete",
+        total_seconds=stats["total_seconds"],
+        slowest={p["name"]: p["duration_s"] for p in slowest},
+    )
@@ -8,10 +8,12 @@ The async ``_run_*`` methods clean up in their ``finally`` blocks.
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 
+from pynchy import metrics, tracing
 from pynchy.config import get_settings
 from pynchy.host.container_manager.ipc.write import (
     clean_ipc_input_dir,
@@ -22,6 +24,26 @@ from pynchy.host.container_manager.security.middleware import PolicyDeniedError
 from pynchy.logger import logger
 from pynchy.utils import create_background_task
 
+_RUNS = metrics.counter(
+    "pynchy_queue_runs_total", "Container runs started by GroupQueue.", ("kind",)
+)
+_RUN_SECONDS = metrics.histogram(
+    "pynchy_queue_run_seconds",
+    "Wall time of GroupQueue runs, from slot start to release.",
+    ("kind",),
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1800),
+)
+_RETRIES = metrics.counter(
+    "pynchy_queue_retries_total", "Message runs rescheduled after a failure."
+)
+_ACTIVE = metrics.gauge("pynchy_queue_active_containers", "Container slots in use.")
+_WAITING = metrics.gauge(
+    "pynchy_queue_waiting_groups", "Groups waiting for a slot at the concurrency limit."
+)
+_PENDING_TASKS = metrics.gauge(
+    "pynchy_queue_pending_tasks", "Scheduled tasks queued behind an active container."
+)
+
 
 @dataclass
 class QueuedTask:
@@ -69,6 +91,12 @@ class GroupQueue:
         self._waiting_groups: deque[str] = deque()
         self._process_messages_fn: Callable[[str], Awaitable[bool]] | None = None
         self._shutting_down = False
+        # Read at scrape time; the app has a single queue
+        _ACTIVE.set_function(lambda: self._active_count)
+        _WAITING.set_function(lambda: len(self._waiting_groups))
+        _PENDING_TASKS.set_function(
+            lambda: sum(len(g.pending_tasks) for g in self._groups.values())
+        )
 
     def _get_group(self, group_jid: str) -> GroupState:
         """Return the GroupState for *group_jid*, creating one if needed."""
@@ -292,10 +320,18 @@ class GroupQueue:
             reason=reason,
             active_count=self._active_count,
         )
+        _RUNS.labels("messages").inc()
+        started = time.monotonic()
 
         try:
             if self._process_messages_fn:
-                success = await self._process_messages_fn(group_jid)
+                with tracing.resume(group_jid) as trace:
+                    tracing.record_since_mark(group_jid, "enqueued", "queue_wait")
+                    success = await self._process_messages_fn(group_jid)
+                # A run that never handed its input to a container (skipped,
+                # intercepted or failed) won't produce output to close the trace.
+                if trace is not None and "dispatched" not in trace.marks:
+                    tracing.discard_trace(group_jid, trace.trace_id)
                 if success:
                     state.retry_count = 0
                 else:
@@ -314,6 +350,7 @@ class GroupQueue:
             )
             self._schedule_retry(group_jid, state)
         finally:
+            _RUN_SECONDS.labels("messages").observe(time.monotonic() - started)
             state.release()
             self._active_count -= 1
             self._drain_group(group_jid)
@@ -331,6 +368,8 @@ class GroupQueue:
             task_id=task.id,
             active_count=self._active_count,
         )
+        _RUNS.labels("task").inc()
+        started = time.monotonic()
 
         try:
             await task.fn()
@@ -345,6 +384,7 @@ class GroupQueue:
             # new container — prevents the next container from seeing
             # duplicates of "btw " messages that were best-effort
             # forwarded but never read by the now-dead task container.
+            _RUN_SECONDS.labels("task").observe(time.monotonic() - started)
             clean_ipc_input_dir(state.group_folder)
             state.release()
             self._active_count -= 1
@@ -354,6 +394,7 @@ class GroupQueue:
         """Re-enqueue a failed message check after exponential backoff."""
         s = get_settings()
         state.retry_count += 1
+        _RETRIES.inc()
         if state.retry_count > s.queue.max_retries:
             logger.error(
                 "Max retries exceeded, dropping messages (will retry on next incoming message)",
@@ -56,6 +56,10 @@ def make_scheduler_deps(app: PynchyApp) -> SchedulerDependencies:
         def queue(self) -> Any:
             return app.queue
 
+        @property
+        def memory(self) -> Any:
+            return app._memory
+
         @staticmethod
         async def run_agent(*args: Any, **kwargs: Any) -> str:
             return await app.run_agent(*args, **kwargs)
@@ -83,18 +87,24 @@ async def _rebuild_and_deploy(
     from pynchy.host.orchestrator.deploy import finalize_deploy
 
     chat_jid = find_admin_jid(workspaces)
+    reason = ""
+    if rebuild:
+        from pynchy.host.git_ops.sync_poll import plan_container_rebuild
+
+        reason = plan_container_rebuild(previous_sha, get_head_sha()).reason
     if chat_jid:
         msg = (
-            "Container files changed — rebuilding and restarting..."
+            f"Container files changed ({reason}) — rebuilding and restarting..."
             if rebuild
             else "Code/config changed — restarting..."
         )
         await host_broadcaster.broadcast_host_message(chat_jid, msg)
 
+    build = None
     if rebuild:
         from pynchy.host.orchestrator.deploy import build_container_image
 
-        await asyncio.to_thread(build_container_image)
+        build = await asyncio.to_thread(build_container_image, reason=reason)
 
     active_sessions = session_manager.get_active_sessions(workspaces)
 
@@ -104,6 +114,7 @@ async def _rebuild_and_deploy(
         commit_sha=get_head_sha(),
         previous_sha=previous_sha,
         active_sessions=active_sessions,
+        build=build,
     )
 
 
@@ -224,6 +235,9 @@ def make_status_deps(app: PynchyApp) -> StatusDeps:
         def get_workspace_count(self) -> int:
             return len(app.workspaces)
 
+        def get_memory_provider(self) -> Any | None:
+            return app._memory
+
     return _StatusDeps()
 
 
@@ -6,6 +6,7 @@ import asyncio
 import os
 import signal
 import subprocess
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime
@@ -22,9 +23,19 @@ class BuildResult:
     success: bool
     skipped: bool = False  # True when build.sh doesn't exist
     stderr: str = ""
+    reason: str = ""  # why the rebuild was needed (see git_ops.plan_rebuild)
+    duration_s: float = 0.0
 
+    def summary(self) -> str:
+        """One line for the deploy notification, e.g. 'Agent image rebuilt in 42s (...)'."""
+        if self.skipped:
+            return "Agent image rebuild skipped (no build.sh)."
+        outcome = "rebuilt" if self.success else "rebuild FAILED"
+        reason = f" ({self.reason})" if self.reason else ""
+        return f"Agent image {outcome} in {self.duration_s:.0f}s{reason}."
 
-def build_container_image(*, timeout: int = 600) -> BuildResult:
+
+def build_container_image(*, timeout: int = 600, reason: str = "") -> BuildResult:
     """Run src/pynchy/agent/build.sh to rebuild the container image.
 
     Returns a BuildResult so callers can decide how to handle success/failure.
@@ -35,7 +46,8 @@ def build_container_image(*, timeout: int = 600) -> BuildResult:
         logger.warning("Container rebuild requested but build.sh not found")
         return BuildResult(success=True, skipped=True)
 
-    logger.info("Rebuilding container image...")
+    logger.info("Rebuilding container image...", reason=reason)
+    started = time.monotonic()
     result = subprocess.run(
         [str(build_script)],
         cwd=str(get_settings().project_root / "src" / "pynchy" / "agent"),
@@ -43,12 +55,15 @@ def build_container_image(*, timeout: int = 600) -> BuildResult:
         text=True,
         timeout=timeout,
     )
+    duration = time.monotonic() - started
     if result.returncode != 0:
         logger.error("Container rebuild failed", stderr=result.stderr[-500:])
-        return BuildResult(success=False, stderr=result.stderr[-500:])
+        return BuildResult(
+            success=False, stderr=result.stderr[-500:], reason=reason, duration_s=duration
+        )
 
-    logger.info("Container image rebuilt successfully")
-    return BuildResult(success=True)
+    logger.info("Container image rebuilt successfully", duration_s=round(duration, 1))
+    return BuildResult(success=True, reason=reason, duration_s=duration)
 
 
 async def finalize_deploy(
@@ -61,6 +76,7 @@ async def finalize_deploy(
     resume_prompt: str = "Deploy complete. Verifying service health.",
     sigterm_delay: float = 0,
     active_sessions: dict[str, str] | None = None,
+    build: BuildResult | None = None,
 ) -> None:
     """Write continuation, notify all UIs, and SIGTERM self.
 
@@ -76,6 +92,8 @@ async def finalize_deploy(
             response needs to flush before the process dies.
         active_sessions: Optional mapping of chat_jid → session_id for all
             active groups. Merged with the single session_id/chat_jid pair.
+        build: Result of the image rebuild done for this deploy, if any —
+            its reason and duration are included in the notification.
     """
     # 0. Persist deploy metadata in router_state for /status endpoint
     from pynchy.state import set_router_state
@@ -103,10 +121,10 @@ async def finalize_deploy(
     # 3. Notify all UIs
     short_sha = commit_sha[:8] if commit_sha else "unknown"
     if chat_jid:
-        await broadcast_host_message(
-            chat_jid,
-            f"Deploying {short_sha}... restarting now.",
-        )
+        msg = f"Deploying {short_sha}... restarting now."
+        if build is not None:
+            msg += f" {build.summary()}"
+        await broadcast_host_message(chat_jid, msg)
 
     logger.info(
         "Deploy: restarting service",
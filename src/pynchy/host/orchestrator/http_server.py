@@ -13,13 +13,15 @@ import signal
 import subprocess
 import time
 from collections.abc import Callable, Coroutine
+from datetime import UTC, datetime, timedelta
 from typing import Any, Protocol
 
 from aiohttp import web
 
+from pynchy import metrics
 from pynchy.config import get_settings
+from pynchy.host.git_ops.sync_poll import plan_container_rebuild
 from pynchy.host.git_ops.utils import (
-    files_changed_between,
     get_head_commit_message,
     get_head_sha,
     is_repo_dirty,
@@ -28,7 +30,9 @@ from pynchy.host.git_ops.utils import (
 )
 from pynchy.host.orchestrator.deploy import finalize_deploy
 from pynchy.host.orchestrator.status import StatusDeps, collect_status
+from pynchy.host.orchestrator.usage import get_usage_writer
 from pynchy.logger import logger
+from pynchy.state import get_usage_summary
 from pynchy.types import NewMessage
 
 _start_time = time.monotonic()
@@ -153,11 +157,13 @@ async def _handle_deploy(request: web.Request) -> web.Response:
                 status=422,
             )
 
-    # 5. Rebuild container image if src/pynchy/agent/ files changed
-    if has_new_code and files_changed_between(old_sha, new_sha, "src/pynchy/agent/"):
+    # 5. Rebuild container image if files baked into it changed
+    build = None
+    plan = plan_container_rebuild(old_sha, new_sha) if has_new_code else None
+    if plan is not None and plan.rebuild:
         from pynchy.host.orchestrator.deploy import build_container_image
 
-        build = await asyncio.to_thread(build_container_image)
+        build = await asyncio.to_thread(build_container_image, reason=plan.reason)
         if not build.success:
             chat_jid = deps.admin_chat_jid()
             if chat_jid:
@@ -174,6 +180,7 @@ async def _handle_deploy(request: web.Request) -> web.Response:
             previous_sha=old_sha,
             sigterm_delay=0.5,
             active_sessions=deps.get_active_sessions(),
+            build=build,
         )
     else:
         # Plain restart — no continuation needed, boot notification handles "I'm back"
@@ -199,6 +206,17 @@ async def _handle_status(request: web.Request) -> web.Response:
     return web.json_response(data)
 
 
+async def _handle_metrics(request: web.Request) -> web.Response:
+    """Counters, gauges and histograms in the Prometheus text format.
+
+    Unlike ``/status`` this only reads in-memory values, so it is cheap
+    enough to scrape every few seconds.
+    """
+    return web.Response(
+        body=metrics.render().encode(), headers={"Content-Type": metrics.CONTENT_TYPE}
+    )
+
+
 # ------------------------------------------------------------------
 # TUI API endpoints
 # ------------------------------------------------------------------
@@ -290,6 +308,35 @@ async def _handle_api_periodic(request: web.Request) -> web.Response:
     return web.json_response(agents)
 
 
+async def _handle_api_usage(request: web.Request) -> web.Response:
+    """Return token/cost totals from the usage rollups.
+
+    Query params: ``period`` (hour|day, default day), ``days`` (look-back,
+    default 7), ``group_by`` (comma-separated workspace/model/bucket,
+    default workspace) and an optional ``workspace`` filter.
+    """
+    period = request.query.get("period", "day")
+    if period not in ("hour", "day"):
+        return web.json_response({"error": "period must be hour or day"}, status=400)
+    try:
+        days = float(request.query.get("days", "7"))
+    except ValueError:
+        return web.json_response({"error": "days must be a number"}, status=400)
+    group_by = tuple(c for c in request.query.get("group_by", "workspace").split(",") if c)
+
+    writer = get_usage_writer()
+    if writer is not None:
+        await writer.flush()
+    since = (datetime.now(UTC) - timedelta(days=days)).isoformat()
+    try:
+        rows = await get_usage_summary(
+            period, since, group_by=group_by, workspace=request.query.get("workspace")
+        )
+    except ValueError as exc:
+        return web.json_response({"error": str(exc)}, status=400)
+    return web.json_response({"period": period, "since": since, "rows": rows})
+
+
 # ------------------------------------------------------------------
 # Server setup
 # ------------------------------------------------------------------
@@ -305,12 +352,14 @@ async def start_http_server(
         app[status_deps_key] = status_deps
     app.router.add_get("/health", _handle_health)
     app.router.add_get("/status", _handle_status)
+    app.router.add_get("/metrics", _handle_metrics)
     app.router.add_post("/deploy", _handle_deploy)
     app.router.add_get("/api/groups", _handle_api_groups)
     app.router.add_get("/api/messages", _handle_api_messages)
     app.router.add_post("/api/send", _handle_api_send)
     app.router.add_get("/api/events", _handle_api_events)
     app.router.add_get("/api/periodic", _handle_api_periodic)
+    app.router.add_get("/api/usage", _handle_api_usage)
 
     runner = web.AppRunner(app)
     await runner.setup()
@@ -4,7 +4,8 @@ Extracted from ``app.py`` to keep the orchestrator focused on state
 management and delegation.  Each function receives the ``PynchyApp``
 instance so it can access runtime state without being a method.
 
-Startup runs in five explicit phases (see :func:`run_app`).
+Startup is a dependency graph of phases (see :func:`_boot_phases`) run
+concurrently by :mod:`boot`, followed by subsystem startup and finalization.
 """
 
 from __future__ import annotations
@@ -17,9 +18,11 @@ import threading
 from typing import TYPE_CHECKING
 
 from pynchy.config import get_settings
-from pynchy.host.orchestrator import startup_handler
+from pynchy.host.orchestrator import boot, startup_handler
+from pynchy.host.orchestrator.boot import Phase
 from pynchy.host.orchestrator.messaging import router as output_handler
 from pynchy.host.orchestrator.messaging.inbound import start_message_loop
+from pynchy.host.orchestrator.usage import get_usage_writer, init_usage_writer
 from pynchy.logger import logger
 from pynchy.plugins.channel_runtime import (
     ChannelPluginContext,
@@ -78,8 +81,10 @@ async def shutdown_app(app: PynchyApp, sig_name: str) -> None:
     await app.queue.shutdown()
 
     from pynchy.host.container_manager.gateway import stop_gateway
+    from pynchy.host.container_manager.ipc.handlers_service import close_plugin_handlers
 
     await stop_gateway()
+    await close_plugin_handlers()
     for obs in app._observers:
         await obs.close()
     if app._memory:
@@ -87,54 +92,82 @@ async def shutdown_app(app: PynchyApp, sig_name: str) -> None:
     batcher = output_handler.get_trace_batcher()
     if batcher is not None:
         await batcher.flush_all()
+    usage_writer = get_usage_writer()
+    if usage_writer is not None:
+        await usage_writer.flush()
     for ch in app.channels:
         await ch.disconnect()
 
 
 # ---------------------------------------------------------------------------
-# Phase 1: Core initialization
+# Boot phases (run concurrently, see _boot_phases)
 # ---------------------------------------------------------------------------
 
 
-async def _initialize_core(app: PynchyApp) -> None:
-    """Plugins, gateway, database, observers, memory, state."""
+async def _init_plugins(app: PynchyApp) -> None:
+    """Service unit, plugin manager, plugin workspace config."""
+    from pynchy.host.container_manager.ipc.handlers_service import index_plugin_handlers
     from pynchy.host.orchestrator.service_installer import install_service
     from pynchy.host.orchestrator.workspace_config import configure_plugin_workspaces
     from pynchy.plugins import get_plugin_manager
-    from pynchy.plugins.runtimes.system_checks import ensure_container_system_running
 
     install_service()
 
     app.plugin_manager = get_plugin_manager()
     configure_plugin_workspaces(app.plugin_manager)
-    ensure_container_system_running()
+    index_plugin_handlers(app.plugin_manager)
+
+
+async def _ensure_containers() -> None:
+    """Container runtime up, agent image present, orphans stopped (blocking CLI calls)."""
+    from pynchy.plugins.runtimes.system_checks import ensure_container_system_running
+
+    await asyncio.to_thread(ensure_container_system_running)
+
+
+async def _precompile_agent_runner() -> None:
+    """Bytecode for the read-only agent-runner mount (see precompile_agent_runner)."""
+    from pynchy.host.container_manager.mounts import precompile_agent_runner
+
+    await asyncio.to_thread(precompile_agent_runner)
+
+
+async def _init_tracing() -> None:
+    from pynchy import tracing
+
+    s = get_settings()
+    if s.logging.trace_export:
+        tracing.configure_export(s.data_dir / s.logging.trace_export)
 
+
+async def _start_gateway(app: PynchyApp) -> None:
     from pynchy.host.container_manager.gateway import start_gateway
 
     await start_gateway(plugin_manager=app.plugin_manager)
 
+
+async def _init_database() -> None:
     await init_database()
+    init_usage_writer()
     logger.info("Database initialized")
 
-    from pynchy.plugins.memory import get_memory_provider
-    from pynchy.plugins.observers import attach_observers
 
-    app._observers = attach_observers(app.event_bus)
+async def _init_memory(app: PynchyApp) -> None:
+    from pynchy.plugins.memory import get_memory_provider
 
     app._memory = get_memory_provider()
     if app._memory:
         await app._memory.init()
 
-    await app._load_state()
 
+async def _attach_observers(app: PynchyApp) -> None:
+    from pynchy.plugins.observers import attach_observers
 
-# ---------------------------------------------------------------------------
-# Phase 2: Channel setup
-# ---------------------------------------------------------------------------
+    app._observers = attach_observers(app.event_bus)
 
 
 async def _setup_channels(app: PynchyApp) -> None:
-    """Create channel context, load channels, validate, connect."""
+    """Create channel context, load channels, validate, connect concurrently."""
     context = ChannelPluginContext(
         on_message_callback=lambda jid, msg: create_background_task(
             app._on_inbound(jid, msg), name="on-inbound"
@@ -162,32 +195,30 @@ async def _setup_channels(app: PynchyApp) -> None:
             )
     output_handler.init_trace_batcher(app)
 
-    for ch in app.channels:
-        await ch.connect()
+    await asyncio.gather(*(boot.timed(f"connect:{ch.name}", ch.connect()) for ch in app.channels))
 
 
-# ---------------------------------------------------------------------------
-# Phase 3: State reconciliation
-# ---------------------------------------------------------------------------
+async def _setup_admin_group(app: PynchyApp) -> None:
+    if not app.workspaces:
+        default_channel = resolve_default_channel(app.channels)
+        await startup_handler.setup_admin_group(app, default_channel)
 
 
-async def _reconcile_state(app: PynchyApp) -> dict[str, list[str]]:
-    """Worktree + workspace reconciliation.  Returns repo_groups."""
+async def _reconcile_worktrees(repo_groups: dict[str, list[str]]) -> None:
+    """Fill *repo_groups* (slug → folders) and reconcile their worktrees."""
     from pynchy.host.git_ops.worktree import reconcile_worktrees_at_startup
-    from pynchy.host.orchestrator.workspace_config import (
-        get_repo_access_groups,
-        reconcile_workspaces,
-    )
-
-    s = get_settings()
-
-    repo_groups = get_repo_access_groups(s.workspaces)
+    from pynchy.host.orchestrator.workspace_config import get_repo_access_groups
 
+    repo_groups.update(get_repo_access_groups(get_settings().workspaces))
     await asyncio.to_thread(
         reconcile_worktrees_at_startup,
         repo_groups=repo_groups,
     )
 
+
+async def _reconcile_workspaces(app: PynchyApp) -> None:
+    from pynchy.host.orchestrator.workspace_config import reconcile_workspaces
+
     await reconcile_workspaces(
         workspaces=app.workspaces,
         channels=app.channels,
@@ -195,11 +226,36 @@ async def _reconcile_state(app: PynchyApp) -> dict[str, list[str]]:
         unregister_fn=app._unregister_workspace,
     )
 
-    return repo_groups
+
+def _boot_phases(app: PynchyApp, repo_groups: dict[str, list[str]]) -> list[Phase]:
+    """Startup as a dependency graph.
+
+    The gateway (which may pull images and wait for LiteLLM/Postgres
+    health) only gates the subsystems that run agents, so the database,
+    memory, state load, channel connections and workspace reconciliation
+    all proceed while it starts.
+    """
+    return [
+        Phase("plugins", lambda: _init_plugins(app)),
+        Phase("database", _init_database),
+        # Plugins may contribute workspaces, so repo access is resolved after them
+        Phase("worktrees", lambda: _reconcile_worktrees(repo_groups), after=("plugins",)),
+        # Stops orphaned pynchy-* containers, so must precede the gateway's
+        Phase("containers", _ensure_containers, after=("plugins",)),
+        Phase("gateway", lambda: _start_gateway(app), after=("containers",)),
+        Phase("agent_bytecode", _precompile_agent_runner),
+        Phase("tracing", _init_tracing),
+        Phase("memory", lambda: _init_memory(app), after=("plugins",)),
+        Phase("observers", lambda: _attach_observers(app), after=("plugins", "database")),
+        Phase("state", app._load_state, after=("database",)),
+        Phase("channels", lambda: _setup_channels(app), after=("plugins", "state")),
+        Phase("admin_group", lambda: _setup_admin_group(app), after=("channels",)),
+        Phase("workspaces", lambda: _reconcile_workspaces(app), after=("admin_group",)),
+    ]
 
 
 # ---------------------------------------------------------------------------
-# Phase 4: Subsystem startup
+# Subsystem startup
 # ---------------------------------------------------------------------------
 
 
@@ -269,22 +325,15 @@ async def _start_subsystems(app: PynchyApp, repo_groups: dict[str, list[str]]) -
 async def run_app(app: PynchyApp) -> None:
     """Main entry point — startup sequence.
 
-    Phases:
-    1. Core initialization (plugins, gateway, DB, observers, state)
-    2. Channel setup (load, validate, connect)
-    3. State reconciliation (worktrees, workspaces)
-    4. Subsystem startup (scheduler, IPC, git sync, HTTP)
-    5. Boot finalization (notification, recovery, message loop)
+    1. Boot phases, concurrently where independent (see :func:`_boot_phases`)
+    2. Subsystem startup (scheduler, IPC, git sync, HTTP) once the gateway is up
+    3. Boot finalization (notification, recovery, message loop)
+
+    Each step's timing is reported in the "boot" section of ``/status``.
     """
     s = get_settings()
     continuation_path = s.data_dir / "deploy_continuation.json"
-
-    try:
-        await _initialize_core(app)
-    except Exception as exc:
-        if continuation_path.exists():
-            await startup_handler.auto_rollback(continuation_path, exc)
-        raise
+    boot.start_boot_clock()
 
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
@@ -293,24 +342,21 @@ async def run_app(app: PynchyApp) -> None:
             lambda s=sig: asyncio.ensure_future(shutdown_app(app, s.name)),
         )
 
+    repo_groups: dict[str, list[str]] = {}  # filled by the worktrees phase
     try:
-        await _setup_channels(app)
+        await boot.run_phases(_boot_phases(app, repo_groups))
     except Exception as exc:
         if continuation_path.exists():
             await startup_handler.auto_rollback(continuation_path, exc)
         raise
 
-    if not app.workspaces:
-        default_channel = resolve_default_channel(app.channels)
-        await startup_handler.setup_admin_group(app, default_channel)
-
-    repo_groups = await _reconcile_state(app)
-    await _start_subsystems(app, repo_groups)
+    await boot.timed("subsystems", _start_subsystems(app, repo_groups))
 
-    await startup_handler.send_boot_notification(app)
-    await app._catch_up_channel_history()
-    await startup_handler.recover_pending_messages(app)
+    await boot.timed("boot_notification", startup_handler.send_boot_notification(app))
+    await boot.timed("channel_history", app._catch_up_channel_history())
+    await boot.timed("recover_pending", startup_handler.recover_pending_messages(app))
     await startup_handler.check_deploy_continuation(app)
+    boot.log_boot_summary()
 
     if app.message_loop_running:
         logger.debug("Message loop already running, skipping duplicate start")
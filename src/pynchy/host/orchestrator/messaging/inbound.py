@@ -14,6 +14,7 @@ import asyncio
 import time as _time
 from typing import TYPE_CHECKING
 
+from pynchy import tracing
 from pynchy.config import get_settings
 from pynchy.host.orchestrator.messaging.commands import is_any_magic_command
 from pynchy.host.orchestrator.messaging.pipeline import (
@@ -21,6 +22,7 @@ from pynchy.host.orchestrator.messaging.pipeline import (
     _mark_dispatched,
     intercept_special_command,
 )
+from pynchy.host.orchestrator.usage import over_daily_budget
 from pynchy.logger import logger
 from pynchy.state import get_messages_since, get_new_messages
 from pynchy.utils import create_background_task
@@ -131,13 +133,24 @@ async def _route_incoming_group(
 
     # --- Active scheduled task: forward, add todo, or interrupt ---
     if deps.queue.is_active_task(group_jid):
+        tracing.mark(group_jid, "enqueued")
         logger.info("route_trace", step="active_task_forward", group=group.name)
         await _handle_message_during_task(deps, group_jid, group, formatted, last_content, is_btw)
         return
 
+    # --- Over the daily budget: don't feed a warm container ---
+    # Wind it down instead; the queued check then runs the budget gate in
+    # process_group_messages, which notifies the chat.
+    if await over_daily_budget(group) is not None:
+        logger.info("route_trace", step="over_budget", group=group.name)
+        deps.queue.close_stdin(group_jid)
+        deps.queue.enqueue_message_check(group_jid)
+        return
+
     # --- Active message container: pipe follow-up messages ---
     if deps.queue.send_message(group_jid, formatted):
         logger.info("route_trace", step="piped_to_container", group=group.name)
+        tracing.mark(group_jid, "dispatched")
         if is_btw:
             # Non-interrupting — forward to active container via IPC but
             # don't advance the cursor.  Will be reprocessed after the
@@ -162,6 +175,7 @@ async def _route_incoming_group(
 
     # --- No active container: enqueue a new run ---
     logger.info("route_trace", step="enqueue_new_run", group=group.name)
+    tracing.mark(group_jid, "enqueued")
     first_msg = group_messages[0]
     await deps.send_reaction_to_channels(group_jid, first_msg.id, first_msg.sender, "sunrise")
     deps.queue.enqueue_message_check(group_jid)
@@ -267,7 +281,16 @@ async def start_message_loop(
                             step="route_start",
                             group=group.name,
                         )
-                        await _route_incoming_group(deps, group_jid, group, group_messages)
+                        with tracing.resume(group_jid) as trace:
+                            tracing.record_since_mark(group_jid, "ingested", "poll_wait")
+                            with tracing.span("route", group=group.name):
+                                await _route_incoming_group(deps, group_jid, group, group_messages)
+                        # Skipped or intercepted: no agent reply will close it
+                        if trace is not None and not trace.marks.keys() & {
+                            "enqueued",
+                            "dispatched",
+                        }:
+                            tracing.discard_trace(group_jid, trace.trace_id)
                         logger.info(
                             "message_loop_trace",
                             step="route_done",
@@ -10,6 +10,10 @@ for the user to answer via the channel (Slack, WhatsApp, etc.).
         -> user answers via widget callback
         -> answer written as IPC response, pending file deleted
 
+The files are the durable store; lookups (including the per-message
+``find_pending_for_jid`` check on WhatsApp inbound) go through an in-memory
+write-through index keyed by request_id and chat_jid.
+
 See docs/plans/2026-02-22-ask-user-blocking-design.md
 """
 
@@ -21,14 +25,22 @@ from pathlib import Path
 
 from pynchy.config import get_settings
 from pynchy.logger import logger
+from pynchy.utils import PendingFileIndex
 
 # How long before a pending question expires (seconds).
 # Matches the container-side ASK_USER_TIMEOUT (1800s = 30 minutes).
 PENDING_QUESTION_TIMEOUT_SECONDS = 1800
 
+# In-memory mirror of every pending_questions/*.json file across groups.
+_index = PendingFileIndex("pending_questions", keys=("chat_jid",))
+
 # -- Directory helpers ---------------------------------------------------------
 
 
+def _ipc_dir() -> Path:
+    return get_settings().data_dir / "ipc"
+
+
 def _pending_questions_dir(source_group: str) -> Path:
     """Return the pending_questions directory for a group, creating it if needed."""
     d = get_settings().data_dir / "ipc" / source_group / "pending_questions"
@@ -71,6 +83,7 @@ def create_pending_question(
     temp_path = filepath.with_suffix(".json.tmp")
     temp_path.write_text(json.dumps(data, indent=2))
     temp_path.rename(filepath)
+    _index.put(_ipc_dir(), data)
 
     logger.info(
         "Pending question created",
@@ -83,59 +96,24 @@ def create_pending_question(
 
 def find_pending_question(request_id: str) -> dict | None:
     """Find a pending question by exact request_id, searching across all groups."""
-    s = get_settings()
-    ipc_dir = s.data_dir / "ipc"
-    if not ipc_dir.exists():
-        return None
-
-    for group_dir in ipc_dir.iterdir():
-        if not group_dir.is_dir() or group_dir.name == "errors":
-            continue
-        filepath = group_dir / "pending_questions" / f"{request_id}.json"
-        if filepath.exists():
-            try:
-                return json.loads(filepath.read_text())
-            except (json.JSONDecodeError, OSError):
-                continue
-    return None
+    return _index.get(_ipc_dir(), request_id)
 
 
 def find_pending_for_jid(chat_jid: str) -> dict | None:
     """Find a pending question by chat_jid, searching across all groups.
 
     Returns the first match (there should only be one pending question
-    per chat at a time).
-
-    Note: This performs a synchronous filesystem scan across all group IPC
-    directories. Acceptable for personal deployments with a small number
-    of groups and pending questions. If this becomes a bottleneck, consider
-    an in-memory index keyed by chat_jid.
+    per chat at a time). O(1) index lookup — this runs on every inbound
+    WhatsApp message.
     """
-    s = get_settings()
-    ipc_dir = s.data_dir / "ipc"
-    if not ipc_dir.exists():
-        return None
-
-    for group_dir in ipc_dir.iterdir():
-        if not group_dir.is_dir() or group_dir.name == "errors":
-            continue
-        pq_dir = group_dir / "pending_questions"
-        if not pq_dir.exists():
-            continue
-        for filepath in pq_dir.glob("*.json"):
-            try:
-                data = json.loads(filepath.read_text())
-                if data.get("chat_jid") == chat_jid:
-                    return data
-            except (json.JSONDecodeError, OSError):
-                continue
-    return None
+    return _index.find(_ipc_dir(), "chat_jid", chat_jid)
 
 
 def resolve_pending_question(request_id: str, source_group: str) -> None:
     """Delete the pending question file (question has been answered)."""
     pending_dir = _pending_questions_dir(source_group)
     filepath = pending_dir / f"{request_id}.json"
+    _index.discard(_ipc_dir(), request_id)
     if filepath.exists():
         filepath.unlink()
         logger.info(
@@ -183,6 +161,7 @@ def update_message_id(request_id: str, source_group: str, message_id: str) -> No
     temp_path = filepath.with_suffix(".json.tmp")
     temp_path.write_text(json.dumps(data, indent=2))
     temp_path.rename(filepath)
+    _index.put(_ipc_dir(), data)
 
     logger.info(
         "Pending question message_id updated",
@@ -202,6 +181,8 @@ async def sweep_expired_questions() -> list[dict]:
     error IPC response for each expired question so the container (if still
     alive) unblocks with a timeout error.
 
+    Rebuilds the in-memory index from disk afterwards.
+
     Returns list of expired question dicts.
     """
     # Deferred import to avoid circular dependency:
@@ -211,6 +192,7 @@ async def sweep_expired_questions() -> list[dict]:
     s = get_settings()
     ipc_dir = s.data_dir / "ipc"
     if not ipc_dir.exists():
+        _index.rebuild(ipc_dir)
         return []
 
     now = datetime.now(UTC)
@@ -250,4 +232,5 @@ async def sweep_expired_questions() -> list[dict]:
                     err=str(exc),
                 )
 
+    _index.rebuild(ipc_dir)
     return expired
@@ -406,6 +406,20 @@ async def process_group_messages(
     if resolved.access == "read":
         return True
 
+    # Over the daily budget: leave the messages pending and re-check them
+    # once the UTC day rolls over (the chat is told once per day)
+    from pynchy.host.orchestrator.usage import over_daily_budget, run_after_budget_reset
+
+    spent = await over_daily_budget(group)
+    if spent is not None:
+        if run_after_budget_reset(chat_jid, lambda: deps.queue.enqueue_message_check(chat_jid)):
+            await deps.broadcast_host_message(
+                chat_jid,
+                f"💸 Daily budget reached ({spent:.2f} USD today) — "
+                "messages will be picked up after it resets at 00:00 UTC.",
+            )
+        return True
+
     from pynchy.host.orchestrator.messaging.formatter import format_messages_for_sdk
 
     messages = format_messages_for_sdk(missed_messages)
@@ -191,7 +191,11 @@ async def reconcile_all_channels(deps: ReconcilerDeps) -> None:
                 will_advance=new_inbound_cursor != inbound_cursor,
             )
             # --- Outbound retry ---
-            pending = await get_pending_outbound(ch.name, canonical_jid)
+            # Channels with their own ledger-backed outbox pace their retries
+            if getattr(ch, "drains_outbound_ledger", False) is True:
+                pending = []
+            else:
+                pending = await get_pending_outbound(ch.name, canonical_jid)
             outbound_cursor = await get_channel_cursor(ch.name, canonical_jid, "outbound")
             new_outbound_cursor = outbound_cursor
             for row in pending:
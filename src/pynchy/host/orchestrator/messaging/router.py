@@ -14,6 +14,7 @@ from datetime import UTC, datetime
 from itertools import count
 from typing import TYPE_CHECKING, Any
 
+from pynchy import tracing
 from pynchy.config import get_settings
 from pynchy.event_bus import AgentTraceEvent, MessageEvent
 from pynchy.host.orchestrator.messaging.formatter import format_tool_preview, parse_host_tag
@@ -22,6 +23,7 @@ from pynchy.host.orchestrator.messaging.streaming import (
     OutputDeps,
     StreamState,
     TraceBatcher,
+    detach_stream,
     enqueue_or_broadcast,
     finalize_active_stream,
     get_trace_batcher,
@@ -29,8 +31,9 @@ from pynchy.host.orchestrator.messaging.streaming import (
     stream_states,
     stream_text_to_channels,
 )
+from pynchy.host.orchestrator.usage import get_usage_writer
 from pynchy.logger import logger
-from pynchy.state import store_message_direct
+from pynchy.state import UsageRecord, store_message_direct
 from pynchy.utils import generate_message_id
 
 if TYPE_CHECKING:
@@ -338,14 +341,15 @@ async def _handle_text(deps: OutputDeps, chat_jid: str, result: ContainerOutput)
             event = OutboundEvent(type=OutboundEventType.TEXT, content="")
             state = StreamState(event=event)
             stream_states[chat_jid] = state
-        state.event.content += delta
-        await stream_text_to_channels(deps, chat_jid, state)
+        state.append(delta)
+        with tracing.span("stream"):
+            await stream_text_to_channels(deps, chat_jid, state)
 
 
 async def _handle_result_metadata(
-    deps: OutputDeps, chat_jid: str, meta: dict[str, Any], ts: str
+    deps: OutputDeps, chat_jid: str, group: WorkspaceProfile, meta: dict[str, Any], ts: str
 ) -> None:
-    """Persist result metadata (cost, usage, duration) and broadcast summary."""
+    """Persist result metadata (cost, usage, duration), account it and broadcast summary."""
     await store_message_direct(
         id=_next_trace_id("meta"),
         chat_jid=chat_jid,
@@ -356,6 +360,13 @@ async def _handle_result_metadata(
         is_from_me=True,
         message_type="assistant",
     )
+    writer = get_usage_writer()
+    if writer is not None:
+        record = UsageRecord.from_result_metadata(
+            meta, timestamp=ts, workspace=group.folder, chat_jid=chat_jid
+        )
+        if record is not None:
+            writer.add(record)
     cost = meta.get("total_cost_usd")
     duration = meta.get("duration_ms")
     turns = meta.get("num_turns")
@@ -429,8 +440,18 @@ async def _handle_final_result(
 
     # For channels that were streaming, finalize the existing message.
     # For all others, post normally via broadcast.
+    # Channels that rolled the stream over into several messages only get
+    # the not-yet-delivered tail in their last message.
     stream_ids = stream_state.message_ids if stream_state else None
-    await finalize_stream_or_broadcast(deps, chat_jid, event, stream_ids, suppress_errors=False)
+    stream_offsets = stream_state.final_offsets(event.content) if stream_state else None
+    await finalize_stream_or_broadcast(
+        deps,
+        chat_jid,
+        event,
+        stream_ids,
+        suppress_errors=False,
+        stream_offsets=stream_offsets,
+    )
 
     # Stash per-channel message IDs for post-run reactions (e.g. zzz).
     if stream_ids:
@@ -467,7 +488,31 @@ async def handle_streamed_output(
     Dispatches to type-specific handlers for trace events (thinking,
     tool_use, tool_result, system, text) and final results.
     Returns True if a user-visible result was sent.
+
+    Outputs tagged with the chat's open latency trace resume it; the
+    first user-visible text closes it.
     """
+    if not result.trace_id:
+        return await _dispatch_streamed_output(deps, chat_jid, group, result)
+
+    with tracing.resume(chat_jid, result.trace_id) as trace:
+        if trace is None:
+            return await _dispatch_streamed_output(deps, chat_jid, group, result)
+        if "first_output" not in trace.marks:
+            tracing.mark(chat_jid, "first_output")
+            tracing.record_since_mark(chat_jid, "dispatched", "container")
+        sent = await _dispatch_streamed_output(deps, chat_jid, group, result)
+    if (result.type == "text" and result.text) or sent:
+        tracing.close_trace(chat_jid, result.trace_id)
+    return sent
+
+
+async def _dispatch_streamed_output(
+    deps: OutputDeps,
+    chat_jid: str,
+    group: WorkspaceProfile,
+    result: ContainerOutput,
+) -> bool:
     ts = datetime.now(UTC).isoformat()
 
     # --- Trace events: persist to DB + broadcast ---
@@ -489,11 +534,11 @@ async def handle_streamed_output(
 
     # --- Final result: metadata + result text ---
     if result.result_metadata:
-        await _handle_result_metadata(deps, chat_jid, result.result_metadata, ts)
+        await _handle_result_metadata(deps, chat_jid, group, result.result_metadata, ts)
 
     # Finalize any streaming state — update streamed messages with final text
     # or clean up if the result is empty.
-    stream_state = stream_states.pop(chat_jid, None)
+    stream_state = await detach_stream(chat_jid)
 
     # Flush any buffered traces before the bot reply so ordering is preserved.
     batcher = get_trace_batcher()
@@ -15,14 +15,24 @@ proceeds fire-and-forget — the same behaviour as before the ledger existed.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import TYPE_CHECKING, Protocol
 
+from pynchy import metrics, tracing
 from pynchy.logger import logger
 
 if TYPE_CHECKING:
     from pynchy.types import Channel, OutboundEvent
 
 
+_SENDS = metrics.counter(
+    "pynchy_channel_sends_total", "Outbound events delivered per channel.", ("channel",)
+)
+_SEND_ERRORS = metrics.counter(
+    "pynchy_channel_send_errors_total", "Outbound deliveries that failed.", ("channel",)
+)
+
+
 class BusDeps(Protocol):
     """Minimal dependencies for the message bus."""
 
@@ -197,13 +207,16 @@ async def broadcast(
     )
 
     # Deliver to each target
-    for ch, target_jid in targets:
-        try:
-            await ch.send_event(target_jid, event)
-            await _mark_success(ledger_id, ch.name)
-        except caught as exc:
-            logger.warning("Channel send failed", channel=ch.name, err=str(exc))
-            await _mark_error(ledger_id, ch.name, str(exc))
+    with tracing.span("broadcast", source=source):
+        for ch, target_jid in targets:
+            try:
+                await ch.send_event(target_jid, event)
+                _SENDS.labels(ch.name).inc()
+                await _mark_success(ledger_id, ch.name)
+            except caught as exc:
+                _SEND_ERRORS.labels(ch.name).inc()
+                logger.warning("Channel send failed", channel=ch.name, err=str(exc))
+                await _mark_error(ledger_id, ch.name, str(exc))
 
 
 async def finalize_stream_or_broadcast(
@@ -213,6 +226,7 @@ async def finalize_stream_or_broadcast(
     stream_message_ids: dict[str, str] | None,
     *,
     suppress_errors: bool = True,
+    stream_offsets: dict[str, int] | None = None,
 ) -> None:
     """Finalize streaming messages or fall back to normal broadcast.
 
@@ -227,6 +241,9 @@ async def finalize_stream_or_broadcast(
         stream_message_ids: Mapping of channel_name -> message_id from
             streaming. Pass None or empty dict to broadcast normally.
         suppress_errors: Error handling mode (same as ``broadcast``).
+        stream_offsets: Mapping of channel_name -> offset for channels whose
+            stream was split across several messages; their streamed message
+            is updated with ``event.content[offset:]`` only.
     """
     if not stream_message_ids:
         await broadcast(deps, chat_jid, event, suppress_errors=suppress_errors, source="agent")
@@ -268,13 +285,15 @@ async def finalize_stream_or_broadcast(
     # update_event failures always trigger fallback (catch Exception);
     # send_event failures respect suppress_errors via `caught`.
     for ch, msg_id, target_jid in stream_targets:
+        offset = (stream_offsets or {}).get(ch.name, 0)
+        ch_event = replace(event, content=event.content[offset:]) if offset else event
         try:
-            await ch.update_event(target_jid, msg_id, event)
+            await ch.update_event(target_jid, msg_id, ch_event)
             await _mark_success(ledger_id, ch.name)
         except Exception:
             logger.warning("Stream update failed, falling back to send_event", channel=ch.name)
             try:
-                await ch.send_event(target_jid, event)
+                await ch.send_event(target_jid, ch_event)
                 await _mark_success(ledger_id, ch.name)
             except caught as exc:
                 logger.warning("Fallback send_event also failed", channel=ch.name, err=str(exc))
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import asyncio
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, Protocol
 
 from pynchy.host.orchestrator.messaging.sender import resolve_target_jid
@@ -42,29 +42,177 @@ class OutputDeps(Protocol):
 # Text streaming — accumulates text deltas and pushes to channels
 # ---------------------------------------------------------------------------
 
-# Minimum interval between streaming updates to channels (seconds).
+# Default minimum interval between streaming updates to a channel (seconds).
+# Channels can override it with a ``stream_update_interval`` attribute that
+# reflects their provider's update rate limit.
 _STREAM_THROTTLE = 0.5
 
+# Adaptive throttle: a failed update multiplies the channel's interval by
+# _BACKOFF_FACTOR (capped at _MAX_STREAM_INTERVAL); each success decays it
+# back toward the channel's base interval.
+_BACKOFF_FACTOR = 2.0
+_DECAY_FACTOR = 0.75
+_MAX_STREAM_INTERVAL = 10.0
+
+
+class StreamBuffer:
+    """Append-only text buffer with O(1) appends.
+
+    Deltas are kept as a chunk list and joined onto the cached prefix only
+    when the text is read, so a reply of N deltas costs O(total length)
+    instead of O(N * length) for repeated ``str +=``.
+    """
+
+    def __init__(self, text: str = "") -> None:
+        self._prefix = text
+        self._chunks: list[str] = []
+        self._length = len(text)
+
+    def append(self, delta: str) -> None:
+        self._chunks.append(delta)
+        self._length += len(delta)
+
+    @property
+    def text(self) -> str:
+        if self._chunks:
+            self._prefix += "".join(self._chunks)
+            self._chunks.clear()
+        return self._prefix
+
+    def __len__(self) -> int:
+        return self._length
+
 
 @dataclass
 class StreamState:
     """Tracks in-progress streaming text for a single chat.
 
-    The ``event`` field is a TEXT OutboundEvent whose content grows as deltas
-    arrive.  The channel's formatter handles cursor display and internal-tag
-    rendering via ``event.metadata["cursor"]``.
+    Text deltas accumulate in ``buffer``; ``event`` is the TEXT OutboundEvent
+    template whose content is filled from the buffer when pushed.  The
+    channel's formatter handles cursor display and internal-tag rendering
+    via ``event.metadata["cursor"]``.
+
+    When a channel's ``max_stream_length`` is reached, the current message
+    is finalized and streaming continues in a new one; ``offsets`` records
+    where each channel's current message starts in the full text.
     """
 
     event: OutboundEvent
-    # channel -> message_id for in-place updates
+    # channel -> message_id for in-place updates (current message per channel)
     message_ids: dict[str, str] = field(default_factory=dict)
     last_update: float = 0.0
+    buffer: StreamBuffer = field(default_factory=StreamBuffer)
+    # channel -> offset into the full text where its current message starts
+    offsets: dict[str, int] = field(default_factory=dict)
+    # channel -> last push time / current adaptive interval
+    channel_updates: dict[str, float] = field(default_factory=dict)
+    channel_intervals: dict[str, float] = field(default_factory=dict)
+    flush_timer: asyncio.TimerHandle | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    # Set once the stream is handed to finalization; late flushes are dropped.
+    closed: bool = False
+
+    def __post_init__(self) -> None:
+        if self.event.content and not len(self.buffer):
+            self.buffer = StreamBuffer(self.event.content)
+
+    def append(self, delta: str) -> None:
+        self.buffer.append(delta)
+
+    @property
+    def text(self) -> str:
+        return self.buffer.text
+
+    def cancel_flush(self) -> None:
+        if self.flush_timer is not None:
+            self.flush_timer.cancel()
+            self.flush_timer = None
+
+    def final_offsets(self, final_text: str) -> dict[str, int]:
+        """Per-channel offsets to apply to the final result text.
+
+        Only channels whose already-finalized messages are a prefix of
+        *final_text* get an offset; others fall back to the full text.
+        """
+        text = self.text
+        return {
+            name: offset
+            for name, offset in self.offsets.items()
+            if offset and final_text.startswith(text[:offset])
+        }
 
 
 # Per-chat streaming state, created on first text event, cleaned up on result.
 stream_states: dict[str, StreamState] = {}
 
 
+def _split_point(text: str, limit: int) -> int:
+    """Choose where to break *text* so the first part fits in *limit* chars."""
+    cut = text.rfind("\n", 0, limit)
+    if cut <= limit // 2:
+        cut = text.rfind(" ", 0, limit)
+    if cut <= limit // 2:
+        cut = limit
+    return cut
+
+
+def _channel_limit(ch: Channel, attr: str, default: float | None) -> Any:
+    """Read an optional numeric streaming hint from a channel, else *default*."""
+    value = getattr(ch, attr, default)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        return default
+    return value
+
+
+def _stream_channels(deps: OutputDeps, chat_jid: str) -> list[tuple[Channel, str]]:
+    targets: list[tuple[Channel, str]] = []
+    for ch in deps.channels:
+        if not ch.is_connected():
+            continue
+        if not hasattr(ch, "update_event") or not hasattr(ch, "post_event"):
+            continue
+        target_jid = resolve_target_jid(chat_jid, ch)
+        if target_jid:
+            targets.append((ch, target_jid))
+    return targets
+
+
+def _schedule_trailing_flush(
+    deps: OutputDeps, chat_jid: str, state: StreamState, delay: float
+) -> None:
+    """Make sure text that arrived inside a throttle window is shown eventually."""
+    if state.flush_timer is not None:
+        return
+
+    def _fire() -> None:
+        state.flush_timer = None
+        if stream_states.get(chat_jid) is state:
+            create_background_task(
+                stream_text_to_channels(deps, chat_jid, state), name="stream-flush"
+            )
+
+    loop = asyncio.get_running_loop()
+    state.flush_timer = loop.call_later(max(delay, 0.0), _fire)
+
+
+async def _push(
+    ch: Channel, target_jid: str, state: StreamState, content: str, *, cursor: bool
+) -> None:
+    """Post or update this channel's current stream message."""
+    ch_name = getattr(ch, "name", "?")
+    event = replace(state.event, content=content, metadata={**state.event.metadata})
+    event.metadata["cursor"] = cursor
+    msg_id = state.message_ids.get(ch_name)
+    if msg_id is None:
+        msg_id = await ch.post_event(target_jid, event)
+        if msg_id:
+            state.message_ids[ch_name] = msg_id
+        else:
+            logger.warning("Stream post_event returned no message_id", channel=ch_name)
+    else:
+        await ch.update_event(target_jid, msg_id, event)
+
+
 async def stream_text_to_channels(
     deps: OutputDeps,
     chat_jid: str,
@@ -72,50 +220,82 @@ async def stream_text_to_channels(
     *,
     final: bool = False,
 ) -> None:
-    """Push the current OutboundEvent to channels that support update_event.
+    """Push the buffered text to channels that support update_event.
 
     On first call, posts a new message via ``post_event``.  Subsequent calls
-    update it in-place via ``update_event``.  Throttled to _STREAM_THROTTLE
-    unless ``final`` is True.
+    update it in-place via ``update_event``.  Each channel is throttled to
+    its own ``stream_update_interval`` (default _STREAM_THROTTLE), backing
+    off after failed updates; text that arrives inside the window is pushed
+    by a trailing-edge timer.  ``final`` bypasses the throttle.
+
+    When the text exceeds a channel's ``max_stream_length``, the current
+    message is finalized at a line/word boundary and a new one is started.
 
     The formatter inside each channel handles cursor display and internal-tag
     rendering -- this function just sets ``metadata["cursor"]`` and delegates.
     """
-    now = time.monotonic()
-    if not final and (now - state.last_update) < _STREAM_THROTTLE:
-        return
-
-    if not state.event.content and not final:
+    if not len(state.buffer) and not final:
         return  # nothing to show yet
 
-    # Tell the formatter whether to show a cursor indicator.
-    state.event.metadata["cursor"] = not final
-    state.last_update = now
-
-    for ch in deps.channels:
-        if not ch.is_connected():
-            continue
-        if not hasattr(ch, "update_event") or not hasattr(ch, "post_event"):
-            continue
-
-        target_jid = resolve_target_jid(chat_jid, ch)
-        if not target_jid:
-            continue
-
-        ch_name = getattr(ch, "name", "?")
-        msg_id = state.message_ids.get(ch_name)
-
-        try:
-            if msg_id is None:
-                msg_id = await ch.post_event(target_jid, state.event)
-                if msg_id:
-                    state.message_ids[ch_name] = msg_id
-                else:
-                    logger.warning("Stream post_event returned no message_id", channel=ch_name)
-            else:
-                await ch.update_event(target_jid, msg_id, state.event)
-        except Exception as exc:
-            logger.warning("Stream post/update failed", channel=ch_name, err=str(exc))
+    async with state.lock:
+        if state.closed and not final:
+            return
+        if final:
+            state.cancel_flush()
+        now = time.monotonic()
+        next_due: float | None = None
+
+        # Throttle check first: most deltas arrive inside every channel's
+        # window, and materializing the text for them would make a reply of
+        # N deltas cost O(N * length) again.
+        due: list[tuple[Channel, str, float, float]] = []
+        for ch, target_jid in _stream_channels(deps, chat_jid):
+            ch_name = getattr(ch, "name", "?")
+            base = _channel_limit(ch, "stream_update_interval", _STREAM_THROTTLE)
+            interval = state.channel_intervals.get(ch_name, base)
+            elapsed = now - state.channel_updates.get(ch_name, 0.0)
+            if not final and elapsed < interval:
+                wait = interval - elapsed
+                next_due = wait if next_due is None else min(next_due, wait)
+                continue
+            due.append((ch, target_jid, base, interval))
+
+        if due or final:
+            text = state.text
+            for ch, target_jid, base, interval in due:
+                ch_name = getattr(ch, "name", "?")
+                state.channel_updates[ch_name] = now
+                offset = state.offsets.get(ch_name, 0)
+                limit = _channel_limit(ch, "max_stream_length", None)
+                try:
+                    # Roll over to a new message while this one would exceed the cap.
+                    while limit and len(text) - offset > limit:
+                        cut = offset + _split_point(text[offset:], limit)
+                        await _push(ch, target_jid, state, text[offset:cut], cursor=False)
+                        state.message_ids.pop(ch_name, None)
+                        offset = cut
+                        while offset < len(text) and text[offset] == "\n":
+                            offset += 1
+                        state.offsets[ch_name] = offset
+                    if offset < len(text) or final:
+                        await _push(ch, target_jid, state, text[offset:], cursor=not final)
+                    state.channel_intervals[ch_name] = max(base, interval * _DECAY_FACTOR)
+                except Exception as exc:
+                    backoff = min(max(interval, base) * _BACKOFF_FACTOR, _MAX_STREAM_INTERVAL)
+                    state.channel_intervals[ch_name] = backoff
+                    logger.warning(
+                        "Stream post/update failed",
+                        channel=ch_name,
+                        err=str(exc),
+                        next_interval=backoff,
+                    )
+
+            state.last_update = now
+            state.event.content = text
+            state.event.metadata["cursor"] = not final
+
+    if next_due is not None and not final:
+        _schedule_trailing_flush(deps, chat_jid, state, next_due)
 
 
 async def finalize_active_stream(deps: OutputDeps, chat_jid: str) -> None:
@@ -125,11 +305,27 @@ async def finalize_active_stream(deps: OutputDeps, chat_jid: str) -> None:
     becomes its own completed message, preserving chronological interleaving
     between agent text and tool calls in the channel.
     """
-    state = stream_states.pop(chat_jid, None)
-    if state and state.event.content:
+    state = await detach_stream(chat_jid)
+    if state is not None and len(state.buffer):
         await stream_text_to_channels(deps, chat_jid, state, final=True)
 
 
+async def detach_stream(chat_jid: str) -> StreamState | None:
+    """Remove *chat_jid*'s stream state and stop its pending flushes.
+
+    Waits for any in-flight push to finish so a late trailing-edge update
+    can't overwrite the message after the caller finalizes it.
+    """
+    state = stream_states.pop(chat_jid, None)
+    if state is None:
+        return None
+    state.closed = True
+    state.cancel_flush()
+    async with state.lock:
+        pass
+    return state
+
+
 # ---------------------------------------------------------------------------
 # Trace batcher — debounce-batches trace messages per chat JID
 # ---------------------------------------------------------------------------
@@ -8,6 +8,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, Protocol
 
+from pynchy import tracing
 from pynchy.event_bus import ChatClearedEvent, MessageEvent
 from pynchy.host.container_manager.session import destroy_session
 from pynchy.host.git_ops._worktree_merge import background_merge_worktree
@@ -162,37 +163,41 @@ async def ingest_user_message(
         source_channel: Optional name of the originating channel (e.g., "tui").
                        If provided, we skip broadcasting back to that channel.
     """
-    # 1. Store in database
-    await store_message(msg)
-
-    # 2. Emit to event bus (for TUI/SSE, logging, etc.)
-    deps.emit(
-        MessageEvent(
-            chat_jid=msg.chat_jid,
-            sender_name=msg.sender_name,
-            content=msg.content,
-            timestamp=msg.timestamp,
-            is_bot=False,
+    # Start (or join) the latency trace for this chat's next agent reply
+    tracing.open_trace(msg.chat_jid, sealed_by="dispatched")
+    with tracing.resume(msg.chat_jid), tracing.span("ingest", channel=source_channel or ""):
+        # 1. Store in database
+        await store_message(msg)
+
+        # 2. Emit to event bus (for TUI/SSE, logging, etc.)
+        deps.emit(
+            MessageEvent(
+                chat_jid=msg.chat_jid,
+                sender_name=msg.sender_name,
+                content=msg.content,
+                timestamp=msg.timestamp,
+                is_bot=False,
+            )
         )
-    )
 
-    # 3. Broadcast to all connected channels (except source)
-    # This ensures messages from one UI appear in all other UIs.
-    # Include sender attribution so the message isn't mistaken for bot
-    # output (e.g. Slack posts as the bot user).  The source channel is
-    # skipped, so magic-word detection on the originating channel is
-    # unaffected — and receiving channels won't re-ingest bot-posted
-    # messages (Slack filters bot_id, WhatsApp filters IsFromMe echoes).
-    from pynchy.types import OutboundEvent, OutboundEventType
-
-    channel_text = f"[{msg.sender_name}] {msg.content}"
-    await broadcast(
-        deps,
-        msg.chat_jid,
-        OutboundEvent(type=OutboundEventType.TEXT, content=channel_text),
-        skip_channel=source_channel,
-        source="cross_post",
-    )
+        # 3. Broadcast to all connected channels (except source)
+        # This ensures messages from one UI appear in all other UIs.
+        # Include sender attribution so the message isn't mistaken for bot
+        # output (e.g. Slack posts as the bot user).  The source channel is
+        # skipped, so magic-word detection on the originating channel is
+        # unaffected — and receiving channels won't re-ingest bot-posted
+        # messages (Slack filters bot_id, WhatsApp filters IsFromMe echoes).
+        from pynchy.types import OutboundEvent, OutboundEventType
+
+        channel_text = f"[{msg.sender_name}] {msg.content}"
+        await broadcast(
+            deps,
+            msg.chat_jid,
+            OutboundEvent(type=OutboundEventType.TEXT, content=channel_text),
+            skip_channel=source_channel,
+            source="cross_post",
+        )
+    tracing.mark(msg.chat_jid, "ingested")
 
 
 async def on_inbound(deps: SessionDeps, _jid: str, msg: NewMessage) -> None:
@@ -14,8 +14,11 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any, Protocol
 
+from pynchy import tracing
 from pynchy.config import get_settings
 from pynchy.host.container_manager.docker import run_docker
+from pynchy.host.container_manager.ipc.registry import get_dispatch_stats
+from pynchy.host.container_manager.security.bash_classify import get_classifier_stats
 from pynchy.host.git_ops.repo import RepoContext, get_repo_context
 from pynchy.host.git_ops.utils import (
     count_unpushed_commits,
@@ -25,6 +28,7 @@ from pynchy.host.git_ops.utils import (
     is_repo_dirty,
     run_git,
 )
+from pynchy.host.orchestrator.boot import get_boot_stats
 from pynchy.logger import logger
 from pynchy.state import (
     get_all_host_jobs,
@@ -59,6 +63,7 @@ class StatusDeps(Protocol):
     def get_gateway_info(self) -> dict[str, Any]: ...
     def get_active_sessions_count(self) -> int: ...
     def get_workspace_count(self) -> int: ...
+    def get_memory_provider(self) -> Any | None: ...
 
 
 # ---------------------------------------------------------------------------
@@ -83,6 +88,10 @@ async def collect_status(deps: StatusDeps, start_time_monotonic: float) -> dict[
         "total": deps.get_workspace_count(),
         "active_sessions": deps.get_active_sessions_count(),
     }
+    security = {"bash_classifier": get_classifier_stats()}
+    ipc = {"dispatch": get_dispatch_stats()}
+    latency = tracing.get_trace_stats()
+    boot = get_boot_stats()
 
     # Concurrent I/O: DB queries, git subprocesses, gateway health
     (
@@ -92,6 +101,7 @@ async def collect_status(deps: StatusDeps, start_time_monotonic: float) -> dict[
         tasks,
         host_jobs,
         gateway,
+        memory,
     ) = await asyncio.gather(
         _collect_deploy(),
         asyncio.to_thread(_collect_repos),
@@ -99,10 +109,12 @@ async def collect_status(deps: StatusDeps, start_time_monotonic: float) -> dict[
         _collect_tasks(),
         _collect_host_jobs(),
         _collect_gateway(deps.get_gateway_info()),
+        _collect_memory(deps.get_memory_provider()),
     )
 
     return {
         "service": service,
+        "boot": boot,
         "deploy": deploy,
         "channels": channels,
         "gateway": gateway,
@@ -112,6 +124,10 @@ async def collect_status(deps: StatusDeps, start_time_monotonic: float) -> dict[
         "tasks": tasks,
         "host_jobs": host_jobs,
         "groups": groups,
+        "security": security,
+        "ipc": ipc,
+        "latency": latency,
+        "memory": memory,
     }
 
 
@@ -265,6 +281,20 @@ async def _collect_host_jobs() -> list[dict[str, Any]]:
     ]
 
 
+async def _collect_memory(provider: Any | None) -> dict[str, Any]:
+    """Memory backend size and maintenance stats, when the backend reports them."""
+    if provider is None:
+        return {"backend": None}
+    stats = getattr(provider, "stats", None)
+    if stats is None:
+        return {"backend": provider.name}
+    try:
+        return await stats()
+    except Exception as exc:
+        logger.warning("Memory stats collection failed", error=str(exc))
+        return {"backend": provider.name, "error": str(exc)}
+
+
 async def _collect_gateway(info: dict[str, Any]) -> dict[str, Any]:
     """Gateway health — Docker inspect + HTTP health check.
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 if TYPE_CHECKING:
     from pynchy.host.container_manager import OnOutput
@@ -35,6 +35,9 @@ class SchedulerDependencies(Protocol):
     @property
     def queue(self) -> GroupQueue: ...
 
+    @property
+    def memory(self) -> Any | None: ...
+
     async def broadcast_to_channels(self, jid: str, event: OutboundEvent) -> None: ...
 
     async def run_agent(
@@ -58,6 +61,7 @@ class SchedulerDependencies(Protocol):
 _scheduler_lock = asyncio.Lock()
 _scheduler_running = False
 _cron_job_next_runs: dict[str, str] = {}
+_memory_maintenance_next_run: str | None = None
 
 
 async def start_scheduler_loop(deps: SchedulerDependencies) -> None:
@@ -73,6 +77,7 @@ async def start_scheduler_loop(deps: SchedulerDependencies) -> None:
     while True:
         try:
             await _poll_host_cron_jobs()
+            await _poll_memory_maintenance(deps)
 
             # Only poll database host jobs if database is available
             try:
@@ -167,6 +172,33 @@ async def _poll_host_cron_jobs() -> None:
         await _run_host_cron_job(job_name)
 
 
+async def _poll_memory_maintenance(deps: SchedulerDependencies) -> None:
+    """Run the memory backend's maintenance on the [memory] cron schedule."""
+    global _memory_maintenance_next_run
+    s = get_settings()
+    maintain = getattr(deps.memory, "maintain", None)
+    if maintain is None or not s.memory.maintenance_schedule:
+        return
+
+    if _memory_maintenance_next_run is None:
+        _memory_maintenance_next_run = compute_next_run(
+            "cron", s.memory.maintenance_schedule, s.timezone
+        )
+    if datetime.fromisoformat(_memory_maintenance_next_run).astimezone(UTC) > datetime.now(UTC):
+        return
+
+    _memory_maintenance_next_run = compute_next_run(
+        "cron", s.memory.maintenance_schedule, s.timezone
+    )
+    try:
+        await maintain(
+            max_rows_per_group=s.memory.max_rows_per_group,
+            max_bytes_per_group=s.memory.max_bytes_per_group,
+        )
+    except Exception:
+        logger.exception("Memory maintenance failed")
+
+
 async def _poll_database_host_jobs() -> None:
     """Run due host jobs from the database (created via MCP tool)."""
     s = get_settings()
@@ -0,0 +1,157 @@
+"""Usage accounting — batches per-query usage into the ledger and gates on budget.
+
+The router hands every agent result's ``result_metadata`` to the
+:class:`UsageWriter`, which buffers :class:`~pynchy.state.UsageRecord`
+rows and writes them in one transaction once ``[usage].batch_size``
+records are pending or ``[usage].flush_interval`` seconds have passed.
+Each write also updates the hourly/daily rollups, which back
+``/api/usage``, the TUI usage view and :func:`over_daily_budget`.
+
+Workspaces over budget are gated both where a new run starts and where
+follow-ups would be piped into a warm container; their pending messages
+are re-checked just after the budget resets (:func:`run_after_budget_reset`).
+Budget checks don't flush the writer — buffered cost is added in memory —
+and a workspace found over budget stays cached as such until the UTC day
+rolls over, since spend can only grow within a day.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from pynchy.config import get_settings
+from pynchy.logger import logger
+from pynchy.state import UsageRecord, get_workspace_spend, record_usage
+from pynchy.utils import create_background_task
+
+if TYPE_CHECKING:
+    from pynchy.types import WorkspaceProfile
+
+
+class UsageWriter:
+    """Buffers usage records and writes them to the ledger in batches."""
+
+    def __init__(self, flush_interval: float, batch_size: int) -> None:
+        self._flush_interval = flush_interval
+        self._batch_size = batch_size
+        self._pending: list[UsageRecord] = []
+        self._writing: list[UsageRecord] = []  # batch being written by flush()
+        self._timer: asyncio.TimerHandle | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def pending_cost(self, workspace: str, day: str) -> float:
+        """USD of *workspace*'s buffered (not yet written) records on UTC *day*."""
+        return sum(
+            r.cost_usd
+            for r in (*self._writing, *self._pending)
+            if r.workspace == workspace and r.timestamp.startswith(day)
+        )
+
+    def add(self, record: UsageRecord) -> None:
+        """Buffer *record*; a full batch is written right away."""
+        self._pending.append(record)
+        if len(self._pending) >= self._batch_size:
+            self._cancel_timer()
+            create_background_task(self.flush(), name="usage-flush")
+        elif self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(
+                self._flush_interval,
+                lambda: create_background_task(self.flush(), name="usage-flush"),
+            )
+
+    async def flush(self) -> None:
+        """Write every buffered record (also used at shutdown)."""
+        self._cancel_timer()
+        async with self._lock:
+            records, self._pending = self._pending, []
+            if not records:
+                return
+            self._writing = records
+            try:
+                await record_usage(records)
+            except Exception:
+                logger.exception("Failed to record usage", dropped=len(records))
+            finally:
+                self._writing = []
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+
+# Module-level singleton
+_usage_writer: UsageWriter | None = None
+
+
+def init_usage_writer() -> UsageWriter:
+    """Initialise the module-level UsageWriter from ``[usage]``. Called once at startup."""
+    global _usage_writer
+    cfg = get_settings().usage
+    _usage_writer = UsageWriter(cfg.flush_interval, cfg.batch_size)
+    return _usage_writer
+
+
+def get_usage_writer() -> UsageWriter | None:
+    """Return the current UsageWriter (or None before init)."""
+    return _usage_writer
+
+
+# workspace folder -> (UTC day, spend) once it reached the budget that day
+_over_budget: dict[str, tuple[str, float]] = {}
+
+
+async def over_daily_budget(group: WorkspaceProfile) -> float | None:
+    """Today's spend if *group* has reached ``[usage].daily_budget_usd``, else None.
+
+    Reads the daily rollup plus the writer's buffered records, so the last
+    few queries count without forcing a flush.  Admin workspaces are never
+    gated.
+    """
+    budget = get_settings().usage.daily_budget_usd
+    if budget is None or group.is_admin:
+        return None
+    today = datetime.now(UTC).date().isoformat()
+    cached = _over_budget.get(group.folder)
+    if cached is not None and cached[0] == today and cached[1] >= budget:
+        return cached[1]
+    spent = await get_workspace_spend(group.folder, today)
+    if _usage_writer is not None:
+        spent += _usage_writer.pending_cost(group.folder, today)
+    if spent < budget:
+        return None
+    _over_budget[group.folder] = (today, spent)
+    return spent
+
+
+# chat_jid -> timer re-checking the chat once the daily budget resets
+_reset_timers: dict[str, asyncio.TimerHandle] = {}
+
+
+def run_after_budget_reset(chat_jid: str, callback: Callable[[], object]) -> bool:
+    """Call *callback* just after the next 00:00 UTC (once per chat, however often asked).
+
+    Returns True only when this call scheduled it — i.e. the first time
+    today for *chat_jid* — so callers can notify the chat once per day.
+    """
+    if chat_jid in _reset_timers:
+        return False
+    now = datetime.now(UTC)
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _fire() -> None:
+        _reset_timers.pop(chat_jid, None)
+        callback()
+
+    # A second past midnight, so the spend lookup lands on the new day
+    delay = (midnight - now).total_seconds() + 1
+    _reset_timers[chat_jid] = asyncio.get_running_loop().call_later(delay, _fire)
+    return True
@@ -0,0 +1,294 @@
+"""In-process metrics — counters, gauges and histograms for ``/metrics``.
+
+Modules declare their metrics at import time and update them inline::
+
+    _RUNS = metrics.counter("pynchy_queue_runs_total", "Container runs", ("kind",))
+    _RUNS.labels("messages").inc()
+
+Updates are plain attribute arithmetic on the event loop thread — no
+locks, no I/O — so instrumenting a hot path costs a dict lookup at most.
+Values already tracked elsewhere (queue depth, active containers) are
+read at scrape time through :meth:`Gauge.set_function` rather than
+mirrored on every change.
+
+:func:`render` produces the Prometheus text exposition format (0.0.4),
+served by the HTTP server at ``/metrics``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiohttp import web
+
+# Seconds; covers sub-millisecond DB commits up to multi-second LLM calls.
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+# ---------------------------------------------------------------------------
+# Per-label-set values
+# ---------------------------------------------------------------------------
+
+
+class _Value:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Buckets:
+    __slots__ = ("_bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self._bounds = bounds
+        # One slot per bound plus +Inf; made cumulative at render time
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    @contextlib.contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the wall time of the block, in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+
+# ---------------------------------------------------------------------------
+# Metric families
+# ---------------------------------------------------------------------------
+
+
+class _Metric[C]:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], C] = {}
+        if not self.labelnames:
+            self.labels()  # unlabelled metrics are exported from the start
+
+    def _new_child(self) -> C:
+        raise NotImplementedError
+
+    def labels(self, *values: object) -> C:
+        """The child for *values*, one per label name (created on first use)."""
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values!r}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _default(self) -> C:
+        if self.labelnames:
+            raise ValueError(f"{self.name} is labelled; call .labels() first")
+        return self.labels()
+
+    def _samples(self) -> Iterator[Sample]:
+        raise NotImplementedError
+
+
+class Counter(_Metric[_Value]):
+    kind = "counter"
+
+    def _new_child(self) -> _Value:
+        return _Value()
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._default().inc(amount)
+
+    def _samples(self) -> Iterator[Sample]:
+        for key, child in sorted(self._children.items()):
+            yield self.name, tuple(zip(self.labelnames, key, strict=True)), child.value
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._function: Callable[[], float] | None = None
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._default().dec(amount)
+
+    def set(self, value: float) -> None:
+        self._default().set(value)
+
+    def set_function(self, fn: Callable[[], float] | None) -> None:
+        """Read the (unlabelled) value from *fn* at scrape time."""
+        self._function = fn
+
+    def _samples(self) -> Iterator[Sample]:
+        if self._function is not None:
+            yield self.name, (), float(self._function())
+        else:
+            yield from super()._samples()
+
+
+class Histogram(_Metric[_Buckets]):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self) -> _Buckets:
+        return _Buckets(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._default().observe(value)
+
+    def time(self) -> contextlib.AbstractContextManager[None]:
+        return self._default().time()
+
+    def _samples(self) -> Iterator[Sample]:
+        bounds = (*self.buckets, math.inf)
+        for key, child in sorted(self._children.items()):
+            labels = tuple(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, n in zip(bounds, child.counts, strict=True):
+                cumulative += n
+                yield f"{self.name}_bucket", (*labels, ("le", _fmt(bound))), cumulative
+            yield f"{self.name}_sum", labels, child.sum
+            yield f"{self.name}_count", labels, child.count
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_registry: dict[str, _Metric] = {}
+
+
+def _register[M: _Metric](metric: M) -> M:
+    existing = _registry.get(metric.name)
+    if existing is None:
+        _registry[metric.name] = metric
+        return metric
+    # Re-declaring the same shape (e.g. a module re-imported in tests) is fine
+    if type(existing) is not type(metric) or existing.labelnames != metric.labelnames:
+        raise ValueError(f"Metric {metric.name} is already registered with a different shape")
+    return existing  # type: ignore[return-value]
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    return _register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    return _register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    return _register(Histogram(name, documentation, labelnames, buckets))
+
+
+def request_middleware(prefix: str, server: str) -> Callable[..., Awaitable[web.StreamResponse]]:
+    """aiohttp middleware counting *server*'s requests by status and timing them.
+
+    Registers ``{prefix}_requests_total{status}`` and ``{prefix}_request_seconds``.
+    Streamed responses are timed until the handler returns, i.e. to the last byte.
+    """
+    from aiohttp import web
+
+    requests = counter(
+        f"{prefix}_requests_total", f"Requests handled by the {server}.", ("status",)
+    )
+    seconds = histogram(f"{prefix}_request_seconds", f"Request latency of the {server}.")
+
+    @web.middleware
+    async def middleware(
+        request: web.Request,
+        handler: Callable[[web.Request], Awaitable[web.StreamResponse]],
+    ) -> web.StreamResponse:
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = await handler(request)
+            status = response.status
+            return response
+        except web.HTTPException as exc:
+            status = exc.status
+            raise
+        finally:
+            requests.labels(status).inc()
+            seconds.observe(time.perf_counter() - started)
+
+    return middleware
+
+
+# ---------------------------------------------------------------------------
+# Exposition
+# ---------------------------------------------------------------------------
+
+
+def _fmt(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def render() -> str:
+    """All registered metrics in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for name, metric in sorted(_registry.items()):
+        lines.append(f"# HELP {name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        for sample, labels, value in metric._samples():
+            if labels:
+                rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels)
+                lines.append(f"{sample}{{{rendered}}} {_fmt(value)}")
+            else:
+                lines.append(f"{sample} {_fmt(value)}")
+    return "\n".join(lines) + "\n"
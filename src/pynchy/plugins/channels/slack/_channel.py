@@ -13,6 +13,14 @@ from typing import Any
 from pynchy.config import get_settings
 from pynchy.logger import logger
 from pynchy.plugins.channels.slack._blocks import SlackBlocksFormatter
+from pynchy.state import (
+    get_directory_names,
+    get_directory_synced_at,
+    prune_directory,
+    set_directory_synced_at,
+    upsert_chat_names,
+    upsert_directory_names,
+)
 from pynchy.types import InboundFetchResult, NewMessage, OutboundEvent
 
 from ._ui import (
@@ -28,6 +36,10 @@ from ._ui import (
 
 JID_PREFIX = "slack:"
 
+# Full users.list / conversations.list sync of the persistent name directory.
+_DIRECTORY_REFRESH_INTERVAL = 24 * 3600
+_DIRECTORY_PAGE_SIZE = 200
+
 
 def _jid(channel_id: str) -> str:
     """Convert a Slack channel ID to a pynchy JID."""
@@ -79,6 +91,10 @@ class SlackChannel:
     """Pynchy ``Channel`` protocol implementation backed by Slack Socket Mode."""
 
     prefix_assistant_name: bool = False  # Slack shows the bot username already
+    # Streaming: chat.update is a Tier 3 method (~50/min), and markdown blocks
+    # cap at 12k chars per message — longer streams roll over to a new message.
+    stream_update_interval: float = 1.0
+    max_stream_length: int = 11_000
 
     def __init__(
         self,
@@ -125,9 +141,13 @@ class SlackChannel:
         self._seen_ts: dict[str, float] = {}
         self._seen_ts_max = 500
         # Cache resolved Slack user/channel names to avoid redundant API calls.
-        # TTL of 1 hour — names change rarely; bounded to 500 entries.
+        # TTL of 1 hour — names change rarely; bounded to 500 entries.  Backed
+        # by the persistent name directory in SQLite, which survives restarts
+        # and is bulk-filled by _refresh_directory().
         self._user_name_cache = _TtlCache(ttl_seconds=3600, max_size=500)
         self._channel_name_cache = _TtlCache(ttl_seconds=3600, max_size=500)
+        self._directory_namespace = f"slack:{connection_name}"
+        self._directory_task: asyncio.Task[None] | None = None
 
     # ------------------------------------------------------------------
     # Channel protocol
@@ -149,6 +169,11 @@ class SlackChannel:
         await self._sync_allowed_channels()
         self._register_handlers()
 
+        if self._directory_task is None or self._directory_task.done():
+            self._directory_task = asyncio.create_task(
+                self._directory_refresh_loop(), name="slack-name-directory"
+            )
+
         self._handler = AsyncSocketModeHandler(self._app, self._app_token)
         self._handler_task = asyncio.create_task(
             self._handler.start_async(), name="slack-socket-mode"
@@ -212,6 +237,9 @@ class SlackChannel:
         if self._reconnect_task and not self._reconnect_task.done():
             self._reconnect_task.cancel()
             self._reconnect_task = None
+        if self._directory_task and not self._directory_task.done():
+            self._directory_task.cancel()
+            self._directory_task = None
         if self._handler:
             with contextlib.suppress(Exception):
                 await self._handler.close_async()
@@ -546,19 +574,22 @@ class SlackChannel:
                 if hwm_iso > high_water_mark:
                     high_water_mark = hwm_iso
 
-            results: list[NewMessage] = []
-            for event in raw_messages:
-                # Same filters as _on_slack_message
-                if event.get("bot_id") or event.get("subtype"):
-                    continue
-                user_id = event.get("user")
-                text = event.get("text", "")
-                ts = event.get("ts", "")
-                if not user_id or not ts:
-                    continue
+            # Same filters as _on_slack_message
+            user_events = [
+                e
+                for e in raw_messages
+                if not e.get("bot_id") and not e.get("subtype") and e.get("user") and e.get("ts")
+            ]
+            # Resolve every sender in one directory lookup rather than one
+            # Slack API call per message.
+            sender_names = await self._resolve_user_names([e["user"] for e in user_events])
 
-                text = self._normalize_bot_mention(text)
-                sender_name = await self._resolve_user_name(user_id)
+            results: list[NewMessage] = []
+            for event in user_events:
+                user_id = event["user"]
+                ts = event["ts"]
+                text = self._normalize_bot_mention(event.get("text", ""))
+                sender_name = sender_names.get(user_id, user_id)
                 timestamp = datetime.fromtimestamp(float(ts), tz=UTC).isoformat()
 
                 results.append(
@@ -1029,31 +1060,71 @@ class SlackChannel:
     # Helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _user_display_name(user: dict[str, Any], fallback: str) -> str:
+        profile = user.get("profile", {})
+        return (
+            profile.get("display_name")
+            or profile.get("real_name")
+            or user.get("real_name")
+            or fallback
+        )
+
     async def _resolve_user_name(self, user_id: str) -> str:
-        """Look up a Slack user's display name, falling back to user ID.
+        """Look up a Slack user's display name, falling back to user ID."""
+        names = await self._resolve_user_names([user_id])
+        return names.get(user_id, user_id)
 
-        Results are cached for 1 hour to avoid redundant API calls — the same
-        user sending multiple messages no longer triggers repeated users.info.
+    async def _resolve_user_names(self, user_ids: list[str]) -> dict[str, str]:
+        """Resolve many Slack user IDs to display names.
+
+        Checks the in-memory cache, then the persistent name directory (one
+        query for all misses), and only calls ``users.info`` for users the
+        directory has never seen.  IDs that can't be resolved map to
+        themselves.
         """
-        cached = self._user_name_cache.get(user_id)
-        if cached is not None:
-            return cached
-        if not self._app:
-            return user_id
+        names: dict[str, str] = {}
+        missing: list[str] = []
+        for user_id in dict.fromkeys(user_ids):
+            cached = self._user_name_cache.get(user_id)
+            if cached is not None:
+                names[user_id] = cached
+            else:
+                missing.append(user_id)
+        if not missing:
+            return names
+
         try:
-            resp = await self._app.client.users_info(user=user_id)
-            user = resp.get("user", {})
-            profile = user.get("profile", {})
-            name = (
-                profile.get("display_name")
-                or profile.get("real_name")
-                or user.get("real_name")
-                or user_id
-            )
+            stored = await get_directory_names(self._directory_namespace, "user", missing)
+        except Exception as exc:
+            logger.debug("Slack name directory lookup failed", err=str(exc))
+            stored = {}
+        for user_id, name in stored.items():
             self._user_name_cache.put(user_id, name)
-            return name
-        except Exception:
-            return user_id
+            names[user_id] = name
+
+        fetched: dict[str, str] = {}
+        for user_id in missing:
+            if user_id in names:
+                continue
+            names[user_id] = user_id
+            if not self._app:
+                continue
+            try:
+                resp = await self._app.client.users_info(user=user_id)
+            except Exception:
+                continue
+            name = self._user_display_name(resp.get("user", {}), user_id)
+            self._user_name_cache.put(user_id, name)
+            names[user_id] = name
+            fetched[user_id] = name
+
+        if fetched:
+            try:
+                await upsert_directory_names(self._directory_namespace, "user", fetched)
+            except Exception as exc:
+                logger.debug("Slack name directory write failed", err=str(exc))
+        return names
 
     async def _resolve_channel_name(self, channel_id: str) -> str:
         """Look up a Slack channel name, falling back to channel ID.
@@ -1063,6 +1134,11 @@ class SlackChannel:
         cached = self._channel_name_cache.get(channel_id)
         if cached is not None:
             return cached
+        with contextlib.suppress(Exception):
+            stored = await get_directory_names(self._directory_namespace, "channel", [channel_id])
+            if channel_id in stored:
+                self._channel_name_cache.put(channel_id, stored[channel_id])
+                return stored[channel_id]
         if not self._app:
             return channel_id
         try:
@@ -1070,6 +1146,103 @@ class SlackChannel:
             channel = resp.get("channel", {})
             name = channel.get("name", channel_id)
             self._channel_name_cache.put(channel_id, name)
+            with contextlib.suppress(Exception):
+                await upsert_directory_names(
+                    self._directory_namespace, "channel", {channel_id: name}
+                )
             return name
         except Exception:
             return channel_id
+
+    # ------------------------------------------------------------------
+    # Persistent name directory
+    # ------------------------------------------------------------------
+
+    async def _directory_refresh_loop(self) -> None:
+        """Keep the name directory fresh with a daily bulk sync.
+
+        Skips the initial sync when the last full sync completed recently,
+        so restarts don't re-page the whole workspace.
+        """
+        while True:
+            try:
+                synced_at = await get_directory_synced_at(self._directory_namespace)
+                age = (
+                    (datetime.now(UTC) - datetime.fromisoformat(synced_at)).total_seconds()
+                    if synced_at
+                    else None
+                )
+                if age is None or age >= _DIRECTORY_REFRESH_INTERVAL:
+                    await self._refresh_directory()
+                    delay: float = _DIRECTORY_REFRESH_INTERVAL
+                else:
+                    delay = _DIRECTORY_REFRESH_INTERVAL - age
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning(
+                    "Slack name directory refresh failed",
+                    connection=self._connection_name,
+                    err=str(exc),
+                )
+                delay = _DIRECTORY_REFRESH_INTERVAL
+            await asyncio.sleep(delay)
+
+    async def _refresh_directory(self) -> None:
+        """Bulk-fill the name directory from ``users.list`` and ``conversations.list``.
+
+        Each page is upserted as it arrives.  Once a listing completes, rows
+        it didn't touch (deleted users, archived channels) are pruned.  The
+        sync is recorded as completed only after every listing finished.
+        """
+        if not self._app:
+            return
+        client = self._app.client
+        sync_started_at = datetime.now(UTC).isoformat()
+        listings: list[tuple[str, Any, dict[str, Any], str]] = [
+            ("user", client.users_list, {}, "members"),
+            (
+                "channel",
+                client.conversations_list,
+                {"types": "public_channel,private_channel", "exclude_archived": True},
+                "channels",
+            ),
+        ]
+        for kind, method, extra, key in listings:
+            started_at = datetime.now(UTC).isoformat()
+            count = 0
+            cursor = None
+            while True:
+                kwargs: dict[str, Any] = {"limit": _DIRECTORY_PAGE_SIZE, **extra}
+                if cursor:
+                    kwargs["cursor"] = cursor
+                resp = await method(**kwargs)
+                page: dict[str, str] = {}
+                for item in resp.get(key, []):
+                    entity_id = item.get("id")
+                    if not entity_id or item.get("deleted"):
+                        continue
+                    if kind == "user":
+                        page[entity_id] = self._user_display_name(item, entity_id)
+                    else:
+                        page[entity_id] = item.get("name") or entity_id
+                await upsert_directory_names(self._directory_namespace, kind, page)
+                if kind == "channel":
+                    # Keep names of channels pynchy already knows current
+                    await upsert_chat_names(
+                        {_jid(cid): name for cid, name in page.items()},
+                        insert_missing=False,
+                    )
+                count += len(page)
+                cursor = resp.get("response_metadata", {}).get("next_cursor")
+                if not cursor:
+                    break
+            pruned = await prune_directory(self._directory_namespace, kind, older_than=started_at)
+            logger.info(
+                "Slack name directory refreshed",
+                connection=self._connection_name,
+                kind=kind,
+                count=count,
+                pruned=pruned,
+            )
+        await set_directory_synced_at(self._directory_namespace, sync_started_at)
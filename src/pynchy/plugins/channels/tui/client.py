@@ -11,8 +11,18 @@ import aiohttp
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
+from textual.screen import ModalScreen
 from textual.selection import Selection
-from textual.widgets import Footer, Header, Input, ListItem, ListView, RichLog, Static
+from textual.widgets import (
+    DataTable,
+    Footer,
+    Header,
+    Input,
+    ListItem,
+    ListView,
+    RichLog,
+    Static,
+)
 
 
 class PynchyTUI(App):
@@ -50,6 +60,7 @@ class PynchyTUI(App):
     BINDINGS = [
         Binding("ctrl+n", "next_group", "Next Group"),
         Binding("ctrl+p", "prev_group", "Prev Group"),
+        Binding("ctrl+u", "show_usage", "Usage"),
         Binding("ctrl+q", "quit", "Quit"),
     ]
 
@@ -245,6 +256,9 @@ class PynchyTUI(App):
     async def action_prev_group(self) -> None:
         await self._cycle_group(-1)
 
+    def action_show_usage(self) -> None:
+        self.push_screen(UsageScreen())
+
     async def _cycle_group(self, direction: int) -> None:
         if not self._groups:
             return
@@ -257,6 +271,52 @@ class PynchyTUI(App):
         await self._switch_to_group(jids[new_idx])
 
 
+class UsageScreen(ModalScreen):
+    """Token and cost totals per workspace and model over the last week."""
+
+    DEFAULT_CSS = """
+    UsageScreen {
+        align: center middle;
+    }
+    #usage-panel {
+        width: 90%;
+        height: 80%;
+        border: round $primary;
+        background: $surface;
+    }
+    """
+
+    BINDINGS = [Binding("escape,ctrl+u", "dismiss", "Close")]
+
+    _COLUMNS = ("Workspace", "Model", "Queries", "Errors", "Input", "Output", "Cache read", "USD")
+
+    def compose(self) -> ComposeResult:
+        yield DataTable(id="usage-panel", zebra_stripes=True)
+
+    async def on_mount(self) -> None:
+        table = self.query_one(DataTable)
+        table.border_title = "Usage — last 7 days"
+        table.add_columns(*self._COLUMNS)
+        try:
+            usage = await self.app._get("/api/usage", days="7", group_by="workspace,model")
+        except aiohttp.ClientError as exc:
+            table.border_subtitle = f"[red]Failed to load usage: {exc}[/red]"
+            return
+        for row in usage["rows"]:
+            table.add_row(
+                row["workspace"],
+                row["model"] or "?",
+                row["queries"],
+                row["errors"],
+                f"{row['input_tokens']:,}",
+                f"{row['output_tokens']:,}",
+                f"{row['cache_read_tokens']:,}",
+                f"{row['cost_usd']:.2f}",
+            )
+        total = sum(row["cost_usd"] for row in usage["rows"])
+        table.border_subtitle = f"{total:.2f} USD total"
+
+
 class ChatLog(RichLog):
     """Message display area with text selection support.
 
@@ -6,9 +6,7 @@ import asyncio
 import contextlib
 import re
 import sys
-from collections import deque
 from collections.abc import Callable
-from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 
@@ -19,6 +17,7 @@ from neonize.events import (
     ConnectedEv,
     ConnectFailureEv,
     DisconnectedEv,
+    HistorySyncEv,
     LoggedOutEv,
     MessageEv,
     PairStatusEv,
@@ -32,19 +31,25 @@ from pynchy.host.orchestrator.messaging.pending_questions import find_pending_fo
 from pynchy.logger import logger
 from pynchy.state import (
     get_chat_jids_by_name,
+    get_index_anchor,
+    get_indexed_since,
     get_last_group_sync,
+    index_inbound,
+    prune_inbound_index,
     set_last_group_sync,
-    update_chat_name,
+    upsert_chat_names,
 )
+from pynchy.state.inbound_index import IndexAnchor
 from pynchy.types import InboundFetchResult, NewMessage, OutboundEvent, WorkspaceProfile
 
-GROUP_SYNC_INTERVAL: float = 24 * 60 * 60  # 24 hours in seconds
+from .outbox import WhatsAppOutbox
 
+GROUP_SYNC_INTERVAL: float = 24 * 60 * 60  # 24 hours in seconds
 
-@dataclass
-class _OutgoingMessage:
-    jid: str
-    text: str
+# On-demand history requests: messages per page, and how often one chat may
+# ask again (responses arrive asynchronously as HistorySyncEv).
+HISTORY_REQUEST_COUNT = 50
+HISTORY_REQUEST_COOLDOWN: float = 10 * 60
 
 
 class WhatsAppChannel:
@@ -52,6 +57,9 @@ class WhatsAppChannel:
 
     name: str
     prefix_assistant_name = True
+    # Undelivered ledger rows for this channel are replayed by the outbox,
+    # not by the reconciler.
+    drains_outbound_ledger = True
 
     def __init__(
         self,
@@ -72,11 +80,14 @@ class WhatsAppChannel:
         self._on_ask_user_answer = on_ask_user_answer
         self._connected = False
         self._lid_to_phone: dict[str, str] = {}
-        self._outgoing_queue: deque[_OutgoingMessage] = deque()
-        self._flushing = False
+        self._outbox = WhatsAppOutbox(connection_name, self._deliver, self.is_connected)
         self._group_sync_task: asyncio.Task[None] | None = None
         self._idle_task: asyncio.Task[None] | None = None
         self._first_connect: asyncio.Event = asyncio.Event()
+        # Newest live message per chat — a paging anchor for chats that
+        # have nothing in the history index yet.
+        self._live_anchors: dict[str, IndexAnchor] = {}
+        self._history_requested: dict[str, tuple[str, float]] = {}
 
         loop = asyncio.get_running_loop()
         neonize_events.event_global_loop = loop
@@ -99,7 +110,7 @@ class WhatsAppChannel:
                 if jid and lid and lid.User:
                     self._lid_to_phone[lid.User] = f"{jid.User}@s.whatsapp.net"
 
-            asyncio.ensure_future(self._flush_outgoing_queue())
+            self._outbox.start()
             asyncio.ensure_future(self._sync_group_metadata())
             if self._group_sync_task is None:
                 self._group_sync_task = asyncio.ensure_future(self._periodic_group_sync())
@@ -126,6 +137,13 @@ class WhatsAppChannel:
         async def on_pair_status(_client: NewAClient, ev: PairStatusEv) -> None:
             logger.info("WhatsApp paired", user=ev.ID.User)
 
+        @self._client.event(HistorySyncEv)
+        async def on_history_sync(_client: NewAClient, ev: HistorySyncEv) -> None:
+            try:
+                await self._index_history_sync(ev)
+            except Exception:
+                logger.exception("Failed to index WhatsApp history sync")
+
         @self._client.event(MessageEv)
         async def on_message(_client: NewAClient, message: MessageEv) -> None:
             try:
@@ -153,21 +171,25 @@ class WhatsAppChannel:
         await self._send_text(jid, rendered.text)
 
     async def _send_text(self, jid: str, text: str) -> None:
-        """Send raw text to a JID, queueing if disconnected.
+        """Send raw text to a JID, queueing it in the outbox when it can't go now.
 
         This is the internal transport method -- external callers should use
-        ``send_event`` instead.  Kept for queue flush and ``send_ask_user``
-        which build their own text payloads.
+        ``send_event`` instead.  Kept for ``send_ask_user`` which builds its
+        own text payload.  Messages queue when disconnected, when the chat
+        already has a backlog (ordering), or when its send budget is spent.
         """
-        if not self._connected:
-            self._outgoing_queue.append(_OutgoingMessage(jid=jid, text=text))
+        if not self._connected or not self._outbox.try_acquire(jid):
+            await self._outbox.enqueue(jid, text)
             return
         try:
-            target = self._parse_jid(jid)
-            await self._client.send_message(target, text)
+            await self._deliver(jid, text)
         except Exception as err:
-            self._outgoing_queue.append(_OutgoingMessage(jid=jid, text=text))
             logger.warning("Failed to send, message queued", jid=jid, error=str(err))
+            await self._outbox.enqueue(jid, text)
+
+    async def _deliver(self, jid: str, text: str) -> None:
+        target = self._parse_jid(jid)
+        await self._client.send_message(target, text)
 
     async def disconnect(self) -> None:
         self._connected = False
@@ -175,6 +197,7 @@ class WhatsAppChannel:
             self._group_sync_task.cancel()
         if self._idle_task:
             self._idle_task.cancel()
+        await self._outbox.stop()
         with contextlib.suppress(Exception):
             await self._client.disconnect()
 
@@ -239,15 +262,15 @@ class WhatsAppChannel:
                     return
         try:
             groups = await self._client.get_joined_groups()
-            count = 0
-            for group in groups:
-                name = group.GroupName.Name
-                if name:
-                    group_jid = Jid2String(group.JID)
-                    await update_chat_name(group_jid, name)
-                    count += 1
+            names = {
+                Jid2String(group.JID): group.GroupName.Name
+                for group in groups
+                if group.GroupName.Name
+            }
+            # One transaction; unchanged names are skipped entirely
+            updated = await upsert_chat_names(names)
             await set_last_group_sync()
-            logger.info("Group metadata synced", count=count)
+            logger.info("Group metadata synced", count=len(names), updated=updated)
         except Exception as err:
             logger.error("Failed to sync group metadata", error=str(err))
 
@@ -259,17 +282,6 @@ class WhatsAppChannel:
             except Exception as err:
                 logger.error("Periodic group sync failed", error=str(err))
 
-    async def _flush_outgoing_queue(self) -> None:
-        if self._flushing or not self._outgoing_queue:
-            return
-        self._flushing = True
-        try:
-            while self._outgoing_queue:
-                item = self._outgoing_queue.popleft()
-                await self._send_text(item.jid, item.text)
-        finally:
-            self._flushing = False
-
     async def send_ask_user(self, jid: str, request_id: str, questions: list[dict]) -> str | None:
         """Post a numbered-text question and return a tracking message ID.
 
@@ -342,13 +354,12 @@ class WhatsAppChannel:
         if chat_jid not in groups:
             return
 
-        msg = message.Message
-        content = (
-            msg.conversation
-            or msg.extendedTextMessage.text
-            or msg.imageMessage.caption
-            or msg.videoMessage.caption
-            or ""
+        content = self._message_text(message.Message)
+        self._live_anchors[chat_jid] = IndexAnchor(
+            message_id=info.ID,
+            timestamp=timestamp,
+            sender=Jid2String(source.Sender),
+            is_from_me=source.IsFromMe,
         )
         if source.IsFromMe and content.startswith(f"{get_settings().agent.name}:"):
             return
@@ -387,6 +398,106 @@ class WhatsAppChannel:
         )
         self._on_message(chat_jid, new_msg)
 
+    @staticmethod
+    def _message_text(msg) -> str:
+        return (
+            msg.conversation
+            or msg.extendedTextMessage.text
+            or msg.imageMessage.caption
+            or msg.videoMessage.caption
+            or ""
+        )
+
+    def _own_jid(self) -> str:
+        me = self._client.me
+        jid = getattr(me, "JID", None) if me else None
+        return f"{jid.User}@{jid.Server}" if jid and jid.User else ""
+
+    async def _index_history_sync(self, ev: HistorySyncEv) -> None:
+        """Record text messages from a history-sync payload in the inbound index.
+
+        WhatsApp pushes these after (re)connecting and in response to
+        on-demand requests.  Only chats bound to a workspace are kept.
+        """
+        groups = self._workspaces()
+        own_jid = self._own_jid()
+        messages: list[NewMessage] = []
+        for conv in ev.Data.conversations:
+            raw_jid = conv.ID
+            if not raw_jid or raw_jid == "status@broadcast":
+                continue
+            chat_jid = self._translate_jid_str(raw_jid)
+            if chat_jid not in groups:
+                continue
+            for item in conv.messages:
+                web_msg = item.message
+                key = web_msg.key
+                content = self._message_text(web_msg.message)
+                if not key.ID or not content:
+                    continue
+                ts = web_msg.messageTimestamp
+                if ts > 1e10:
+                    ts = ts / 1000
+                sender = key.participant or web_msg.participant
+                if not sender:
+                    sender = own_jid if key.fromMe else raw_jid
+                sender = self._translate_jid_str(sender)
+                messages.append(
+                    NewMessage(
+                        id=key.ID,
+                        chat_jid=chat_jid,
+                        sender=sender,
+                        sender_name=web_msg.pushName or sender.split("@")[0],
+                        content=content,
+                        timestamp=datetime.fromtimestamp(ts, tz=UTC).isoformat(),
+                        is_from_me=key.fromMe,
+                    )
+                )
+        added = await index_inbound(self.name, messages)
+        pruned = await prune_inbound_index(self.name)
+        logger.info(
+            "WhatsApp history sync indexed",
+            sync_type=getattr(ev.Data, "syncType", None),
+            messages=len(messages),
+            added=added,
+            pruned=pruned,
+        )
+
+    async def _request_history(self, chat_jid: str, anchor: IndexAnchor) -> None:
+        """Ask the phone for messages older than *anchor* (answered via HistorySyncEv)."""
+        last = self._history_requested.get(chat_jid)
+        now = asyncio.get_running_loop().time()
+        if last and (last[0] == anchor.message_id or now - last[1] < HISTORY_REQUEST_COOLDOWN):
+            return
+        self._history_requested[chat_jid] = (anchor.message_id, now)
+        own_jid = self._own_jid()
+        if not own_jid:
+            return
+        try:
+            from neonize.proto.Neonize_pb2 import MessageInfo, MessageSource
+
+            info = MessageInfo(
+                ID=anchor.message_id,
+                Timestamp=int(datetime.fromisoformat(anchor.timestamp).timestamp()),
+                MessageSource=MessageSource(
+                    Chat=self._parse_jid(chat_jid),
+                    Sender=self._parse_jid(anchor.sender),
+                    IsFromMe=anchor.is_from_me,
+                    IsGroup=chat_jid.endswith("@g.us"),
+                ),
+            )
+            request = await self._client.build_history_sync_request(info, HISTORY_REQUEST_COUNT)
+            await self._client.send_message(self._parse_jid(own_jid), request)
+            logger.info("Requested WhatsApp history", chat_jid=chat_jid, anchor=anchor.message_id)
+        except Exception as err:
+            logger.debug("WhatsApp history request failed", chat_jid=chat_jid, error=str(err))
+
+    def _translate_jid_str(self, jid_str: str) -> str:
+        user, _, server = jid_str.partition("@")
+        if server != "lid":
+            return jid_str
+        return self._lid_to_phone.get(user.split(":")[0], jid_str)
+
     def _translate_jid(self, jid_str: str, jid: JID) -> str:
         if jid.Server != "lid":
             return jid_str
@@ -416,16 +527,23 @@ class WhatsAppChannel:
     def owns_jid(self, jid: str) -> bool:
         return jid.endswith("@g.us") or jid.endswith("@s.whatsapp.net")
 
-    async def fetch_inbound_since(
-        self,
-        channel_jid: str,  # noqa: ARG002
-        since: str,  # noqa: ARG002
-    ) -> InboundFetchResult:
-        # WhatsApp has no "fetch history since timestamp" API.  Neonize
-        # exposes HistorySyncEv (bootstrap + on-demand via
-        # build_history_sync_request), but it requires an anchor message
-        # ID to page from — not a timestamp.  Until we register a
-        # HistorySyncEv handler to capture the bootstrap sync WhatsApp
-        # pushes on connect, dropped messages on this channel are
-        # unrecoverable by the reconciler.
-        return InboundFetchResult(messages=[])
+    async def fetch_inbound_since(self, channel_jid: str, since: str) -> InboundFetchResult:
+        """Answer from the local history-sync index — no network round trip.
+
+        WhatsApp has no "fetch history since timestamp" API; history arrives
+        as HistorySyncEv pushes, which ``_index_history_sync`` records.  When
+        the index doesn't reach back to *since*, an on-demand request pages
+        further back from the oldest known message; its results land in the
+        index for the next reconcile cycle.
+        """
+        indexed = await get_indexed_since(self.name, channel_jid, since)
+        anchor = await get_index_anchor(self.name, channel_jid)
+        if anchor is None:
+            anchor = self._live_anchors.get(channel_jid)
+        if anchor is not None and anchor.timestamp > since:
+            await self._request_history(channel_jid, anchor)
+
+        bot_prefix = f"{get_settings().agent.name}:"
+        messages = [m for m in indexed if not (m.is_from_me and m.content.startswith(bot_prefix))]
+        high_water_mark = indexed[-1].timestamp if indexed else ""
+        return InboundFetchResult(messages=messages, high_water_mark=high_water_mark)
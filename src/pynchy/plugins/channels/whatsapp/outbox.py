@@ -0,0 +1,247 @@
+"""Persisted, paced outbound queue for WhatsApp.
+
+Messages that can't go out immediately (disconnected, send failure, or the
+chat's send budget is spent) are written to the outbound ledger as
+``outbound_deliveries`` rows for this connection, so they survive restarts.
+A single drain task replays them per chat with token-bucket pacing, merges
+runs of small consecutive messages, and backs off exponentially on failure —
+a reconnect delivers the backlog quickly without tripping WhatsApp's rate
+limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+
+from pynchy.logger import logger
+from pynchy.state import (
+    get_pending_for_channel,
+    mark_delivered_many,
+    mark_delivery_error_many,
+    record_outbound,
+)
+from pynchy.state.outbound import PendingDelivery
+
+# Per-chat send budget: short bursts are fine, sustained floods are not.
+SEND_RATE = 1.0  # tokens per second
+SEND_BURST = 5
+
+# Consecutive queued messages to one chat are merged while each is at most
+# _SMALL_MESSAGE_CHARS and the merged text stays under _MERGE_MAX_CHARS.
+_SMALL_MESSAGE_CHARS = 1000
+_MERGE_MAX_CHARS = 4000
+_MERGE_SEPARATOR = "\n\n"
+
+_BACKOFF_BASE = 2.0
+_BACKOFF_MAX = 300.0
+
+_LEDGER_SOURCE = "whatsapp_outbox"
+
+
+class TokenBucket:
+    """Classic token bucket; ``take`` never blocks."""
+
+    def __init__(
+        self,
+        rate: float = SEND_RATE,
+        burst: int = SEND_BURST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+
+    def take(self) -> float:
+        """Consume a token if available.
+
+        Returns 0 on success, otherwise the seconds until a token is available
+        (nothing is consumed in that case).
+        """
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return 0.0
+        return (1 - self._tokens) / self.rate
+
+
+@dataclass
+class _Batch:
+    """One send: a merged run of queued rows for the same chat."""
+
+    ledger_ids: list[int] = field(default_factory=list)
+    parts: list[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        return _MERGE_SEPARATOR.join(self.parts)
+
+    def accepts(self, content: str) -> bool:
+        if not self.parts:
+            return True
+        if len(content) > _SMALL_MESSAGE_CHARS or len(self.parts[-1]) > _SMALL_MESSAGE_CHARS:
+            return False
+        merged = len(self.text) + len(_MERGE_SEPARATOR) + len(content)
+        return merged <= _MERGE_MAX_CHARS
+
+
+def merge_pending(rows: list[PendingDelivery]) -> list[_Batch]:
+    """Group one chat's pending rows into sends.
+
+    Every row is its own message — identical text queued twice (two "ok"
+    replies) is delivered twice.
+    """
+    batches: list[_Batch] = []
+    for row in rows:
+        if not batches or not batches[-1].accepts(row.content):
+            batches.append(_Batch())
+        batches[-1].ledger_ids.append(row.ledger_id)
+        batches[-1].parts.append(row.content)
+    return batches
+
+
+class WhatsAppOutbox:
+    """Ledger-backed outbound queue for one WhatsApp connection."""
+
+    def __init__(
+        self,
+        channel_name: str,
+        send: Callable[[str, str], Awaitable[None]],
+        is_connected: Callable[[], bool],
+        *,
+        rate: float = SEND_RATE,
+        burst: int = SEND_BURST,
+    ) -> None:
+        self._channel_name = channel_name
+        self._send = send
+        self._is_connected = is_connected
+        self._rate = rate
+        self._burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._failures: dict[str, int] = {}
+        self._retry_at: dict[str, float] = {}
+        # Chats with queued rows — new messages to them must queue behind
+        # the backlog to keep ordering.  Seeded on the first drain.
+        self._backlog: set[str] = set()
+        self._enqueued: dict[str, int] = {}  # per-chat enqueue counter
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._retry_handle: asyncio.TimerHandle | None = None
+
+    def start(self) -> None:
+        """Start the drain task (idempotent) and trigger a drain."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name=f"outbox-{self._channel_name}")
+        self._wake.set()
+
+    async def stop(self) -> None:
+        if self._retry_handle is not None:
+            self._retry_handle.cancel()
+            self._retry_handle = None
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def try_acquire(self, jid: str) -> bool:
+        """Whether *jid* can be sent to directly right now.
+
+        False when the chat has a backlog (ordering) or its budget is spent.
+        """
+        if jid in self._backlog:
+            return False
+        return self._bucket(jid).take() == 0
+
+    async def enqueue(self, jid: str, text: str) -> None:
+        """Persist *text* for later delivery to *jid* and wake the drainer."""
+        await record_outbound(jid, text, _LEDGER_SOURCE, [self._channel_name])
+        self._backlog.add(jid)
+        self._enqueued[jid] = self._enqueued.get(jid, 0) + 1
+        self._wake.set()
+
+    async def drain(self) -> float | None:
+        """Deliver everything queued, paced per chat.
+
+        Returns the delay until the earliest chat in backoff may retry, or
+        None when nothing is left waiting on a retry.
+        """
+        generations = dict(self._enqueued)
+        rows = await get_pending_for_channel(self._channel_name)
+        by_jid: dict[str, list[PendingDelivery]] = {}
+        for row in rows:
+            by_jid.setdefault(row.chat_jid, []).append(row)
+        # Keep chats enqueued during the read; the next drain picks them up
+        self._backlog = set(by_jid) | {
+            jid for jid, count in self._enqueued.items() if count != generations.get(jid, 0)
+        }
+
+        now = time.monotonic()
+        ready = {jid: r for jid, r in by_jid.items() if self._retry_at.get(jid, 0) <= now}
+        if ready:
+            await asyncio.gather(*(self._drain_jid(jid, r) for jid, r in ready.items()))
+
+        waits = [t - time.monotonic() for jid, t in self._retry_at.items() if jid in self._backlog]
+        return max(min(waits), 0.0) if waits else None
+
+    async def _drain_jid(self, jid: str, rows: list[PendingDelivery]) -> None:
+        bucket = self._bucket(jid)
+        generation = self._enqueued.get(jid, 0)
+        for batch in merge_pending(rows):
+            if not self._is_connected():
+                return
+            while (wait := bucket.take()) > 0:
+                await asyncio.sleep(wait)
+            try:
+                await self._send(jid, batch.text)
+            except Exception as exc:
+                failures = self._failures.get(jid, 0) + 1
+                self._failures[jid] = failures
+                delay = min(_BACKOFF_BASE * 2 ** (failures - 1), _BACKOFF_MAX)
+                self._retry_at[jid] = time.monotonic() + delay
+                logger.warning(
+                    "WhatsApp queued send failed, backing off",
+                    jid=jid,
+                    error=str(exc),
+                    retry_in=delay,
+                )
+                await mark_delivery_error_many(batch.ledger_ids, self._channel_name, str(exc))
+                return
+            self._failures.pop(jid, None)
+            self._retry_at.pop(jid, None)
+            await mark_delivered_many(batch.ledger_ids, self._channel_name)
+        if self._enqueued.get(jid, 0) == generation:
+            # Nothing new was queued meanwhile — direct sends may resume
+            self._backlog.discard(jid)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            if not self._is_connected():
+                continue
+            try:
+                retry_in = await self.drain()
+            except Exception:
+                logger.exception("WhatsApp outbox drain failed")
+                retry_in = _BACKOFF_MAX
+            if retry_in is not None:
+                self._schedule_retry(retry_in)
+
+    def _schedule_retry(self, delay: float) -> None:
+        if self._retry_handle is not None:
+            self._retry_handle.cancel()
+        self._retry_handle = asyncio.get_running_loop().call_later(delay, self._wake.set)
+
+    def _bucket(self, jid: str) -> TokenBucket:
+        bucket = self._buckets.get(jid)
+        if bucket is None:
+            bucket = self._buckets[jid] = TokenBucket(self._rate, self._burst)
+        return bucket
@@ -108,6 +108,8 @@ class PynchySpec:
             Dict with keys:
                 - tools: dict mapping tool_name → async handler function
                   Each handler takes (data: dict) and returns dict with "result" or "error"
+                - close (optional): async teardown called at shutdown (e.g. to
+                  stop a warm browser the handlers share)
         """
 
     @hookspec
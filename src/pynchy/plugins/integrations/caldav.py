@@ -12,11 +12,23 @@ auto-discovered from the server; the ``calendar`` parameter accepts either
 The container-side IPC relay (_tools_calendar.py) sends service requests
 through IPC; the host service handler dispatches to these handlers after
 policy enforcement.
+
+The ``caldav`` library is synchronous, so every server round trip runs on a
+small dedicated thread pool rather than the orchestrator's event loop. One
+DAVClient (and its pooled HTTP session) is kept per server, the calendar
+list is cached for a few minutes, and event-range results are cached and
+revalidated against the calendar's ctag (or collection etag) before reuse.
 """
 
 from __future__ import annotations
 
+import asyncio
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -28,30 +40,128 @@ from pynchy.logger import logger
 
 hookimpl = pluggy.HookimplMarker("pynchy")
 
+# Worker threads for blocking CalDAV round trips.
+_MAX_WORKERS = 4
+
+# How long a server's calendar list is reused before re-discovery.
+_CALENDAR_LIST_TTL = 300.0
+
+# Max number of cached (calendar, date range) event listings.
+_EVENT_CACHE_SIZE = 64
+
+_CTAG_TAG = "{http://calendarserver.org/ns/}getctag"
+_ETAG_TAG = "{DAV:}getetag"
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="caldav")
+        return _executor
+
+
+async def _run[T](fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking CalDAV call on the worker pool."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), fn, *args)
+
+
 # ---------------------------------------------------------------------------
 # CalDAV helpers
 # ---------------------------------------------------------------------------
 
 _caldav_client_cache: dict[str, Any] = {}  # keyed by server name
 
+# server name -> (fetched_at monotonic, all calendars on the server)
+_calendar_list_cache: dict[str, tuple[float, list]] = {}
+
+# (server, calendar url, start, end) -> (collection tag, parsed events)
+_event_cache: OrderedDict[tuple[str, str, str, str], tuple[str, list[dict]]] = OrderedDict()
+
+# Guards the three caches above; held only for dict access, never across I/O.
+_cache_lock = threading.Lock()
+
 
 def _get_caldav_client(name: str, server_cfg: CalDAVServerConfig):
-    """Get or create a cached DAVClient for a named server."""
+    """Get or create a cached DAVClient for a named server.
+
+    The client owns a requests session, so reusing it keeps the server's
+    HTTP connections pooled across tool calls.
+    """
     import caldav
 
-    if name not in _caldav_client_cache:
-        password = os.environ.get(server_cfg.password_env) if server_cfg.password_env else None
-        _caldav_client_cache[name] = caldav.DAVClient(
-            url=server_cfg.url,
-            username=server_cfg.username,
-            password=password,
-        )
-    return _caldav_client_cache[name]
+    with _cache_lock:
+        if name not in _caldav_client_cache:
+            password = os.environ.get(server_cfg.password_env) if server_cfg.password_env else None
+            _caldav_client_cache[name] = caldav.DAVClient(
+                url=server_cfg.url,
+                username=server_cfg.username,
+                password=password,
+            )
+        return _caldav_client_cache[name]
 
 
 def clear_caldav_client_cache() -> None:
-    """Clear cached CalDAV clients (for tests or config reload)."""
-    _caldav_client_cache.clear()
+    """Clear cached CalDAV clients, calendar lists, and events (for tests or config reload)."""
+    with _cache_lock:
+        _caldav_client_cache.clear()
+        _calendar_list_cache.clear()
+        _event_cache.clear()
+
+
+def _get_calendars(name: str, server_cfg: CalDAVServerConfig) -> list:
+    """Return all calendars on a server, re-discovering after the TTL expires."""
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _calendar_list_cache.get(name)
+    if cached is not None and now - cached[0] < _CALENDAR_LIST_TTL:
+        return cached[1]
+
+    client = _get_caldav_client(name, server_cfg)
+    calendars = list(client.principal().calendars())
+    with _cache_lock:
+        _calendar_list_cache[name] = (now, calendars)
+    return calendars
+
+
+def _collection_tag(cal) -> str | None:
+    """Return the calendar's ctag, falling back to its collection etag.
+
+    Either value changes whenever an event in the collection changes. Returns
+    None when the server exposes neither, which disables event caching for
+    that calendar.
+    """
+    try:
+        from caldav.elements.base import ValuedBaseElement
+    except ImportError:
+        return None
+
+    for tag in (_CTAG_TAG, _ETAG_TAG):
+        element = type("_CollectionTag", (ValuedBaseElement,), {"tag": tag})()
+        try:
+            value = cal.get_property(element)
+        except Exception as e:
+            logger.debug("CalDAV collection tag lookup failed", tag=tag, error=str(e))
+            continue
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _invalidate_events(server_name: str, cal) -> None:
+    """Drop cached event ranges for a calendar after a local write."""
+    url = str(cal.url)
+    with _cache_lock:
+        for key in [k for k in _event_cache if k[0] == server_name and k[1] == url]:
+            del _event_cache[key]
 
 
 def _check_configured(cfg: CalDAVConfig) -> str | None:
@@ -117,10 +227,7 @@ def _resolve_calendar(server_name: str, server_cfg: CalDAVServerConfig, calendar
     If calendar_name is None, returns the first visible calendar.
     Respects allow/ignore filtering — rejects filtered-out calendars.
     """
-    client = _get_caldav_client(server_name, server_cfg)
-    principal = client.principal()
-    all_cals = principal.calendars()
-    visible = _filter_calendars(all_cals, server_cfg)
+    visible = _filter_calendars(_get_calendars(server_name, server_cfg), server_cfg)
 
     if calendar_name is None:
         # Use first visible calendar
@@ -164,6 +271,72 @@ def _parse_event(component) -> dict:
     }
 
 
+def _list_events(server_name: str, cal, start: datetime, end: datetime) -> list[dict]:
+    """Fetch and parse events in a range, reusing the cache while the ctag holds."""
+    key = (server_name, str(cal.url), start.isoformat(), end.isoformat())
+    tag = _collection_tag(cal)
+    if tag is not None:
+        with _cache_lock:
+            cached = _event_cache.get(key)
+            if cached is not None and cached[0] == tag:
+                _event_cache.move_to_end(key)
+                return [dict(e) for e in cached[1]]
+
+    events = []
+    for event_obj in cal.date_search(start=start, end=end, expand=True):
+        component = event_obj.icalendar_component
+        if component:
+            events.append(_parse_event(component))
+
+    if tag is not None:
+        with _cache_lock:
+            _event_cache[key] = (tag, events)
+            _event_cache.move_to_end(key)
+            while len(_event_cache) > _EVENT_CACHE_SIZE:
+                _event_cache.popitem(last=False)
+    return [dict(e) for e in events]
+
+
+def _list_calendars_sync(cfg: CalDAVConfig) -> dict[str, list[str]]:
+    result: dict[str, list[str]] = {}
+    for name, server_cfg in cfg.servers.items():
+        visible = _filter_calendars(_get_calendars(name, server_cfg), server_cfg)
+        result[name] = [c.name for c in visible if c.name]
+    return result
+
+
+def _list_calendar_sync(
+    cfg: CalDAVConfig, calendar: str | None, start: datetime, end: datetime
+) -> list[dict]:
+    server_name, server_cfg, cal_name = _resolve_server(cfg, calendar)
+    cal = _resolve_calendar(server_name, server_cfg, cal_name)
+    return _list_events(server_name, cal, start, end)
+
+
+def _create_event_sync(
+    cfg: CalDAVConfig, calendar: str | None, ical_kwargs: dict[str, Any]
+) -> str | None:
+    server_name, server_cfg, cal_name = _resolve_server(cfg, calendar)
+    cal = _resolve_calendar(server_name, server_cfg, cal_name)
+    event = cal.save_event(**ical_kwargs)
+    _invalidate_events(server_name, cal)
+
+    component = event.icalendar_component
+    if component:
+        uid_val = component.get("uid")
+        if uid_val:
+            return str(uid_val)
+    return None
+
+
+def _delete_event_sync(cfg: CalDAVConfig, calendar: str | None, uid: str) -> None:
+    server_name, server_cfg, cal_name = _resolve_server(cfg, calendar)
+    cal = _resolve_calendar(server_name, server_cfg, cal_name)
+    event = cal.event_by_uid(uid)
+    event.delete()
+    _invalidate_events(server_name, cal)
+
+
 # ---------------------------------------------------------------------------
 # Handler functions
 # ---------------------------------------------------------------------------
@@ -176,14 +349,7 @@ async def _handle_list_calendars(data: dict) -> dict:
         return {"error": err}
 
     try:
-        result: dict[str, list[str]] = {}
-        for name, server_cfg in cfg.servers.items():
-            client = _get_caldav_client(name, server_cfg)
-            principal = client.principal()
-            all_cals = principal.calendars()
-            visible = _filter_calendars(all_cals, server_cfg)
-            result[name] = [c.name for c in visible if c.name]
-
+        result = await _run(_list_calendars_sync, cfg)
         return {"result": {"servers": result, "default_server": cfg.default_server}}
     except Exception as e:
         logger.error("CalDAV list_calendars failed", error=str(e))
@@ -197,10 +363,8 @@ async def _handle_list_calendar(data: dict) -> dict:
         return {"error": err}
 
     try:
-        server_name, server_cfg, cal_name = _resolve_server(cfg, data.get("calendar"))
-        cal = _resolve_calendar(server_name, server_cfg, cal_name)
-
-        now = datetime.now(tz=UTC)
+        # Minute precision so repeated default-range queries share a cache key.
+        now = datetime.now(tz=UTC).replace(second=0, microsecond=0)
         start_str = data.get("start_date")
         end_str = data.get("end_date")
 
@@ -213,14 +377,7 @@ async def _handle_list_calendar(data: dict) -> dict:
         if end.tzinfo is None:
             end = end.replace(tzinfo=UTC)
 
-        results = cal.date_search(start=start, end=end, expand=True)
-
-        events = []
-        for event_obj in results:
-            component = event_obj.icalendar_component
-            if component:
-                events.append(_parse_event(component))
-
+        events = await _run(_list_calendar_sync, cfg, data.get("calendar"), start, end)
         return {"result": {"events": events, "count": len(events)}}
     except Exception as e:
         logger.error("CalDAV list_calendar failed", error=str(e))
@@ -234,9 +391,6 @@ async def _handle_create_event(data: dict) -> dict:
         return {"error": err}
 
     try:
-        server_name, server_cfg, cal_name = _resolve_server(cfg, data.get("calendar"))
-        cal = _resolve_calendar(server_name, server_cfg, cal_name)
-
         ical_kwargs: dict[str, Any] = {}
         ical_kwargs["dtstart"] = datetime.fromisoformat(data["start"])
         ical_kwargs["dtend"] = datetime.fromisoformat(data["end"])
@@ -247,15 +401,7 @@ async def _handle_create_event(data: dict) -> dict:
         if data.get("location"):
             ical_kwargs["location"] = data["location"]
 
-        event = cal.save_event(**ical_kwargs)
-
-        uid = None
-        component = event.icalendar_component
-        if component:
-            uid_val = component.get("uid")
-            if uid_val:
-                uid = str(uid_val)
-
+        uid = await _run(_create_event_sync, cfg, data.get("calendar"), ical_kwargs)
         return {"result": {"uid": uid, "status": "created"}}
     except Exception as e:
         logger.error("CalDAV create_event failed", error=str(e))
@@ -269,11 +415,8 @@ async def _handle_delete_event(data: dict) -> dict:
         return {"error": err}
 
     try:
-        server_name, server_cfg, cal_name = _resolve_server(cfg, data.get("calendar"))
-        cal = _resolve_calendar(server_name, server_cfg, cal_name)
         uid = data["event_id"]
-        event = cal.event_by_uid(uid)
-        event.delete()
+        await _run(_delete_event_sync, cfg, data.get("calendar"), uid)
         return {"result": {"uid": uid, "status": "deleted"}}
     except Exception as e:
         logger.error("CalDAV delete_event failed", error=str(e))
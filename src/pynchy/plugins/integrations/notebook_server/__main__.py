@@ -6,6 +6,9 @@ Heavy dependencies (JupyterLab, IPython kernel, FastMCP) are resolved here
 and never imported by the plugin class or the main pynchy process.
 
 Provides MCP tools for agents to create, execute, and manage Jupyter notebooks.
+Kernels are driven through jupyter_client's asyncio API, so long-running cells
+do not tie up threads and can return partial output (``execute_cell`` with
+``wait_seconds``, then ``get_cell_output``).
 JupyterLab runs as a separate subprocess for human viewing via Tailscale.
 
 Usage (Docker)::
@@ -20,6 +23,7 @@ Usage (host)::
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime
 import os
 import subprocess
@@ -29,13 +33,16 @@ from pathlib import Path
 from typing import Any
 
 from fastmcp import FastMCP
-from jupyter_client import KernelManager
+from jupyter_client import AsyncKernelManager
 from nbformat.v4 import new_code_cell, new_markdown_cell
 
 from ._execution import (
+    DEFAULT_TIMEOUT,
     KERNEL_STARTUP_CODE,
+    CellExecution,
     KernelSession,
     execute_code,
+    wait_for_execution,
 )
 from ._formats import (
     generate_name,
@@ -109,6 +116,39 @@ mcp = FastMCP("Notebook Server")
 # kernel_id -> KernelSession
 _sessions: dict[str, KernelSession] = {}
 
+# execution_id -> (session, execution, cell_number) for cells that returned
+# partial output; dropped once the finished result has been fetched.
+_running: dict[str, tuple[KernelSession, CellExecution, int]] = {}
+
+# Strong references to cell-finishing tasks (asyncio only keeps weak ones)
+_finishers: set[asyncio.Task] = set()
+
+
+def _cell_result(session: KernelSession, execution: CellExecution, cell_number: int) -> dict:
+    """Agent-facing result for a cell, offloading any new images to disk first."""
+    # Mutates outputs in-place with _image_path so the agent gets paths, not base64
+    save_cell_images(session.name, cell_number, execution.outputs, NOTEBOOK_DIR)
+    result: dict[str, Any] = {
+        "cell_number": cell_number,
+        "outputs": outputs_for_agent(execution.outputs),
+    }
+    if not execution.done.is_set():
+        result["status"] = "running"
+        result["execution_id"] = execution.msg_id
+    return result
+
+
+async def _finish_cell(
+    session: KernelSession,
+    execution: CellExecution,
+    cell_number: int,
+    timeout: float,
+) -> None:
+    """Wait for a cell that returned early, then save its final outputs."""
+    await wait_for_execution(session, execution, timeout)
+    save_cell_images(session.name, cell_number, execution.outputs, NOTEBOOK_DIR)
+    save_notebook(session.nb, notebook_path(session.name, NOTEBOOK_DIR))
+
 
 # ---------------------------------------------------------------------------
 # MCP Tools
@@ -138,15 +178,16 @@ async def start_kernel(name: str | None = None) -> dict[str, Any]:
     # Strip extension for internal use
     base_name = name.removesuffix(".ipynb").removesuffix(".qmd")
 
-    km = KernelManager(kernel_name="python3")
-    km.start_kernel(cwd=str(WORKSPACE_DIR))
+    km = AsyncKernelManager(kernel_name="python3")
+    await km.start_kernel(cwd=str(WORKSPACE_DIR))
     client = km.client()
     client.start_channels()
     # Wait for kernel to be ready
     try:
-        client.wait_for_ready(timeout=30)
+        await client.wait_for_ready(timeout=30)
     except RuntimeError as e:
-        km.shutdown_kernel(now=True)
+        client.stop_channels()
+        await km.shutdown_kernel(now=True)
         return {"error": f"Kernel failed to start: {e}"}
 
     kernel_id = str(uuid.uuid4())[:8]
@@ -192,7 +233,11 @@ async def start_kernel(name: str | None = None) -> dict[str, Any]:
 
 
 @mcp.tool()
-async def execute_cell(kernel_id: str, code: str) -> dict[str, Any]:
+async def execute_cell(
+    kernel_id: str,
+    code: str,
+    wait_seconds: float | None = None,
+) -> dict[str, Any]:
     """Execute Python code in a running kernel.
 
     Appends the code cell and its outputs to the in-memory notebook, then
@@ -201,6 +246,10 @@ async def execute_cell(kernel_id: str, code: str) -> dict[str, Any]:
     Args:
         kernel_id: Kernel identifier from ``start_kernel``.
         code: Python code to execute.
+        wait_seconds: Return partial output if the cell is still running after
+              this many seconds. The result then has ``status: "running"``
+              and an ``execution_id`` for ``get_cell_output``. Omit to wait
+              for the cell to finish (up to 5 minutes).
 
     Returns:
         Cell outputs (text, images, errors) in a simplified format.
@@ -210,24 +259,57 @@ async def execute_cell(kernel_id: str, code: str) -> dict[str, Any]:
     if not session:
         return {"error": f"No active kernel with id '{kernel_id}'. Use start_kernel first."}
 
-    outputs = await execute_code(session, code)
+    execution = session.submit(code)
 
-    # Append cell + outputs to notebook
+    # Append cell to notebook; its outputs list fills in as the kernel runs
     cell = new_code_cell(source=code)
-    cell.outputs = outputs
+    cell.outputs = execution.outputs
     session.nb.cells.append(cell)
     cell_number = len(session.nb.cells)
 
-    # Save images to disk (mutates outputs in-place with _image_path)
-    save_cell_images(session.name, cell_number, outputs, NOTEBOOK_DIR)
+    if wait_seconds is not None and wait_seconds < DEFAULT_TIMEOUT:
+        if not await execution.wait(max(wait_seconds, 0)):
+            _running[execution.msg_id] = (session, execution, cell_number)
+            task = asyncio.create_task(
+                _finish_cell(session, execution, cell_number, DEFAULT_TIMEOUT - wait_seconds)
+            )
+            _finishers.add(task)
+            task.add_done_callback(_finishers.discard)
+            return _cell_result(session, execution, cell_number)
+    else:
+        await wait_for_execution(session, execution, DEFAULT_TIMEOUT)
+
+    result = _cell_result(session, execution, cell_number)
 
     # Auto-save
     save_notebook(session.nb, notebook_path(session.name, NOTEBOOK_DIR))
 
-    return {
-        "cell_number": cell_number,
-        "outputs": outputs_for_agent(outputs),
-    }
+    return result
+
+
+@mcp.tool()
+async def get_cell_output(execution_id: str, wait_seconds: float = 0) -> dict[str, Any]:
+    """Fetch output of a cell that ``execute_cell`` returned while still running.
+
+    Args:
+        execution_id: Identifier from a ``status: "running"`` result.
+        wait_seconds: Wait up to this long for the cell to finish first.
+
+    Returns:
+        Outputs so far, with ``status: "running"`` until the cell completes.
+    """
+
+    entry = _running.get(execution_id)
+    if not entry:
+        return {"error": f"No running cell with execution id '{execution_id}'."}
+    session, execution, cell_number = entry
+
+    if wait_seconds > 0:
+        await execution.wait(wait_seconds)
+    result = _cell_result(session, execution, cell_number)
+    if execution.done.is_set():
+        _running.pop(execution_id, None)
+    return result
 
 
 @mcp.tool()
@@ -388,8 +470,11 @@ async def shutdown_kernel(kernel_id: str) -> dict[str, Any]:
     save_notebook(session.nb, path)
 
     # Shutdown kernel
+    await session.close()
     session.client.stop_channels()
-    session.km.shutdown_kernel(now=True)
+    await session.km.shutdown_kernel(now=True)
+    for execution_id in [k for k, v in _running.items() if v[0] is session]:
+        del _running[execution_id]
 
     return {
         "notebook": path.name,
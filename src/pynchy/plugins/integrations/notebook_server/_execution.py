@@ -1,30 +1,137 @@
 """Kernel session state and code execution.
 
 ``KernelSession`` tracks a running kernel and its associated notebook.
-``execute_code`` sends code to a kernel and collects outputs in nbformat schema.
+Each session owns one background iopub reader that demultiplexes kernel
+messages by parent ``msg_id`` into ``CellExecution`` objects, so executions
+on different kernels never hold a thread and outputs are visible while a
+cell is still running.  ``execute_code`` submits code and waits for the
+collected outputs in nbformat schema.
 
-The ``KernelManager`` type is only imported under ``TYPE_CHECKING`` so this
+The ``AsyncKernelManager`` type is only imported under ``TYPE_CHECKING`` so this
 module stays importable without jupyter_client at type-check time.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 from typing import TYPE_CHECKING, Any
 
 from nbformat.v4 import new_notebook
 
 if TYPE_CHECKING:
-    from jupyter_client import KernelManager
+    from jupyter_client import AsyncKernelManager
+
+DEFAULT_TIMEOUT = 300.0
+
+# Caps on what one execution keeps in memory (and therefore in the notebook).
+# A runaway print loop or plotting loop otherwise grows without bound.
+MAX_STREAM_CHARS = 200_000
+MAX_OUTPUTS = 500
+
+
+class CellExecution:
+    """Outputs of one ``execute_request``, filled in by the kernel's iopub reader."""
+
+    def __init__(self, msg_id: str):
+        self.msg_id = msg_id
+        self.outputs: list[dict[str, Any]] = []
+        self.done = asyncio.Event()
+        self.dropped = 0  # outputs discarded past MAX_OUTPUTS
+        self._capped: set[int] = set()  # ids of stream outputs at MAX_STREAM_CHARS
+
+    def handle(self, msg: dict[str, Any]) -> bool:
+        """Apply one iopub message.  Returns True once the execution is idle."""
+        msg_type = msg["msg_type"]
+        content = msg["content"]
+
+        if msg_type == "status" and content.get("execution_state") == "idle":
+            self.finish()
+            return True
+
+        if msg_type == "stream":
+            self._add_stream(content.get("name", "stdout"), content.get("text", ""))
+        elif msg_type in ("execute_result", "display_data"):
+            output: dict[str, Any] = {
+                "output_type": msg_type,
+                "data": content.get("data", {}),
+                "metadata": content.get("metadata", {}),
+            }
+            if msg_type == "execute_result":
+                output["execution_count"] = content.get("execution_count")
+            self._add(output)
+        elif msg_type == "error":
+            self._add(
+                {
+                    "output_type": "error",
+                    "ename": content.get("ename", ""),
+                    "evalue": content.get("evalue", ""),
+                    "traceback": content.get("traceback", []),
+                }
+            )
+        return False
+
+    def fail(self, ename: str, evalue: str) -> None:
+        """Finish with a synthetic error output (timeout, kernel gone)."""
+        if self.done.is_set():
+            return
+        self.outputs.append(
+            {"output_type": "error", "ename": ename, "evalue": evalue, "traceback": []}
+        )
+        self.finish()
+
+    def finish(self) -> None:
+        if self.dropped:
+            self.outputs.append(
+                {
+                    "output_type": "stream",
+                    "name": "stderr",
+                    "text": f"... ({self.dropped} further outputs dropped)\n",
+                }
+            )
+            self.dropped = 0
+        self.done.set()
+
+    async def wait(self, timeout: float | None) -> bool:
+        """Wait up to *timeout* seconds for completion.  Returns True if done."""
+        try:
+            await asyncio.wait_for(self.done.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def _add(self, output: dict[str, Any]) -> None:
+        if len(self.outputs) >= MAX_OUTPUTS:
+            self.dropped += 1
+            return
+        self.outputs.append(output)
+
+    def _add_stream(self, name: str, text: str) -> None:
+        # Merge consecutive chunks of the same stream, as Jupyter frontends do
+        last = self.outputs[-1] if self.outputs else None
+        if last is None or last["output_type"] != "stream" or last["name"] != name:
+            if len(self.outputs) >= MAX_OUTPUTS:
+                self.dropped += 1
+                return
+            last = {"output_type": "stream", "name": name, "text": ""}
+            self.outputs.append(last)
+        if id(last) in self._capped:
+            return
+        room = MAX_STREAM_CHARS - len(last["text"])
+        if len(text) > room:
+            last["text"] += text[:room] + "\n... (output truncated)\n"
+            self._capped.add(id(last))
+        else:
+            last["text"] += text
 
 
 class KernelSession:
     """Tracks a running kernel and its associated notebook."""
 
-    def __init__(self, kernel_id: str, km: KernelManager, client: Any, name: str):
+    def __init__(self, kernel_id: str, km: AsyncKernelManager, client: Any, name: str):
         self.kernel_id = kernel_id
         self.km = km
-        self.client = client  # must already have start_channels() called
+        self.client = client  # AsyncKernelClient; must already have start_channels() called
         self.name = name  # notebook name (without extension)
         self.nb = new_notebook()
         self.nb.metadata["kernelspec"] = {
@@ -32,6 +139,45 @@ class KernelSession:
             "language": "python",
             "name": "python3",
         }
+        # In-flight executions by msg_id, fed by the iopub reader
+        self.executions: dict[str, CellExecution] = {}
+        self._reader: asyncio.Task | None = None
+
+    def submit(self, code: str) -> CellExecution:
+        """Send *code* to the kernel and return its (still running) execution."""
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read_iopub(), name=f"iopub-{self.kernel_id}")
+        execution = CellExecution(self.client.execute(code))
+        self.executions[execution.msg_id] = execution
+        return execution
+
+    async def close(self) -> None:
+        """Stop the iopub reader and fail anything still running."""
+        if self._reader is not None:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._reader
+            self._reader = None
+        self._fail_pending("KernelShutdown", "Kernel was shut down")
+
+    async def _read_iopub(self) -> None:
+        while True:
+            try:
+                msg = await self.client.get_iopub_msg()
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._fail_pending("KernelDisconnected", f"Lost iopub channel: {exc}")
+                return
+            parent_id = msg.get("parent_header", {}).get("msg_id")
+            execution = self.executions.get(parent_id)
+            if execution is not None and execution.handle(msg):
+                self.executions.pop(parent_id, None)
+
+    def _fail_pending(self, ename: str, evalue: str) -> None:
+        pending, self.executions = self.executions, {}
+        for execution in pending.values():
+            execution.fail(ename, evalue)
 
 
 # Silently executed at kernel start — not saved to the notebook.
@@ -60,67 +206,33 @@ del _w
 """
 
 
-async def execute_code(session: KernelSession, code: str) -> list[dict[str, Any]]:
+async def execute_code(
+    session: KernelSession,
+    code: str,
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> list[dict[str, Any]]:
     """Execute code on a kernel and collect outputs.
 
     Returns a list of output dicts matching nbformat output schema, suitable
     for both returning to the agent and storing in the notebook cell.
     """
-    client = session.client
-    msg_id = client.execute(code)
-    outputs: list[dict[str, Any]] = []
+    execution = session.submit(code)
+    await wait_for_execution(session, execution, timeout)
+    return execution.outputs
 
-    while True:
-        try:
-            msg = await asyncio.wait_for(
-                asyncio.to_thread(client.get_iopub_msg, timeout=300),
-                timeout=310,
-            )
-        except TimeoutError:
-            outputs.append(
-                {
-                    "output_type": "error",
-                    "ename": "Timeout",
-                    "evalue": "Cell execution timed out (5 min)",
-                    "traceback": [],
-                }
-            )
-            break
-
-        if msg["parent_header"].get("msg_id") != msg_id:
-            continue
-
-        msg_type = msg["msg_type"]
-        content = msg["content"]
 
-        if msg_type == "status" and content.get("execution_state") == "idle":
-            break
+async def wait_for_execution(
+    session: KernelSession,
+    execution: CellExecution,
+    timeout: float,
+) -> bool:
+    """Wait for *execution*; on timeout stop tracking it and record an error.
 
-        if msg_type == "stream":
-            outputs.append(
-                {
-                    "output_type": "stream",
-                    "name": content.get("name", "stdout"),
-                    "text": content.get("text", ""),
-                }
-            )
-        elif msg_type in ("execute_result", "display_data"):
-            output: dict[str, Any] = {
-                "output_type": msg_type,
-                "data": content.get("data", {}),
-                "metadata": content.get("metadata", {}),
-            }
-            if msg_type == "execute_result":
-                output["execution_count"] = content.get("execution_count")
-            outputs.append(output)
-        elif msg_type == "error":
-            outputs.append(
-                {
-                    "output_type": "error",
-                    "ename": content.get("ename", ""),
-                    "evalue": content.get("evalue", ""),
-                    "traceback": content.get("traceback", []),
-                }
-            )
-
-    return outputs
+    Returns True if the kernel finished the cell, False if it timed out.
+    """
+    if await execution.wait(timeout):
+        return True
+    session.executions.pop(execution.msg_id, None)
+    execution.fail("Timeout", f"Cell execution timed out ({timeout / 60:g} min)")
+    return False
@@ -84,7 +84,9 @@ def save_cell_images(
 
     Mutates outputs in-place: adds ``_image_path`` to data dicts that
     contain ``image/png``. Only creates the images directory when there
-    are actual images to save.
+    are actual images to save. Images that already carry ``_image_path``
+    are skipped, so calling this again on a growing output list (partial
+    results of a running cell) only writes the new images.
     """
     img_dir: Path | None = None
     img_count = 0
@@ -94,11 +96,14 @@ def save_cell_images(
         if "image/png" not in data:
             continue
 
+        img_count += 1
+        if "_image_path" in data:
+            continue
+
         # Lazy-create directory on first image
         if img_dir is None:
             img_dir = image_dir(session_name, notebook_dir)
 
-        img_count += 1
         suffix = f"_{img_count}" if img_count > 1 else ""
         filename = f"cell_{cell_number}{suffix}.png"
         filepath = img_dir / filename
@@ -13,19 +13,26 @@ Six handlers:
 - ``x_retweet`` — retweet
 - ``x_quote`` — quote tweet with comment
 
+Action handlers share one warm persistent browser context (``_BrowserWorker``)
+that is started on first use, serialized per profile, restarted after a crash,
+and shut down after ``_IDLE_TIMEOUT`` seconds without an action or when the
+app shuts down (the service handler's ``close``).
+
 The container-side IPC relay (_tools_x.py) sends service requests through IPC;
 the host service handler dispatches to these handlers after policy enforcement.
 """
 
 from __future__ import annotations
 
+import asyncio
 import atexit
 import os
 import re
 import shutil
 import subprocess
 import time
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -40,6 +47,7 @@ from pynchy.plugins.integrations.browser import (
     profile_dir,
     stop_procs,
 )
+from pynchy.utils import create_background_task
 
 if TYPE_CHECKING:
     from playwright.async_api import Page
@@ -257,29 +265,150 @@ def _launch_kwargs(profile_path: Path) -> dict:
     }
 
 
+# Warm browser is shut down after this many seconds without an action.
+_IDLE_TIMEOUT = 300.0
+
+
+class _BrowserWorker:
+    """Long-lived persistent Chromium context shared by the X action handlers.
+
+    Launching Playwright plus a headed Chrome costs seconds per action, so the
+    context is started on first use and kept warm until ``idle_timeout``
+    elapses without an action.  Actions are serialized through a lock — the
+    profile directory can only be opened by one Chrome at a time — and reuse
+    a pooled page.  If Chrome crashes (the context emits ``close``), the next
+    action transparently starts a fresh one.
+    """
+
+    def __init__(self, idle_timeout: float = _IDLE_TIMEOUT) -> None:
+        self.idle_timeout = idle_timeout
+        self._lock = asyncio.Lock()
+        self._playwright: Any = None
+        self._context: Any = None
+        self._page: Page | None = None
+        self._idle_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def running(self) -> bool:
+        return self._context is not None
+
+    async def run(self, name: str, fn: Callable[[Page], Awaitable[dict]]) -> dict:
+        """Run *fn(page)* on the warm context, starting it if needed."""
+        async with self._lock:
+            self._cancel_idle()
+            started = time.monotonic()
+            cold = not self.running
+            launch_ms: float | None = None
+            try:
+                if cold:
+                    await self._start()
+                    launch_ms = round((time.monotonic() - started) * 1000, 1)
+                page = await self._acquire_page()
+                return await fn(page)
+            finally:
+                logger.info(
+                    "X action finished",
+                    action=name,
+                    cold_start=cold,
+                    launch_ms=launch_ms,
+                    duration_ms=round((time.monotonic() - started) * 1000, 1),
+                )
+                if self.running:
+                    self._schedule_idle()
+
+    @asynccontextmanager
+    async def exclusive(self) -> AsyncIterator[None]:
+        """Stop the warm context and hold the profile until the block exits.
+
+        ``setup_x_session`` launches its own visible browser on the same
+        profile, so action handlers must wait until login completes.
+        """
+        async with self._lock:
+            await self._stop()
+            yield
+
+    async def shutdown(self) -> None:
+        async with self._lock:
+            await self._stop()
+
+    async def _start(self) -> None:
+        from playwright.async_api import async_playwright
+
+        _ensure_xvfb()
+        x_profile = profile_dir("x")
+        cleanup_lock_files(x_profile)
+
+        playwright = await async_playwright().start()
+        try:
+            context = await playwright.chromium.launch_persistent_context(
+                **_launch_kwargs(x_profile),
+            )
+        except BaseException:
+            await playwright.stop()
+            raise
+        context.on("close", lambda _ctx: self._on_context_closed(context))
+        self._playwright = playwright
+        self._context = context
+        self._page = context.pages[0] if context.pages else None
+
+    def _on_context_closed(self, context: Any) -> None:
+        """Forget a context Chrome closed underneath us (crash or kill)."""
+        if context is not self._context:
+            return
+        logger.warning("X browser context closed unexpectedly; restarting on next action")
+        self._context = None
+        self._page = None
+        self._cancel_idle()
+        playwright, self._playwright = self._playwright, None
+        if playwright is not None:
+            create_background_task(playwright.stop(), name="x-browser-stop")
+
+    async def _acquire_page(self) -> Page:
+        if self._page is None or self._page.is_closed():
+            self._page = await self._context.new_page()
+        return self._page
+
+    async def _stop(self) -> None:
+        self._cancel_idle()
+        context, self._context = self._context, None
+        playwright, self._playwright = self._playwright, None
+        self._page = None
+        if context is not None:
+            try:
+                await context.close()
+            except Exception as exc:
+                logger.debug("X browser context close failed", error=str(exc))
+        if playwright is not None:
+            try:
+                await playwright.stop()
+            except Exception as exc:
+                logger.debug("Playwright stop failed", error=str(exc))
+
+    def _schedule_idle(self) -> None:
+        self._cancel_idle()
+        self._idle_handle = asyncio.get_running_loop().call_later(
+            self.idle_timeout,
+            lambda: create_background_task(self.shutdown(), name="x-browser-idle"),
+        )
+
+    def _cancel_idle(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+
+
+_browser = _BrowserWorker()
+
+
 async def _with_browser(
     fn: Callable[[Page], Awaitable[dict]],
+    action: str = "x_action",
 ) -> dict:
-    """Run *fn(page)* inside a persistent browser context.
+    """Run *fn(page)* on the plugin's warm persistent browser context.
 
-    Manages Xvfb display, lock-file cleanup, Playwright lifecycle.
     Used by action tools (``setup_x_session`` has its own VNC flow).
     """
-    from playwright.async_api import async_playwright
-
-    _ensure_xvfb()
-    x_profile = profile_dir("x")
-    cleanup_lock_files(x_profile)
-
-    async with async_playwright() as pw:
-        context = await pw.chromium.launch_persistent_context(
-            **_launch_kwargs(x_profile),
-        )
-        try:
-            page = context.pages[0] if context.pages else await context.new_page()
-            return await fn(page)
-        finally:
-            await context.close()
+    return await _browser.run(action, fn)
 
 
 async def _check_login(page: Page) -> str | None:
@@ -312,9 +441,11 @@ async def _handle_setup_x_session(data: dict) -> dict:
             vnc_procs, novnc_url = _start_vnc_layer()
 
         x_profile = profile_dir("x")
-        cleanup_lock_files(x_profile)
 
-        async with async_playwright() as pw:
+        # The warm action browser holds the profile lock — release it and
+        # keep actions waiting until the human finishes logging in.
+        async with _browser.exclusive(), async_playwright() as pw:
+            cleanup_lock_files(x_profile)
             context = await pw.chromium.launch_persistent_context(
                 **_launch_kwargs(x_profile),
             )
@@ -410,7 +541,7 @@ async def _handle_x_post(data: dict) -> dict:
         return {"result": {"status": "ok", "message": f"Tweet posted: {preview}"}}
 
     try:
-        return await _with_browser(action)
+        return await _with_browser(action, "x_post")
     except Exception as exc:
         logger.error("X post failed", error=str(exc))
         return {"error": str(exc)}
@@ -448,7 +579,7 @@ async def _handle_x_like(data: dict) -> dict:
         }
 
     try:
-        return await _with_browser(action)
+        return await _with_browser(action, "x_like")
     except Exception as exc:
         logger.error("X like failed", error=str(exc))
         return {"error": str(exc)}
@@ -497,7 +628,7 @@ async def _handle_x_reply(data: dict) -> dict:
         return {"result": {"status": "ok", "message": f"Reply posted: {preview}"}}
 
     try:
-        return await _with_browser(action)
+        return await _with_browser(action, "x_reply")
     except Exception as exc:
         logger.error("X reply failed", error=str(exc))
         return {"error": str(exc)}
@@ -540,7 +671,7 @@ async def _handle_x_retweet(data: dict) -> dict:
         }
 
     try:
-        return await _with_browser(action)
+        return await _with_browser(action, "x_retweet")
     except Exception as exc:
         logger.error("X retweet failed", error=str(exc))
         return {"error": str(exc)}
@@ -596,7 +727,7 @@ async def _handle_x_quote(data: dict) -> dict:
         return {"result": {"status": "ok", "message": f"Quote tweet posted: {preview}"}}
 
     try:
-        return await _with_browser(action)
+        return await _with_browser(action, "x_quote")
     except Exception as exc:
         logger.error("X quote failed", error=str(exc))
         return {"error": str(exc)}
@@ -623,4 +754,5 @@ class XIntegrationPlugin:
                 "x_retweet": _handle_x_retweet,
                 "x_quote": _handle_x_quote,
             },
+            "close": _browser.shutdown,
         }
@@ -15,6 +15,9 @@ hookimpl = pluggy.HookimplMarker("pynchy")
 # Singleton backend instance shared between both hooks.
 _backend: SqliteMemoryBackend | None = None
 
+# Upper bound on items per batch tool call
+_MAX_BATCH = 50
+
 
 def _get_backend() -> SqliteMemoryBackend:
     global _backend  # noqa: PLW0603
@@ -37,6 +40,8 @@ async def _handle_save_memory(data: dict) -> dict:
     content = data.get("content")
     if not key or not content:
         return {"error": "Missing required fields: key, content"}
+    if not isinstance(key, str) or not isinstance(content, str):
+        return {"error": "key and content must be strings"}
 
     backend = _get_backend()
     result = await backend.save(
@@ -68,6 +73,55 @@ async def _handle_recall_memories(data: dict) -> dict:
     return {"result": {"memories": results, "count": len(results)}}
 
 
+async def _handle_save_memories(data: dict) -> dict:
+    source_group = data.get("source_group")
+    if not source_group:
+        return {"error": "Missing source_group"}
+
+    items = data.get("memories")
+    if not isinstance(items, list) or not items:
+        return {"error": "Missing required field: memories"}
+    if len(items) > _MAX_BATCH:
+        return {"error": f"Too many memories in one call (max {_MAX_BATCH})"}
+    for i, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get("key") or not item.get("content"):
+            return {"error": f"memories[{i}]: missing required fields: key, content"}
+        if not isinstance(item["key"], str) or not isinstance(item["content"], str):
+            return {"error": f"memories[{i}]: key and content must be strings"}
+
+    backend = _get_backend()
+    results = await backend.save_many(group_folder=source_group, items=items)
+    return {"result": {"saved": results, "count": len(results)}}
+
+
+async def _handle_recall_memories_batch(data: dict) -> dict:
+    source_group = data.get("source_group")
+    if not source_group:
+        return {"error": "Missing source_group"}
+
+    queries = data.get("queries")
+    if not isinstance(queries, list) or not queries:
+        return {"error": "Missing required field: queries"}
+    if len(queries) > _MAX_BATCH:
+        return {"error": f"Too many queries in one call (max {_MAX_BATCH})"}
+
+    backend = _get_backend()
+    results = await backend.recall_many(
+        group_folder=source_group,
+        queries=[str(q) for q in queries],
+        category=data.get("category"),
+        limit=data.get("limit", 5),
+    )
+    return {
+        "result": {
+            "results": [
+                {"query": q, "memories": memories, "count": len(memories)}
+                for q, memories in zip(queries, results, strict=True)
+            ]
+        }
+    }
+
+
 async def _handle_forget_memory(data: dict) -> dict:
     source_group = data.get("source_group")
     if not source_group:
@@ -114,7 +168,9 @@ class SqliteMemoryPlugin:
         return {
             "tools": {
                 "save_memory": _handle_save_memory,
+                "save_memories": _handle_save_memories,
                 "recall_memories": _handle_recall_memories,
+                "recall_memories_batch": _handle_recall_memories_batch,
                 "forget_memory": _handle_forget_memory,
                 "list_memories": _handle_list_memories,
             },
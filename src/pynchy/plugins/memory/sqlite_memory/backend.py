@@ -1,14 +1,25 @@
 """SQLite FTS5 memory backend.
 
 Stores memories in a dedicated ``data/memories.db`` database with BM25-ranked
-full-text search and per-group isolation via ``group_folder`` column.
+full-text search and per-group isolation via ``group_folder`` column.  When
+NumPy is installed, recall is hybrid: BM25 and a local hashed n-gram vector
+index (see ``vectors``) are fused with reciprocal-rank fusion.  Queries that
+match no whole word fall back to a trigram FTS5 index, which answers
+substring lookups (URLs, partial words) without scanning the table.
+
+``maintain`` keeps long-lived databases in shape (FTS segment merges,
+per-group quotas with archival to ``memories_archive``, incremental vacuum)
+and ``stats`` reports size and fragmentation for ``/status``.
 """
 
 from __future__ import annotations
 
 import json
+import time
 import uuid
+from collections.abc import Callable
 from datetime import UTC, datetime
+from functools import partial
 from pathlib import Path
 
 import aiosqlite
@@ -16,6 +27,8 @@ import aiosqlite
 from pynchy.config import get_settings
 from pynchy.logger import logger
 
+from . import vectors
+
 _SCHEMA = """\
 CREATE TABLE IF NOT EXISTS memories (
     id TEXT PRIMARY KEY,
@@ -47,13 +60,72 @@ CREATE TRIGGER IF NOT EXISTS memories_au AFTER UPDATE ON memories BEGIN
         VALUES('delete', old.rowid, old.key, old.content);
     INSERT INTO memories_fts(rowid, key, content) VALUES (new.rowid, new.key, new.content);
 END;
+
+-- Substring index: every 3-character window of key and content
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_trigram USING fts5(
+    key, content, content=memories, content_rowid=rowid, tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS memories_tri_ai AFTER INSERT ON memories BEGIN
+    INSERT INTO memories_trigram(rowid, key, content) VALUES (new.rowid, new.key, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_tri_ad AFTER DELETE ON memories BEGIN
+    INSERT INTO memories_trigram(memories_trigram, rowid, key, content)
+        VALUES('delete', old.rowid, old.key, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS memories_tri_au AFTER UPDATE ON memories BEGIN
+    INSERT INTO memories_trigram(memories_trigram, rowid, key, content)
+        VALUES('delete', old.rowid, old.key, old.content);
+    INSERT INTO memories_trigram(rowid, key, content) VALUES (new.rowid, new.key, new.content);
+END;
+
+-- Hashed n-gram embeddings (float32 blobs), maintained by the backend
+CREATE TABLE IF NOT EXISTS memory_vectors (
+    memory_rowid INTEGER PRIMARY KEY,
+    vec BLOB NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS memories_vec_ad AFTER DELETE ON memories BEGIN
+    DELETE FROM memory_vectors WHERE memory_rowid = old.rowid;
+END;
+
+-- Cold storage for memories evicted by per-group quotas (not searched)
+CREATE TABLE IF NOT EXISTS memories_archive (
+    id TEXT PRIMARY KEY,
+    group_folder TEXT NOT NULL,
+    key TEXT NOT NULL,
+    content TEXT NOT NULL,
+    category TEXT NOT NULL,
+    metadata TEXT DEFAULT '{}',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    archived_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_memories_archive_group ON memories_archive(group_folder, key);
 """
 
+_FTS_TABLES = ("memories_fts", "memories_trigram")
+_AUTO_VACUUM_MODES = {0: "none", 1: "full", 2: "incremental"}
+# Rows per statement when archiving, well under SQLite's variable limit
+_ARCHIVE_CHUNK = 500
+_UNLIMITED = 2**62
+
+# Each ranker contributes this many candidates per requested result to fusion
+_CANDIDATES_PER_RESULT = 4
+_BACKFILL_BATCH = 1000
+# The trigram tokenizer can't match anything shorter than one trigram
+_MIN_SUBSTRING_CHARS = 3
+
 
 def _db_path() -> Path:
     return get_settings().data_dir / "memories.db"
 
 
+def _apply(index_updates: list[Callable[[], None]]) -> None:
+    """Run vector index updates deferred until their transaction committed."""
+    for update in index_updates:
+        update()
+
+
 class SqliteMemoryBackend:
     """SQLite FTS5 memory backend with BM25 ranked search."""
 
@@ -61,6 +133,8 @@ class SqliteMemoryBackend:
 
     def __init__(self) -> None:
         self._db: aiosqlite.Connection | None = None
+        self._vectors: vectors.VectorIndex | None = None
+        self._last_maintenance: dict | None = None
 
     async def _conn(self) -> aiosqlite.Connection:
         if self._db is None:
@@ -75,16 +149,55 @@ class SqliteMemoryBackend:
         self._db = await aiosqlite.connect(str(path))
         self._db.row_factory = aiosqlite.Row
 
-        # Connection tuning
+        # Connection tuning.  auto_vacuum must come first: it only takes effect
+        # on a new, empty database (existing ones would need a full VACUUM,
+        # which can renumber the rowids the FTS and vector tables key on).
+        await self._db.execute("PRAGMA auto_vacuum = INCREMENTAL")
         await self._db.execute("PRAGMA journal_mode = WAL")
         await self._db.execute("PRAGMA synchronous = NORMAL")
         await self._db.execute("PRAGMA mmap_size = 8388608")
         await self._db.execute("PRAGMA cache_size = -2000")
         await self._db.execute("PRAGMA temp_store = MEMORY")
 
+        cursor = await self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'memories_trigram'"
+        )
+        has_trigram = await cursor.fetchone() is not None
         await self._db.executescript(_SCHEMA)
+        if not has_trigram:
+            # Databases from before the trigram index: populate it once
+            await self._db.execute(
+                "INSERT INTO memories_trigram(memories_trigram) VALUES('rebuild')"
+            )
         await self._db.commit()
-        logger.info("Memory backend initialized", path=str(path))
+
+        if vectors.AVAILABLE:
+            self._vectors = vectors.VectorIndex()
+            await self._backfill_vectors(self._db)
+        logger.info("Memory backend initialized", path=str(path), hybrid=self._vectors is not None)
+
+    async def _backfill_vectors(self, db: aiosqlite.Connection) -> None:
+        """Embed memories that have no (or a stale-width) vector yet."""
+        total = 0
+        while True:
+            cursor = await db.execute(
+                """SELECT m.rowid, m.key, m.content FROM memories m
+                   LEFT JOIN memory_vectors v ON v.memory_rowid = m.rowid
+                   WHERE v.vec IS NULL OR length(v.vec) != ?
+                   LIMIT ?""",
+                (vectors.DIM * 4, _BACKFILL_BATCH),
+            )
+            rows = await cursor.fetchall()
+            if not rows:
+                break
+            await db.executemany(
+                "INSERT OR REPLACE INTO memory_vectors (memory_rowid, vec) VALUES (?, ?)",
+                [(r[0], vectors.embed(vectors.memory_text(r[1], r[2])).tobytes()) for r in rows],
+            )
+            await db.commit()
+            total += len(rows)
+        if total:
+            logger.info("Embedded memories for hybrid recall", count=total)
 
     async def close(self) -> None:
         if self._db:
@@ -100,11 +213,69 @@ class SqliteMemoryBackend:
         metadata: dict | None = None,
     ) -> dict:
         db = await self._conn()
+        index_updates: list[Callable[[], None]] = []
+        try:
+            result = await self._upsert(
+                db, group_folder, key, content, category, metadata, index_updates
+            )
+        except Exception:
+            await db.rollback()
+            raise
+        await db.commit()
+        _apply(index_updates)
+        return result
+
+    async def save_many(self, group_folder: str, items: list[dict]) -> list[dict]:
+        """Save several memories in one transaction.
+
+        Each item takes the ``save`` arguments (``key``, ``content`` and
+        optionally ``category``, ``metadata``); results are in item order.
+        """
+        db = await self._conn()
+        index_updates: list[Callable[[], None]] = []
+        try:
+            results = [
+                await self._upsert(
+                    db,
+                    group_folder,
+                    item["key"],
+                    item["content"],
+                    item.get("category", "core"),
+                    item.get("metadata"),
+                    index_updates,
+                )
+                for item in items
+            ]
+        except Exception:
+            await db.rollback()
+            raise
+        await db.commit()
+        _apply(index_updates)
+        return results
+
+    async def _upsert(
+        self,
+        db: aiosqlite.Connection,
+        group_folder: str,
+        key: str,
+        content: str,
+        category: str,
+        metadata: dict | None,
+        index_updates: list[Callable[[], None]],
+    ) -> dict:
+        """Insert or update one memory without committing.
+
+        The in-memory vector index update is appended to *index_updates*
+        for the caller to apply after the commit: a rolled-back insert
+        frees its rowid for reuse, possibly by another group's memory.
+        """
         now = datetime.now(tz=UTC).isoformat()
         meta_json = json.dumps(metadata or {})
         mem_id = uuid.uuid4().hex
 
-        await db.execute(
+        # On conflict the existing row keeps its id, so a returned id other
+        # than ours means this was an update
+        cursor = await db.execute(
             """INSERT INTO memories
             (id, group_folder, key, content, category, metadata, created_at, updated_at)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -112,18 +283,23 @@ class SqliteMemoryBackend:
                 content = excluded.content,
                 category = excluded.category,
                 metadata = excluded.metadata,
-                updated_at = excluded.updated_at""",
+                updated_at = excluded.updated_at
+            RETURNING rowid, id""",
             (mem_id, group_folder, key, content, category, meta_json, now, now),
         )
-        await db.commit()
-
-        # Determine if this was a create or update
-        cursor = await db.execute(
-            "SELECT id FROM memories WHERE group_folder = ? AND key = ?",
-            (group_folder, key),
-        )
         row = await cursor.fetchone()
-        status = "created" if row and row["id"] == mem_id else "updated"
+        await cursor.close()
+        status = "created" if row["id"] == mem_id else "updated"
+
+        if self._vectors is not None:
+            vec = vectors.embed(vectors.memory_text(key, content))
+            await db.execute(
+                "INSERT OR REPLACE INTO memory_vectors (memory_rowid, vec) VALUES (?, ?)",
+                (row["rowid"], vec.tobytes()),
+            )
+            index_updates.append(
+                partial(self._vectors.upsert, group_folder, row["rowid"], vec, category)
+            )
 
         return {"key": key, "status": status}
 
@@ -139,15 +315,28 @@ class SqliteMemoryBackend:
 
         db = await self._conn()
 
-        # Tier 1: BM25 via FTS5
-        results = await self._fts_search(db, group_folder, query, category, limit)
+        # Tier 1: BM25 via FTS5, fused with vector similarity when available
+        if self._vectors is not None:
+            results = await self._hybrid_search(db, group_folder, query, category, limit)
+        else:
+            results = await self._fts_search(db, group_folder, query, category, limit)
 
-        # Tier 2: LIKE fallback if FTS5 returns nothing
+        # Tier 2: indexed substring match if nothing matched
         if not results:
-            results = await self._like_search(db, group_folder, query, category, limit)
+            results = await self._substring_search(db, group_folder, query, category, limit)
 
         return results
 
+    async def recall_many(
+        self,
+        group_folder: str,
+        queries: list[str],
+        category: str | None = None,
+        limit: int = 5,
+    ) -> list[list[dict]]:
+        """Run several ``recall`` queries; results are in query order."""
+        return [await self.recall(group_folder, q, category, limit) for q in queries]
+
     async def _fts_search(
         self,
         db: aiosqlite.Connection,
@@ -198,7 +387,54 @@ class SqliteMemoryBackend:
             for r in rows
         ]
 
-    async def _like_search(
+    async def _hybrid_search(
+        self,
+        db: aiosqlite.Connection,
+        group_folder: str,
+        query: str,
+        category: str | None,
+        limit: int,
+    ) -> list[dict]:
+        assert self._vectors is not None
+        candidates = limit * _CANDIDATES_PER_RESULT
+        bm25 = await self._fts_search(db, group_folder, query, category, candidates)
+
+        index = await self._vectors.group(db, group_folder)
+        hits = index.search(vectors.embed(query), candidates, category)
+        by_key = {r["key"]: r for r in bm25}
+        rowids = [rowid for rowid, _ in hits]
+        if rowids:
+            placeholders = ",".join("?" * len(rowids))
+            cursor = await db.execute(
+                f"""SELECT rowid, key, content, category, metadata, updated_at
+                    FROM memories WHERE group_folder = ? AND rowid IN ({placeholders})""",
+                [group_folder, *rowids],
+            )
+            rows = {r["rowid"]: r for r in await cursor.fetchall()}
+        else:
+            rows = {}
+        vector_ranking = []
+        for rowid, _similarity in hits:
+            r = rows.get(rowid)
+            if r is None:
+                continue
+            vector_ranking.append(r["key"])
+            by_key.setdefault(
+                r["key"],
+                {
+                    "key": r["key"],
+                    "content": r["content"],
+                    "category": r["category"],
+                    "metadata": json.loads(r["metadata"]),
+                    "updated_at": r["updated_at"],
+                },
+            )
+
+        fused = vectors.reciprocal_rank_fusion([r["key"] for r in bm25], vector_ranking)
+        ranked = sorted(fused, key=fused.__getitem__, reverse=True)[:limit]
+        return [{**by_key[key], "score": fused[key]} for key in ranked]
+
+    async def _substring_search(
         self,
         db: aiosqlite.Connection,
         group_folder: str,
@@ -206,27 +442,31 @@ class SqliteMemoryBackend:
         category: str | None,
         limit: int,
     ) -> list[dict]:
-        like_pattern = f"%{query}%"
+        query = query.strip()
+        if len(query) < _MIN_SUBSTRING_CHARS:
+            return []
+        # One quoted phrase: matches rows containing the query as a substring
+        phrase = '"' + query.replace('"', '""') + '"'
 
         if category:
             cursor = await db.execute(
-                """SELECT key, content, category, metadata, updated_at
-                   FROM memories
-                   WHERE (content LIKE ? OR key LIKE ?)
-                     AND group_folder = ? AND category = ?
-                   ORDER BY updated_at DESC
+                """SELECT m.key, m.content, m.category, m.metadata, m.updated_at
+                   FROM memories m
+                   JOIN memories_trigram t ON m.rowid = t.rowid
+                   WHERE memories_trigram MATCH ? AND m.group_folder = ? AND m.category = ?
+                   ORDER BY bm25(memories_trigram)
                    LIMIT ?""",
-                (like_pattern, like_pattern, group_folder, category, limit),
+                (phrase, group_folder, category, limit),
             )
         else:
             cursor = await db.execute(
-                """SELECT key, content, category, metadata, updated_at
-                   FROM memories
-                   WHERE (content LIKE ? OR key LIKE ?)
-                     AND group_folder = ?
-                   ORDER BY updated_at DESC
+                """SELECT m.key, m.content, m.category, m.metadata, m.updated_at
+                   FROM memories m
+                   JOIN memories_trigram t ON m.rowid = t.rowid
+                   WHERE memories_trigram MATCH ? AND m.group_folder = ?
+                   ORDER BY bm25(memories_trigram)
                    LIMIT ?""",
-                (like_pattern, like_pattern, group_folder, limit),
+                (phrase, group_folder, limit),
             )
 
         rows = await cursor.fetchall()
@@ -241,14 +481,165 @@ class SqliteMemoryBackend:
             for r in rows
         ]
 
+    async def maintain(
+        self,
+        *,
+        max_rows_per_group: int | None = None,
+        max_bytes_per_group: int | None = None,
+    ) -> dict:
+        """Archive over-quota memories, merge FTS segments, reclaim free pages.
+
+        Quotas count each group's most recently updated memories first; the
+        rest move to ``memories_archive``.  Byte size is key + content +
+        metadata in UTF-8.
+        """
+        db = await self._conn()
+        started = time.monotonic()
+        index_updates: list[Callable[[], None]] = []
+        try:
+            archived = await self._archive_over_quota(
+                db, max_rows_per_group, max_bytes_per_group, index_updates
+            )
+            for table in _FTS_TABLES:
+                await db.execute(f"INSERT INTO {table}({table}) VALUES('optimize')")
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            raise
+        _apply(index_updates)
+        reclaimed = await self._incremental_vacuum(db)
+
+        result = {
+            "finished_at": datetime.now(tz=UTC).isoformat(),
+            "duration_ms": round((time.monotonic() - started) * 1000),
+            "archived": archived,
+            "pages_reclaimed": reclaimed,
+        }
+        self._last_maintenance = result
+        logger.info("Memory maintenance finished", **result)
+        return result
+
+    async def _archive_over_quota(
+        self,
+        db: aiosqlite.Connection,
+        max_rows: int | None,
+        max_bytes: int | None,
+        index_updates: list[Callable[[], None]],
+    ) -> int:
+        if max_rows is None and max_bytes is None:
+            return 0
+        cursor = await db.execute(
+            """SELECT rid FROM (
+                   SELECT rowid AS rid,
+                          ROW_NUMBER() OVER w AS n,
+                          SUM(length(CAST(key AS BLOB)) + length(CAST(content AS BLOB))
+                              + length(CAST(coalesce(metadata, '') AS BLOB))) OVER w AS bytes
+                   FROM memories
+                   WINDOW w AS (PARTITION BY group_folder ORDER BY updated_at DESC, rowid DESC)
+               )
+               WHERE n > ? OR bytes > ?""",
+            (
+                max_rows if max_rows is not None else _UNLIMITED,
+                max_bytes if max_bytes is not None else _UNLIMITED,
+            ),
+        )
+        rowids = [r[0] for r in await cursor.fetchall()]
+        now = datetime.now(tz=UTC).isoformat()
+        for i in range(0, len(rowids), _ARCHIVE_CHUNK):
+            chunk = rowids[i : i + _ARCHIVE_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            await db.execute(
+                f"""INSERT OR REPLACE INTO memories_archive
+                    (id, group_folder, key, content, category, metadata,
+                     created_at, updated_at, archived_at)
+                    SELECT id, group_folder, key, content, category, metadata,
+                           created_at, updated_at, ?
+                    FROM memories WHERE rowid IN ({placeholders})""",
+                [now, *chunk],
+            )
+            cursor = await db.execute(
+                f"DELETE FROM memories WHERE rowid IN ({placeholders}) RETURNING rowid, group_folder",
+                chunk,
+            )
+            removed = await cursor.fetchall()
+            if self._vectors is not None:
+                for row in removed:
+                    index_updates.append(partial(self._vectors.remove, row[1], row[0]))
+        if rowids:
+            logger.info("Archived memories over quota", count=len(rowids))
+        return len(rowids)
+
+    async def _incremental_vacuum(self, db: aiosqlite.Connection) -> int:
+        """Return free pages to the OS; a no-op unless auto_vacuum is incremental."""
+        if await self._pragma(db, "auto_vacuum") != 2:
+            return 0
+        before = await self._pragma(db, "freelist_count")
+        cursor = await db.execute("PRAGMA incremental_vacuum")
+        await cursor.fetchall()
+        return before - await self._pragma(db, "freelist_count")
+
+    @staticmethod
+    async def _pragma(db: aiosqlite.Connection, name: str) -> int:
+        cursor = await db.execute(f"PRAGMA {name}")
+        row = await cursor.fetchone()
+        return int(row[0]) if row else 0
+
+    async def stats(self) -> dict:
+        """Size, fragmentation and row counts for the status endpoint."""
+        db = await self._conn()
+        page_size = await self._pragma(db, "page_size")
+        page_count = await self._pragma(db, "page_count")
+        freelist = await self._pragma(db, "freelist_count")
+        auto_vacuum = await self._pragma(db, "auto_vacuum")
+
+        cursor = await db.execute("SELECT COUNT(*), COUNT(DISTINCT group_folder) FROM memories")
+        rows, groups = await cursor.fetchone()
+        cursor = await db.execute("SELECT COUNT(*) FROM memories_archive")
+        (archived,) = await cursor.fetchone()
+        cursor = await db.execute(
+            """SELECT group_folder, COUNT(*) AS n,
+                      SUM(length(CAST(key AS BLOB)) + length(CAST(content AS BLOB))) AS bytes
+               FROM memories GROUP BY group_folder ORDER BY n DESC LIMIT 5"""
+        )
+        largest = [
+            {"group": r["group_folder"], "rows": r["n"], "bytes": r["bytes"]}
+            for r in await cursor.fetchall()
+        ]
+
+        return {
+            "backend": self.name,
+            "rows": rows,
+            "groups": groups,
+            "archived_rows": archived,
+            "file_bytes": page_count * page_size,
+            "free_bytes": freelist * page_size,
+            "fragmentation": round(freelist / page_count, 3) if page_count else 0.0,
+            "auto_vacuum": _AUTO_VACUUM_MODES.get(auto_vacuum, str(auto_vacuum)),
+            "hybrid_recall": self._vectors is not None,
+            "largest_groups": largest,
+            "last_maintenance": self._last_maintenance,
+        }
+
     async def forget(self, group_folder: str, key: str) -> dict:
         db = await self._conn()
+        # memories_vec_ad drops the stored vector; RETURNING gives us the
+        # rowid to evict from the in-memory index
+        cursor = await db.execute(
+            "DELETE FROM memories WHERE group_folder = ? AND key = ? RETURNING rowid",
+            (group_folder, key),
+        )
+        removed = await cursor.fetchall()
+        # Forgetting also drops any archived copy
         cursor = await db.execute(
-            "DELETE FROM memories WHERE group_folder = ? AND key = ?",
+            "DELETE FROM memories_archive WHERE group_folder = ? AND key = ?",
             (group_folder, key),
         )
+        archived = cursor.rowcount
         await db.commit()
-        return {"removed": cursor.rowcount > 0}
+        if self._vectors is not None:
+            for row in removed:
+                self._vectors.remove(group_folder, row[0])
+        return {"removed": bool(removed) or archived > 0}
 
     async def list_keys(
         self,
@@ -0,0 +1,197 @@
+"""Local hashed n-gram embeddings and an in-memory per-group vector index.
+
+Nothing is downloaded: a memory is embedded by hashing its words and
+character trigrams into a fixed-width signed feature vector (the "hashing
+trick"), L2-normalised.  Vectors persist as float32 blobs in the
+``memory_vectors`` table next to the memories themselves; each group is
+loaded on first use into one contiguous matrix, so a query is a single
+matrix-vector product.  The index is kept in step with ``save``/``forget``
+instead of being rebuilt.
+
+NumPy is optional (``pynchy[memory]``).  Without it ``AVAILABLE`` is False
+and recall stays BM25-only.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import aiosqlite
+    from numpy.typing import NDArray
+
+AVAILABLE = np is not None
+
+DIM = 256
+# Unrelated texts still share the odd trigram or hash bucket; below this a
+# cosine is noise rather than a match (spelling variants like colour/color
+# in a short memory land around 0.15-0.4).
+MIN_SIMILARITY = 0.15
+
+_WORD_WEIGHT = 1.0
+_TRIGRAM_WEIGHT = 0.5
+_WORD_RE = re.compile(r"\w+")
+
+
+def _features(text: str) -> tuple[list[int], list[float]]:
+    """Hashed feature buckets and signed weights for *text*."""
+    buckets: list[int] = []
+    weights: list[float] = []
+    for word in _WORD_RE.findall(text.lower()):
+        grams = [word]
+        padded = f" {word} "
+        grams.extend(padded[i : i + 3] for i in range(len(padded) - 2))
+        for n, gram in enumerate(grams):
+            h = zlib.crc32(gram.encode())
+            weight = _WORD_WEIGHT if n == 0 else _TRIGRAM_WEIGHT
+            buckets.append(h % DIM)
+            weights.append(weight if h & 0x80000000 else -weight)
+    return buckets, weights
+
+
+def embed(text: str) -> NDArray:
+    """Unit-length float32 embedding of *text* (all zeros if it has no words)."""
+    buckets, weights = _features(text)
+    vec = np.bincount(buckets, weights=weights, minlength=DIM).astype(np.float32)
+    norm = float(np.linalg.norm(vec))
+    if norm > 0:
+        vec /= norm
+    return vec
+
+
+def memory_text(key: str, content: str) -> str:
+    """Text a memory is embedded from — keys carry meaning too."""
+    return f"{key.replace('-', ' ').replace('_', ' ')} {content}"
+
+
+class GroupIndex:
+    """Contiguous vector matrix for one group with O(1) upsert/remove.
+
+    Rows live in ``matrix[:size]``; removal swaps the last row into the gap.
+    Capacity grows geometrically so appends are amortised O(1).
+    """
+
+    def __init__(self) -> None:
+        self.size = 0
+        self._matrix = np.zeros((0, DIM), dtype=np.float32)
+        self._rowids = np.zeros(0, dtype=np.int64)
+        self._categories = np.zeros(0, dtype=np.int32)
+        self._pos: dict[int, int] = {}
+        self._category_codes: dict[str, int] = {}
+
+    def upsert(self, rowid: int, vec: NDArray, category: str) -> None:
+        code = self._category_codes.setdefault(category, len(self._category_codes))
+        pos = self._pos.get(rowid)
+        if pos is None:
+            if self.size == len(self._rowids):
+                self._grow(max(16, self.size * 2))
+            pos = self.size
+            self.size += 1
+            self._pos[rowid] = pos
+            self._rowids[pos] = rowid
+        self._matrix[pos] = vec
+        self._categories[pos] = code
+
+    def remove(self, rowid: int) -> None:
+        pos = self._pos.pop(rowid, None)
+        if pos is None:
+            return
+        last = self.size - 1
+        if pos != last:
+            moved = int(self._rowids[last])
+            self._matrix[pos] = self._matrix[last]
+            self._rowids[pos] = moved
+            self._categories[pos] = self._categories[last]
+            self._pos[moved] = pos
+        self.size = last
+
+    def search(
+        self, query: NDArray, k: int, category: str | None = None
+    ) -> list[tuple[int, float]]:
+        """Top-*k* ``(rowid, cosine)`` pairs above ``MIN_SIMILARITY``, best first."""
+        if self.size == 0 or k <= 0:
+            return []
+        scores = self._matrix[: self.size] @ query
+        if category is not None:
+            code = self._category_codes.get(category)
+            if code is None:
+                return []
+            scores = np.where(self._categories[: self.size] == code, scores, -np.inf)
+        k = min(k, self.size)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(self._rowids[i]), float(scores[i])) for i in top if scores[i] >= MIN_SIMILARITY
+        ]
+
+    def _grow(self, capacity: int) -> None:
+        matrix = np.zeros((capacity, DIM), dtype=np.float32)
+        matrix[: self.size] = self._matrix[: self.size]
+        self._matrix = matrix
+        self._rowids = np.resize(self._rowids, capacity)
+        self._categories = np.resize(self._categories, capacity)
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[int, str, bytes]]) -> GroupIndex:
+        """Build from ``(rowid, category, blob)`` rows in one allocation."""
+        index = cls()
+        if not rows:
+            return index
+        n = len(rows)
+        index._matrix = np.frombuffer(b"".join(r[2] for r in rows), dtype=np.float32)
+        index._matrix = index._matrix.reshape(n, DIM).copy()
+        index._rowids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=n)
+        codes = index._category_codes
+        index._categories = np.fromiter(
+            (codes.setdefault(r[1], len(codes)) for r in rows), dtype=np.int32, count=n
+        )
+        index._pos = {int(rowid): i for i, rowid in enumerate(index._rowids)}
+        index.size = n
+        return index
+
+
+class VectorIndex:
+    """Per-group ``GroupIndex`` cache, loaded lazily from ``memory_vectors``."""
+
+    def __init__(self) -> None:
+        self._groups: dict[str, GroupIndex] = {}
+
+    async def group(self, db: aiosqlite.Connection, group_folder: str) -> GroupIndex:
+        index = self._groups.get(group_folder)
+        if index is None:
+            cursor = await db.execute(
+                """SELECT v.memory_rowid, m.category, v.vec
+                   FROM memory_vectors v JOIN memories m ON m.rowid = v.memory_rowid
+                   WHERE m.group_folder = ?""",
+                (group_folder,),
+            )
+            rows = [(r[0], r[1], r[2]) for r in await cursor.fetchall()]
+            index = self._groups[group_folder] = GroupIndex.from_rows(rows)
+        return index
+
+    def upsert(self, group_folder: str, rowid: int, vec: NDArray, category: str) -> None:
+        # Unloaded groups pick the row up from the table on first use
+        index = self._groups.get(group_folder)
+        if index is not None:
+            index.upsert(rowid, vec, category)
+
+    def remove(self, group_folder: str, rowid: int) -> None:
+        index = self._groups.get(group_folder)
+        if index is not None:
+            index.remove(rowid)
+
+
+def reciprocal_rank_fusion(*rankings: list[str], k: int = 60) -> dict[str, float]:
+    """Fuse ranked id lists: ``score(id) = sum(1 / (k + rank))``."""
+    fused: dict[str, float] = {}
+    for ranking in rankings:
+        for rank, item in enumerate(ranking, start=1):
+            fused[item] = fused.get(item, 0.0) + 1.0 / (k + rank)
+    return fused
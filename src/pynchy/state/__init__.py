@@ -13,10 +13,15 @@ This package is split into domain-specific submodules:
   host_jobs    — host-level cron jobs
   sessions     — session tracking and router state
   groups       — registered groups and workspace profiles
+  name_directory — persistent user/channel display names
+  inbound_index — platform-pushed message history for reconciliation
+  agent_cursors — per-group "handed to the agent" cursors
+  usage        — token/cost ledger and hourly/daily rollups
 """
 
 # Re-export every public symbol so that `from pynchy.state import X` keeps working.
 
+from pynchy.state.agent_cursors import get_agent_cursors, save_agent_cursors
 from pynchy.state.channel_cursors import (
     advance_cursors_atomic,
     get_channel_cursor,
@@ -32,6 +37,7 @@ from pynchy.state.chats import (
     set_last_group_sync,
     store_chat_metadata,
     update_chat_name,
+    upsert_chat_names,
 )
 from pynchy.state.connection import _get_db, _init_test_database, init_database
 from pynchy.state.events import store_event
@@ -51,6 +57,12 @@ from pynchy.state.host_jobs import (
     update_host_job,
     update_host_job_after_run,
 )
+from pynchy.state.inbound_index import (
+    get_index_anchor,
+    get_indexed_since,
+    index_inbound,
+    prune_inbound_index,
+)
 from pynchy.state.messages import (
     get_chat_history,
     get_messages_since,
@@ -61,11 +73,21 @@ from pynchy.state.messages import (
     store_message,
     store_message_direct,
 )
+from pynchy.state.name_directory import (
+    get_directory_names,
+    get_directory_synced_at,
+    prune_directory,
+    set_directory_synced_at,
+    upsert_directory_names,
+)
 from pynchy.state.outbound import (
     gc_delivered,
+    get_pending_for_channel,
     get_pending_outbound,
     mark_delivered,
+    mark_delivered_many,
     mark_delivery_error,
+    mark_delivery_error_many,
     record_outbound,
 )
 from pynchy.state.sessions import (
@@ -89,22 +111,45 @@ from pynchy.state.tasks import (
     update_task,
     update_task_after_run,
 )
+from pynchy.state.usage import (
+    UsageRecord,
+    get_usage_summary,
+    get_workspace_spend,
+    record_usage,
+)
 
 __all__ = [
     # connection
     "_get_db",
     "_init_test_database",
     "init_database",
+    # agent_cursors
+    "get_agent_cursors",
+    "save_agent_cursors",
     # channel_cursors
     "advance_cursors_atomic",
     "get_channel_cursor",
     "prune_stale_cursors",
     "set_channel_cursor",
+    # inbound_index
+    "get_index_anchor",
+    "get_indexed_since",
+    "index_inbound",
+    "prune_inbound_index",
+    # name_directory
+    "get_directory_names",
+    "get_directory_synced_at",
+    "prune_directory",
+    "set_directory_synced_at",
+    "upsert_directory_names",
     # outbound
     "gc_delivered",
+    "get_pending_for_channel",
     "get_pending_outbound",
     "mark_delivered",
+    "mark_delivered_many",
     "mark_delivery_error",
+    "mark_delivery_error_many",
     "record_outbound",
     # events
     "store_event",
@@ -117,6 +162,7 @@ __all__ = [
     "set_last_group_sync",
     "store_chat_metadata",
     "update_chat_name",
+    "upsert_chat_names",
     # messages
     "get_chat_history",
     "get_messages_since",
@@ -159,4 +205,9 @@ __all__ = [
     "get_all_workspace_profiles",
     "get_workspace_profile",
     "set_workspace_profile",
+    # usage
+    "UsageRecord",
+    "get_usage_summary",
+    "get_workspace_spend",
+    "record_usage",
 ]
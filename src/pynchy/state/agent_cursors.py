@@ -0,0 +1,49 @@
+"""Per-group agent cursors — how far each chat has been handed to its agent.
+
+One row per chat JID, so advancing one group's cursor rewrites one row
+instead of the whole map.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from pynchy.state.connection import _get_db, atomic_write
+
+
+async def get_agent_cursors() -> dict[str, str]:
+    """Return every agent cursor as a dict of chat_jid -> timestamp."""
+    db = _get_db()
+    cursor = await db.execute("SELECT chat_jid, ts FROM agent_cursors")
+    rows = await cursor.fetchall()
+    return {row["chat_jid"]: row["ts"] for row in rows}
+
+
+async def save_agent_cursors(
+    changed: dict[str, str],
+    removed: Iterable[str] = (),
+    *,
+    router_state: dict[str, str] | None = None,
+) -> None:
+    """Upsert *changed* cursors and delete *removed* ones in one transaction.
+
+    *router_state* pairs are written in the same transaction so the global
+    and per-group cursors can never disagree after a crash.
+    """
+    removed = list(removed)
+    async with atomic_write() as db:
+        if changed:
+            await db.executemany(
+                "INSERT INTO agent_cursors (chat_jid, ts) VALUES (?, ?)"
+                " ON CONFLICT(chat_jid) DO UPDATE SET ts = excluded.ts",
+                list(changed.items()),
+            )
+        if removed:
+            await db.executemany(
+                "DELETE FROM agent_cursors WHERE chat_jid = ?", [(jid,) for jid in removed]
+            )
+        if router_state:
+            await db.executemany(
+                "INSERT OR REPLACE INTO router_state (key, value) VALUES (?, ?)",
+                list(router_state.items()),
+            )
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime
 
-from pynchy.state.connection import _get_db, atomic_write
+from pynchy.state.connection import _commit, _get_db, atomic_write
 
 
 async def get_channel_cursor(channel_name: str, chat_jid: str, direction: str) -> str:
@@ -33,7 +33,7 @@ async def set_channel_cursor(channel_name: str, chat_jid: str, direction: str, v
         " VALUES (?, ?, ?, ?, ?)",
         (channel_name, chat_jid, direction, value, now),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def advance_cursors_atomic(
@@ -78,5 +78,5 @@ async def prune_stale_cursors(active_channel_names: set[str]) -> int:
         f"DELETE FROM channel_cursors WHERE channel_name NOT IN ({placeholders})",
         tuple(active_channel_names),
     )
-    await db.commit()
+    await _commit(db)
     return cursor.rowcount
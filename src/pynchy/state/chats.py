@@ -3,15 +3,34 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Any
 
-from pynchy.state.connection import _get_db
+from pynchy.state.connection import _commit, _get_db, atomic_write
+
+# SQLite's default limit on host parameters is 999; stay well under it.
+_IN_BATCH = 500
+
+# jid -> name as last read or written, so periodic bulk syncs can skip rows
+# whose name hasn't changed without touching the database.  Bound to the
+# connection it was filled from (tests swap connections freely).
+_name_cache: dict[str, str] = {}
+_name_cache_db: Any = None
+
+
+def _names() -> dict[str, str]:
+    global _name_cache_db
+    db = _get_db()
+    if db is not _name_cache_db:
+        _name_cache.clear()
+        _name_cache_db = db
+    return _name_cache
 
 
 async def set_chat_cleared_at(chat_jid: str, timestamp: str) -> None:
     """Mark a chat as cleared at the given timestamp. Messages before this are hidden."""
     db = _get_db()
     await db.execute("UPDATE chats SET cleared_at = ? WHERE jid = ?", (timestamp, chat_jid))
-    await db.commit()
+    await _commit(db)
 
 
 async def get_chat_cleared_at(chat_jid: str) -> str | None:
@@ -35,6 +54,7 @@ async def store_chat_metadata(chat_jid: str, timestamp: str, name: str | None =
             """,
             (chat_jid, name, timestamp),
         )
+        _names()[chat_jid] = name
     else:
         await db.execute(
             """
@@ -44,7 +64,7 @@ async def store_chat_metadata(chat_jid: str, timestamp: str, name: str | None =
             """,
             (chat_jid, chat_jid, timestamp),
         )
-    await db.commit()
+    await _commit(db)
 
 
 async def update_chat_name(chat_jid: str, name: str) -> None:
@@ -58,7 +78,49 @@ async def update_chat_name(chat_jid: str, name: str) -> None:
         """,
         (chat_jid, name, now),
     )
-    await db.commit()
+    await _commit(db)
+    _names()[chat_jid] = name
+
+
+async def upsert_chat_names(names: dict[str, str], *, insert_missing: bool = True) -> int:
+    """Bulk version of ``update_chat_name`` — one transaction for all changes.
+
+    Names that match what is already stored are skipped (checked against an
+    in-memory map, then one batched read for JIDs not seen yet).  With
+    ``insert_missing=False`` only chats that already exist are renamed.
+
+    Returns the number of rows written.
+    """
+    cache = _names()
+    changed = {jid: name for jid, name in names.items() if name and cache.get(jid) != name}
+    unseen = [jid for jid in changed if jid not in cache]
+    if unseen:
+        db = _get_db()
+        for i in range(0, len(unseen), _IN_BATCH):
+            batch = unseen[i : i + _IN_BATCH]
+            placeholders = ",".join("?" * len(batch))
+            cursor = await db.execute(
+                f"SELECT jid, name FROM chats WHERE jid IN ({placeholders})", batch
+            )
+            for row in await cursor.fetchall():
+                cache[row["jid"]] = row["name"]
+        changed = {jid: name for jid, name in changed.items() if cache.get(jid) != name}
+    if not insert_missing:
+        changed = {jid: name for jid, name in changed.items() if jid in cache}
+    if not changed:
+        return 0
+
+    now = datetime.now(UTC).isoformat()
+    async with atomic_write() as db:
+        await db.executemany(
+            """
+            INSERT INTO chats (jid, name, last_message_time) VALUES (?, ?, ?)
+            ON CONFLICT(jid) DO UPDATE SET name = excluded.name
+            """,
+            [(jid, name, now) for jid, name in changed.items()],
+        )
+    cache.update(changed)
+    return len(changed)
 
 
 async def get_all_chats() -> list[dict[str, str]]:
@@ -99,4 +161,4 @@ async def set_last_group_sync() -> None:
         "VALUES ('__group_sync__', '__group_sync__', ?)",
         (now,),
     )
-    await db.commit()
+    await _commit(db)
@@ -7,17 +7,24 @@ Schema definition and migrations live in :mod:`schema`.
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
 import aiosqlite
 
+from pynchy import metrics
 from pynchy.config import get_settings
 from pynchy.state.schema import create_schema
 
 _db: aiosqlite.Connection | None = None
 
+_COMMIT_SECONDS = metrics.histogram(
+    "pynchy_db_commit_seconds",
+    "SQLite commit latency, including the wait for the aiosqlite worker thread.",
+)
+
 # Shared write lock for multi-statement DB transactions — see atomic_write().
 #
 # pynchy uses a single aiosqlite connection shared across many concurrent
@@ -49,12 +56,19 @@ async def atomic_write() -> AsyncIterator[aiosqlite.Connection]:
     async with _write_lock:
         try:
             yield db
-            await db.commit()
+            await _commit(db)
         except Exception:
             await db.rollback()
             raise
 
 
+async def _commit(db: aiosqlite.Connection) -> None:
+    """Commit *db*, recording the latency — use instead of ``db.commit()``."""
+    started = time.perf_counter()
+    await db.commit()
+    _COMMIT_SECONDS.observe(time.perf_counter() - started)
+
+
 def _get_db() -> aiosqlite.Connection:
     if _db is None:
         raise RuntimeError("Database not initialized. Call init_database() first.")
@@ -90,7 +104,7 @@ async def _update_by_id(
         f"UPDATE {table} SET {', '.join(fields)} WHERE id = ?",
         values,
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def init_database() -> None:
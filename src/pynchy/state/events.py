@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from datetime import UTC, datetime
 
-from pynchy.state.connection import _get_db
+from pynchy.state.connection import _commit, _get_db
 
 
 async def store_event(
@@ -23,4 +23,4 @@ async def store_event(
         "INSERT INTO events (event_type, chat_jid, timestamp, payload) VALUES (?, ?, ?, ?)",
         (event_type, chat_jid, datetime.now(UTC).isoformat(), json.dumps(payload)),
     )
-    await db.commit()
+    await _commit(db)
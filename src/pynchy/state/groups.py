@@ -6,7 +6,7 @@ import json
 from dataclasses import asdict
 
 from pynchy.logger import logger
-from pynchy.state.connection import _get_db
+from pynchy.state.connection import _commit, _get_db
 from pynchy.types import (
     ContainerConfig,
     ServiceTrustConfig,
@@ -107,14 +107,14 @@ async def set_workspace_profile(profile: WorkspaceProfile) -> None:
             1 if profile.is_admin else 0,
         ),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def delete_workspace_profile(jid: str) -> None:
     """Delete a workspace profile by JID."""
     db = _get_db()
     await db.execute("DELETE FROM registered_groups WHERE jid = ?", (jid,))
-    await db.commit()
+    await _commit(db)
 
 
 async def get_all_workspace_profiles() -> dict[str, WorkspaceProfile]:
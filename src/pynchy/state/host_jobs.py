@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from pynchy.state.connection import _get_db, _update_by_id
+from pynchy.state.connection import _commit, _get_db, _update_by_id
 from pynchy.types import HostJob
 
 
@@ -53,7 +53,7 @@ async def create_host_job(job: dict[str, Any]) -> None:
             1 if job.get("enabled", True) else 0,
         ),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def get_due_host_jobs() -> list[HostJob]:
@@ -86,7 +86,7 @@ async def update_host_job_after_run(job_id: str, next_run: str | None, exit_code
         """,
         (next_run, now, next_run, job_id),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def get_host_job_by_id(job_id: str) -> HostJob | None:
@@ -129,4 +129,4 @@ async def delete_host_job(job_id: str) -> None:
     """Delete a host job."""
     db = _get_db()
     await db.execute("DELETE FROM host_jobs WHERE id = ?", (job_id,))
-    await db.commit()
+    await _commit(db)
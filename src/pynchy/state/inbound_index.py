@@ -0,0 +1,141 @@
+"""Per-chat index of inbound messages captured outside the live event stream.
+
+Channels whose platform has no "fetch history since" API (WhatsApp) record
+the history payloads the platform pushes on their own — typically right
+after a reconnect — so the reconciler can recover dropped messages from
+here instead of the network.  The oldest row per chat also serves as the
+anchor for on-demand history requests that page further back.
+
+Rows are keyed by (channel_name, chat_jid, message_id) and pruned per chat.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from pynchy.state.connection import _get_db, atomic_write
+from pynchy.types import NewMessage
+
+# Retention per (channel, chat): enough to cover a long disconnect without
+# letting a chatty group grow the table unbounded.
+MAX_INDEX_PER_CHAT = 1000
+INDEX_RETENTION = timedelta(days=14)
+
+
+@dataclass
+class IndexAnchor:
+    """A known message to page history requests from."""
+
+    message_id: str
+    timestamp: str
+    sender: str
+    is_from_me: bool
+
+
+async def index_inbound(channel_name: str, messages: list[NewMessage]) -> int:
+    """Record messages in the index (duplicates ignored).
+
+    Returns the number of new rows.
+    """
+    if not messages:
+        return 0
+    async with atomic_write() as db:
+        before = db.total_changes
+        await db.executemany(
+            "INSERT OR IGNORE INTO inbound_index"
+            " (channel_name, chat_jid, message_id, timestamp, sender, sender_name,"
+            " content, is_from_me)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    channel_name,
+                    m.chat_jid,
+                    m.id,
+                    m.timestamp,
+                    m.sender,
+                    m.sender_name,
+                    m.content,
+                    1 if m.is_from_me else 0,
+                )
+                for m in messages
+            ],
+        )
+        return db.total_changes - before
+
+
+async def get_indexed_since(
+    channel_name: str, chat_jid: str, since: str, *, limit: int = 500
+) -> list[NewMessage]:
+    """Indexed messages for a chat newer than *since*, oldest first."""
+    db = _get_db()
+    cursor = await db.execute(
+        "SELECT message_id, chat_jid, sender, sender_name, content, timestamp, is_from_me"
+        " FROM inbound_index"
+        " WHERE channel_name = ? AND chat_jid = ? AND timestamp > ?"
+        " ORDER BY timestamp LIMIT ?",
+        (channel_name, chat_jid, since, limit),
+    )
+    rows = await cursor.fetchall()
+    return [
+        NewMessage(
+            id=row["message_id"],
+            chat_jid=row["chat_jid"],
+            sender=row["sender"],
+            sender_name=row["sender_name"],
+            content=row["content"],
+            timestamp=row["timestamp"],
+            is_from_me=bool(row["is_from_me"]),
+        )
+        for row in rows
+    ]
+
+
+async def get_index_anchor(channel_name: str, chat_jid: str) -> IndexAnchor | None:
+    """Return the oldest indexed message for a chat, or None if none."""
+    db = _get_db()
+    cursor = await db.execute(
+        "SELECT message_id, timestamp, sender, is_from_me FROM inbound_index"
+        " WHERE channel_name = ? AND chat_jid = ?"
+        " ORDER BY timestamp LIMIT 1",
+        (channel_name, chat_jid),
+    )
+    row = await cursor.fetchone()
+    if row is None:
+        return None
+    return IndexAnchor(
+        message_id=row["message_id"],
+        timestamp=row["timestamp"],
+        sender=row["sender"],
+        is_from_me=bool(row["is_from_me"]),
+    )
+
+
+async def prune_inbound_index(
+    channel_name: str,
+    *,
+    max_per_chat: int = MAX_INDEX_PER_CHAT,
+    retention: timedelta = INDEX_RETENTION,
+) -> int:
+    """Drop rows past the retention window or beyond the per-chat cap.
+
+    Returns the number of rows deleted.
+    """
+    cutoff = (datetime.now(UTC) - retention).isoformat()
+    async with atomic_write() as db:
+        before = db.total_changes
+        await db.execute(
+            "DELETE FROM inbound_index WHERE channel_name = ? AND timestamp < ?",
+            (channel_name, cutoff),
+        )
+        await db.execute(
+            "DELETE FROM inbound_index WHERE rowid IN ("
+            "  SELECT rowid FROM ("
+            "    SELECT rowid, ROW_NUMBER() OVER ("
+            "      PARTITION BY chat_jid ORDER BY timestamp DESC"
+            "    ) AS rn FROM inbound_index WHERE channel_name = ?"
+            "  ) WHERE rn > ?"
+            ")",
+            (channel_name, max_per_chat),
+        )
+        return db.total_changes - before
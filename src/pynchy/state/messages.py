@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any
 
-from pynchy.state.connection import _get_db
+from pynchy.state.connection import _commit, _get_db
 from pynchy.types import NewMessage
 
 
@@ -87,7 +87,7 @@ async def store_message_direct(
             metadata_json,
         ),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def message_exists(msg_id: str, chat_jid: str) -> bool:
@@ -188,7 +188,7 @@ async def prune_messages_by_sender(sender: str, before_timestamp: str) -> int:
         "DELETE FROM messages WHERE sender = ? AND timestamp < ?",
         (sender, before_timestamp),
     )
-    await db.commit()
+    await _commit(db)
     return cursor.rowcount
 
 
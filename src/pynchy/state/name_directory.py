@@ -0,0 +1,108 @@
+"""Persistent ID → display-name directory for channel users and chats.
+
+Rows are keyed by (namespace, kind, entity_id).  *namespace* identifies the
+channel connection (e.g. ``slack:connection.slack.main``) and *kind* is
+``"user"`` or ``"channel"``.  Channels fill the directory in bulk from
+their platform's list APIs and read it back instead of looking names up
+one at a time.  When a full sync last completed is kept per namespace in
+``router_state``.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from pynchy.state.connection import _get_db, atomic_write
+from pynchy.state.sessions import get_router_state, set_router_state
+
+# Hard cap per (namespace, kind); the least recently refreshed rows go first.
+MAX_DIRECTORY_ENTRIES = 50_000
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds.
+_LOOKUP_BATCH = 500
+
+
+async def get_directory_names(namespace: str, kind: str, entity_ids: list[str]) -> dict[str, str]:
+    """Return ``{entity_id: name}`` for the IDs present in the directory."""
+    ids = list(dict.fromkeys(entity_ids))
+    if not ids:
+        return {}
+    db = _get_db()
+    found: dict[str, str] = {}
+    for i in range(0, len(ids), _LOOKUP_BATCH):
+        batch = ids[i : i + _LOOKUP_BATCH]
+        placeholders = ",".join("?" for _ in batch)
+        cursor = await db.execute(
+            "SELECT entity_id, name FROM name_directory"
+            f" WHERE namespace = ? AND kind = ? AND entity_id IN ({placeholders})",
+            (namespace, kind, *batch),
+        )
+        for row in await cursor.fetchall():
+            found[row["entity_id"]] = row["name"]
+    return found
+
+
+async def upsert_directory_names(namespace: str, kind: str, names: dict[str, str]) -> None:
+    """Insert or refresh many names in one transaction."""
+    if not names:
+        return
+    now = datetime.now(UTC).isoformat()
+    async with atomic_write() as db:
+        await db.executemany(
+            "INSERT INTO name_directory (namespace, kind, entity_id, name, updated_at)"
+            " VALUES (?, ?, ?, ?, ?)"
+            " ON CONFLICT(namespace, kind, entity_id)"
+            " DO UPDATE SET name = excluded.name, updated_at = excluded.updated_at",
+            [(namespace, kind, entity_id, name, now) for entity_id, name in names.items()],
+        )
+
+
+def _synced_at_key(namespace: str) -> str:
+    return f"name_directory_synced:{namespace}"
+
+
+async def get_directory_synced_at(namespace: str) -> str:
+    """When *namespace*'s last full sync completed, or empty string if never.
+
+    Tracked separately from row ``updated_at``: one-off lookups and partly
+    failed syncs also write rows, but only a completed sync is proof the
+    directory is fresh.
+    """
+    return await get_router_state(_synced_at_key(namespace)) or ""
+
+
+async def set_directory_synced_at(namespace: str, synced_at: str) -> None:
+    """Record that a full sync of *namespace* completed at *synced_at*."""
+    await set_router_state(_synced_at_key(namespace), synced_at)
+
+
+async def prune_directory(
+    namespace: str,
+    kind: str,
+    *,
+    older_than: str | None = None,
+    max_entries: int = MAX_DIRECTORY_ENTRIES,
+) -> int:
+    """Drop stale rows and enforce the size cap.
+
+    *older_than* removes rows not refreshed since that ISO timestamp — a
+    full sync passes its start time so entries that vanished upstream
+    (deleted users, archived channels) go away.  Returns rows deleted.
+    """
+    deleted = 0
+    async with atomic_write() as db:
+        if older_than:
+            cursor = await db.execute(
+                "DELETE FROM name_directory WHERE namespace = ? AND kind = ? AND updated_at < ?",
+                (namespace, kind, older_than),
+            )
+            deleted += cursor.rowcount
+        cursor = await db.execute(
+            "DELETE FROM name_directory WHERE rowid IN ("
+            "  SELECT rowid FROM name_directory WHERE namespace = ? AND kind = ?"
+            "  ORDER BY updated_at DESC LIMIT -1 OFFSET ?"
+            ")",
+            (namespace, kind, max_entries),
+        )
+        deleted += cursor.rowcount
+    return deleted
@@ -10,7 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 
-from pynchy.state.connection import _get_db, atomic_write
+from pynchy.state.connection import _commit, _get_db, atomic_write
 
 
 @dataclass
@@ -60,7 +60,7 @@ async def mark_delivered(ledger_id: int, channel_name: str) -> None:
         " WHERE ledger_id = ? AND channel_name = ?",
         (now, ledger_id, channel_name),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def mark_delivery_error(ledger_id: int, channel_name: str, error: str) -> None:
@@ -70,7 +70,7 @@ async def mark_delivery_error(ledger_id: int, channel_name: str, error: str) ->
         "UPDATE outbound_deliveries SET error = ? WHERE ledger_id = ? AND channel_name = ?",
         (error, ledger_id, channel_name),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def get_pending_outbound(channel_name: str, chat_jid: str) -> list[PendingDelivery]:
@@ -100,6 +100,57 @@ async def get_pending_outbound(channel_name: str, chat_jid: str) -> list[Pending
     ]
 
 
+async def mark_delivered_many(ledger_ids: list[int], channel_name: str) -> None:
+    """Mark several deliveries successful at once (e.g. a merged send)."""
+    if not ledger_ids:
+        return
+    now = datetime.now(UTC).isoformat()
+    async with atomic_write() as db:
+        await db.executemany(
+            "UPDATE outbound_deliveries SET delivered_at = ?, error = NULL"
+            " WHERE ledger_id = ? AND channel_name = ?",
+            [(now, ledger_id, channel_name) for ledger_id in ledger_ids],
+        )
+
+
+async def mark_delivery_error_many(ledger_ids: list[int], channel_name: str, error: str) -> None:
+    """Record the same failure for several deliveries (e.g. a merged send)."""
+    if not ledger_ids:
+        return
+    async with atomic_write() as db:
+        await db.executemany(
+            "UPDATE outbound_deliveries SET error = ? WHERE ledger_id = ? AND channel_name = ?",
+            [(error, ledger_id, channel_name) for ledger_id in ledger_ids],
+        )
+
+
+async def get_pending_for_channel(channel_name: str) -> list[PendingDelivery]:
+    """Get undelivered outbound messages for a channel across all groups.
+
+    Ordered by ledger ID so per-group ordering is preserved.
+    """
+    db = _get_db()
+    cursor = await db.execute(
+        "SELECT ol.id, ol.chat_jid, ol.content, ol.timestamp, ol.source"
+        " FROM outbound_deliveries od"
+        " JOIN outbound_ledger ol ON od.ledger_id = ol.id"
+        " WHERE od.channel_name = ? AND od.delivered_at IS NULL"
+        " ORDER BY ol.id",
+        (channel_name,),
+    )
+    rows = await cursor.fetchall()
+    return [
+        PendingDelivery(
+            ledger_id=row["id"],
+            chat_jid=row["chat_jid"],
+            content=row["content"],
+            timestamp=row["timestamp"],
+            source=row["source"],
+        )
+        for row in rows
+    ]
+
+
 async def gc_delivered(max_age_hours: int = 24) -> int:
     """Delete ledger entries older than max_age where all channels delivered.
 
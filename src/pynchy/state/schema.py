@@ -98,6 +98,29 @@ CREATE TABLE IF NOT EXISTS channel_cursors (
     PRIMARY KEY (channel_name, chat_jid, direction)
 );
 
+CREATE TABLE IF NOT EXISTS name_directory (
+    namespace   TEXT NOT NULL,
+    kind        TEXT NOT NULL,
+    entity_id   TEXT NOT NULL,
+    name        TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    PRIMARY KEY (namespace, kind, entity_id)
+);
+
+CREATE TABLE IF NOT EXISTS inbound_index (
+    channel_name  TEXT NOT NULL,
+    chat_jid      TEXT NOT NULL,
+    message_id    TEXT NOT NULL,
+    timestamp     TEXT NOT NULL,
+    sender        TEXT NOT NULL,
+    sender_name   TEXT NOT NULL,
+    content       TEXT NOT NULL,
+    is_from_me    INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (channel_name, chat_jid, message_id)
+);
+CREATE INDEX IF NOT EXISTS idx_inbound_index_chat_ts
+    ON inbound_index(channel_name, chat_jid, timestamp);
+
 CREATE TABLE IF NOT EXISTS outbound_ledger (
     id            INTEGER PRIMARY KEY AUTOINCREMENT,
     chat_jid      TEXT NOT NULL,
@@ -123,6 +146,10 @@ CREATE TABLE IF NOT EXISTS router_state (
     key TEXT PRIMARY KEY,
     value TEXT NOT NULL
 );
+CREATE TABLE IF NOT EXISTS agent_cursors (
+    chat_jid TEXT PRIMARY KEY,
+    ts TEXT NOT NULL
+);
 CREATE TABLE IF NOT EXISTS sessions (
     group_folder TEXT PRIMARY KEY,
     session_id TEXT NOT NULL
@@ -138,6 +165,44 @@ CREATE INDEX IF NOT EXISTS idx_events_type ON events(event_type);
 CREATE INDEX IF NOT EXISTS idx_events_chat ON events(chat_jid);
 CREATE INDEX IF NOT EXISTS idx_events_ts ON events(timestamp);
 
+CREATE TABLE IF NOT EXISTS usage_ledger (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    chat_jid TEXT NOT NULL,
+    model TEXT NOT NULL DEFAULT '',
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    num_turns INTEGER NOT NULL DEFAULT 0,
+    is_error INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_usage_ledger_ts ON usage_ledger(timestamp);
+CREATE INDEX IF NOT EXISTS idx_usage_ledger_workspace ON usage_ledger(workspace, timestamp);
+
+-- Maintained incrementally alongside usage_ledger inserts (see state/usage.py).
+-- period is 'hour' or 'day'; bucket is the UTC timestamp prefix (2026-01-31T14 / 2026-01-31).
+CREATE TABLE IF NOT EXISTS usage_rollups (
+    period TEXT NOT NULL,
+    bucket TEXT NOT NULL,
+    workspace TEXT NOT NULL,
+    model TEXT NOT NULL,
+    queries INTEGER NOT NULL DEFAULT 0,
+    errors INTEGER NOT NULL DEFAULT 0,
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_read_tokens INTEGER NOT NULL DEFAULT 0,
+    cache_write_tokens INTEGER NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (period, bucket, workspace, model)
+);
+CREATE INDEX IF NOT EXISTS idx_usage_rollups_workspace
+    ON usage_rollups(workspace, period, bucket);
+
 CREATE TABLE IF NOT EXISTS registered_groups (
     jid TEXT PRIMARY KEY,
     name TEXT NOT NULL,
@@ -264,18 +329,14 @@ async def _migrate_repo_access_column(database: aiosqlite.Connection) -> None:
     await database.commit()
 
 
-async def _seed_channel_cursors(database: aiosqlite.Connection) -> None:
-    """Seed channel_cursors from existing last_agent_timestamp (one-time migration).
+async def _migrate_agent_cursors(database: aiosqlite.Connection) -> None:
+    """Merge the JSON ``last_agent_timestamp`` blob into agent_cursors.
 
-    Reads the JSON-encoded per-group agent timestamps from router_state and
-    creates inbound cursor rows so the new reconciler starts from where the
-    old catch-up left off.  Only runs when channel_cursors is empty.
+    Runs on every start and keeps the later timestamp per chat.  Builds
+    from before agent_cursors still advance the blob, so after a rollback
+    and roll-forward the blob can be ahead of the table; taking the max
+    means messages the older build already handled aren't dispatched again.
     """
-    cursor = await database.execute("SELECT COUNT(*) FROM channel_cursors")
-    (count,) = await cursor.fetchone()
-    if count > 0:
-        return  # already seeded
-
     cursor = await database.execute(
         "SELECT value FROM router_state WHERE key = 'last_agent_timestamp'"
     )
@@ -284,8 +345,38 @@ async def _seed_channel_cursors(database: aiosqlite.Connection) -> None:
         return
 
     try:
-        agent_timestamps: dict[str, str] = json.loads(row[0])
+        agent_timestamps = json.loads(row[0])
     except (ValueError, TypeError):
+        logger.warning("Corrupted last_agent_timestamp in router_state, not migrating")
+        return
+    if not isinstance(agent_timestamps, dict):
+        return
+
+    cursor = await database.executemany(
+        "INSERT INTO agent_cursors (chat_jid, ts) VALUES (?, ?)"
+        " ON CONFLICT(chat_jid) DO UPDATE SET ts = excluded.ts WHERE excluded.ts > ts",
+        [(jid, ts) for jid, ts in agent_timestamps.items() if isinstance(ts, str) and ts],
+    )
+    await database.commit()
+    if cursor.rowcount > 0:
+        logger.info("Merged last_agent_timestamp into agent_cursors", count=cursor.rowcount)
+
+
+async def _seed_channel_cursors(database: aiosqlite.Connection) -> None:
+    """Seed channel_cursors from existing agent cursors (one-time migration).
+
+    Reads the per-group agent timestamps from agent_cursors and
+    creates inbound cursor rows so the new reconciler starts from where the
+    old catch-up left off.  Only runs when channel_cursors is empty.
+    """
+    cursor = await database.execute("SELECT COUNT(*) FROM channel_cursors")
+    (count,) = await cursor.fetchone()
+    if count > 0:
+        return  # already seeded
+
+    cursor = await database.execute("SELECT chat_jid, ts FROM agent_cursors")
+    agent_timestamps: dict[str, str] = {jid: ts for jid, ts in await cursor.fetchall()}
+    if not agent_timestamps:
         return
 
     now = datetime.now(UTC).isoformat()
@@ -314,7 +405,7 @@ async def _seed_channel_cursors(database: aiosqlite.Connection) -> None:
 
     await database.commit()
     if seen:
-        logger.info("Seeded channel_cursors from last_agent_timestamp", count=len(seen))
+        logger.info("Seeded channel_cursors from agent_cursors", count=len(seen))
 
 
 async def create_schema(database: aiosqlite.Connection) -> None:
@@ -324,4 +415,5 @@ async def create_schema(database: aiosqlite.Connection) -> None:
     await _migrate_renamed_columns(database)
     await _drop_is_god_column(database)
     await _migrate_repo_access_column(database)
+    await _migrate_agent_cursors(database)
     await _seed_channel_cursors(database)
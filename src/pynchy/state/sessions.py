@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from pynchy.state.connection import _get_db, atomic_write
+from pynchy.state.connection import _commit, _get_db, atomic_write
 
 # --- Router state ---
 
@@ -22,7 +22,7 @@ async def set_router_state(key: str, value: str) -> None:
         "INSERT OR REPLACE INTO router_state (key, value) VALUES (?, ?)",
         (key, value),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def save_router_state_batch(pairs: dict[str, str]) -> None:
@@ -58,14 +58,14 @@ async def set_session(group_folder: str, session_id: str) -> None:
         "INSERT OR REPLACE INTO sessions (group_folder, session_id) VALUES (?, ?)",
         (group_folder, session_id),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def clear_session(group_folder: str) -> None:
     """Delete the session for a group, forcing a fresh session on next run."""
     db = _get_db()
     await db.execute("DELETE FROM sessions WHERE group_folder = ?", (group_folder,))
-    await db.commit()
+    await _commit(db)
 
 
 async def get_all_sessions() -> dict[str, str]:
@@ -5,7 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 from typing import Any
 
-from pynchy.state.connection import _get_db, _update_by_id, atomic_write
+from pynchy.state.connection import _commit, _get_db, _update_by_id, atomic_write
 from pynchy.types import ScheduledTask, TaskRunLog
 
 
@@ -52,7 +52,7 @@ async def create_task(task: dict[str, Any]) -> None:
             task.get("repo_access") or None,
         ),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def get_task_by_id(task_id: str) -> ScheduledTask | None:
@@ -148,7 +148,7 @@ async def update_task_after_run(task_id: str, next_run: str | None, last_result:
         """,
         (next_run, now, last_result, next_run, task_id),
     )
-    await db.commit()
+    await _commit(db)
 
 
 async def log_task_run(log: TaskRunLog) -> None:
@@ -161,4 +161,4 @@ async def log_task_run(log: TaskRunLog) -> None:
         """,
         (log.task_id, log.run_at, log.duration_ms, log.status, log.result, log.error),
     )
-    await db.commit()
+    await _commit(db)
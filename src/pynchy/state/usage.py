@@ -0,0 +1,164 @@
+"""Token and cost accounting — per-query ledger plus hourly/daily rollups.
+
+Each agent query's ``result_metadata`` becomes one ``usage_ledger`` row.
+The same write upserts the matching ``usage_rollups`` rows (one per
+period), so summaries and budget checks read a handful of pre-aggregated
+rows instead of scanning the ledger.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Literal
+
+from pynchy.state.connection import _get_db, atomic_write
+
+Period = Literal["hour", "day"]
+
+# Bucket key = prefix of the record's ISO-8601 UTC timestamp
+_BUCKET_LEN: dict[Period, int] = {"hour": len("2026-01-31T14"), "day": len("2026-01-31")}
+
+# Summed columns shared by the ledger (per row) and the rollups (per bucket)
+_SUMS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_write_tokens",
+    "cost_usd",
+    "duration_ms",
+)
+
+_GROUP_COLUMNS = frozenset({"workspace", "model", "bucket"})
+
+
+@dataclass
+class UsageRecord:
+    """One agent query's token usage, cost and latency."""
+
+    timestamp: str
+    workspace: str
+    chat_jid: str
+    model: str = ""
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    cost_usd: float = 0.0
+    duration_ms: int = 0
+    num_turns: int = 0
+    is_error: bool = False
+
+    @classmethod
+    def from_result_metadata(
+        cls, meta: dict[str, Any], *, timestamp: str, workspace: str, chat_jid: str
+    ) -> UsageRecord | None:
+        """Build a record from an agent core's ``result_metadata`` (None if it has no usage).
+
+        ``usage`` follows the Anthropic shape (``input_tokens``,
+        ``cache_read_input_tokens``, ...); missing fields count as zero.
+        ``cost_usd`` is this query's cost.  ``total_cost_usd`` is only a
+        fallback: the Claude CLI reports it as a running total for the
+        whole (possibly warm, multi-query) session.
+        """
+        usage = meta.get("usage") or {}
+        cost = meta.get("cost_usd")
+        if cost is None:
+            cost = meta.get("total_cost_usd")
+        if not usage and cost is None:
+            return None
+        return cls(
+            timestamp=timestamp,
+            workspace=workspace,
+            chat_jid=chat_jid,
+            model=meta.get("model") or "",
+            input_tokens=usage.get("input_tokens") or 0,
+            output_tokens=usage.get("output_tokens") or 0,
+            cache_read_tokens=usage.get("cache_read_input_tokens") or 0,
+            cache_write_tokens=usage.get("cache_creation_input_tokens") or 0,
+            cost_usd=cost or 0.0,
+            duration_ms=meta.get("duration_ms") or 0,
+            num_turns=meta.get("num_turns") or 0,
+            is_error=bool(meta.get("is_error")),
+        )
+
+
+def _rollup_rows(records: list[UsageRecord]) -> list[tuple[Any, ...]]:
+    """Pre-aggregate *records* per (period, bucket, workspace, model)."""
+    totals: dict[tuple[str, str, str, str], list[float]] = {}
+    for r in records:
+        for period, length in _BUCKET_LEN.items():
+            key = (period, r.timestamp[:length], r.workspace, r.model)
+            row = totals.setdefault(key, [0] * (len(_SUMS) + 2))
+            row[0] += 1
+            row[1] += 1 if r.is_error else 0
+            for i, column in enumerate(_SUMS, start=2):
+                row[i] += getattr(r, column)
+    return [(*key, *values) for key, values in totals.items()]
+
+
+async def record_usage(records: list[UsageRecord]) -> None:
+    """Append *records* to the ledger and fold them into the rollups, atomically."""
+    if not records:
+        return
+    ledger_columns = list(asdict(records[0]))
+    rollup_columns = ("queries", "errors", *_SUMS)
+    async with atomic_write() as db:
+        await db.executemany(
+            f"INSERT INTO usage_ledger ({', '.join(ledger_columns)})"
+            f" VALUES ({', '.join('?' * len(ledger_columns))})",
+            [tuple(asdict(r).values()) for r in records],
+        )
+        await db.executemany(
+            "INSERT INTO usage_rollups (period, bucket, workspace, model,"
+            f" {', '.join(rollup_columns)})"
+            f" VALUES (?, ?, ?, ?, {', '.join('?' * len(rollup_columns))})"
+            " ON CONFLICT (period, bucket, workspace, model) DO UPDATE SET "
+            + ", ".join(f"{c} = {c} + excluded.{c}" for c in rollup_columns),
+            _rollup_rows(records),
+        )
+
+
+async def get_usage_summary(
+    period: Period,
+    since: str,
+    *,
+    group_by: tuple[str, ...] = ("workspace",),
+    workspace: str | None = None,
+) -> list[dict[str, Any]]:
+    """Totals from the *period* rollups since the UTC timestamp *since*.
+
+    *group_by* picks any of ``workspace``, ``model`` and ``bucket``; rows
+    are ordered by cost, highest first.
+    """
+    unknown = set(group_by) - _GROUP_COLUMNS
+    if unknown:
+        raise ValueError(f"Cannot group usage by {sorted(unknown)}")
+    columns = ", ".join(group_by)
+    where = "period = ? AND bucket >= ?"
+    params: list[Any] = [period, since[: _BUCKET_LEN[period]]]
+    if workspace is not None:
+        where += " AND workspace = ?"
+        params.append(workspace)
+    sums = ", ".join(f"SUM({c}) AS {c}" for c in ("queries", "errors", *_SUMS))
+    db = _get_db()
+    cursor = await db.execute(
+        f"SELECT {columns + ', ' if columns else ''}{sums} FROM usage_rollups"
+        f" WHERE {where}"
+        f"{' GROUP BY ' + columns if columns else ''}"
+        " HAVING COUNT(*) > 0 ORDER BY cost_usd DESC",
+        params,
+    )
+    rows = await cursor.fetchall()
+    return [dict(row) for row in rows]
+
+
+async def get_workspace_spend(workspace: str, day: str) -> float:
+    """USD spent by *workspace* on the UTC *day* (``YYYY-MM-DD``), from the daily rollup."""
+    db = _get_db()
+    cursor = await db.execute(
+        "SELECT COALESCE(SUM(cost_usd), 0) FROM usage_rollups"
+        " WHERE period = 'day' AND bucket = ? AND workspace = ?",
+        (day[: _BUCKET_LEN["day"]], workspace),
+    )
+    row = await cursor.fetchone()
+    return float(row[0])
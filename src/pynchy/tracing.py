@@ -0,0 +1,323 @@
+"""Lightweight request tracing — spans carried in contextvars.
+
+A trace follows one user message from channel ingest to the first token
+streamed back.  The path crosses the DB poll loop, ``GroupQueue`` and
+the container, so contextvars alone can't carry it: the root span of
+each in-flight message is also kept per chat JID (:func:`open_trace`)
+and re-entered at each hop with :func:`resume`.  Inside a hop, nested
+:func:`span` blocks pick up their parent from the context, and the
+trace ID is bound into structlog so log lines carry it too.
+
+Spans outside a trace are no-ops, so scheduled tasks and other
+untraced paths pay only a contextvar read.
+
+Finished spans feed per-name latency samples (:func:`get_trace_stats`,
+the "latency" section of ``/status``) and, when an export file is
+configured, are appended to it as OTLP/JSON span records, one per line.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import secrets
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from pynchy.logger import logger
+
+# Samples kept per span name for the percentile summary.
+_MAX_SAMPLES = 1000
+
+# An open trace older than this is abandoned (the message never produced
+# agent output, e.g. it was filtered or the run failed).
+_OPEN_TRACE_TTL_NS = 30 * 60 * 1_000_000_000
+# Abandoned traces are swept once this many are open.
+_MAX_OPEN_TRACES = 256
+
+# Buffered export records are flushed when a trace closes or the buffer fills.
+_EXPORT_BATCH = 64
+
+
+@dataclass(eq=False)
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_ns: int
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    # Named timestamps for stages measured across hops (root spans only)
+    marks: dict[str, int] = field(default_factory=dict)
+
+    def end(self, **attributes: Any) -> None:
+        """Finish the span (idempotent) and record it."""
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        self.attributes.update(attributes)
+        _finish(self)
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+
+_current: ContextVar[Span | None] = ContextVar("pynchy_span", default=None)
+_open: dict[str, Span] = {}
+_samples: dict[str, deque[float]] = {}
+_counts: dict[str, int] = {}
+_export_path: Path | None = None
+_export_buffer: list[str] = []
+
+
+def _new_id(nbytes: int) -> str:
+    return secrets.token_hex(nbytes)
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def current_trace_id() -> str | None:
+    span = _current.get()
+    return span.trace_id if span is not None else None
+
+
+def start_span(
+    name: str,
+    *,
+    parent: Span | None = None,
+    start_ns: int | None = None,
+    **attributes: Any,
+) -> Span | None:
+    """Start a child of *parent* (default: the current span); None if untraced."""
+    parent = parent or _current.get()
+    if parent is None:
+        return None
+    return Span(
+        name=name,
+        trace_id=parent.trace_id,
+        span_id=_new_id(8),
+        parent_id=parent.span_id,
+        start_ns=time.time_ns() if start_ns is None else start_ns,
+        attributes=attributes,
+    )
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | None]:
+    """Run the block as a child span of the current one."""
+    child = start_span(name, **attributes)
+    if child is None:
+        yield None
+        return
+    token = _current.set(child)
+    try:
+        yield child
+    finally:
+        _current.reset(token)
+        child.end()
+
+
+def record_span(name: str, start_ns: int | None, **attributes: Any) -> None:
+    """Record a finished child span from *start_ns* until now (e.g. a wait)."""
+    if start_ns is None:
+        return
+    child = start_span(name, start_ns=start_ns, **attributes)
+    if child is not None:
+        child.end()
+
+
+# ---------------------------------------------------------------------------
+# Traces keyed by chat JID — carried across the poll loop, queue and container
+# ---------------------------------------------------------------------------
+
+
+def open_trace(
+    key: str, name: str = "message", *, sealed_by: str | None = None, **attributes: Any
+) -> Span:
+    """Return the open trace for *key*, starting one if there is none.
+
+    Messages that arrive while a trace is open join it, so the trace
+    measures the wait of the earliest unanswered message — unless the
+    open trace already carries the mark *sealed_by* (its input has left
+    for the container), in which case a new trace replaces it.
+    """
+    now = time.time_ns()
+    root = _open.get(key)
+    if (
+        root is not None
+        and now - root.start_ns < _OPEN_TRACE_TTL_NS
+        and (sealed_by is None or sealed_by not in root.marks)
+    ):
+        return root
+    if len(_open) >= _MAX_OPEN_TRACES:
+        for stale in [k for k, r in _open.items() if now - r.start_ns >= _OPEN_TRACE_TTL_NS]:
+            del _open[stale]
+    root = Span(
+        name=name,
+        trace_id=_new_id(16),
+        span_id=_new_id(8),
+        parent_id=None,
+        start_ns=now,
+        attributes={"key": key, **attributes},
+    )
+    _open[key] = root
+    return root
+
+
+def get_open_trace(key: str) -> Span | None:
+    return _open.get(key)
+
+
+@contextlib.contextmanager
+def resume(key: str, trace_id: str | None = None) -> Iterator[Span | None]:
+    """Make the open trace for *key* current for the block (or clear it).
+
+    With *trace_id*, the trace is only resumed if it matches.  Clearing
+    matters: tasks inherit their creator's context, and a queue run
+    scheduled from an earlier trace must not be attributed to it.
+    """
+    root = _open.get(key)
+    if root is not None and trace_id is not None and root.trace_id != trace_id:
+        root = None
+    token = _current.set(root)
+    try:
+        if root is None:
+            yield None
+        else:
+            with structlog.contextvars.bound_contextvars(trace_id=root.trace_id):
+                yield root
+    finally:
+        _current.reset(token)
+
+
+def mark(key: str, name: str) -> None:
+    """Timestamp stage *name* on the open trace for *key* (first call wins)."""
+    root = _open.get(key)
+    if root is not None:
+        root.marks.setdefault(name, time.time_ns())
+
+
+def record_since_mark(key: str, mark_name: str, span_name: str) -> None:
+    """Record *span_name* from mark *mark_name* on *key*'s open trace until now."""
+    root = _open.get(key)
+    if root is not None and mark_name in root.marks:
+        record_span(span_name, root.marks[mark_name], parent=root)
+
+
+def close_trace(key: str, trace_id: str | None = None, **attributes: Any) -> Span | None:
+    """End the open trace for *key*; with *trace_id*, only if it matches."""
+    root = _open.get(key)
+    if root is None or (trace_id is not None and root.trace_id != trace_id):
+        return None
+    del _open[key]
+    root.end(**attributes)
+    _flush_export()
+    return root
+
+
+def discard_trace(key: str, trace_id: str | None = None) -> None:
+    """Drop the open trace for *key* unrecorded; with *trace_id*, only if it matches."""
+    root = _open.get(key)
+    if root is not None and (trace_id is None or root.trace_id == trace_id):
+        del _open[key]
+
+
+# ---------------------------------------------------------------------------
+# Recording: percentile samples and OTLP/JSON export
+# ---------------------------------------------------------------------------
+
+
+def _finish(span: Span) -> None:
+    samples = _samples.get(span.name)
+    if samples is None:
+        samples = _samples[span.name] = deque(maxlen=_MAX_SAMPLES)
+    samples.append(span.duration_ms)
+    _counts[span.name] = _counts.get(span.name, 0) + 1
+    if _export_path is not None:
+        _export_buffer.append(json.dumps(_to_otlp(span)))
+        if len(_export_buffer) >= _EXPORT_BATCH:
+            _flush_export()
+
+
+def _to_otlp(span: Span) -> dict[str, Any]:
+    """OTLP/JSON ``Span`` shape, so the file can be replayed into a collector."""
+    record: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in span.attributes.items()],
+    }
+    if span.parent_id:
+        record["parentSpanId"] = span.parent_id
+    return record
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _flush_export() -> None:
+    if _export_path is None or not _export_buffer:
+        return
+    lines, _export_buffer[:] = list(_export_buffer), []
+    try:
+        with _export_path.open("a") as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError as exc:
+        logger.warning("Failed to export trace spans", path=str(_export_path), err=str(exc))
+
+
+def configure_export(path: Path | None) -> None:
+    """Append finished spans to *path* as OTLP/JSON lines (None disables)."""
+    global _export_path
+    _flush_export()
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+    _export_path = path
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def get_trace_stats() -> dict[str, dict[str, float | int]]:
+    """Latency percentiles per span name over the most recent samples."""
+    stats: dict[str, dict[str, float | int]] = {}
+    for name, samples in sorted(_samples.items()):
+        ordered = sorted(samples)
+        stats[name] = {
+            "count": _counts[name],
+            "p50_ms": round(_percentile(ordered, 50), 1),
+            "p90_ms": round(_percentile(ordered, 90), 1),
+            "p99_ms": round(_percentile(ordered, 99), 1),
+        }
+    return stats
+
+
+def reset_tracing() -> None:
+    """Clear open traces and samples (for tests)."""
+    _open.clear()
+    _samples.clear()
+    _counts.clear()
+    _export_buffer.clear()
@@ -261,6 +261,8 @@ class ContainerInput:
     # Direct MCP server connections (bypass LiteLLM gateway).
     # Each entry: {"name": str, "url": str, "transport": "sse"|"http"}
     mcp_direct_servers: list[dict] | None = None
+    output_max_delay_ms: int | None = None  # Agent-runner text-delta merge window
+    trace_id: str | None = None  # Latency trace of the message being answered
 
 
 @dataclass
@@ -281,6 +283,10 @@ class ContainerOutput:
     tool_result_content: str | None = None
     tool_result_is_error: bool | None = None
     result_metadata: dict | None = None
+    # Agent-runner cold-start milestones in ms (first output of a container only)
+    startup: dict | None = None
+    # Host trace ID of the input this output answers (echoed by the agent)
+    trace_id: str | None = None
 
 
 class OutboundEventType(Enum):
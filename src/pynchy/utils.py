@@ -2,14 +2,17 @@
 
 Small helpers used across multiple modules. Avoids duplication of common
 patterns like timestamped ID generation, schedule calculations, async shell
-execution, atomic file writing, and idle timer management.
+execution, atomic file writing, idle timer management, and in-memory indexes
+over pending IPC state files.
 """
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
+import copy
 import json
+import threading
 from asyncio.subprocess import PIPE
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
@@ -219,3 +222,138 @@ class IdleTimer:
         if self._handle is not None:
             self._handle.cancel()
             self._handle = None
+
+
+class PendingFileIndex:
+    """Write-through in-memory index over ``ipc/<group>/<subdir>/*.json`` files.
+
+    The JSON files stay the durable store (they survive restarts and are
+    what the containers and sweeps see); this index mirrors them so hot
+    lookups don't ``iterdir`` + ``json.loads`` every group on every call.
+    Entries are keyed by ``request_id`` with secondary lookups on the
+    fields named in ``keys`` (e.g. ``short_id``, ``chat_jid``).
+
+    The index is (re)built from disk the first time it is used for a given
+    IPC directory and whenever :meth:`rebuild` is called (startup sweep).
+    Writers must call :meth:`put` / :meth:`discard` after touching a file.
+
+    Guarded by a lock because some lookups (WhatsApp inbound) run on
+    channel library threads rather than the event loop.
+    """
+
+    def __init__(self, subdir: str, keys: tuple[str, ...] = ()) -> None:
+        self._subdir = subdir
+        self._keys = keys
+        self._lock = threading.Lock()
+        self._root: Path | None = None
+        self._entries: dict[str, dict[str, Any]] = {}
+        # field -> value -> request_ids (dict used as an insertion-ordered set)
+        self._by_key: dict[str, dict[str, dict[str, None]]] = {k: {} for k in keys}
+
+    # -- maintenance -------------------------------------------------------
+
+    def rebuild(self, ipc_dir: Path) -> int:
+        """Reload the index from disk. Returns the number of entries indexed."""
+        entries: dict[str, dict[str, Any]] = {}
+        if ipc_dir.exists():
+            for group_dir in ipc_dir.iterdir():
+                if not group_dir.is_dir() or group_dir.name == "errors":
+                    continue
+                pending_dir = group_dir / self._subdir
+                if not pending_dir.exists():
+                    continue
+                for filepath in pending_dir.glob("*.json"):
+                    try:
+                        data = json.loads(filepath.read_text())
+                    except (json.JSONDecodeError, OSError) as exc:
+                        logger.warning(
+                            "Failed to index pending file",
+                            path=str(filepath),
+                            err=str(exc),
+                        )
+                        continue
+                    if isinstance(data, dict):
+                        data.setdefault("request_id", filepath.stem)
+                        data.setdefault("source_group", group_dir.name)
+                        entries[data["request_id"]] = data
+
+        with self._lock:
+            self._root = ipc_dir
+            self._entries = {}
+            self._by_key = {k: {} for k in self._keys}
+            for data in entries.values():
+                self._add_locked(data)
+        return len(entries)
+
+    def _ensure(self, ipc_dir: Path) -> None:
+        if self._root != ipc_dir:
+            self.rebuild(ipc_dir)
+
+    def _add_locked(self, data: dict[str, Any]) -> None:
+        request_id = data["request_id"]
+        self._entries[request_id] = data
+        for key in self._keys:
+            value = data.get(key)
+            if value is not None:
+                self._by_key[key].setdefault(value, {})[request_id] = None
+
+    def _remove_locked(self, request_id: str) -> dict[str, Any] | None:
+        data = self._entries.pop(request_id, None)
+        if data is None:
+            return None
+        for key in self._keys:
+            value = data.get(key)
+            ids = self._by_key[key].get(value) if value is not None else None
+            if ids is not None:
+                ids.pop(request_id, None)
+                if not ids:
+                    del self._by_key[key][value]
+        return data
+
+    # -- write-through -----------------------------------------------------
+
+    def put(self, ipc_dir: Path, data: dict[str, Any]) -> None:
+        """Record (or replace) an entry after its file was written."""
+        self._ensure(ipc_dir)
+        with self._lock:
+            self._remove_locked(data["request_id"])
+            self._add_locked(copy.deepcopy(data))
+
+    def discard(self, ipc_dir: Path, request_id: str) -> None:
+        """Drop an entry after its file was deleted."""
+        with self._lock:
+            if self._root != ipc_dir:
+                return  # not indexed yet — the next lookup rebuilds from disk
+            self._remove_locked(request_id)
+
+    # -- lookups (return copies so callers can't corrupt the index) --------
+
+    def get(self, ipc_dir: Path, request_id: str) -> dict[str, Any] | None:
+        self._ensure(ipc_dir)
+        with self._lock:
+            data = self._entries.get(request_id)
+            return copy.deepcopy(data) if data is not None else None
+
+    def find(self, ipc_dir: Path, key: str, value: str) -> dict[str, Any] | None:
+        """Return the first (oldest-indexed) entry whose ``key`` equals ``value``."""
+        self._ensure(ipc_dir)
+        with self._lock:
+            ids = self._by_key[key].get(value)
+            if not ids:
+                return None
+            return copy.deepcopy(self._entries[next(iter(ids))])
+
+    def values_for(self, ipc_dir: Path, key: str) -> set[str]:
+        """Return every indexed value for ``key`` across all groups."""
+        self._ensure(ipc_dir)
+        with self._lock:
+            return set(self._by_key[key])
+
+    def list(self, ipc_dir: Path, group: str | None = None) -> list[dict[str, Any]]:
+        self._ensure(ipc_dir)
+        with self._lock:
+            return [
+                copy.deepcopy(d)
+                for d in self._entries.values()
+                if group is None or d.get("source_group") == group
+            ]
@@ -164,6 +164,16 @@ def reset_settings(monkeypatch):
     monkeypatch.setattr("pynchy.config.settings._settings", safe)
 
 
+@pytest.fixture(autouse=True)
+def _clear_credential_cache():
+    """Drop cached host gh/git credentials so per-test patches take effect."""
+    from pynchy.host.container_manager.credentials import _clear_credential_cache
+
+    _clear_credential_cache()
+    yield
+    _clear_credential_cache()
+
+
 @pytest.fixture(autouse=True, scope="session")
 def _close_test_database():
     """Close the aiosqlite connection after all tests complete.
@@ -0,0 +1,86 @@
+"""Tests for the per-group agent cursor table and its router_state migration."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from pynchy.state import (
+    _get_db,
+    _init_test_database,
+    get_agent_cursors,
+    get_router_state,
+    save_agent_cursors,
+    set_router_state,
+)
+from pynchy.state.schema import _migrate_agent_cursors
+
+
+@pytest.fixture()
+async def _db():
+    await _init_test_database()
+
+
+@pytest.mark.usefixtures("_db")
+class TestSaveAgentCursors:
+    @pytest.mark.asyncio
+    async def test_empty_table(self):
+        assert await get_agent_cursors() == {}
+
+    @pytest.mark.asyncio
+    async def test_upserts_changed_and_keeps_others(self):
+        await save_agent_cursors({"a@g.us": "t1", "b@g.us": "t1"})
+        await save_agent_cursors({"a@g.us": "t2"})
+
+        assert await get_agent_cursors() == {"a@g.us": "t2", "b@g.us": "t1"}
+
+    @pytest.mark.asyncio
+    async def test_deletes_removed(self):
+        await save_agent_cursors({"a@g.us": "t1", "b@g.us": "t1"})
+        await save_agent_cursors({}, ["b@g.us"])
+
+        assert await get_agent_cursors() == {"a@g.us": "t1"}
+
+    @pytest.mark.asyncio
+    async def test_writes_router_state_in_same_call(self):
+        await save_agent_cursors({"a@g.us": "t1"}, router_state={"last_timestamp": "t9"})
+
+        assert await get_router_state("last_timestamp") == "t9"
+
+
+@pytest.mark.usefixtures("_db")
+class TestMigrateAgentCursors:
+    @pytest.mark.asyncio
+    async def test_moves_json_blob_into_rows(self):
+        cursors = {"a@g.us": "t1", "slack:C1": "t2"}
+        await set_router_state("last_agent_timestamp", json.dumps(cursors))
+
+        await _migrate_agent_cursors(_get_db())
+
+        assert await get_agent_cursors() == cursors
+
+    @pytest.mark.asyncio
+    async def test_keeps_the_later_timestamp_per_chat(self):
+        # A rolled-back build kept advancing the blob for one chat
+        await save_agent_cursors(
+            {"a@g.us": "2026-01-02T00:00:00+00:00", "b@g.us": "2026-01-02T00:00:00+00:00"}
+        )
+        blob = {"a@g.us": "2026-01-01T00:00:00+00:00", "b@g.us": "2026-01-03T00:00:00+00:00"}
+        await set_router_state("last_agent_timestamp", json.dumps(blob))
+
+        await _migrate_agent_cursors(_get_db())
+        await _migrate_agent_cursors(_get_db())
+
+        assert await get_agent_cursors() == {
+            "a@g.us": "2026-01-02T00:00:00+00:00",
+            "b@g.us": "2026-01-03T00:00:00+00:00",
+        }
+
+    @pytest.mark.asyncio
+    async def test_corrupted_json_is_ignored(self):
+        await set_router_state("last_agent_timestamp", "not valid json")
+
+        await _migrate_agent_cursors(_get_db())
+
+        assert await get_agent_cursors() == {}
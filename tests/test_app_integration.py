@@ -588,15 +588,61 @@ class TestStatePersistence:
         assert app2.last_timestamp == "2024-06-01T12:00:00Z"
         assert app2.last_agent_timestamp == {"group@g.us": "2024-06-01T11:00:00Z"}
 
-    async def test_load_state_handles_corrupted_json(self, app: PynchyApp):
-        from pynchy.state import set_router_state
+    async def test_save_writes_only_changed_cursors(self, app: PynchyApp):
+        from pynchy.state import get_agent_cursors, save_agent_cursors
 
-        await set_router_state("last_agent_timestamp", "not valid json")
+        app.last_agent_timestamp = {"a@g.us": "t1", "b@g.us": "t1"}
+        await app._save_state()
 
-        app2 = PynchyApp()
-        await app2._load_state()
-        # Should reset to empty dict, not crash
-        assert app2.last_agent_timestamp == {}
+        app.last_agent_timestamp["a@g.us"] = "t2"
+        with patch(
+            "pynchy.host.orchestrator.app.save_agent_cursors",
+            wraps=save_agent_cursors,
+        ) as save:
+            await app._save_state()
+            await app._save_state()  # nothing changed since — no write
+
+        save.assert_called_once_with({"a@g.us": "t2"}, [], router_state=None)
+        assert await get_agent_cursors() == {"a@g.us": "t2", "b@g.us": "t1"}
+
+    async def test_concurrent_saves_coalesce(self, app: PynchyApp):
+        calls = []
+        release = asyncio.Event()
+
+        async def fake_save(changed, removed, *, router_state=None):
+            calls.append(changed)
+            await release.wait()
+
+        with patch("pynchy.host.orchestrator.app.save_agent_cursors", fake_save):
+            app.last_agent_timestamp["g0@g.us"] = "t1"
+            first = asyncio.create_task(app._save_state())
+            await asyncio.sleep(0)  # first write is now in flight
+
+            queued = []
+            for i in range(1, 5):
+                app.last_agent_timestamp[f"g{i}@g.us"] = "t1"
+                queued.append(asyncio.create_task(app._save_state()))
+            release.set()
+            await asyncio.gather(first, *queued)
+
+        # The four saves queued behind the in-flight one share one write
+        assert calls == [{"g0@g.us": "t1"}, {f"g{i}@g.us": "t1" for i in range(1, 5)}]
+
+    async def test_failed_save_is_retried_on_next_save(self, app: PynchyApp):
+        from pynchy.state import get_agent_cursors
+
+        app.last_agent_timestamp = {"a@g.us": "t1"}
+        with (
+            patch(
+                "pynchy.host.orchestrator.app.save_agent_cursors",
+                side_effect=RuntimeError("disk full"),
+            ),
+            pytest.raises(RuntimeError),
+        ):
+            await app._save_state()
+
+        await app._save_state()
+        assert await get_agent_cursors() == {"a@g.us": "t1"}
 
 
 class TestTracePersistence:
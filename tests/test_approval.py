@@ -260,6 +260,33 @@ class TestSweepExpiredApprovals:
         assert "error" in response
         assert "expired" in response["error"].lower()
 
+    @pytest.mark.asyncio
+    async def test_sweep_evicts_expired_from_index(self, _setup_db, ipc_dir: Path, settings):
+        from pynchy.host.container_manager.security.approval import (
+            create_pending_approval,
+            find_pending_by_short_id,
+            list_pending_approvals,
+            sweep_expired_approvals,
+        )
+
+        with (
+            patch(
+                "pynchy.host.container_manager.security.approval.get_settings",
+                return_value=settings,
+            ),
+            patch("pynchy.host.container_manager.ipc.write.get_settings", return_value=settings),
+        ):
+            short_id = create_pending_approval("req-old", "tool_a", "grp", "j@g.us", {})
+            pending_file = ipc_dir / "grp" / "pending_approvals" / "req-old.json"
+            data = json.loads(pending_file.read_text())
+            data["timestamp"] = (datetime.now(UTC) - timedelta(minutes=10)).isoformat()
+            pending_file.write_text(json.dumps(data))
+
+            await sweep_expired_approvals()
+
+            assert find_pending_by_short_id(short_id) is None
+            assert list_pending_approvals() == []
+
     @pytest.mark.asyncio
     async def test_keeps_fresh_pending(self, ipc_dir: Path, settings):
         from pynchy.host.container_manager.security.approval import (
@@ -351,3 +378,26 @@ class TestFormatApprovalNotification:
             short_id="abc12345",
         )
         assert "no details" in msg.lower()
+
+
+# -- remove_pending_approval --------------------------------------------------
+
+
+class TestRemovePendingApproval:
+    def test_removes_file_and_index_entry(self, ipc_dir: Path, settings):
+        from pynchy.host.container_manager.security.approval import (
+            create_pending_approval,
+            find_pending_by_short_id,
+            remove_pending_approval,
+        )
+
+        with patch(
+            "pynchy.host.container_manager.security.approval.get_settings", return_value=settings
+        ):
+            short_id = create_pending_approval("req-rm", "tool", "grp", "j@g.us", {})
+            pending_file = ipc_dir / "grp" / "pending_approvals" / "req-rm.json"
+
+            remove_pending_approval(pending_file)
+
+            assert not pending_file.exists()
+            assert find_pending_by_short_id(short_id) is None
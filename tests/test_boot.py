@@ -0,0 +1,108 @@
+"""Tests for the concurrent, dependency-ordered boot phase runner."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pynchy.host.orchestrator import boot
+from pynchy.host.orchestrator.boot import Phase, get_boot_stats, run_phases
+
+
+@pytest.fixture(autouse=True)
+def _fresh_clock():
+    boot.start_boot_clock()
+    yield
+    boot._boot_started = None
+    boot._timings.clear()
+
+
+def _recorder(log: list[str], name: str, delay: float = 0.0):
+    async def run() -> None:
+        log.append(f"start:{name}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{name}")
+
+    return run
+
+
+class TestRunPhases:
+    async def test_independent_phases_overlap(self):
+        log: list[str] = []
+        await run_phases(
+            [
+                Phase("gateway", _recorder(log, "gateway", 0.05)),
+                Phase("database", _recorder(log, "database", 0.01)),
+            ]
+        )
+
+        # database starts before the slow gateway finishes, and finishes first
+        assert log.index("start:database") < log.index("end:gateway")
+        assert log.index("end:database") < log.index("end:gateway")
+
+    async def test_dependencies_run_first(self):
+        log: list[str] = []
+        await run_phases(
+            [
+                Phase("database", _recorder(log, "database", 0.02)),
+                Phase("plugins", _recorder(log, "plugins")),
+                Phase("state", _recorder(log, "state"), after=("database", "plugins")),
+            ]
+        )
+
+        assert log.index("start:state") > log.index("end:database")
+        assert log.index("start:state") > log.index("end:plugins")
+
+    async def test_failure_cancels_running_phases(self):
+        log: list[str] = []
+
+        async def broken() -> None:
+            raise RuntimeError("db locked")
+
+        with pytest.raises(RuntimeError, match="db locked"):
+            await run_phases(
+                [
+                    Phase("gateway", _recorder(log, "gateway", 10)),
+                    Phase("database", broken),
+                    Phase("state", _recorder(log, "state"), after=("database",)),
+                ]
+            )
+
+        assert log == ["start:gateway"]
+
+    async def test_undeclared_dependency_rejected(self):
+        with pytest.raises(ValueError, match="undeclared"):
+            await run_phases([Phase("state", _recorder([], "state"), after=("database",))])
+
+    async def test_duplicate_phase_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            await run_phases([Phase("a", _recorder([], "a")), Phase("a", _recorder([], "a"))])
+
+
+class TestBootStats:
+    async def test_records_each_phase(self):
+        await run_phases(
+            [
+                Phase("database", _recorder([], "database", 0.01)),
+                Phase("state", _recorder([], "state"), after=("database",)),
+            ]
+        )
+        await boot.timed("subsystems", asyncio.sleep(0))
+
+        stats = get_boot_stats()
+        names = [p["name"] for p in stats["phases"]]
+        assert names == ["database", "state", "subsystems"]
+        state = stats["phases"][1]
+        assert state["start_s"] >= stats["phases"][0]["duration_s"]
+        assert stats["total_seconds"] >= state["start_s"] + state["duration_s"] - 0.001
+
+    def test_empty_before_boot(self):
+        boot._boot_started = None
+        assert get_boot_stats() == {"total_seconds": None, "phases": []}
+
+    async def test_timed_returns_result(self):
+        async def value() -> int:
+            return 42
+
+        assert await boot.timed("x", value()) == 42
@@ -456,7 +456,7 @@ class TestFetchMissedMessages:
     async def test_returns_messages_in_chronological_order(self) -> None:
         ch = _make_channel()
         ch._app = MagicMock()
-        ch._resolve_user_name = AsyncMock(return_value="Alice")
+        ch._resolve_user_names = AsyncMock(return_value={"U1": "Alice"})
 
         # Slack returns newest-first
         ch._app.client.conversations_history = AsyncMock(
@@ -482,7 +482,7 @@ class TestFetchMissedMessages:
     async def test_filters_bot_messages(self) -> None:
         ch = _make_channel()
         ch._app = MagicMock()
-        ch._resolve_user_name = AsyncMock(return_value="Alice")
+        ch._resolve_user_names = AsyncMock(return_value={"U1": "Alice"})
 
         ch._app.client.conversations_history = AsyncMock(
             return_value={
@@ -502,7 +502,7 @@ class TestFetchMissedMessages:
     async def test_filters_subtypes(self) -> None:
         ch = _make_channel()
         ch._app = MagicMock()
-        ch._resolve_user_name = AsyncMock(return_value="Alice")
+        ch._resolve_user_names = AsyncMock(return_value={"U1": "Alice"})
 
         ch._app.client.conversations_history = AsyncMock(
             return_value={
@@ -534,7 +534,7 @@ class TestFetchMissedMessages:
         ch = _make_channel()
         ch._app = MagicMock()
         ch._bot_user_id = "U_BOT"
-        ch._resolve_user_name = AsyncMock(return_value="Alice")
+        ch._resolve_user_names = AsyncMock(return_value={"U1": "Alice"})
 
         ch._app.client.conversations_history = AsyncMock(
             return_value={
@@ -575,7 +575,7 @@ class TestFetchMissedMessages:
 
         ch = _make_channel()
         ch._app = MagicMock()
-        ch._resolve_user_name = AsyncMock(return_value="Alice")
+        ch._resolve_user_names = AsyncMock(return_value={"U1": "Alice"})
 
         ts = "1700000001.000000"
         ch._app.client.conversations_history = AsyncMock(
@@ -588,6 +588,158 @@ class TestFetchMissedMessages:
         assert result[0].timestamp == expected
 
 
+# ------------------------------------------------------------------
+# Persistent name directory
+# ------------------------------------------------------------------
+
+
+@pytest.fixture()
+async def _db():
+    from pynchy.state import _init_test_database
+
+    await _init_test_database()
+
+
+@pytest.mark.usefixtures("_db")
+class TestNameDirectory:
+    @pytest.mark.asyncio
+    async def test_catch_up_resolves_senders_from_directory(self) -> None:
+        from pynchy.state import upsert_directory_names
+
+        ch = _make_channel()
+        ch._app = MagicMock()
+        ch._app.client.users_info = AsyncMock()
+        await upsert_directory_names(
+            "slack:connection.slack.main", "user", {"U1": "Alice", "U2": "Bob"}
+        )
+        ch._app.client.conversations_history = AsyncMock(
+            return_value={
+                "messages": [
+                    {"user": "U2", "text": "c", "ts": "1700000003.000000"},
+                    {"user": "U1", "text": "b", "ts": "1700000002.000000"},
+                    {"user": "U1", "text": "a", "ts": "1700000001.000000"},
+                ]
+            }
+        )
+
+        result = await ch.fetch_missed_messages("C12345", "1700000000.000000")
+
+        assert [m.sender_name for m in result] == ["Alice", "Alice", "Bob"]
+        ch._app.client.users_info.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_unknown_user_fetched_once_and_persisted(self) -> None:
+        from pynchy.state import get_directory_names
+
+        ch = _make_channel()
+        ch._app = MagicMock()
+        ch._app.client.users_info = AsyncMock(
+            return_value={"user": {"profile": {"display_name": "Carol"}}}
+        )
+
+        names = await ch._resolve_user_names(["U3", "U3"])
+        again = await ch._resolve_user_name("U3")
+
+        assert names == {"U3": "Carol"}
+        assert again == "Carol"
+        ch._app.client.users_info.assert_awaited_once_with(user="U3")
+        stored = await get_directory_names("slack:connection.slack.main", "user", ["U3"])
+        assert stored == {"U3": "Carol"}
+
+    @pytest.mark.asyncio
+    async def test_directory_survives_new_channel_instance(self) -> None:
+        first = _make_channel()
+        first._app = MagicMock()
+        first._app.client.users_info = AsyncMock(
+            return_value={"user": {"profile": {"display_name": "Carol"}}}
+        )
+        await first._resolve_user_name("U3")
+
+        # Simulates a restart: fresh in-memory cache, same database.
+        second = _make_channel()
+        second._app = MagicMock()
+        second._app.client.users_info = AsyncMock()
+
+        assert await second._resolve_user_name("U3") == "Carol"
+        second._app.client.users_info.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_paginates_and_prunes(self) -> None:
+        from pynchy.state import (
+            get_directory_names,
+            get_directory_synced_at,
+            upsert_directory_names,
+        )
+
+        ns = "slack:connection.slack.main"
+        await upsert_directory_names(ns, "user", {"U_GONE": "Departed"})
+
+        ch = _make_channel()
+        ch._app = MagicMock()
+        ch._app.client.users_list = AsyncMock(
+            side_effect=[
+                {
+                    "members": [{"id": "U1", "profile": {"display_name": "Alice"}}],
+                    "response_metadata": {"next_cursor": "page2"},
+                },
+                {
+                    "members": [
+                        {"id": "U2", "real_name": "Bob"},
+                        {"id": "U_DEL", "deleted": True, "real_name": "Old"},
+                    ],
+                    "response_metadata": {"next_cursor": ""},
+                },
+            ]
+        )
+        ch._app.client.conversations_list = AsyncMock(
+            return_value={"channels": [{"id": "C1", "name": "general"}]}
+        )
+
+        await ch._refresh_directory()
+
+        assert ch._app.client.users_list.await_count == 2
+        assert ch._app.client.users_list.await_args_list[1].kwargs["cursor"] == "page2"
+        users = await get_directory_names(ns, "user", ["U1", "U2", "U_DEL", "U_GONE"])
+        assert users == {"U1": "Alice", "U2": "Bob"}
+        assert await get_directory_names(ns, "channel", ["C1"]) == {"C1": "general"}
+        assert await ch._resolve_channel_name("C1") == "general"
+        assert await get_directory_synced_at(ns) != ""
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_is_not_recorded_as_synced(self) -> None:
+        from pynchy.state import get_directory_synced_at
+
+        ch = _make_channel()
+        ch._app = MagicMock()
+        ch._app.client.users_list = AsyncMock(return_value={"members": []})
+        ch._app.client.conversations_list = AsyncMock(side_effect=RuntimeError("ratelimited"))
+
+        with pytest.raises(RuntimeError):
+            await ch._refresh_directory()
+
+        assert await get_directory_synced_at("slack:connection.slack.main") == ""
+
+    @pytest.mark.asyncio
+    async def test_refresh_renames_known_chats_only(self) -> None:
+        from pynchy.state import get_all_chats, store_chat_metadata
+
+        await store_chat_metadata("slack:C1", "2024-01-01T00:00:00+00:00", "old-name")
+
+        ch = _make_channel()
+        ch._app = MagicMock()
+        ch._app.client.users_list = AsyncMock(return_value={"members": []})
+        ch._app.client.conversations_list = AsyncMock(
+            return_value={
+                "channels": [{"id": "C1", "name": "general"}, {"id": "C2", "name": "random"}]
+            }
+        )
+
+        await ch._refresh_directory()
+
+        chats = {c["jid"]: c["name"] for c in await get_all_chats()}
+        assert chats == {"slack:C1": "general"}
+
+
 # ------------------------------------------------------------------
 # Deterministic message IDs
 # ------------------------------------------------------------------
@@ -637,7 +789,7 @@ class TestDeterministicMessageIds:
         # Second call via fetch_missed_messages
         ch2 = _make_channel()
         ch2._app = MagicMock()
-        ch2._resolve_user_name = AsyncMock(return_value="Alice")
+        ch2._resolve_user_names = AsyncMock(return_value={"U1": "Alice"})
         ch2._app.client.conversations_history = AsyncMock(
             return_value={"messages": [{"user": "U1", "text": "hi", "ts": ts}]}
         )
@@ -641,6 +641,123 @@ async def test_delete_event_success():
     fake_event.delete.assert_called_once()
 
 
+# ---------------------------------------------------------------------------
+# Caching
+# ---------------------------------------------------------------------------
+
+_RANGE = {
+    "start_date": "2026-02-16T00:00:00+00:00",
+    "end_date": "2026-02-17T00:00:00+00:00",
+    "calendar": "primary",
+}
+
+
+@pytest.mark.asyncio
+async def test_calendar_list_is_cached_across_calls():
+    """Calendar discovery hits the server once within the TTL."""
+    fake_client, cals = _make_fake_client("meetings")
+    settings = _make_settings()
+
+    with (
+        patch("pynchy.plugins.integrations.caldav.get_settings", return_value=settings),
+        patch("pynchy.plugins.integrations.caldav._get_caldav_client", return_value=fake_client),
+    ):
+        await _handle_list_calendars({})
+        await _handle_list_calendar(_RANGE)
+
+    # One discovery per server (work + personal); list_calendar reuses "work".
+    assert fake_client.principal.return_value.calendars.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_event_range_reused_while_ctag_unchanged():
+    """A repeated range query is served from cache while the ctag holds."""
+    fake_client, cals = _make_fake_client("meetings")
+    cals[0].url = "https://work/cal/meetings/"
+    cals[0].date_search.return_value = [_make_fake_event(uid="ev-1")]
+    settings = _make_settings()
+
+    with (
+        patch("pynchy.plugins.integrations.caldav.get_settings", return_value=settings),
+        patch("pynchy.plugins.integrations.caldav._get_caldav_client", return_value=fake_client),
+        patch("pynchy.plugins.integrations.caldav._collection_tag", return_value="ctag-1"),
+    ):
+        first = await _handle_list_calendar(_RANGE)
+        second = await _handle_list_calendar(_RANGE)
+
+    assert first == second
+    assert second["result"]["events"][0]["uid"] == "ev-1"
+    cals[0].date_search.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_event_range_refetched_when_ctag_changes():
+    """A changed ctag invalidates the cached range."""
+    fake_client, cals = _make_fake_client("meetings")
+    cals[0].url = "https://work/cal/meetings/"
+    cals[0].date_search.side_effect = [
+        [_make_fake_event(uid="ev-1")],
+        [_make_fake_event(uid="ev-1"), _make_fake_event(uid="ev-2")],
+    ]
+    settings = _make_settings()
+
+    with (
+        patch("pynchy.plugins.integrations.caldav.get_settings", return_value=settings),
+        patch("pynchy.plugins.integrations.caldav._get_caldav_client", return_value=fake_client),
+        patch(
+            "pynchy.plugins.integrations.caldav._collection_tag",
+            side_effect=["ctag-1", "ctag-2"],
+        ),
+    ):
+        first = await _handle_list_calendar(_RANGE)
+        second = await _handle_list_calendar(_RANGE)
+
+    assert first["result"]["count"] == 1
+    assert second["result"]["count"] == 2
+    assert cals[0].date_search.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_create_event_invalidates_cached_range():
+    """Writing through pynchy drops cached ranges even if the ctag lags."""
+    fake_client, cals = _make_fake_client("meetings")
+    cals[0].url = "https://work/cal/meetings/"
+    cals[0].date_search.return_value = []
+    cals[0].save_event.return_value = _make_fake_event(uid="new")
+    settings = _make_settings()
+
+    with (
+        patch("pynchy.plugins.integrations.caldav.get_settings", return_value=settings),
+        patch("pynchy.plugins.integrations.caldav._get_caldav_client", return_value=fake_client),
+        patch("pynchy.plugins.integrations.caldav._collection_tag", return_value="ctag-1"),
+    ):
+        await _handle_list_calendar(_RANGE)
+        await _handle_create_event(
+            {"title": "New", "start": "2026-02-16T10:00:00", "end": "2026-02-16T11:00:00"}
+        )
+        await _handle_list_calendar(_RANGE)
+
+    assert cals[0].date_search.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_no_collection_tag_disables_event_cache():
+    """Servers without a ctag/etag are queried every time."""
+    fake_client, cals = _make_fake_client("meetings")
+    cals[0].date_search.return_value = []
+    settings = _make_settings()
+
+    with (
+        patch("pynchy.plugins.integrations.caldav.get_settings", return_value=settings),
+        patch("pynchy.plugins.integrations.caldav._get_caldav_client", return_value=fake_client),
+        patch("pynchy.plugins.integrations.caldav._collection_tag", return_value=None),
+    ):
+        await _handle_list_calendar(_RANGE)
+        await _handle_list_calendar(_RANGE)
+
+    assert cals[0].date_search.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Error handling
 # ---------------------------------------------------------------------------
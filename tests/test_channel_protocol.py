@@ -76,9 +76,10 @@ def _make_whatsapp_channel() -> WhatsAppChannel:
     ch._on_ask_user_answer = None
     ch._workspaces = lambda: {}
     ch._connected = True
-    ch._outgoing_queue = MagicMock()
+    ch._outbox = MagicMock()
+    ch._outbox.try_acquire.return_value = True
+    ch._outbox.enqueue = AsyncMock()
     ch._lid_to_phone = {}
-    ch._flushing = False
     # Mock internal transport so _send_text doesn't hit neonize
     ch._client = MagicMock()
     ch._client.send_message = AsyncMock()
@@ -135,15 +136,30 @@ class TestWhatsAppSendEvent:
 
     @pytest.mark.asyncio
     async def test_send_event_queues_when_disconnected(self):
-        """When disconnected, send_event should queue the message."""
+        """When disconnected, send_event should queue the message in the outbox."""
         ch = _make_whatsapp_channel()
         ch._connected = False
-        ch._outgoing_queue = MagicMock()
-        ch._outgoing_queue.append = MagicMock()
         event = OutboundEvent(type=OutboundEventType.TEXT, content="queued")
         await ch.send_event("test@g.us", event)
         # Should have queued rather than sent directly
-        ch._outgoing_queue.append.assert_called_once()
+        ch._outbox.enqueue.assert_awaited_once_with("test@g.us", "queued")
+        ch._client.send_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_event_queues_behind_backlog(self):
+        """A chat with queued messages (or no send budget) queues new ones too."""
+        ch = _make_whatsapp_channel()
+        ch._outbox.try_acquire.return_value = False
+        await ch.send_event("test@g.us", OutboundEvent(type=OutboundEventType.TEXT, content="x"))
+        ch._outbox.enqueue.assert_awaited_once()
+        ch._client.send_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_failure_queues_message(self):
+        ch = _make_whatsapp_channel()
+        ch._client.send_message.side_effect = OSError("socket closed")
+        await ch.send_event("test@g.us", OutboundEvent(type=OutboundEventType.TEXT, content="x"))
+        ch._outbox.enqueue.assert_awaited_once_with("test@g.us", "x")
 
 
 class TestWhatsAppPrivateSendText:
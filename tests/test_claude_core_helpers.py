@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import pytest
+
 # Mock claude_agent_sdk so we can import container code on the host
 sys.modules.setdefault("claude_agent_sdk", MagicMock())
 
@@ -22,6 +24,7 @@ from agent_runner.cores.claude import (  # noqa: E402
     _generate_fallback_name,
     _get_session_summary,
     _parse_transcript,
+    _query_cost,
     _sanitize_filename,
 )
 
@@ -372,3 +375,24 @@ class TestGetSessionSummary:
 
         result = _get_session_summary("s1", transcript_path)
         assert result == "Found it"
+
+
+# ---------------------------------------------------------------------------
+# _query_cost
+# ---------------------------------------------------------------------------
+
+
+class TestQueryCost:
+    """total_cost_usd is a running total per CLI process."""
+
+    def test_delta_against_reported_total(self):
+        assert _query_cost(0.75, 0.5) == pytest.approx(0.25)
+
+    def test_first_query_is_the_whole_total(self):
+        assert _query_cost(0.5, 0.0) == 0.5
+
+    def test_total_below_reported_means_a_fresh_process(self):
+        assert _query_cost(0.2, 0.5) == 0.2
+
+    def test_missing_total(self):
+        assert _query_cost(None, 0.5) is None
@@ -6,6 +6,7 @@ import asyncio
 import contextlib
 import json
 import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -22,7 +23,11 @@ from pynchy.host.container_manager.credentials import (
     _write_env_file,
 )
 from pynchy.host.container_manager.ipc.write import clean_ipc_input_dir
-from pynchy.host.container_manager.mounts import _build_container_args, _build_volume_mounts
+from pynchy.host.container_manager.mounts import (
+    _build_container_args,
+    _build_volume_mounts,
+    precompile_agent_runner,
+)
 from pynchy.host.container_manager.orchestrator import (
     _write_initial_input,
     resolve_agent_core,
@@ -372,6 +377,54 @@ class TestOutputParsing:
         assert out.error == "boom"
         assert out.result is None
 
+    def test_parses_startup_timeline(self):
+        timeline = {"imports_ms": 180, "core_started_ms": 900, "first_event_ms": 2400}
+        out = _parse_container_output(
+            json.dumps({"status": "success", "type": "system", "startup": timeline})
+        )
+        assert out.startup == timeline
+
+
+class TestPrecompileAgentRunner:
+    def _src(self, tmp_path: Path) -> Path:
+        pkg = tmp_path / "src" / "pynchy" / "agent" / "agent_runner" / "src" / "agent_runner"
+        pkg.mkdir(parents=True)
+        (pkg / "main.py").write_text("X = 1\n")
+        return pkg
+
+    def test_writes_bytecode_next_to_source(self, tmp_path: Path):
+        pkg = self._src(tmp_path)
+        with (
+            _patch_settings(tmp_path),
+            patch(
+                "pynchy.host.container_manager.mounts._AGENT_IMAGE_PYTHON",
+                sys.version_info[:2],
+            ),
+        ):
+            assert precompile_agent_runner() is True
+
+        assert list((pkg / "__pycache__").glob("main.*.pyc"))
+
+    def test_skips_when_host_python_differs_from_image(self, tmp_path: Path):
+        pkg = self._src(tmp_path)
+        with (
+            _patch_settings(tmp_path),
+            patch("pynchy.host.container_manager.mounts._AGENT_IMAGE_PYTHON", (2, 7)),
+        ):
+            assert precompile_agent_runner() is False
+
+        assert not (pkg / "__pycache__").exists()
+
+    def test_missing_source_tree(self, tmp_path: Path):
+        with (
+            _patch_settings(tmp_path),
+            patch(
+                "pynchy.host.container_manager.mounts._AGENT_IMAGE_PYTHON",
+                sys.version_info[:2],
+            ),
+        ):
+            assert precompile_agent_runner() is False
+
 
 class TestContainerArgs:
     def test_readonly_uses_mount_flag(self):
@@ -770,6 +823,87 @@ class TestWriteEnvFile:
             assert "Brien" in content
 
 
+class TestHostCredentialCache:
+    """gh/git are forked once and env files rewritten only when content changes."""
+
+    def _write(self, tmp_path: Path, gw: _MockGateway) -> Path | None:
+        with (
+            _patch_settings(tmp_path),
+            patch(f"{_GATEWAY}.get_gateway", return_value=gw),
+            patch(f"{_CR_CREDS}.Path.home", return_value=tmp_path),
+        ):
+            return _write_env_file(is_admin=True, group_folder="test")
+
+    def test_host_credentials_resolved_once(self, tmp_path: Path):
+        gw = _MockGateway(providers={"anthropic"})
+        with (
+            patch(f"{_CR_CREDS}._read_gh_token", return_value="gho_x") as gh,
+            patch(f"{_CR_CREDS}._read_git_identity", return_value=("Bob", None)) as git,
+        ):
+            self._write(tmp_path, gw)
+            self._write(tmp_path, gw)
+
+        assert gh.call_count == 1
+        assert git.call_count == 1
+
+    def test_gitconfig_change_invalidates(self, tmp_path: Path):
+        gw = _MockGateway(providers={"anthropic"})
+        with (
+            patch(f"{_CR_CREDS}._read_gh_token", return_value=None),
+            patch(f"{_CR_CREDS}._read_git_identity", return_value=("Bob", None)) as git,
+        ):
+            self._write(tmp_path, gw)
+            (tmp_path / ".gitconfig").write_text("[user]\n\tname = Alice\n")
+            git.return_value = ("Alice", None)
+            env_dir = self._write(tmp_path, gw)
+
+        assert git.call_count == 2
+        assert env_dir is not None
+        assert "GIT_AUTHOR_NAME='Alice'" in (env_dir / "env").read_text()
+
+    def test_ttl_expiry_invalidates(self, tmp_path: Path):
+        gw = _MockGateway(providers={"anthropic"})
+        with (
+            patch(f"{_CR_CREDS}._read_gh_token", return_value=None) as gh,
+            patch(f"{_CR_CREDS}._read_git_identity", return_value=(None, None)),
+            patch(f"{_CR_CREDS}._HOST_CREDENTIAL_TTL", 0.0),
+        ):
+            self._write(tmp_path, gw)
+            self._write(tmp_path, gw)
+
+        assert gh.call_count == 2
+
+    def test_unchanged_env_file_not_rewritten(self, tmp_path: Path):
+        gw = _MockGateway(providers={"anthropic"})
+        with (
+            patch(f"{_CR_CREDS}._read_gh_token", return_value=None),
+            patch(f"{_CR_CREDS}._read_git_identity", return_value=(None, None)),
+        ):
+            env_dir = self._write(tmp_path, gw)
+            assert env_dir is not None
+            env_file = env_dir / "env"
+            env_file.write_text("sentinel")  # would be clobbered by a rewrite
+            self._write(tmp_path, gw)
+            assert env_file.read_text() == "sentinel"
+
+            gw.key = "rotated-key"
+            self._write(tmp_path, gw)
+            assert "rotated-key" in env_file.read_text()
+
+    def test_deleted_env_file_is_rewritten(self, tmp_path: Path):
+        gw = _MockGateway(providers={"anthropic"})
+        with (
+            patch(f"{_CR_CREDS}._read_gh_token", return_value=None),
+            patch(f"{_CR_CREDS}._read_git_identity", return_value=(None, None)),
+        ):
+            env_dir = self._write(tmp_path, gw)
+            assert env_dir is not None
+            (env_dir / "env").unlink()
+            self._write(tmp_path, gw)
+
+        assert (env_dir / "env").exists()
+
+
 class TestReadGhToken:
     def test_returns_token_from_gh_cli(self):
         mock_result = type("Result", (), {"returncode": 0, "stdout": "gho_test123\n"})()
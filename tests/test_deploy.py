@@ -17,7 +17,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from conftest import make_settings
 
-from pynchy.host.orchestrator.deploy import finalize_deploy
+from pynchy.host.orchestrator.deploy import BuildResult, finalize_deploy
 
 
 @contextlib.contextmanager
@@ -82,6 +82,25 @@ class TestFinalizeDeploy:
         assert jid == "group@g.us"
         assert "commit-s" in text  # First 8 chars of SHA
 
+    async def test_notification_includes_rebuild_reason_and_time(self, deploy_dir: Path):
+        broadcast = AsyncMock()
+        build = BuildResult(
+            success=True, reason="dependencies changed: agent_runner/uv.lock", duration_s=42.4
+        )
+
+        with patch("pynchy.host.orchestrator.deploy.os.kill"):
+            await finalize_deploy(
+                broadcast_host_message=broadcast,
+                chat_jid="group@g.us",
+                commit_sha="commit-sha-001",
+                previous_sha="000",
+                build=build,
+            )
+
+        _, text = broadcast.call_args[0]
+        assert "rebuilt in 42s" in text
+        assert "agent_runner/uv.lock" in text
+
     async def test_skips_broadcast_when_no_chat_jid(self, deploy_dir: Path):
         broadcast = AsyncMock()
 
@@ -25,6 +25,7 @@ from pynchy.host.git_ops.sync_poll import (
     _host_get_origin_main_sha,
     needs_container_rebuild,
     needs_deploy,
+    plan_rebuild,
 )
 from pynchy.host.git_ops.worktree import ensure_worktree
 
@@ -572,6 +573,49 @@ class TestNeedsDeploy:
             assert needs_container_rebuild("aaa", "bbb") is True
 
 
+class TestPlanRebuild:
+    def test_runtime_mounted_source_skips_rebuild(self):
+        plan = plan_rebuild(
+            [
+                "src/pynchy/agent/agent_runner/src/agent_runner/main.py",
+                "src/pynchy/agent/skills/browser-control/SKILL.md",
+                "src/pynchy/agent/scripts/settings.json",
+            ]
+        )
+        assert plan.rebuild is False
+        assert "runtime-mounted" in plan.reason
+
+    def test_dependency_manifest_rebuilds(self):
+        plan = plan_rebuild(
+            [
+                "src/pynchy/agent/agent_runner/src/agent_runner/main.py",
+                "src/pynchy/agent/agent_runner/pyproject.toml",
+            ]
+        )
+        assert plan.rebuild is True
+        assert plan.reason == "dependencies changed: agent_runner/pyproject.toml"
+        assert plan.changed == ("src/pynchy/agent/agent_runner/pyproject.toml",)
+
+    def test_image_files_rebuild(self):
+        plan = plan_rebuild(["src/pynchy/agent/entrypoint.sh", "src/pynchy/agent/Dockerfile"])
+        assert plan.rebuild is True
+        assert plan.reason == "image files changed: entrypoint.sh, Dockerfile"
+
+    def test_non_agent_paths_ignored(self):
+        plan = plan_rebuild(["src/pynchy/host/orchestrator/app.py"])
+        assert plan.rebuild is False
+        assert plan.reason == "no agent files changed"
+
+    def test_needs_container_rebuild_source_only(self):
+        with patch("subprocess.run") as mock_run:
+            mock_run.return_value = subprocess.CompletedProcess(
+                args=[],
+                returncode=0,
+                stdout="src/pynchy/agent/agent_runner/src/agent_runner/cores/claude.py\n",
+            )
+            assert needs_container_rebuild("aaa", "bbb") is False
+
+
 # ---------------------------------------------------------------------------
 # Config file hashing tests
 # ---------------------------------------------------------------------------
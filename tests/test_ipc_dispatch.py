@@ -0,0 +1,94 @@
+"""Tests for IPC dispatch: namespace lookup and per-type stats."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pynchy.host.container_manager.ipc import registry
+from pynchy.host.container_manager.ipc.registry import (
+    dispatch,
+    get_dispatch_stats,
+    register_prefix,
+    reset_dispatch_stats,
+    resolve_handler,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry():
+    with (
+        patch.dict(registry.HANDLERS, clear=True),
+        patch.dict(registry.PREFIX_HANDLERS, clear=True),
+    ):
+        reset_dispatch_stats()
+        yield
+    reset_dispatch_stats()
+
+
+class TestResolveHandler:
+    def test_exact_match_wins_over_namespace(self):
+        exact, namespaced = AsyncMock(), AsyncMock()
+        registry.register("service:special", exact)
+        register_prefix("service:", namespaced)
+
+        assert resolve_handler("service:special") is exact
+        assert resolve_handler("service:list_calendar") is namespaced
+
+    def test_namespace_is_split_at_first_separator(self):
+        handler = AsyncMock()
+        register_prefix("security:", handler)
+
+        assert resolve_handler("security:bash:check") is handler
+        assert resolve_handler("securityx:bash") is None
+        assert resolve_handler("security") is None
+
+    def test_unknown_type(self):
+        assert resolve_handler("nope") is None
+        assert resolve_handler("") is None
+
+    @pytest.mark.parametrize("prefix", ["service", "a:b:", ""])
+    def test_register_prefix_requires_namespace(self, prefix):
+        with pytest.raises(ValueError, match="namespace"):
+            register_prefix(prefix, AsyncMock())
+
+
+class TestDispatchStats:
+    async def test_counts_and_histogram(self):
+        register_prefix("service:", AsyncMock())
+        for _ in range(3):
+            await dispatch({"type": "service:list_calendar"}, "grp", False, MagicMock())
+
+        stats = get_dispatch_stats()["service:list_calendar"]
+        assert stats["count"] == 3
+        assert stats["errors"] == 0
+        assert sum(stats["histogram"].values()) == 3
+        assert list(stats["histogram"])[-1] == "slower"
+
+    async def test_handler_error_is_counted_and_propagates(self):
+        registry.register("boom", AsyncMock(side_effect=RuntimeError("x")))
+
+        with pytest.raises(RuntimeError):
+            await dispatch({"type": "boom"}, "grp", False, MagicMock())
+
+        assert get_dispatch_stats()["boom"]["errors"] == 1
+
+    async def test_unknown_types_share_one_row(self):
+        await dispatch({"type": "a"}, "grp", False, MagicMock())
+        await dispatch({"type": "b"}, "grp", False, MagicMock())
+
+        stats = get_dispatch_stats()
+        assert set(stats) == {"<unknown>"}
+        assert stats["<unknown>"]["count"] == 2
+        assert stats["<unknown>"]["errors"] == 2
+
+    async def test_table_size_is_capped(self):
+        register_prefix("service:", AsyncMock())
+        with patch.object(registry, "_MAX_TRACKED_TYPES", 2):
+            for name in ("a", "b", "c", "d"):
+                await dispatch({"type": f"service:{name}"}, "grp", False, MagicMock())
+
+        stats = get_dispatch_stats()
+        assert set(stats) == {"service:a", "service:b", "<other>"}
+        assert stats["<other>"]["count"] == 2
@@ -9,8 +9,11 @@ import pytest
 
 from pynchy.config.models import WorkspaceConfig
 from pynchy.host.container_manager.ipc.handlers_service import (
+    _get_plugin_handlers,
     _handle_service_request,
     clear_plugin_handler_cache,
+    close_plugin_handlers,
+    index_plugin_handlers,
 )
 from pynchy.host.container_manager.security.gate import _gates, create_gate
 from pynchy.state import _init_test_database
@@ -358,3 +361,47 @@ async def test_safe_service_allowed(tmp_path, register_gate):
     response_file = tmp_path / "ipc" / "test-ws" / "responses" / "test-req-1.json"
     response = json.loads(response_file.read_text())
     assert "result" in response
+
+
+class TestIndexPluginHandlers:
+    def test_indexes_given_plugin_manager_once(self):
+        handler = AsyncMock()
+        pm = MagicMock()
+        pm.hook.pynchy_service_handler.return_value = [
+            {"tools": {"list_calendar": handler}},
+            {"tools": {}},
+        ]
+
+        with patch(
+            "pynchy.host.container_manager.ipc.handlers_service.get_plugin_manager"
+        ) as fresh_pm:
+            assert index_plugin_handlers(pm) == {"list_calendar": handler}
+            assert _get_plugin_handlers() == {"list_calendar": handler}
+
+        fresh_pm.assert_not_called()
+        pm.hook.pynchy_service_handler.assert_called_once()
+
+    def test_reindex_replaces_previous_handlers(self):
+        pm = MagicMock()
+        pm.hook.pynchy_service_handler.return_value = [{"tools": {"old": AsyncMock()}}]
+        index_plugin_handlers(pm)
+        pm.hook.pynchy_service_handler.return_value = [{"tools": {"new": AsyncMock()}}]
+        index_plugin_handlers(pm)
+
+        assert set(_get_plugin_handlers()) == {"new"}
+
+    @pytest.mark.asyncio
+    async def test_close_runs_every_teardown_despite_failures(self):
+        failing, closing = AsyncMock(side_effect=RuntimeError("boom")), AsyncMock()
+        pm = MagicMock()
+        pm.hook.pynchy_service_handler.return_value = [
+            {"tools": {"a": AsyncMock()}, "close": failing},
+            {"tools": {"b": AsyncMock()}},
+            {"tools": {"c": AsyncMock()}, "close": closing},
+        ]
+        index_plugin_handlers(pm)
+
+        await close_plugin_handlers()
+
+        failing.assert_awaited_once()
+        closing.assert_awaited_once()
@@ -12,6 +12,8 @@ from pynchy.plugins.memory.sqlite_memory import (
     _handle_forget_memory,
     _handle_list_memories,
     _handle_recall_memories,
+    _handle_recall_memories_batch,
+    _handle_save_memories,
     _handle_save_memory,
 )
 from pynchy.plugins.memory.sqlite_memory.backend import SqliteMemoryBackend
@@ -44,6 +46,8 @@ class TestMemoryProvider:
         assert "recall_memories" in tools
         assert "forget_memory" in tools
         assert "list_memories" in tools
+        assert "save_memories" in tools
+        assert "recall_memories_batch" in tools
 
 
 class TestMcpHandlers:
@@ -110,6 +114,49 @@ class TestMcpHandlers:
             limit=3,
         )
 
+    async def test_save_many_validates_every_item(self):
+        result = await _handle_save_memories(
+            {"source_group": "g", "memories": [{"key": "k", "content": "c"}, {"key": "k2"}]}
+        )
+        assert result == {"error": "memories[1]: missing required fields: key, content"}
+        self.mock_backend.save_many.assert_not_called()
+
+    async def test_save_many_rejects_non_string_fields(self):
+        result = await _handle_save_memories(
+            {"source_group": "g", "memories": [{"key": 5, "content": "c"}]}
+        )
+        assert result == {"error": "memories[0]: key and content must be strings"}
+        self.mock_backend.save_many.assert_not_called()
+
+    async def test_save_many_rejects_oversized_batch(self):
+        items = [{"key": f"k{i}", "content": "c"} for i in range(51)]
+        result = await _handle_save_memories({"source_group": "g", "memories": items})
+        assert "error" in result
+
+    async def test_save_many_delegates_to_backend(self):
+        self.mock_backend.save_many.return_value = [{"key": "k", "status": "created"}]
+        items = [{"key": "k", "content": "c"}]
+        result = await _handle_save_memories({"source_group": "g", "memories": items})
+        assert result == {"result": {"saved": [{"key": "k", "status": "created"}], "count": 1}}
+        self.mock_backend.save_many.assert_called_once_with(group_folder="g", items=items)
+
+    async def test_recall_batch_requires_queries(self):
+        result = await _handle_recall_memories_batch({"source_group": "g", "queries": []})
+        assert "error" in result
+
+    async def test_recall_batch_pairs_results_with_queries(self):
+        self.mock_backend.recall_many.return_value = [[{"key": "k"}], []]
+        result = await _handle_recall_memories_batch(
+            {"source_group": "g", "queries": ["a", "b"], "limit": 2}
+        )
+        assert result["result"]["results"] == [
+            {"query": "a", "memories": [{"key": "k"}], "count": 1},
+            {"query": "b", "memories": [], "count": 0},
+        ]
+        self.mock_backend.recall_many.assert_called_once_with(
+            group_folder="g", queries=["a", "b"], category=None, limit=2
+        )
+
     async def test_forget_requires_source_group(self):
         result = await _handle_forget_memory({"key": "k"})
         assert "error" in result
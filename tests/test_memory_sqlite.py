@@ -6,8 +6,11 @@ from unittest.mock import patch
 
 import pytest
 
+from pynchy.plugins.memory.sqlite_memory import vectors
 from pynchy.plugins.memory.sqlite_memory.backend import SqliteMemoryBackend
 
+needs_numpy = pytest.mark.skipif(not vectors.AVAILABLE, reason="numpy not installed")
+
 
 @pytest.fixture
 async def backend(tmp_path):
@@ -22,6 +25,20 @@ async def backend(tmp_path):
         await b.close()
 
 
+@pytest.fixture
+async def bm25_backend(tmp_path, monkeypatch):
+    """Backend without the vector index, as when numpy isn't installed."""
+    monkeypatch.setattr(vectors, "AVAILABLE", False)
+    with patch(
+        "pynchy.plugins.memory.sqlite_memory.backend._db_path",
+        return_value=tmp_path / "memories.db",
+    ):
+        b = SqliteMemoryBackend()
+        await b.init()
+        yield b
+        await b.close()
+
+
 class TestSave:
     async def test_save_creates_memory(self, backend):
         result = await backend.save("group-a", "fav-color", "blue")
@@ -91,12 +108,46 @@ class TestRecall:
         assert results[0]["score"] > 0
 
     async def test_recall_like_fallback(self, backend):
-        """LIKE fallback catches queries that FTS5 doesn't tokenize well."""
+        """Substring fallback catches queries that FTS5 doesn't tokenize well."""
         await backend.save("group-a", "url-bookmark", "https://example.com/path")
-        # FTS5 may not tokenize URLs well, but LIKE should catch it
+        # FTS5 may not tokenize URLs well, but the trigram index should catch it
         results = await backend.recall("group-a", "example.com")
         assert len(results) >= 1
 
+    async def test_recall_substring_of_word(self, bm25_backend):
+        await bm25_backend.save("group-a", "infra", "kubernetes cluster in eu-west")
+        results = await bm25_backend.recall("group-a", "bernet")
+        assert [r["key"] for r in results] == ["infra"]
+        # Shorter than one trigram: nothing to look up
+        assert await bm25_backend.recall("group-a", "be") == []
+
+    async def test_substring_index_follows_updates_and_deletes(self, bm25_backend):
+        await bm25_backend.save("group-a", "k1", "kubernetes")
+        await bm25_backend.save("group-a", "k1", "nomad")
+        assert await bm25_backend.recall("group-a", "bernet") == []
+        assert len(await bm25_backend.recall("group-a", "oma")) == 1
+        await bm25_backend.forget("group-a", "k1")
+        assert await bm25_backend.recall("group-a", "oma") == []
+
+    async def test_substring_index_rebuilt_for_existing_database(self, tmp_path):
+        db_path = tmp_path / "memories.db"
+        with patch("pynchy.plugins.memory.sqlite_memory.backend._db_path", return_value=db_path):
+            b = SqliteMemoryBackend()
+            await b.init()
+            await b.save("group-a", "infra", "kubernetes cluster")
+            db = await b._conn()
+            await db.executescript(
+                "DROP TRIGGER memories_tri_ai; DROP TRIGGER memories_tri_ad;"
+                " DROP TRIGGER memories_tri_au; DROP TABLE memories_trigram;"
+            )
+            await b.close()
+
+            b = SqliteMemoryBackend()
+            await b.init()
+            results = await b.recall("group-a", "bernet")
+            await b.close()
+        assert [r["key"] for r in results] == ["infra"]
+
     async def test_recall_empty_query(self, backend):
         await backend.save("group-a", "k1", "hello world")
         results = await backend.recall("group-a", "")
@@ -116,6 +167,113 @@ class TestRecall:
         assert results[0]["key"] == "k2"
 
 
+class TestBatch:
+    async def test_save_many_reports_status_per_item(self, backend):
+        await backend.save("group-a", "existing", "old")
+        results = await backend.save_many(
+            "group-a",
+            [
+                {"key": "existing", "content": "new"},
+                {"key": "fresh", "content": "hello", "category": "daily"},
+            ],
+        )
+        assert results == [
+            {"key": "existing", "status": "updated"},
+            {"key": "fresh", "status": "created"},
+        ]
+        keys = {k["key"]: k["category"] for k in await backend.list_keys("group-a")}
+        assert keys == {"existing": "core", "fresh": "daily"}
+
+    async def test_save_many_is_all_or_nothing(self, backend):
+        with pytest.raises(KeyError):
+            await backend.save_many("group-a", [{"key": "ok", "content": "c"}, {"key": "bad"}])
+        assert await backend.list_keys("group-a") == []
+
+    async def test_recall_many_keeps_query_order(self, backend):
+        await backend.save("group-a", "fav-color", "blue")
+        await backend.save("group-a", "fav-food", "pizza")
+        results = await backend.recall_many("group-a", ["pizza", "", "blue"])
+        assert [[r["key"] for r in rs] for rs in results] == [["fav-food"], [], ["fav-color"]]
+
+
+class TestMaintenance:
+    async def _touch(self, backend, key: str, updated_at: str) -> None:
+        db = await backend._conn()
+        await db.execute("UPDATE memories SET updated_at = ? WHERE key = ?", (updated_at, key))
+        await db.commit()
+
+    async def test_row_quota_archives_least_recently_updated(self, backend):
+        for i in range(4):
+            await backend.save("group-a", f"k{i}", f"note number {i}")
+            await self._touch(backend, f"k{i}", f"2026-01-0{i + 1}T00:00:00+00:00")
+        await backend.save("group-b", "other", "untouched")
+
+        result = await backend.maintain(max_rows_per_group=2)
+
+        assert result["archived"] == 2
+        keys = sorted(k["key"] for k in await backend.list_keys("group-a"))
+        assert keys == ["k2", "k3"]
+        assert len(await backend.list_keys("group-b")) == 1
+        # Archived memories are no longer recalled
+        recalled = {r["key"] for r in await backend.recall("group-a", "note number", limit=10)}
+        assert recalled == {"k2", "k3"}
+        stats = await backend.stats()
+        assert stats["archived_rows"] == 2
+        assert stats["last_maintenance"] == result
+
+    async def test_byte_quota(self, backend):
+        await backend.save("group-a", "big", "x" * 500)
+        await self._touch(backend, "big", "2026-01-01T00:00:00+00:00")
+        await backend.save("group-a", "small", "y" * 10)
+
+        result = await backend.maintain(max_bytes_per_group=100)
+
+        assert result["archived"] == 1
+        assert [k["key"] for k in await backend.list_keys("group-a")] == ["small"]
+
+    async def test_no_quotas_archives_nothing(self, backend):
+        await backend.save("group-a", "k1", "content")
+        result = await backend.maintain()
+        assert result["archived"] == 0
+        assert len(await backend.list_keys("group-a")) == 1
+
+    async def test_forget_drops_archived_copy(self, backend):
+        await backend.save("group-a", "old", "stale")
+        await self._touch(backend, "old", "2026-01-01T00:00:00+00:00")
+        await backend.save("group-a", "new", "fresh")
+        await backend.maintain(max_rows_per_group=1)
+
+        assert await backend.forget("group-a", "old") == {"removed": True}
+        assert (await backend.stats())["archived_rows"] == 0
+
+    async def test_new_database_reclaims_free_pages(self, backend):
+        for i in range(200):
+            await backend.save("group-a", f"k{i}", "filler " * 200)
+        for i in range(200):
+            await backend.forget("group-a", f"k{i}")
+
+        before = await backend.stats()
+        assert before["auto_vacuum"] == "incremental"
+        assert before["free_bytes"] > 0
+
+        result = await backend.maintain()
+
+        assert result["pages_reclaimed"] > 0
+        after = await backend.stats()
+        assert after["file_bytes"] < before["file_bytes"]
+        assert after["fragmentation"] <= before["fragmentation"]
+
+    async def test_stats_shape(self, backend):
+        await backend.save("group-a", "k1", "hello")
+        await backend.save("group-b", "k1", "world")
+        stats = await backend.stats()
+        assert stats["backend"] == "sqlite"
+        assert stats["rows"] == 2
+        assert stats["groups"] == 2
+        assert stats["last_maintenance"] is None
+        assert {g["group"] for g in stats["largest_groups"]} == {"group-a", "group-b"}
+
+
 class TestForget:
     async def test_forget_removes_memory(self, backend):
         await backend.save("group-a", "fav-color", "blue")
@@ -196,3 +354,98 @@ class TestLifecycle:
     async def test_close_is_idempotent(self, backend):
         await backend.close()
         await backend.close()  # Should not raise
+
+
+@needs_numpy
+class TestHybridRecall:
+    async def test_vector_match_survives_spelling_variants(self, backend):
+        await backend.save("group-a", "fav-color", "my favorite color is blue")
+        await backend.save("group-a", "lunch", "sandwich with cheese")
+        results = await backend.recall("group-a", "favourite colour")
+        assert [r["key"] for r in results] == ["fav-color"]
+
+    async def test_bm25_only_without_numpy(self, bm25_backend):
+        await bm25_backend.save("group-a", "fav-color", "my favorite color is blue")
+        assert await bm25_backend.recall("group-a", "favourite colour") == []
+        assert len(await bm25_backend.recall("group-a", "color")) == 1
+
+    async def test_fusion_ranks_agreed_top_hit_first(self, backend):
+        await backend.save("group-a", "runbook", "deploy to the staging cluster")
+        await backend.save("group-a", "env", "staging")
+        await backend.save("group-a", "lunch", "sandwich with cheese")
+        results = await backend.recall("group-a", "deploy staging cluster")
+        assert [r["key"] for r in results] == ["runbook", "env"]
+        # First in both rankings: 1/(60+1) from each
+        assert results[0]["score"] == pytest.approx(2 / 61)
+
+    async def test_update_and_forget_keep_index_in_sync(self, backend):
+        await backend.save("group-a", "pet", "a cat named whiskers")
+        assert await backend.recall("group-a", "whiskerz")  # loads the group index
+        await backend.save("group-a", "pet", "a dog named rex")
+        assert await backend.recall("group-a", "whiskerz") == []
+        await backend.forget("group-a", "pet")
+        assert await backend.recall("group-a", "rex") == []
+
+    async def test_rolled_back_batch_leaves_no_index_entries(self, backend):
+        assert await backend.recall("group-a", "anything") == []  # loads the group index
+        with pytest.raises(AttributeError):
+            await backend.save_many(
+                "group-a",
+                [{"key": "x", "content": "a plan"}, {"key": 5, "content": "bad key"}],
+            )
+        # B's row reuses the rolled-back rowid; A must not see it
+        await backend.save("group-b", "bpriv", "banana plan private to B")
+        assert await backend.recall("group-a", "banana plan") == []
+
+    async def test_category_filter_applies_to_vector_hits(self, backend):
+        await backend.save("group-a", "k1", "favorite color blue", category="daily")
+        await backend.save("group-a", "k2", "favorite color red", category="core")
+        results = await backend.recall("group-a", "favourite colour", category="core")
+        assert [r["key"] for r in results] == ["k2"]
+
+    async def test_init_backfills_existing_memories(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "memories.db"
+        monkeypatch.setattr(vectors, "AVAILABLE", False)
+        with patch("pynchy.plugins.memory.sqlite_memory.backend._db_path", return_value=db_path):
+            b = SqliteMemoryBackend()
+            await b.init()
+            await b.save("group-a", "fav-color", "my favorite color is blue")
+            await b.close()
+
+            monkeypatch.setattr(vectors, "AVAILABLE", True)
+            b = SqliteMemoryBackend()
+            await b.init()
+            results = await b.recall("group-a", "favourite colour")
+            await b.close()
+        assert [r["key"] for r in results] == ["fav-color"]
+
+
+@needs_numpy
+class TestGroupIndex:
+    def test_swap_remove_keeps_positions_consistent(self):
+        index = vectors.GroupIndex()
+        for rowid, text in enumerate(["river", "quartz", "tiger", "mango"], start=1):
+            index.upsert(rowid, vectors.embed(text), "core")
+        index.remove(1)
+        index.remove(99)  # unknown rowids are ignored
+        assert index.size == 3
+        # "mango" moved into the removed slot and is still found by rowid
+        assert index.search(vectors.embed("mango"), 1) == [(4, pytest.approx(1.0))]
+        assert index.search(vectors.embed("river"), 3) == []
+
+    def test_grows_past_initial_capacity(self):
+        index = vectors.GroupIndex()
+        for rowid in range(100):
+            index.upsert(rowid, vectors.embed(f"memory number {rowid}"), "core")
+        assert index.size == 100
+        assert index.search(vectors.embed("memory number 42"), 1)[0][0] == 42
+
+    def test_embedding_is_unit_length_and_empty_safe(self):
+        import numpy as np
+
+        assert float(np.linalg.norm(vectors.embed("hello world"))) == pytest.approx(1.0)
+        assert not vectors.embed("   ").any()
+
+    def test_reciprocal_rank_fusion(self):
+        fused = vectors.reciprocal_rank_fusion(["a", "b"], ["b", "c"], k=1)
+        assert fused["b"] > fused["a"] > fused["c"]
@@ -1498,3 +1498,88 @@ class TestBtwNonInterruptingMessages:
         )
         # Still enqueues the run
         deps.queue.enqueue_message_check.assert_called_once_with(jid)
+
+
+class TestDailyBudgetGate:
+    @pytest.fixture(autouse=True)
+    def _allow_all_senders(self, monkeypatch):
+        from pynchy.config.models import SandboxProfileConfig
+
+        mock_settings = MagicMock()
+        mock_settings.sandbox_universal = SandboxProfileConfig(allowed_users=["*"])
+        mock_settings.sandbox_profiles = {}
+        mock_settings.workspaces = {}
+        monkeypatch.setattr("pynchy.config.access.get_settings", lambda: mock_settings)
+
+    @pytest.mark.asyncio
+    async def test_over_budget_run_notifies_and_rechecks_after_reset(self, tmp_path):
+        group = _make_group(is_admin=False)
+        deps = _make_deps(groups={"g@g.us": group})
+        msg = _make_message("@pynchy hello")
+
+        with (
+            patch(_P_SETTINGS) as ms,
+            _patch_msgs_since([msg]),
+            _patch_intercept(),
+            patch(
+                "pynchy.host.orchestrator.usage.over_daily_budget",
+                new_callable=AsyncMock,
+                return_value=5.25,
+            ),
+            patch("pynchy.host.orchestrator.usage.run_after_budget_reset") as after_reset,
+        ):
+            ms.return_value = _settings_mock(tmp_path)
+            result = await process_group_messages(deps, "g@g.us")
+
+        assert result is True
+        deps.run_agent.assert_not_awaited()
+        assert "5.25 USD" in deps.broadcast_host_message.call_args[0][1]
+        assert deps.last_agent_timestamp.get("g@g.us", "") == ""
+        after_reset.call_args[0][1]()
+        deps.queue.enqueue_message_check.assert_called_once_with("g@g.us")
+
+    @pytest.mark.asyncio
+    async def test_over_budget_notice_is_sent_once_per_day(self, tmp_path):
+        group = _make_group(is_admin=False)
+        deps = _make_deps(groups={"g@g.us": group})
+        msg = _make_message("@pynchy hello again")
+
+        with (
+            patch(_P_SETTINGS) as ms,
+            _patch_msgs_since([msg]),
+            _patch_intercept(),
+            patch(
+                "pynchy.host.orchestrator.usage.over_daily_budget",
+                new_callable=AsyncMock,
+                return_value=5.25,
+            ),
+            # Already scheduled today: the chat was told on the first message
+            patch("pynchy.host.orchestrator.usage.run_after_budget_reset", return_value=False),
+        ):
+            ms.return_value = _settings_mock(tmp_path)
+            result = await process_group_messages(deps, "g@g.us")
+
+        assert result is True
+        deps.run_agent.assert_not_awaited()
+        deps.broadcast_host_message.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_over_budget_follow_up_is_not_piped(self):
+        jid = "group@g.us"
+        deps = _make_deps(groups={jid: _make_group(is_admin=False)})
+        deps.queue.is_active_task.return_value = False
+        deps.queue.send_message.return_value = True
+        msg = _make_message("@pynchy one more thing", timestamp="new-ts")
+
+        with (
+            patch(_PR_SETTINGS, return_value=_loop_settings_mock()),
+            patch(_PR_NEW_MSGS, new_callable=AsyncMock, return_value=([msg], "poll-ts")),
+            patch(_PR_MSGS_SINCE, new_callable=AsyncMock, return_value=[msg]),
+            patch(_PR_INTERCEPT, new_callable=AsyncMock, return_value=False),
+            patch(f"{_PR}.over_daily_budget", new_callable=AsyncMock, return_value=5.25),
+        ):
+            await _run_loop_once(deps)
+
+        deps.queue.send_message.assert_not_called()
+        deps.queue.close_stdin.assert_called_once_with(jid)
+        deps.queue.enqueue_message_check.assert_called_once_with(jid)
@@ -183,6 +183,34 @@ class TestResolvePendingQuestion:
         filepath = ipc_dir / "grp" / "pending_questions" / "todelete.json"
         assert not filepath.exists()
 
+    def test_resolved_question_no_longer_found(self, ipc_dir: Path, settings):
+        """The in-memory index must drop the entry together with the file."""
+        from pynchy.host.orchestrator.messaging.pending_questions import (
+            create_pending_question,
+            find_pending_for_jid,
+            find_pending_question,
+            resolve_pending_question,
+        )
+
+        with patch(
+            "pynchy.host.orchestrator.messaging.pending_questions.get_settings",
+            return_value=settings,
+        ):
+            create_pending_question(
+                request_id="indexed",
+                source_group="grp",
+                chat_jid="slack:C1",
+                channel_name="slack",
+                session_id="sess-1",
+                questions=[],
+            )
+            assert find_pending_for_jid("slack:C1")["request_id"] == "indexed"
+
+            resolve_pending_question("indexed", "grp")
+
+            assert find_pending_for_jid("slack:C1") is None
+            assert find_pending_question("indexed") is None
+
     def test_no_error_when_already_resolved(self, ipc_dir: Path, settings):
         """Resolving a nonexistent file should log a warning but not raise."""
         from pynchy.host.orchestrator.messaging.pending_questions import resolve_pending_question
@@ -0,0 +1,272 @@
+"""Tests for channel text streaming — buffer, throttling, and message splitting."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pynchy.host.orchestrator.messaging import streaming
+from pynchy.host.orchestrator.messaging.streaming import (
+    StreamBuffer,
+    StreamState,
+    detach_stream,
+    finalize_active_stream,
+    stream_states,
+    stream_text_to_channels,
+)
+from pynchy.types import OutboundEvent, OutboundEventType
+
+
+@pytest.fixture(autouse=True)
+def _clean_stream_states():
+    stream_states.clear()
+    yield
+    for state in stream_states.values():
+        state.cancel_flush()
+    stream_states.clear()
+
+
+class _StreamingChannel:
+    """Minimal channel recording post/update calls as (msg_id, content, cursor)."""
+
+    def __init__(self, name: str = "slack", *, interval=None, max_length=None) -> None:
+        self.name = name
+        if interval is not None:
+            self.stream_update_interval = interval
+        if max_length is not None:
+            self.max_stream_length = max_length
+        self.calls: list[tuple[str, str, bool]] = []
+        self._next_id = 0
+        self.fail_updates = False
+
+    def is_connected(self) -> bool:
+        return True
+
+    def owns_jid(self, jid: str) -> bool:
+        return True
+
+    async def post_event(self, jid: str, event: OutboundEvent) -> str:
+        self._next_id += 1
+        msg_id = f"m{self._next_id}"
+        self.calls.append((msg_id, event.content, event.metadata["cursor"]))
+        return msg_id
+
+    async def update_event(self, jid: str, message_id: str, event: OutboundEvent) -> None:
+        if self.fail_updates:
+            raise OSError("ratelimited")
+        self.calls.append((message_id, event.content, event.metadata["cursor"]))
+
+
+def _deps(*channels) -> MagicMock:
+    deps = MagicMock()
+    deps.channels = list(channels)
+    return deps
+
+
+def _state(chat_jid: str = "g@g.us") -> StreamState:
+    state = StreamState(event=OutboundEvent(type=OutboundEventType.TEXT, content=""))
+    stream_states[chat_jid] = state
+    return state
+
+
+class TestStreamBuffer:
+    def test_appends_join_lazily(self) -> None:
+        buf = StreamBuffer()
+        for part in ("a", "bc", "", "def"):
+            buf.append(part)
+        assert len(buf) == 6
+        assert buf.text == "abcdef"
+        buf.append("g")
+        assert buf.text == "abcdefg"
+
+    def test_initial_event_content_seeds_buffer(self) -> None:
+        state = StreamState(event=OutboundEvent(type=OutboundEventType.TEXT, content="hi"))
+        state.append("!")
+        assert state.text == "hi!"
+
+
+class TestThrottle:
+    @pytest.mark.asyncio
+    async def test_updates_inside_window_are_deferred(self) -> None:
+        ch = _StreamingChannel(interval=60)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("Hello")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        state.append(" world")
+        await stream_text_to_channels(deps, "g@g.us", state)
+
+        assert ch.calls == [("m1", "Hello", True)]
+        assert state.flush_timer is not None
+
+    @pytest.mark.asyncio
+    async def test_throttled_deltas_do_not_materialize_the_text(self) -> None:
+        ch = _StreamingChannel(interval=60)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("Hello")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        with patch.object(StreamBuffer, "text", property(lambda _: pytest.fail("joined"))):
+            for _ in range(100):
+                state.append(".")
+                await stream_text_to_channels(deps, "g@g.us", state)
+
+        assert len(state.buffer) == 105
+
+    @pytest.mark.asyncio
+    async def test_trailing_edge_flush_pushes_pending_text(self) -> None:
+        ch = _StreamingChannel(interval=0.05)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("Hello")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        state.append(" world")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        await asyncio.sleep(0.2)
+
+        assert ch.calls[-1] == ("m1", "Hello world", True)
+
+    @pytest.mark.asyncio
+    async def test_channels_throttle_independently(self) -> None:
+        fast = _StreamingChannel("tui", interval=0.001)
+        slow = _StreamingChannel("slack", interval=60)
+        deps = _deps(fast, slow)
+        state = _state()
+
+        state.append("a")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        await asyncio.sleep(0.01)
+        state.append("b")
+        await stream_text_to_channels(deps, "g@g.us", state)
+
+        assert [c[1] for c in fast.calls] == ["a", "ab"]
+        assert [c[1] for c in slow.calls] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_failed_update_backs_off(self) -> None:
+        ch = _StreamingChannel(interval=0.001)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("a")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        ch.fail_updates = True
+        await asyncio.sleep(0.01)
+        state.append("b")
+        await stream_text_to_channels(deps, "g@g.us", state)
+
+        assert state.channel_intervals["slack"] == pytest.approx(0.002)
+
+    @pytest.mark.asyncio
+    async def test_final_bypasses_throttle(self) -> None:
+        ch = _StreamingChannel(interval=60)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("Hello")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        state.append(" world")
+        await stream_text_to_channels(deps, "g@g.us", state, final=True)
+
+        assert ch.calls[-1] == ("m1", "Hello world", False)
+        assert state.flush_timer is None
+
+
+class TestSplitting:
+    @pytest.mark.asyncio
+    async def test_rolls_over_to_new_message_at_cap(self) -> None:
+        ch = _StreamingChannel(interval=0.001, max_length=20)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("first line here\nsecond line here")
+        await stream_text_to_channels(deps, "g@g.us", state, final=True)
+
+        assert ch.calls == [
+            ("m1", "first line here", False),
+            ("m2", "second line here", False),
+        ]
+        assert state.message_ids == {"slack": "m2"}
+        assert state.offsets == {"slack": 16}
+
+    @pytest.mark.asyncio
+    async def test_final_offsets_only_when_prefix_matches(self) -> None:
+        ch = _StreamingChannel(interval=0.001, max_length=20)
+        state = _state()
+        state.append("first line here\nsecond line here")
+        await stream_text_to_channels(_deps(ch), "g@g.us", state, final=True)
+
+        assert state.final_offsets("first line here\nsecond line here!") == {"slack": 16}
+        assert state.final_offsets("something else entirely") == {}
+
+
+class TestDetach:
+    @pytest.mark.asyncio
+    async def test_detach_cancels_trailing_flush(self) -> None:
+        ch = _StreamingChannel(interval=0.05)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("a")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        state.append("b")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        assert await detach_stream("g@g.us") is state
+        await asyncio.sleep(0.15)
+
+        assert ch.calls == [("m1", "a", True)]
+        assert "g@g.us" not in stream_states
+
+    @pytest.mark.asyncio
+    async def test_finalize_active_stream_pushes_final_text(self) -> None:
+        ch = _StreamingChannel(interval=60)
+        deps = _deps(ch)
+        state = _state()
+
+        state.append("a")
+        await stream_text_to_channels(deps, "g@g.us", state)
+        state.append("b")
+        await finalize_active_stream(deps, "g@g.us")
+
+        assert ch.calls[-1] == ("m1", "ab", False)
+
+    @pytest.mark.asyncio
+    async def test_default_throttle_applies_without_channel_hint(self) -> None:
+        ch = _StreamingChannel()
+        state = _state()
+        state.append("a")
+        with patch.object(streaming, "_STREAM_THROTTLE", 60):
+            await stream_text_to_channels(_deps(ch), "g@g.us", state)
+            state.append("b")
+            await stream_text_to_channels(_deps(ch), "g@g.us", state)
+
+        assert ch.calls == [("m1", "a", True)]
+
+
+class TestFinalizeWithOffsets:
+    @pytest.mark.asyncio
+    async def test_split_channel_gets_only_the_tail(self) -> None:
+        from pynchy.host.orchestrator.messaging.sender import finalize_stream_or_broadcast
+
+        ch = MagicMock()
+        ch.name = "slack"
+        ch.is_connected.return_value = True
+        ch.owns_jid.return_value = True
+        ch.update_event = AsyncMock()
+        deps = MagicMock()
+        deps.channels = [ch]
+        deps.workspaces = {}
+        event = OutboundEvent(type=OutboundEventType.RESULT, content="0123456789")
+
+        await finalize_stream_or_broadcast(
+            deps, "g@g.us", event, {"slack": "m2"}, stream_offsets={"slack": 4}
+        )
+
+        sent = ch.update_event.await_args.args[2]
+        assert sent.content == "456789"
+        assert event.content == "0123456789"
@@ -0,0 +1,110 @@
+"""Tests for the in-process metrics registry and its wiring."""
+
+from __future__ import annotations
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from pynchy import metrics
+
+
+def _lines(name: str) -> list[str]:
+    return [line for line in metrics.render().splitlines() if line.startswith(name)]
+
+
+class TestRegistry:
+    def test_counter_renders_per_label_set(self):
+        c = metrics.counter("test_things_total", "Things.", ("kind",))
+        c.labels("a").inc()
+        c.labels("a").inc(2)
+        c.labels('we"ird').inc()
+
+        assert "# TYPE test_things_total counter" in metrics.render()
+        assert _lines("test_things_total") == [
+            'test_things_total{kind="a"} 3',
+            'test_things_total{kind="we\\"ird"} 1',
+        ]
+
+    def test_unlabelled_metric_is_exported_at_zero(self):
+        metrics.counter("test_untouched_total", "Never incremented.")
+        assert _lines("test_untouched_total") == ["test_untouched_total 0"]
+
+    def test_redeclaring_returns_the_same_metric(self):
+        first = metrics.counter("test_redeclared_total", "x", ("a",))
+        assert metrics.counter("test_redeclared_total", "x", ("a",)) is first
+        with pytest.raises(ValueError, match="different shape"):
+            metrics.gauge("test_redeclared_total", "x", ("a",))
+        with pytest.raises(ValueError, match="different shape"):
+            metrics.counter("test_redeclared_total", "x", ("b",))
+
+    def test_label_count_is_checked(self):
+        c = metrics.counter("test_labelled_total", "x", ("a", "b"))
+        with pytest.raises(ValueError, match="expects labels"):
+            c.labels("only-one")
+        with pytest.raises(ValueError, match="call .labels"):
+            c.inc()
+
+    def test_gauge_function_is_read_at_scrape_time(self):
+        g = metrics.gauge("test_depth", "Depth.")
+        depth = [3]
+        g.set_function(lambda: depth[0])
+        depth[0] = 7
+        assert _lines("test_depth") == ["test_depth 7"]
+
+    def test_histogram_buckets_are_cumulative(self):
+        h = metrics.histogram("test_latency_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            h.observe(value)
+
+        assert _lines("test_latency_seconds") == [
+            'test_latency_seconds_bucket{le="0.1"} 2',
+            'test_latency_seconds_bucket{le="1"} 3',
+            'test_latency_seconds_bucket{le="+Inf"} 4',
+            "test_latency_seconds_sum 3.65",
+            "test_latency_seconds_count 4",
+        ]
+
+
+class TestRequestMiddleware:
+    async def test_counts_requests_by_status(self):
+        async def ok(request: web.Request) -> web.Response:
+            return web.Response(text="ok")
+
+        app = web.Application(middlewares=[metrics.request_middleware("test_srv", "test server")])
+        app.router.add_get("/ok", ok)
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        try:
+            assert (await client.get("/ok")).status == 200
+            assert (await client.get("/missing")).status == 404
+        finally:
+            await client.close()
+
+        assert _lines("test_srv_requests_total") == [
+            'test_srv_requests_total{status="200"} 1',
+            'test_srv_requests_total{status="404"} 1',
+        ]
+        assert "test_srv_request_seconds_count 2" in _lines("test_srv_request_seconds_count")
+
+
+class TestWiring:
+    def test_group_queue_gauges_read_live_state(self):
+        from pynchy.host.orchestrator.concurrency import GroupQueue
+
+        queue = GroupQueue()
+        queue._active_count = 2
+        queue._waiting_groups.extend(["a", "b", "c"])
+
+        assert _lines("pynchy_queue_active_containers") == ["pynchy_queue_active_containers 2"]
+        assert _lines("pynchy_queue_waiting_groups") == ["pynchy_queue_waiting_groups 3"]
+
+    async def test_db_commits_are_timed(self):
+        from pynchy.state import _init_test_database
+        from pynchy.state.connection import _COMMIT_SECONDS
+        from pynchy.state.events import store_event
+
+        await _init_test_database()
+        before = _COMMIT_SECONDS.labels().count
+        await store_event("test", "chat@g.us", {"k": "v"})
+        assert _COMMIT_SECONDS.labels().count == before + 1
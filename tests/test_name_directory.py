@@ -0,0 +1,102 @@
+"""Tests for the persistent user/channel name directory."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+
+from pynchy.state import (
+    _init_test_database,
+    get_directory_names,
+    get_directory_synced_at,
+    prune_directory,
+    set_directory_synced_at,
+    upsert_directory_names,
+)
+
+NS = "slack:connection.slack.main"
+
+
+@pytest.fixture()
+async def _db():
+    await _init_test_database()
+
+
+@pytest.mark.usefixtures("_db")
+class TestNameDirectory:
+    @pytest.mark.asyncio
+    async def test_lookup_returns_only_known_ids(self):
+        await upsert_directory_names(NS, "user", {"U1": "Alice", "U2": "Bob"})
+
+        assert await get_directory_names(NS, "user", ["U1", "U3"]) == {"U1": "Alice"}
+
+    @pytest.mark.asyncio
+    async def test_empty_lookup(self):
+        assert await get_directory_names(NS, "user", []) == {}
+
+    @pytest.mark.asyncio
+    async def test_upsert_overwrites_name(self):
+        await upsert_directory_names(NS, "user", {"U1": "Alice"})
+        await upsert_directory_names(NS, "user", {"U1": "Alice B"})
+
+        assert await get_directory_names(NS, "user", ["U1"]) == {"U1": "Alice B"}
+
+    @pytest.mark.asyncio
+    async def test_namespaces_and_kinds_are_independent(self):
+        await upsert_directory_names(NS, "user", {"X1": "Alice"})
+        await upsert_directory_names(NS, "channel", {"X1": "general"})
+        await upsert_directory_names("slack:other", "user", {"X1": "Carol"})
+
+        assert await get_directory_names(NS, "user", ["X1"]) == {"X1": "Alice"}
+        assert await get_directory_names(NS, "channel", ["X1"]) == {"X1": "general"}
+        assert await get_directory_names("slack:other", "user", ["X1"]) == {"X1": "Carol"}
+
+    @pytest.mark.asyncio
+    async def test_lookup_batches_large_id_lists(self):
+        names = {f"U{i}": f"user{i}" for i in range(1200)}
+        await upsert_directory_names(NS, "user", names)
+
+        assert await get_directory_names(NS, "user", list(names)) == names
+
+    @pytest.mark.asyncio
+    async def test_synced_at_ignores_row_writes(self):
+        assert await get_directory_synced_at(NS) == ""
+        await upsert_directory_names(NS, "user", {"U1": "Alice"})
+        assert await get_directory_synced_at(NS) == ""
+
+        await set_directory_synced_at(NS, "2026-01-31T00:00:00+00:00")
+
+        assert await get_directory_synced_at(NS) == "2026-01-31T00:00:00+00:00"
+        assert await get_directory_synced_at("slack:other") == ""
+
+    @pytest.mark.asyncio
+    async def test_prune_older_than(self):
+        await upsert_directory_names(NS, "user", {"U1": "Alice", "U2": "Bob"})
+        await upsert_directory_names(NS, "channel", {"C1": "general"})
+
+        deleted = await prune_directory(NS, "user", older_than="9999-01-01T00:00:00+00:00")
+
+        assert deleted == 2
+        assert await get_directory_names(NS, "user", ["U1", "U2"]) == {}
+        assert await get_directory_names(NS, "channel", ["C1"]) == {"C1": "general"}
+
+    @pytest.mark.asyncio
+    async def test_prune_keeps_rows_refreshed_since_cutoff(self):
+        cutoff = datetime.now(UTC).isoformat()
+        await upsert_directory_names(NS, "user", {"U1": "Alice"})
+
+        deleted = await prune_directory(NS, "user", older_than=cutoff)
+
+        assert deleted == 0
+        assert await get_directory_names(NS, "user", ["U1"]) == {"U1": "Alice"}
+
+    @pytest.mark.asyncio
+    async def test_prune_enforces_max_entries(self):
+        await upsert_directory_names(NS, "user", {f"U{i}": "x" for i in range(5)})
+
+        deleted = await prune_directory(NS, "user", max_entries=3)
+
+        assert deleted == 2
+        remaining = await get_directory_names(NS, "user", [f"U{i}" for i in range(5)])
+        assert len(remaining) == 3
@@ -0,0 +1,187 @@
+"""Tests for notebook kernel execution — iopub demultiplexing and output caps.
+
+Uses a fake async kernel client; no Jupyter kernel is started.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import pytest
+
+try:
+    from pynchy.plugins.integrations.notebook_server import _execution
+    from pynchy.plugins.integrations.notebook_server._execution import (
+        KernelSession,
+        execute_code,
+        wait_for_execution,
+    )
+    from pynchy.plugins.integrations.notebook_server._output import save_cell_images
+except ImportError:
+    pytest.skip("notebook_server deps not installed", allow_module_level=True)
+
+
+class FakeAsyncClient:
+    """Async kernel client whose iopub channel is an asyncio.Queue."""
+
+    def __init__(self) -> None:
+        self.iopub: asyncio.Queue = asyncio.Queue()
+        self._ids = itertools.count(1)
+        self.sent: list[tuple[str, str]] = []
+
+    def execute(self, code: str) -> str:
+        msg_id = f"msg-{next(self._ids)}"
+        self.sent.append((msg_id, code))
+        return msg_id
+
+    async def get_iopub_msg(self) -> dict:
+        msg = await self.iopub.get()
+        if isinstance(msg, Exception):
+            raise msg
+        return msg
+
+    def emit(self, parent: str, msg_type: str, **content) -> None:
+        self.iopub.put_nowait(
+            {"parent_header": {"msg_id": parent}, "msg_type": msg_type, "content": content}
+        )
+
+    def idle(self, parent: str) -> None:
+        self.emit(parent, "status", execution_state="idle")
+
+
+def _session() -> tuple[KernelSession, FakeAsyncClient]:
+    client = FakeAsyncClient()
+    return KernelSession("k1", km=None, client=client, name="nb"), client
+
+
+class TestExecuteCode:
+    @pytest.mark.asyncio
+    async def test_collects_outputs_until_idle(self):
+        session, client = _session()
+        task = asyncio.create_task(execute_code(session, "print(1); 2"))
+        await asyncio.sleep(0)
+        client.emit("msg-1", "stream", name="stdout", text="1\n")
+        client.emit("msg-1", "execute_result", data={"text/plain": "2"}, execution_count=1)
+        client.idle("msg-1")
+
+        outputs = await task
+        assert outputs == [
+            {"output_type": "stream", "name": "stdout", "text": "1\n"},
+            {
+                "output_type": "execute_result",
+                "data": {"text/plain": "2"},
+                "metadata": {},
+                "execution_count": 1,
+            },
+        ]
+        assert session.executions == {}
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_demultiplexes_by_parent_msg_id(self):
+        session, client = _session()
+        first = session.submit("a")
+        second = session.submit("b")
+        client.emit("msg-2", "stream", name="stdout", text="from b")
+        client.emit("other", "stream", name="stdout", text="ignored")
+        client.emit("msg-1", "stream", name="stdout", text="from a")
+        client.idle("msg-1")
+        client.idle("msg-2")
+
+        assert await first.wait(1) and await second.wait(1)
+        assert first.outputs[0]["text"] == "from a"
+        assert second.outputs[0]["text"] == "from b"
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_partial_outputs_visible_while_running(self):
+        session, client = _session()
+        execution = session.submit("long")
+        client.emit("msg-1", "stream", name="stdout", text="step 1\n")
+
+        assert not await execution.wait(0.05)
+        assert execution.outputs[0]["text"] == "step 1\n"
+        client.emit("msg-1", "stream", name="stdout", text="step 2\n")
+        client.idle("msg-1")
+        assert await execution.wait(1)
+        assert execution.outputs[0]["text"] == "step 1\nstep 2\n"
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_timeout_records_error_and_stops_tracking(self):
+        session, _client = _session()
+        execution = session.submit("while True: pass")
+
+        assert not await wait_for_execution(session, execution, 0.01)
+        assert execution.outputs[-1]["ename"] == "Timeout"
+        assert session.executions == {}
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_channel_fails_pending(self):
+        session, client = _session()
+        execution = session.submit("x")
+        client.iopub.put_nowait(RuntimeError("socket closed"))
+
+        assert await execution.wait(1)
+        assert execution.outputs[-1]["ename"] == "KernelDisconnected"
+
+    @pytest.mark.asyncio
+    async def test_close_fails_pending(self):
+        session, _client = _session()
+        execution = session.submit("x")
+        await asyncio.sleep(0)
+        await session.close()
+
+        assert execution.outputs[-1]["ename"] == "KernelShutdown"
+
+
+class TestOutputCaps:
+    @pytest.mark.asyncio
+    async def test_stream_text_capped(self, monkeypatch):
+        monkeypatch.setattr(_execution, "MAX_STREAM_CHARS", 10)
+        session, client = _session()
+        execution = session.submit("spam")
+        for _ in range(5):
+            client.emit("msg-1", "stream", name="stdout", text="abcdef")
+        client.idle("msg-1")
+
+        assert await execution.wait(1)
+        text = execution.outputs[0]["text"]
+        assert text.startswith("abcdefabcd\n... (output truncated)")
+        assert len(execution.outputs) == 1
+        await session.close()
+
+    @pytest.mark.asyncio
+    async def test_output_count_capped(self, monkeypatch):
+        monkeypatch.setattr(_execution, "MAX_OUTPUTS", 2)
+        session, client = _session()
+        execution = session.submit("plots")
+        for i in range(5):
+            client.emit("msg-1", "display_data", data={"text/plain": str(i)})
+        client.idle("msg-1")
+
+        assert await execution.wait(1)
+        assert [o["output_type"] for o in execution.outputs] == [
+            "display_data",
+            "display_data",
+            "stream",
+        ]
+        assert "3 further outputs dropped" in execution.outputs[-1]["text"]
+        await session.close()
+
+
+class TestIncrementalImageSave:
+    def test_already_saved_images_are_skipped(self, tmp_path):
+        png = "iVBORw0KGgo="
+        outputs = [{"output_type": "display_data", "data": {"image/png": png}}]
+        save_cell_images("nb", 3, outputs, tmp_path)
+        first = tmp_path / "nb_files" / "cell_3.png"
+        first.write_bytes(b"sentinel")
+
+        outputs.append({"output_type": "display_data", "data": {"image/png": png}})
+        save_cell_images("nb", 3, outputs, tmp_path)
+
+        assert first.read_bytes() == b"sentinel"
+        assert outputs[1]["data"]["_image_path"] == "nb_files/cell_3_2.png"
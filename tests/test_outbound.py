@@ -148,3 +148,39 @@ class TestGcDelivered:
 
         deleted = await gc_delivered(max_age_hours=1)
         assert deleted == 0
+
+
+@pytest.mark.usefixtures("_db")
+class TestChannelWideHelpers:
+    @pytest.mark.asyncio
+    async def test_pending_for_channel_spans_groups(self):
+        from pynchy.state import get_pending_for_channel
+
+        await record_outbound("group@g.us", "a", "broadcast", ["whatsapp"])
+        await record_outbound("other@g.us", "b", "broadcast", ["whatsapp", "slack"])
+        pending = await get_pending_for_channel("whatsapp")
+        assert [(p.chat_jid, p.content) for p in pending] == [
+            ("group@g.us", "a"),
+            ("other@g.us", "b"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_mark_delivered_many(self):
+        from pynchy.state import mark_delivered_many
+
+        ids = [await record_outbound("group@g.us", t, "broadcast", ["whatsapp"]) for t in "ab"]
+        await mark_delivered_many(ids, "whatsapp")
+        assert await get_pending_outbound("whatsapp", "group@g.us") == []
+
+    @pytest.mark.asyncio
+    async def test_mark_delivery_error_many(self):
+        from pynchy.state import _get_db, mark_delivery_error_many
+
+        ids = [await record_outbound("group@g.us", t, "broadcast", ["whatsapp"]) for t in "ab"]
+        await mark_delivery_error_many(ids, "whatsapp", "rate-overlimit")
+
+        cursor = await _get_db().execute(
+            "SELECT error FROM outbound_deliveries WHERE channel_name = 'whatsapp'"
+        )
+        assert [row[0] for row in await cursor.fetchall()] == ["rate-overlimit"] * 2
+        assert len(await get_pending_outbound("whatsapp", "group@g.us")) == 2
@@ -153,6 +153,28 @@ class TestOutputFileProcessing:
         assert output.tool_name == "bash"
         assert output.tool_input == {"command": "ls"}
 
+    @pytest.mark.parametrize(
+        "startup",
+        [{"imports_ms": 120, "event": 5}, ["imports_ms", 120], {"imports_ms": "slow"}],
+    )
+    async def test_untrusted_startup_timeline_still_dispatched(self, _db, tmp_path: Path, startup):
+        """A malformed or key-clashing startup timeline must not drop the event."""
+        ipc_dir = tmp_path / "ipc"
+        file_path = _write_output_file(
+            ipc_dir,
+            "test-group",
+            {"status": "success", "type": "text", "text": "Hi", "startup": startup},
+        )
+
+        handler = AsyncMock()
+        with patch(
+            "pynchy.host.container_manager.ipc.watcher._get_output_handler", return_value=handler
+        ):
+            await _process_output_file(file_path, "test-group", ipc_dir)
+
+        handler.assert_called_once()
+        assert not file_path.exists()
+
 
 # ---------------------------------------------------------------------------
 # Query-done pulse detection
@@ -230,6 +230,24 @@ class TestOutboundRetry:
         pending = await get_pending_outbound("slack", "group@g.us")
         assert len(pending) == 2
 
+    @pytest.mark.asyncio
+    async def test_skips_channels_that_drain_their_own_ledger(self):
+        """Channels with their own outbox (WhatsApp) pace their own retries."""
+        await record_outbound("group@g.us", "queued", "whatsapp_outbox", ["whatsapp"])
+
+        ch = _make_channel(name="whatsapp")
+        ch.drains_outbound_ledger = True
+        deps = _make_deps(
+            channels=[ch],
+            workspaces={"group@g.us": TEST_GROUP},
+        )
+
+        await reconcile_all_channels(deps)
+
+        ch.send_message.assert_not_awaited()
+        pending = await get_pending_outbound("whatsapp", "group@g.us")
+        assert len(pending) == 1
+
 
 # ---------------------------------------------------------------------------
 # Cooldown behaviour
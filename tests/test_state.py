@@ -38,6 +38,7 @@ from pynchy.state import (
     update_host_job,
     update_task,
     update_task_after_run,
+    upsert_chat_names,
 )
 from pynchy.types import (
     NewMessage,
@@ -623,6 +624,38 @@ class TestUpdateChatName:
         assert chats[0]["name"] == "Brand New"
 
 
+class TestUpsertChatNames:
+    async def test_inserts_and_renames_in_one_call(self):
+        await store_chat_metadata("a@g.us", "2024-01-01T00:00:00.000Z", "Old A")
+        written = await upsert_chat_names({"a@g.us": "New A", "b@g.us": "B"})
+        assert written == 2
+        names = {c["jid"]: c["name"] for c in await get_all_chats()}
+        assert names == {"a@g.us": "New A", "b@g.us": "B"}
+
+    async def test_unchanged_names_are_skipped(self):
+        await store_chat_metadata("a@g.us", "2024-01-01T00:00:00.000Z", "A")
+        assert await upsert_chat_names({"a@g.us": "A", "b@g.us": "B"}) == 1
+        assert await upsert_chat_names({"a@g.us": "A", "b@g.us": "B"}) == 0
+
+    async def test_preserves_last_message_time(self):
+        await store_chat_metadata("a@g.us", "2024-01-01T00:00:00.000Z", "A")
+        await upsert_chat_names({"a@g.us": "Renamed"})
+        chats = await get_all_chats()
+        assert chats[0]["last_message_time"] == "2024-01-01T00:00:00.000Z"
+
+    async def test_insert_missing_false_only_renames_known_chats(self):
+        await store_chat_metadata("a@g.us", "2024-01-01T00:00:00.000Z", "A")
+        written = await upsert_chat_names(
+            {"a@g.us": "Renamed", "unknown@g.us": "X"}, insert_missing=False
+        )
+        assert written == 1
+        assert [c["jid"] for c in await get_all_chats()] == ["a@g.us"]
+
+    async def test_empty_names_ignored(self):
+        assert await upsert_chat_names({"a@g.us": ""}) == 0
+        assert await get_all_chats() == []
+
+
 # --- store_message_direct with metadata ---
 
 
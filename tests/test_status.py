@@ -16,6 +16,7 @@ from pynchy.host.orchestrator.http_server import status_deps_key
 from pynchy.host.orchestrator.status import (
     _collect_deploy,
     _collect_gateway,
+    _collect_memory,
     _collect_service,
     _container_state,
     collect_status,
@@ -39,6 +40,7 @@ class MockStatusDeps:
         gateway: dict[str, Any] | None = None,
         active_sessions: int = 0,
         workspace_count: int = 0,
+        memory: Any | None = None,
     ):
         self._shutting_down = shutting_down
         self._channels = channels or {"whatsapp": True}
@@ -51,6 +53,7 @@ class MockStatusDeps:
         self._gateway = gateway or {"mode": "litellm", "port": 4000, "key": "sk-test"}
         self._active_sessions = active_sessions
         self._workspace_count = workspace_count
+        self._memory = memory
 
     def is_shutting_down(self) -> bool:
         return self._shutting_down
@@ -70,6 +73,9 @@ class MockStatusDeps:
     def get_workspace_count(self) -> int:
         return self._workspace_count
 
+    def get_memory_provider(self) -> Any | None:
+        return self._memory
+
 
 # ---------------------------------------------------------------------------
 # _collect_service
@@ -508,6 +514,32 @@ class TestContainerState:
             assert await _container_state("any") == "not_found"
 
 
+class TestCollectMemory:
+    @pytest.mark.asyncio
+    async def test_no_provider(self):
+        assert await _collect_memory(None) == {"backend": None}
+
+    @pytest.mark.asyncio
+    async def test_provider_without_stats(self):
+        provider = Mock(spec=["name"])
+        provider.name = "jsonl"
+        assert await _collect_memory(provider) == {"backend": "jsonl"}
+
+    @pytest.mark.asyncio
+    async def test_reports_provider_stats(self):
+        provider = Mock()
+        provider.name = "sqlite"
+        provider.stats = AsyncMock(return_value={"backend": "sqlite", "rows": 3})
+        assert await _collect_memory(provider) == {"backend": "sqlite", "rows": 3}
+
+    @pytest.mark.asyncio
+    async def test_stats_failure_is_reported(self):
+        provider = Mock()
+        provider.name = "sqlite"
+        provider.stats = AsyncMock(side_effect=RuntimeError("locked"))
+        assert await _collect_memory(provider) == {"backend": "sqlite", "error": "locked"}
+
+
 # ---------------------------------------------------------------------------
 # collect_status (orchestrator)
 # ---------------------------------------------------------------------------
@@ -561,6 +593,7 @@ class TestCollectStatus:
         # Verify all top-level keys exist
         expected_keys = {
             "service",
+            "boot",
             "deploy",
             "channels",
             "gateway",
@@ -570,6 +603,10 @@ class TestCollectStatus:
             "tasks",
             "host_jobs",
             "groups",
+            "security",
+            "ipc",
+            "latency",
+            "memory",
         }
         assert set(result.keys()) == expected_keys
 
@@ -21,7 +21,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from conftest import make_settings
 
-from pynchy.config import CronJobConfig, SchedulerConfig
+from pynchy.config import CronJobConfig, MemoryConfig, SchedulerConfig
 from pynchy.host.orchestrator.concurrency import GroupQueue
 from pynchy.host.orchestrator.task_scheduler import start_scheduler_loop
 from pynchy.types import (
@@ -33,10 +33,11 @@ from pynchy.types import (
 
 
 @contextlib.contextmanager
-def _patch_settings(*, poll_interval: float = 5.0, groups_dir=None, cron_jobs=None):
+def _patch_settings(*, poll_interval: float = 5.0, groups_dir=None, cron_jobs=None, memory=None):
     overrides = {
         "scheduler": SchedulerConfig(poll_interval=poll_interval),
         "cron_jobs": cron_jobs or {},
+        "memory": memory or MemoryConfig(),
     }
     if groups_dir is not None:
         overrides["groups_dir"] = groups_dir
@@ -141,6 +142,7 @@ class MockSchedulerDeps:
     def __init__(self):
         self.groups: dict[str, WorkspaceProfile] = {}
         self.queue = GroupQueue()
+        self.memory = None
         self.messages: list = []
         self.agent_runs: list = []
         self.streamed_outputs: list = []
@@ -862,3 +864,73 @@ class TestHostCronJobs:
             await _poll_host_cron_jobs()
 
         mock_spawn.assert_not_awaited()
+
+
+class TestMemoryMaintenance:
+    def setup_method(self):
+        import pynchy.host.orchestrator.task_scheduler
+
+        pynchy.host.orchestrator.task_scheduler._memory_maintenance_next_run = None
+
+    @pytest.mark.asyncio
+    async def test_runs_when_due_with_configured_quotas(self, mock_deps):
+        import pynchy.host.orchestrator.task_scheduler as scheduler
+
+        scheduler._memory_maintenance_next_run = datetime.now(UTC).isoformat()
+        mock_deps.memory = AsyncMock()
+        memory = MemoryConfig(max_rows_per_group=100, max_bytes_per_group=None)
+        with _patch_settings(memory=memory):
+            await scheduler._poll_memory_maintenance(mock_deps)
+            # Rescheduled into the future — a second poll is a no-op
+            await scheduler._poll_memory_maintenance(mock_deps)
+
+        mock_deps.memory.maintain.assert_awaited_once_with(
+            max_rows_per_group=100, max_bytes_per_group=None
+        )
+        assert scheduler._memory_maintenance_next_run > datetime.now(UTC).isoformat()
+
+    @pytest.mark.asyncio
+    async def test_quotas_are_opt_in(self, mock_deps):
+        import pynchy.host.orchestrator.task_scheduler as scheduler
+
+        scheduler._memory_maintenance_next_run = datetime.now(UTC).isoformat()
+        mock_deps.memory = AsyncMock()
+        with _patch_settings():
+            await scheduler._poll_memory_maintenance(mock_deps)
+
+        mock_deps.memory.maintain.assert_awaited_once_with(
+            max_rows_per_group=None, max_bytes_per_group=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_poll_only_schedules(self, mock_deps):
+        from pynchy.host.orchestrator.task_scheduler import _poll_memory_maintenance
+
+        mock_deps.memory = AsyncMock()
+        with _patch_settings():
+            await _poll_memory_maintenance(mock_deps)
+        mock_deps.memory.maintain.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_disabled_schedule_or_backend_without_maintenance(self, mock_deps):
+        import pynchy.host.orchestrator.task_scheduler as scheduler
+
+        scheduler._memory_maintenance_next_run = datetime.now(UTC).isoformat()
+        mock_deps.memory = AsyncMock()
+        with _patch_settings(memory=MemoryConfig(maintenance_schedule="")):
+            await scheduler._poll_memory_maintenance(mock_deps)
+        mock_deps.memory.maintain.assert_not_awaited()
+
+        mock_deps.memory = object()
+        with _patch_settings():
+            await scheduler._poll_memory_maintenance(mock_deps)  # no maintain(): no-op
+
+    @pytest.mark.asyncio
+    async def test_failures_are_logged_not_raised(self, mock_deps):
+        import pynchy.host.orchestrator.task_scheduler as scheduler
+
+        scheduler._memory_maintenance_next_run = datetime.now(UTC).isoformat()
+        mock_deps.memory = AsyncMock()
+        mock_deps.memory.maintain.side_effect = RuntimeError("disk full")
+        with _patch_settings():
+            await scheduler._poll_memory_maintenance(mock_deps)
@@ -0,0 +1,148 @@
+"""Tests for message latency tracing: spans, per-chat traces and export."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pynchy import tracing
+from pynchy.host.container_manager.ipc.write import write_ipc_message
+
+
+@pytest.fixture(autouse=True)
+def _clean_tracing():
+    tracing.reset_tracing()
+    yield
+    tracing.configure_export(None)
+    tracing.reset_tracing()
+
+
+class TestSpans:
+    def test_span_outside_a_trace_is_a_no_op(self):
+        with tracing.span("route") as child:
+            assert child is None
+        assert tracing.current_trace_id() is None
+        assert tracing.get_trace_stats() == {}
+
+    def test_nested_spans_share_the_trace_and_chain_parents(self):
+        root = tracing.open_trace("chat-1")
+        with tracing.resume("chat-1"):
+            with tracing.span("route") as outer, tracing.span("broadcast", source="x") as inner:
+                assert tracing.current_span() is inner
+            assert tracing.current_span() is root
+
+        assert outer.trace_id == inner.trace_id == root.trace_id
+        assert outer.parent_id == root.span_id
+        assert inner.parent_id == outer.span_id
+        assert inner.attributes == {"source": "x"}
+        assert inner.end_ns is not None
+        assert tracing.current_span() is None
+
+    def test_span_is_ended_when_the_block_raises(self):
+        tracing.open_trace("chat-1")
+        with tracing.resume("chat-1"), pytest.raises(RuntimeError), tracing.span("route"):
+            raise RuntimeError("boom")
+        assert tracing.get_trace_stats()["route"]["count"] == 1
+
+
+class TestPerChatTraces:
+    def test_messages_join_the_open_trace_until_it_is_sealed(self):
+        first = tracing.open_trace("chat-1", sealed_by="dispatched")
+        assert tracing.open_trace("chat-1", sealed_by="dispatched") is first
+
+        tracing.mark("chat-1", "dispatched")
+        second = tracing.open_trace("chat-1", sealed_by="dispatched")
+        assert second is not first
+        assert tracing.get_open_trace("chat-1") is second
+
+    def test_expired_trace_is_replaced(self):
+        first = tracing.open_trace("chat-1")
+        first.start_ns -= tracing._OPEN_TRACE_TTL_NS
+        assert tracing.open_trace("chat-1") is not first
+
+    def test_resume_with_mismatched_trace_id_clears_the_context(self):
+        tracing.open_trace("chat-1")
+        with tracing.resume("chat-1", "other") as trace:
+            assert trace is None
+            assert tracing.current_trace_id() is None
+
+    def test_resume_clears_an_inherited_span(self):
+        tracing.open_trace("chat-1")
+        with tracing.resume("chat-1"), tracing.resume("chat-2") as trace:
+            assert trace is None
+            assert tracing.current_span() is None
+
+    def test_record_since_mark_measures_from_the_mark(self):
+        root = tracing.open_trace("chat-1")
+        tracing.mark("chat-1", "enqueued")
+        root.marks["enqueued"] -= 5_000_000  # 5ms ago
+        tracing.record_since_mark("chat-1", "enqueued", "queue_wait")
+        tracing.record_since_mark("chat-1", "missing", "never")
+
+        stats = tracing.get_trace_stats()
+        assert stats["queue_wait"]["p50_ms"] >= 5
+        assert "never" not in stats
+
+    def test_close_only_matches_its_own_trace(self):
+        root = tracing.open_trace("chat-1")
+        assert tracing.close_trace("chat-1", "other") is None
+        assert tracing.close_trace("chat-1", root.trace_id) is root
+        assert tracing.get_open_trace("chat-1") is None
+        assert tracing.get_trace_stats()["message"]["count"] == 1
+
+    def test_discard_drops_without_recording(self):
+        root = tracing.open_trace("chat-1")
+        tracing.discard_trace("chat-1", "other")
+        assert tracing.get_open_trace("chat-1") is root
+        tracing.discard_trace("chat-1", root.trace_id)
+        assert tracing.get_open_trace("chat-1") is None
+        assert tracing.get_trace_stats() == {}
+
+
+class TestStatsAndExport:
+    def test_percentiles(self):
+        for ms in range(1, 101):
+            tracing._finish(tracing.Span("x", "t", "s", None, 0, ms * 1_000_000))
+        stats = tracing.get_trace_stats()["x"]
+        assert stats == {"count": 100, "p50_ms": 50.0, "p90_ms": 90.0, "p99_ms": 99.0}
+
+    def test_export_writes_otlp_json_lines_on_close(self, tmp_path):
+        path = tmp_path / "traces" / "spans.jsonl"
+        tracing.configure_export(path)
+        root = tracing.open_trace("chat-1", channel="tui")
+        with tracing.resume("chat-1"), tracing.span("route", retries=2, fast=True):
+            pass
+        assert not path.exists()  # buffered until the trace closes
+
+        tracing.close_trace("chat-1")
+        route, message = (json.loads(line) for line in path.read_text().splitlines())
+
+        assert route["name"] == "route"
+        assert route["traceId"] == message["traceId"] == root.trace_id
+        assert route["parentSpanId"] == message["spanId"]
+        assert "parentSpanId" not in message
+        assert int(route["endTimeUnixNano"]) >= int(route["startTimeUnixNano"])
+        assert route["attributes"] == [
+            {"key": "retries", "value": {"intValue": "2"}},
+            {"key": "fast", "value": {"boolValue": True}},
+        ]
+        assert {"key": "channel", "value": {"stringValue": "tui"}} in message["attributes"]
+
+
+class TestIpcPropagation:
+    def test_message_carries_current_trace_id(self, tmp_path):
+        settings = type("S", (), {"data_dir": tmp_path})()
+        root = tracing.open_trace("chat-1")
+        with patch("pynchy.host.container_manager.ipc.write.get_settings", return_value=settings):
+            write_ipc_message("grp", "untraced")
+            with tracing.resume("chat-1"):
+                write_ipc_message("grp", "traced")
+
+        payloads = {
+            d["text"]: d
+            for d in (json.loads(f.read_text()) for f in (tmp_path / "ipc/grp/input").iterdir())
+        }
+        assert "trace_id" not in payloads["untraced"]
+        assert payloads["traced"]["trace_id"] == root.trace_id
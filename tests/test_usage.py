@@ -0,0 +1,259 @@
+"""Tests for usage accounting: ledger, rollups, batched writer and budget gate."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from conftest import make_settings
+
+from pynchy.config.models import UsageConfig
+from pynchy.host.orchestrator import usage as host_usage
+from pynchy.host.orchestrator.http_server import _handle_api_usage
+from pynchy.state import (
+    UsageRecord,
+    _get_db,
+    _init_test_database,
+    get_usage_summary,
+    get_workspace_spend,
+    record_usage,
+)
+from pynchy.types import WorkspaceProfile
+
+
+@pytest.fixture(autouse=True)
+async def _setup_db():
+    await _init_test_database()
+
+
+@pytest.fixture(autouse=True)
+def _reset_budget_cache(monkeypatch):
+    monkeypatch.setattr(host_usage, "_over_budget", {})
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    w = host_usage.UsageWriter(flush_interval=0.01, batch_size=3)
+    monkeypatch.setattr(host_usage, "_usage_writer", w)
+    return w
+
+
+def _record(ts: str, workspace: str = "alpha", model: str = "sonnet", **kw) -> UsageRecord:
+    defaults = {"input_tokens": 100, "output_tokens": 10, "cost_usd": 0.5, "duration_ms": 1000}
+    return UsageRecord(
+        timestamp=ts, workspace=workspace, chat_jid="c@g.us", model=model, **{**defaults, **kw}
+    )
+
+
+def _group(*, is_admin: bool = False) -> WorkspaceProfile:
+    return WorkspaceProfile(
+        jid="c@g.us", name="Alpha", folder="alpha", trigger="@pynchy", is_admin=is_admin
+    )
+
+
+class TestFromResultMetadata:
+    def test_maps_anthropic_usage_fields(self):
+        meta = {
+            "model": "claude-sonnet",
+            "total_cost_usd": 0.12,
+            "duration_ms": 3400,
+            "num_turns": 2,
+            "is_error": False,
+            "usage": {
+                "input_tokens": 10,
+                "output_tokens": 20,
+                "cache_read_input_tokens": 30,
+                "cache_creation_input_tokens": 40,
+            },
+        }
+        record = UsageRecord.from_result_metadata(
+            meta, timestamp="2026-01-31T14:00:00+00:00", workspace="alpha", chat_jid="c@g.us"
+        )
+        assert record == UsageRecord(
+            timestamp="2026-01-31T14:00:00+00:00",
+            workspace="alpha",
+            chat_jid="c@g.us",
+            model="claude-sonnet",
+            input_tokens=10,
+            output_tokens=20,
+            cache_read_tokens=30,
+            cache_write_tokens=40,
+            cost_usd=0.12,
+            duration_ms=3400,
+            num_turns=2,
+        )
+
+    def test_per_query_cost_wins_over_the_session_total(self):
+        # Third query of a warm session: the CLI's total covers all three
+        meta = {"total_cost_usd": 0.9, "cost_usd": 0.3, "usage": {"input_tokens": 1}}
+        record = UsageRecord.from_result_metadata(meta, timestamp="t", workspace="w", chat_jid="c")
+        assert record is not None
+        assert record.cost_usd == pytest.approx(0.3)
+
+    def test_metadata_without_usage_is_skipped(self):
+        meta = {"subtype": "result", "is_error": False}
+        assert (
+            UsageRecord.from_result_metadata(meta, timestamp="t", workspace="w", chat_jid="c")
+            is None
+        )
+
+
+class TestLedgerAndRollups:
+    async def test_rollups_accumulate_across_writes(self):
+        await record_usage([_record("2026-01-31T14:05:00"), _record("2026-01-31T14:50:00")])
+        await record_usage([_record("2026-01-31T15:10:00", is_error=True)])
+
+        db = _get_db()
+        cursor = await db.execute("SELECT COUNT(*) FROM usage_ledger")
+        assert (await cursor.fetchone())[0] == 3
+
+        hours = await get_usage_summary("hour", "2026-01-31", group_by=("bucket",))
+        assert {r["bucket"]: r["queries"] for r in hours} == {
+            "2026-01-31T14": 2,
+            "2026-01-31T15": 1,
+        }
+        (day,) = await get_usage_summary("day", "2026-01-31")
+        assert day["workspace"] == "alpha"
+        assert (day["queries"], day["errors"], day["input_tokens"]) == (3, 1, 300)
+        assert day["cost_usd"] == pytest.approx(1.5)
+
+    async def test_summary_groups_filters_and_orders_by_cost(self):
+        await record_usage(
+            [
+                _record("2026-01-30T09:00:00", workspace="old"),
+                _record("2026-01-31T09:00:00", workspace="alpha", cost_usd=0.1),
+                _record("2026-01-31T09:00:00", workspace="beta", model="opus", cost_usd=2.0),
+                _record("2026-01-31T10:00:00", workspace="beta", model="sonnet", cost_usd=1.0),
+            ]
+        )
+
+        rows = await get_usage_summary("day", "2026-01-31T08:00:00")
+        assert [r["workspace"] for r in rows] == ["beta", "alpha"]
+
+        by_model = await get_usage_summary(
+            "day", "2026-01-31", group_by=("model",), workspace="beta"
+        )
+        assert [(r["model"], r["queries"]) for r in by_model] == [("opus", 1), ("sonnet", 1)]
+
+        with pytest.raises(ValueError, match="Cannot group"):
+            await get_usage_summary("day", "2026-01-31", group_by=("chat_jid",))
+
+    async def test_workspace_spend_reads_the_daily_rollup(self):
+        await record_usage([_record("2026-01-31T23:59:00"), _record("2026-02-01T00:01:00")])
+        assert await get_workspace_spend("alpha", "2026-01-31") == pytest.approx(0.5)
+        assert await get_workspace_spend("missing", "2026-01-31") == 0.0
+
+
+class TestUsageWriter:
+    async def test_full_batch_is_written_immediately(self, writer):
+        for i in range(3):
+            writer.add(_record(f"2026-01-31T14:0{i}:00"))
+        await asyncio.sleep(0)  # let the flush task take the batch
+        assert writer.pending == 0
+        await writer.flush()  # waits on the in-flight batch's lock
+
+        assert await get_workspace_spend("alpha", "2026-01-31") == pytest.approx(1.5)
+
+    async def test_partial_batch_is_written_after_the_interval(self, writer):
+        writer.add(_record("2026-01-31T14:00:00"))
+        assert writer.pending == 1
+        await asyncio.sleep(0.05)
+
+        assert writer.pending == 0
+        assert await get_workspace_spend("alpha", "2026-01-31") == pytest.approx(0.5)
+
+
+class TestDailyBudget:
+    def _settings(self, budget: float | None):
+        return patch.object(
+            host_usage,
+            "get_settings",
+            return_value=make_settings(usage=UsageConfig(daily_budget_usd=budget)),
+        )
+
+    async def test_gates_once_todays_spend_reaches_the_budget(self, writer):
+        today = datetime.now(UTC).isoformat()
+        with self._settings(1.0):
+            writer.add(_record(today, cost_usd=0.6))
+            assert await host_usage.over_daily_budget(_group()) is None
+            writer.add(_record(today, cost_usd=0.6))
+            assert await host_usage.over_daily_budget(_group()) == pytest.approx(1.2)
+            assert await host_usage.over_daily_budget(_group(is_admin=True)) is None
+
+    async def test_counts_buffered_cost_without_flushing(self, writer):
+        writer._flush_interval = 60
+        today = datetime.now(UTC).isoformat()
+        await record_usage([_record(today, cost_usd=0.6)])
+        writer.add(_record(today, cost_usd=0.6))
+        writer.add(_record(today, workspace="beta", cost_usd=5.0))
+
+        with self._settings(1.0):
+            assert await host_usage.over_daily_budget(_group()) == pytest.approx(1.2)
+
+        assert writer.pending == 2
+        writer._cancel_timer()
+
+    async def test_over_budget_is_cached_for_the_day(self):
+        await record_usage([_record(datetime.now(UTC).isoformat(), cost_usd=2.0)])
+        with self._settings(1.0):
+            assert await host_usage.over_daily_budget(_group()) == pytest.approx(2.0)
+            with patch.object(host_usage, "get_workspace_spend") as spend:
+                assert await host_usage.over_daily_budget(_group()) == pytest.approx(2.0)
+            spend.assert_not_called()
+
+        host_usage._over_budget["alpha"] = ("2000-01-01", 2.0)
+        with (
+            self._settings(1.0),
+            patch.object(host_usage, "get_workspace_spend", return_value=0.0) as spend,
+        ):
+            assert await host_usage.over_daily_budget(_group()) is None
+        spend.assert_awaited_once()
+
+    async def test_no_budget_configured(self):
+        await record_usage([_record(datetime.now(UTC).isoformat(), cost_usd=100.0)])
+        with self._settings(None):
+            assert await host_usage.over_daily_budget(_group()) is None
+
+
+class TestRunAfterBudgetReset:
+    async def test_schedules_once_per_chat_just_after_midnight(self, monkeypatch):
+        monkeypatch.setattr(host_usage, "_reset_timers", {})
+        calls: list[str] = []
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "call_later", wraps=loop.call_later) as call_later:
+            assert host_usage.run_after_budget_reset("c@g.us", lambda: calls.append("first"))
+            assert not host_usage.run_after_budget_reset("c@g.us", lambda: calls.append("second"))
+
+        assert call_later.call_count == 1
+        delay, fire = call_later.call_args[0]
+        assert 1 <= delay <= 86_401
+        host_usage._reset_timers["c@g.us"].cancel()
+        fire()
+        assert calls == ["first"]
+        assert "c@g.us" not in host_usage._reset_timers
+
+
+class TestApiUsage:
+    async def test_returns_rollup_rows(self):
+        await record_usage([_record(datetime.now(UTC).isoformat())])
+        app = web.Application()
+        app.router.add_get("/api/usage", _handle_api_usage)
+        client = TestClient(TestServer(app))
+        await client.start_server()
+        try:
+            resp = await client.get("/api/usage", params={"group_by": "workspace,model"})
+            body = await resp.json()
+            bad = await client.get("/api/usage", params={"period": "week"})
+        finally:
+            await client.close()
+
+        assert resp.status == 200
+        assert body["period"] == "day"
+        assert [(r["workspace"], r["model"], r["queries"]) for r in body["rows"]] == [
+            ("alpha", "sonnet", 1)
+        ]
+        assert bad.status == 400
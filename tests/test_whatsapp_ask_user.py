@@ -122,7 +122,8 @@ def _make_channel(
     ch._on_ask_user_answer = on_ask_user_answer
     ch._workspaces = lambda: {CHAT_JID: MagicMock()}
     ch._connected = True
-    ch._outgoing_queue = MagicMock()
+    ch._outbox = MagicMock()
+    ch._live_anchors = {}
     ch._lid_to_phone = {}
     ch._send_text = AsyncMock()
     return ch
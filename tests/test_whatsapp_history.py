@@ -0,0 +1,228 @@
+"""Tests for WhatsApp history-sync indexing and index-backed inbound recovery."""
+
+from __future__ import annotations
+
+import sys
+from datetime import UTC, datetime, timedelta
+from types import ModuleType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pynchy.state import (
+    _init_test_database,
+    get_index_anchor,
+    get_indexed_since,
+    index_inbound,
+    prune_inbound_index,
+)
+from pynchy.types import NewMessage
+
+# Create fake neonize modules so the WhatsApp channel module can be imported
+# in environments where neonize (a native Go binding) isn't installed.
+_NEONIZE_MODULES = [
+    "neonize",
+    "neonize.aioze",
+    "neonize.aioze.client",
+    "neonize.aioze.events",
+    "neonize.events",
+    "neonize.proto",
+    "neonize.proto.Neonize_pb2",
+    "neonize.utils",
+    "neonize.utils.jid",
+    "neonize.utils.enum",
+]
+_neonize_mocks: dict[str, ModuleType] = {}
+for _mod_name in _NEONIZE_MODULES:
+    if _mod_name not in sys.modules:
+        _neonize_mocks[_mod_name] = MagicMock()
+        sys.modules[_mod_name] = _neonize_mocks[_mod_name]
+
+from pynchy.plugins.channels.whatsapp.channel import WhatsAppChannel  # noqa: E402
+
+CHANNEL = "connection.whatsapp.test"
+CHAT_JID = "120363001234567890@g.us"
+
+
+@pytest.fixture(autouse=True)
+async def _db():
+    await _init_test_database()
+
+
+def _ts(minutes_ago: int) -> str:
+    return (datetime.now(UTC) - timedelta(minutes=minutes_ago)).isoformat()
+
+
+def _msg(msg_id: str, ts: str, content: str = "hi", *, from_me: bool = False) -> NewMessage:
+    return NewMessage(
+        id=msg_id,
+        chat_jid=CHAT_JID,
+        sender="111@s.whatsapp.net",
+        sender_name="Alice",
+        content=content,
+        timestamp=ts,
+        is_from_me=from_me,
+    )
+
+
+def _text(content: str) -> SimpleNamespace:
+    empty = SimpleNamespace(text="", caption="")
+    return SimpleNamespace(
+        conversation=content,
+        extendedTextMessage=empty,
+        imageMessage=empty,
+        videoMessage=empty,
+    )
+
+
+def _history_msg(msg_id: str, seconds: int, content: str, **key) -> SimpleNamespace:
+    return SimpleNamespace(
+        message=SimpleNamespace(
+            key=SimpleNamespace(
+                ID=msg_id,
+                fromMe=key.get("fromMe", False),
+                participant=key.get("participant", "111@s.whatsapp.net"),
+            ),
+            participant="",
+            pushName=key.get("pushName", "Alice"),
+            messageTimestamp=seconds,
+            message=_text(content),
+        )
+    )
+
+
+def _make_channel() -> WhatsAppChannel:
+    ch = WhatsAppChannel.__new__(WhatsAppChannel)
+    ch.name = CHANNEL
+    ch._connection_name = CHANNEL
+    ch._workspaces = lambda: {CHAT_JID: MagicMock()}
+    ch._lid_to_phone = {"999": "222@s.whatsapp.net"}
+    ch._live_anchors = {}
+    ch._history_requested = {}
+    ch._client = MagicMock()
+    ch._client.me = SimpleNamespace(JID=SimpleNamespace(User="555", Server="s.whatsapp.net"))
+    ch._client.build_history_sync_request = AsyncMock(return_value="request")
+    ch._client.send_message = AsyncMock()
+    ch._parse_jid = MagicMock(side_effect=lambda jid: jid)
+    return ch
+
+
+class TestInboundIndexState:
+    @pytest.mark.asyncio
+    async def test_index_is_idempotent(self):
+        assert await index_inbound(CHANNEL, [_msg("a", _ts(5))]) == 1
+        assert await index_inbound(CHANNEL, [_msg("a", _ts(5)), _msg("b", _ts(4))]) == 1
+
+    @pytest.mark.asyncio
+    async def test_since_filters_and_orders(self):
+        await index_inbound(CHANNEL, [_msg("new", _ts(1)), _msg("old", _ts(30))])
+        result = await get_indexed_since(CHANNEL, CHAT_JID, _ts(10))
+        assert [m.id for m in result] == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_anchor_is_oldest(self):
+        await index_inbound(CHANNEL, [_msg("new", _ts(1)), _msg("old", _ts(30))])
+        anchor = await get_index_anchor(CHANNEL, CHAT_JID)
+        assert anchor is not None and anchor.message_id == "old"
+        assert await get_index_anchor(CHANNEL, "other@g.us") is None
+
+    @pytest.mark.asyncio
+    async def test_prune_caps_per_chat_and_age(self):
+        msgs = [_msg(f"m{i}", _ts(i)) for i in range(5)]
+        msgs.append(_msg("ancient", (datetime.now(UTC) - timedelta(days=30)).isoformat()))
+        await index_inbound(CHANNEL, msgs)
+
+        assert await prune_inbound_index(CHANNEL, max_per_chat=3) == 3
+        remaining = await get_indexed_since(CHANNEL, CHAT_JID, "")
+        assert [m.id for m in remaining] == ["m2", "m1", "m0"]
+
+
+class TestHistorySyncIndexing:
+    @pytest.mark.asyncio
+    async def test_indexes_text_messages_for_workspace_chats(self):
+        ch = _make_channel()
+        now = int(datetime.now(UTC).timestamp())
+        ev = SimpleNamespace(
+            Data=SimpleNamespace(
+                syncType=1,
+                conversations=[
+                    SimpleNamespace(
+                        ID=CHAT_JID,
+                        messages=[
+                            _history_msg("m1", now - 60, "hello"),
+                            _history_msg("m2", now - 30, ""),  # media without caption
+                            _history_msg("m3", now, "lid sender", participant="999@lid"),
+                        ],
+                    ),
+                    SimpleNamespace(
+                        ID="unrelated@g.us", messages=[_history_msg("x", now, "skip me")]
+                    ),
+                ],
+            )
+        )
+
+        await ch._index_history_sync(ev)
+
+        indexed = await get_indexed_since(CHANNEL, CHAT_JID, "")
+        assert [m.id for m in indexed] == ["m1", "m3"]
+        assert indexed[1].sender == "222@s.whatsapp.net"
+        assert await get_indexed_since(CHANNEL, "unrelated@g.us", "") == []
+
+
+class TestFetchInboundSince:
+    @pytest.mark.asyncio
+    async def test_answers_from_index_and_filters_bot_echoes(self, monkeypatch):
+        settings = SimpleNamespace(agent=SimpleNamespace(name="pynchy"))
+        monkeypatch.setattr(
+            "pynchy.plugins.channels.whatsapp.channel.get_settings", lambda: settings
+        )
+        await index_inbound(
+            CHANNEL,
+            [
+                _msg("old", _ts(60)),
+                _msg("user", _ts(5), "question"),
+                _msg("bot", _ts(4), "pynchy: answer", from_me=True),
+            ],
+        )
+        ch = _make_channel()
+
+        result = await ch.fetch_inbound_since(CHAT_JID, _ts(30))
+
+        assert [m.id for m in result.messages] == ["user"]
+        assert result.high_water_mark > result.messages[0].timestamp
+        ch._client.build_history_sync_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_requests_older_history_when_index_starts_after_since(self):
+        await index_inbound(CHANNEL, [_msg("first-known", _ts(5))])
+        ch = _make_channel()
+
+        await ch.fetch_inbound_since(CHAT_JID, _ts(60))
+        await ch.fetch_inbound_since(CHAT_JID, _ts(60))
+
+        ch._client.build_history_sync_request.assert_awaited_once()
+        info = ch._client.build_history_sync_request.await_args.args[0]
+        assert info is not None
+        ch._client.send_message.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_live_anchor(self):
+        from pynchy.state.inbound_index import IndexAnchor
+
+        ch = _make_channel()
+        ch._live_anchors[CHAT_JID] = IndexAnchor(
+            message_id="live", timestamp=_ts(1), sender="111@s.whatsapp.net", is_from_me=False
+        )
+
+        result = await ch.fetch_inbound_since(CHAT_JID, _ts(60))
+
+        assert result.messages == []
+        ch._client.build_history_sync_request.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_index_without_anchor_is_a_no_op(self):
+        ch = _make_channel()
+        result = await ch.fetch_inbound_since(CHAT_JID, _ts(60))
+        assert result.messages == []
+        assert result.high_water_mark == ""
+        ch._client.build_history_sync_request.assert_not_awaited()
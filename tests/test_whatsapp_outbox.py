@@ -0,0 +1,219 @@
+"""Tests for the WhatsApp outbox — ledger-backed queue, pacing, merging, backoff."""
+
+from __future__ import annotations
+
+import sys
+import time
+from types import ModuleType
+from unittest.mock import MagicMock
+
+import pytest
+
+from pynchy.state import _init_test_database, get_pending_outbound, record_outbound
+from pynchy.state.outbound import PendingDelivery
+
+# The whatsapp package imports neonize (a native Go binding) on import;
+# stub it so the outbox can be tested where neonize isn't installed.
+_NEONIZE_MODULES = [
+    "neonize",
+    "neonize.aioze",
+    "neonize.aioze.client",
+    "neonize.aioze.events",
+    "neonize.events",
+    "neonize.proto",
+    "neonize.proto.Neonize_pb2",
+    "neonize.utils",
+    "neonize.utils.jid",
+    "neonize.utils.enum",
+]
+_neonize_mocks: dict[str, ModuleType] = {}
+for _mod_name in _NEONIZE_MODULES:
+    if _mod_name not in sys.modules:
+        _neonize_mocks[_mod_name] = MagicMock()
+        sys.modules[_mod_name] = _neonize_mocks[_mod_name]
+
+from pynchy.plugins.channels.whatsapp import outbox as outbox_mod  # noqa: E402
+from pynchy.plugins.channels.whatsapp.outbox import (  # noqa: E402
+    TokenBucket,
+    WhatsAppOutbox,
+    merge_pending,
+)
+
+CHANNEL = "connection.whatsapp.test"
+JID = "group@g.us"
+
+
+@pytest.fixture()
+async def _db():
+    await _init_test_database()
+
+
+def _row(ledger_id: int, content: str) -> PendingDelivery:
+    return PendingDelivery(
+        ledger_id=ledger_id, chat_jid=JID, content=content, timestamp="", source="test"
+    )
+
+
+class _Sender:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, str]] = []
+        self.fail: Exception | None = None
+
+    async def __call__(self, jid: str, text: str) -> None:
+        if self.fail is not None:
+            raise self.fail
+        self.sent.append((jid, text))
+
+
+def _outbox(sender: _Sender, *, connected: bool = True, **kwargs) -> WhatsAppOutbox:
+    return WhatsAppOutbox(CHANNEL, sender, lambda: connected, **kwargs)
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=2.0, burst=2, clock=lambda: now[0])
+        assert bucket.take() == 0
+        assert bucket.take() == 0
+        assert bucket.take() == pytest.approx(0.5)
+        now[0] = 0.5
+        assert bucket.take() == 0
+
+    def test_refill_capped_at_burst(self):
+        now = [0.0]
+        bucket = TokenBucket(rate=1.0, burst=2, clock=lambda: now[0])
+        now[0] = 100.0
+        assert [bucket.take() for _ in range(3)][:2] == [0, 0]
+
+
+class TestMergePending:
+    def test_small_consecutive_messages_merge(self):
+        batches = merge_pending([_row(1, "a"), _row(2, "b"), _row(3, "c")])
+        assert len(batches) == 1
+        assert batches[0].text == "a\n\nb\n\nc"
+        assert batches[0].ledger_ids == [1, 2, 3]
+
+    def test_large_messages_sent_alone(self):
+        big = "x" * (outbox_mod._SMALL_MESSAGE_CHARS + 1)
+        batches = merge_pending([_row(1, "a"), _row(2, big), _row(3, "b")])
+        assert [b.ledger_ids for b in batches] == [[1], [2], [3]]
+
+    def test_merge_stops_at_cap(self, monkeypatch):
+        monkeypatch.setattr(outbox_mod, "_MERGE_MAX_CHARS", 10)
+        batches = merge_pending([_row(1, "aaaa"), _row(2, "bbbb"), _row(3, "cccc")])
+        assert [b.text for b in batches] == ["aaaa\n\nbbbb", "cccc"]
+
+    def test_repeated_text_is_kept(self):
+        batches = merge_pending([_row(1, "ok"), _row(2, "ok"), _row(3, "there")])
+        assert batches[0].text == "ok\n\nok\n\nthere"
+        assert batches[0].ledger_ids == [1, 2, 3]
+
+
+@pytest.mark.usefixtures("_db")
+class TestOutbox:
+    @pytest.mark.asyncio
+    async def test_enqueue_persists_and_blocks_direct_sends(self):
+        box = _outbox(_Sender())
+        await box.enqueue(JID, "queued")
+
+        pending = await get_pending_outbound(CHANNEL, JID)
+        assert [p.content for p in pending] == ["queued"]
+        assert box.try_acquire(JID) is False
+
+    @pytest.mark.asyncio
+    async def test_identical_messages_are_each_queued(self):
+        sender = _Sender()
+        box = _outbox(sender)
+        await box.enqueue(JID, "ok")
+        await box.enqueue(JID, "ok")
+        assert len(await get_pending_outbound(CHANNEL, JID)) == 2
+
+        await box.drain()
+        assert sender.sent == [(JID, "ok\n\nok")]
+
+    @pytest.mark.asyncio
+    async def test_drain_delivers_backlog_from_previous_run(self):
+        # Rows written before a restart are picked up by a fresh outbox
+        await record_outbound(JID, "one", "whatsapp_outbox", [CHANNEL])
+        await record_outbound(JID, "two", "whatsapp_outbox", [CHANNEL])
+        sender = _Sender()
+        box = _outbox(sender)
+
+        assert await box.drain() is None
+        assert sender.sent == [(JID, "one\n\ntwo")]
+        assert await get_pending_outbound(CHANNEL, JID) == []
+        assert box.try_acquire(JID) is True
+
+    @pytest.mark.asyncio
+    async def test_drain_paces_per_chat(self):
+        big = "x" * (outbox_mod._SMALL_MESSAGE_CHARS + 1)
+        for i in range(3):
+            await record_outbound(JID, f"{i}{big}", "whatsapp_outbox", [CHANNEL])
+        sender = _Sender()
+        box = _outbox(sender, rate=50.0, burst=1)
+
+        started = time.monotonic()
+        await box.drain()
+        assert [text[0] for _, text in sender.sent] == ["0", "1", "2"]
+        # Burst of one, then one token every 20ms
+        assert time.monotonic() - started >= 0.035
+
+    @pytest.mark.asyncio
+    async def test_failure_backs_off_and_keeps_row(self):
+        await record_outbound(JID, "one", "whatsapp_outbox", [CHANNEL])
+        sender = _Sender()
+        sender.fail = OSError("rate-overlimit")
+        box = _outbox(sender)
+
+        first = await box.drain()
+        assert first == pytest.approx(outbox_mod._BACKOFF_BASE, abs=0.1)
+        pending = await get_pending_outbound(CHANNEL, JID)
+        assert len(pending) == 1
+
+        # Still in backoff: a second drain doesn't retry
+        sender.fail = None
+        await box.drain()
+        assert sender.sent == []
+
+        box._retry_at[JID] = 0
+        await box.drain()
+        assert sender.sent == [(JID, "one")]
+
+    @pytest.mark.asyncio
+    async def test_failed_merged_send_marks_every_row(self):
+        from pynchy.state import _get_db
+
+        for text in ("one", "two", "three"):
+            await record_outbound(JID, text, "whatsapp_outbox", [CHANNEL])
+        sender = _Sender()
+        sender.fail = OSError("rate-overlimit")
+
+        await _outbox(sender).drain()
+
+        cursor = await _get_db().execute(
+            "SELECT error FROM outbound_deliveries WHERE channel_name = ?", (CHANNEL,)
+        )
+        assert [row[0] for row in await cursor.fetchall()] == ["rate-overlimit"] * 3
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_exponentially(self):
+        await record_outbound(JID, "one", "whatsapp_outbox", [CHANNEL])
+        sender = _Sender()
+        sender.fail = OSError("down")
+        box = _outbox(sender)
+
+        delays = []
+        for _ in range(3):
+            box._retry_at.pop(JID, None)
+            delays.append(await box.drain())
+        assert delays == [pytest.approx(d, abs=0.1) for d in (2.0, 4.0, 8.0)]
+
+    @pytest.mark.asyncio
+    async def test_drain_stops_when_disconnected(self):
+        await record_outbound(JID, "one", "whatsapp_outbox", [CHANNEL])
+        sender = _Sender()
+        box = _outbox(sender, connected=False)
+
+        await box.drain()
+        assert sender.sent == []
+        assert len(await get_pending_outbound(CHANNEL, JID)) == 1
@@ -0,0 +1,162 @@
+"""Tests for the X integration plugin's warm browser worker."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from pynchy.plugins.integrations.x_integration import (
+    XIntegrationPlugin,
+    _browser,
+    _BrowserWorker,
+)
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+
+class _FakeContext:
+    def __init__(self) -> None:
+        self.pages: list[_FakePage] = []
+        self.closed = False
+        self._close_handlers: list = []
+
+    def on(self, event: str, handler) -> None:
+        assert event == "close"
+        self._close_handlers.append(handler)
+
+    async def new_page(self) -> _FakePage:
+        page = _FakePage()
+        self.pages.append(page)
+        return page
+
+    async def close(self) -> None:
+        self.closed = True
+        for handler in self._close_handlers:
+            handler(self)
+
+    def crash(self) -> None:
+        for handler in self._close_handlers:
+            handler(self)
+
+
+class _FakeWorker(_BrowserWorker):
+    """Worker whose ``_start`` hands out fake contexts instead of launching Chrome."""
+
+    def __init__(self, idle_timeout: float = 60.0) -> None:
+        super().__init__(idle_timeout)
+        self.contexts: list[_FakeContext] = []
+
+    async def _start(self) -> None:
+        context = _FakeContext()
+        context.on("close", lambda _ctx: self._on_context_closed(context))
+        self.contexts.append(context)
+        self._context = context
+        self._page = None
+
+
+async def _page_of(page):
+    return {"page": page}
+
+
+class TestBrowserWorker:
+    @pytest.mark.asyncio
+    async def test_context_and_page_reused_across_actions(self):
+        worker = _FakeWorker()
+        first = await worker.run("x_like", _page_of)
+        second = await worker.run("x_retweet", _page_of)
+
+        assert len(worker.contexts) == 1
+        assert first["page"] is second["page"]
+        await worker.shutdown()
+        assert worker.contexts[0].closed
+        assert not worker.running
+
+    @pytest.mark.asyncio
+    async def test_closed_page_is_replaced(self):
+        worker = _FakeWorker()
+        first = (await worker.run("x_like", _page_of))["page"]
+        first.closed = True
+        second = (await worker.run("x_like", _page_of))["page"]
+
+        assert second is not first
+        assert len(worker.contexts) == 1
+        await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_actions_are_serialized(self):
+        worker = _FakeWorker()
+        active = 0
+        peak = 0
+
+        async def action(page):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {}
+
+        await asyncio.gather(*(worker.run("x_like", action) for _ in range(4)))
+
+        assert peak == 1
+        await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_crashed_context_restarts_on_next_action(self):
+        worker = _FakeWorker()
+        await worker.run("x_like", _page_of)
+        worker.contexts[0].crash()
+        assert not worker.running
+
+        await worker.run("x_like", _page_of)
+        assert len(worker.contexts) == 2
+        await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_idle_timeout_shuts_down(self):
+        worker = _FakeWorker(idle_timeout=0.01)
+        await worker.run("x_like", _page_of)
+        await asyncio.sleep(0.1)
+
+        assert not worker.running
+        assert worker.contexts[0].closed
+
+    @pytest.mark.asyncio
+    async def test_exclusive_stops_context_and_blocks_actions(self):
+        worker = _FakeWorker()
+        await worker.run("x_like", _page_of)
+
+        async with worker.exclusive():
+            assert not worker.running
+            pending = asyncio.create_task(worker.run("x_like", _page_of))
+            await asyncio.sleep(0.01)
+            assert not pending.done()
+
+        await pending
+        assert len(worker.contexts) == 2
+        await worker.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_action_error_keeps_context_warm(self):
+        worker = _FakeWorker()
+
+        async def boom(page):
+            raise RuntimeError("selector missing")
+
+        with pytest.raises(RuntimeError):
+            await worker.run("x_post", boom)
+
+        assert worker.running
+        await worker.shutdown()
+
+
+def test_plugin_closes_the_shared_worker_at_shutdown():
+    handlers = XIntegrationPlugin().pynchy_service_handler()
+    assert handlers["close"] == _browser.shutdown